@@ -0,0 +1,125 @@
+"""
+Benchmark decoding large collection responses
+
+Compares the two ways a client can turn a response body into a model: decoding it into a dictionary with
+`json.loads` and validating that with `model_validate`, as `response.json()` did, and validating the raw bytes
+directly with `model_validate_json`, which parses them in a single pass with pydantic-core's JSON parser
+
+Usage:
+    uv run python -m benchmarks.decode --rows 25000 --repeat 10
+"""
+
+import argparse
+import json
+import time
+from collections.abc import Callable
+from typing import Any
+
+from pydantic import BaseModel
+
+from vantage_sdk.models import AuditLogs, Costs, Resources
+
+
+def costs_page(rows: int) -> dict[str, Any]:
+    """A Costs page grouped by provider, service, region and account, as GET /costs returns it"""
+    services = ["Amazon Elastic Compute Cloud", "Amazon Simple Storage Service", "Amazon Relational Database Service"]
+    return {
+        "links": {"self": "https://api.vantage.sh/v2/costs?page=1", "next": None},
+        "total_cost": {"amount": "12345.67", "currency": "USD"},
+        "costs": [
+            {
+                "accrued_at": f"2024-01-{row % 28 + 1:02d}",
+                "amount": f"{row * 1.37:.2f}",
+                "currency": "USD",
+                "provider": "aws",
+                "service": services[row % len(services)],
+                "region": "us-east-1",
+                "account_id": f"{row % 7:012d}",
+            }
+            for row in range(rows)
+        ],
+    }
+
+
+def resources_page(rows: int) -> dict[str, Any]:
+    """A Resources page of EC2 instances"""
+    return {
+        "links": {},
+        "resources": [
+            {
+                "token": f"prvdr_rsrc_{row}",
+                "uuid": f"i-{row:016x}",
+                "type": "aws_instance",
+                "label": f"web-{row}",
+                "metadata": {"instance_type": "m5.large", "platform": "linux"},
+                "account_id": "123456789012",
+                "billing_account_id": "123456789012",
+                "provider": "aws",
+                "region": "us-east-1",
+                "created_at": "2024-01-01T00:00:00Z",
+                "tags": {"team": "platform", "env": "production"},
+            }
+            for row in range(rows)
+        ],
+    }
+
+
+def audit_logs_page(rows: int) -> dict[str, Any]:
+    """An AuditLogs page of cost report updates"""
+    return {
+        "links": {},
+        "audit_logs": [
+            {
+                "token": f"adt_lg_{row}",
+                "object_token": f"rprt_{row % 50}",
+                "object_type": "Report",
+                "object_title": "Production Cost Report",
+                "event": "record_updated",
+                "source": "api",
+                "created_at": "2024-01-01T00:00:00Z",
+                "changed_values": {"title": ["Old", "New"]},
+                "unchanged_values": {},
+            }
+            for row in range(rows)
+        ],
+    }
+
+
+def best_of(call: Callable[[], object], repeat: int) -> float:
+    """The fastest of `repeat` runs of a call, in seconds"""
+    timings: list[float] = []
+    for _ in range(repeat):
+        start = time.perf_counter()
+        call()
+        timings.append(time.perf_counter() - start)
+    return min(timings)
+
+
+def compare(name: str, model: type[BaseModel], body: bytes, rows: int, repeat: int) -> None:
+    """Time both decoding paths for a response body and print their throughput"""
+    via_dict = best_of(lambda: model.model_validate(json.loads(body)), repeat)
+    via_bytes = best_of(lambda: model.model_validate_json(body), repeat)
+    print(
+        f"{name:<10} {rows / via_dict:>20,.0f} rows/s {rows / via_bytes:>12,.0f} rows/s {via_dict / via_bytes:>7.2f}x"
+    )
+
+
+def main() -> None:
+    """Run the benchmark"""
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--rows", type=int, default=25_000, help="Items per response")
+    parser.add_argument("--repeat", type=int, default=10, help="Runs of each decoding path, the fastest is kept")
+    args = parser.parse_args()
+
+    print(f"{'':<10} {'json.loads + model_validate':>27} {'model_validate_json':>19} {'speedup':>8}")
+    pages = [
+        ("Costs", Costs, costs_page(args.rows)),
+        ("Resources", Resources, resources_page(args.rows)),
+        ("AuditLogs", AuditLogs, audit_logs_page(args.rows)),
+    ]
+    for name, model, page in pages:
+        compare(name, model, json.dumps(page).encode(), args.rows, args.repeat)
+
+
+if __name__ == "__main__":
+    main()
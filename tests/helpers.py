@@ -0,0 +1,131 @@
+"""Stand-ins for the Vantage API, shared by the tests that do not replay cassettes"""
+
+import asyncio
+import copy
+import time
+from datetime import date, timedelta
+from decimal import Decimal
+from typing import Any, NamedTuple
+
+from httpx import AsyncClient, Request, Response
+
+from vantage_sdk import VantageSDK
+
+BASE_URL = "https://api.vantage.sh/v2/"
+
+
+class Call(NamedTuple):
+    """A request answered by a FakeAPI"""
+
+    method: str
+    url: str
+    params: dict[str, Any]
+    headers: dict[str, str] | None
+
+    @property
+    def page(self) -> int:
+        return self.params.get("page", 1)
+
+
+class FakeAPI:
+    """
+    Answers the requests sent through sync and async sessions instead of the API, recording each of them
+
+    Args:
+        answer: Called with each Call, returns a Response or the JSON body of a 200. Anything else is
+            a JSON body returned, as a copy, to every request
+        delay: Seconds each request takes, or a function of the Call returning them
+    """
+
+    def __init__(self, answer, delay=0.0):
+        self.answer = answer
+        self.delay = delay
+        self.calls: list[Call] = []
+        self.in_flight = 0
+        self.peak = 0
+
+    def install(self, monkeypatch, *sessions):
+        for session in sessions:
+            request = self._async_request if isinstance(session, AsyncClient) else self._request
+            monkeypatch.setattr(session, "request", request)
+        return self
+
+    @property
+    def pages(self):
+        return [call.page for call in self.calls]
+
+    def _start(self, method, url, params, headers):
+        call = Call(method, url, dict(params or {}), headers)
+        self.calls.append(call)
+        self.in_flight += 1
+        self.peak = max(self.peak, self.in_flight)
+        return call, self.delay(call) if callable(self.delay) else self.delay
+
+    def _finish(self, call):
+        self.in_flight -= 1
+        result = self.answer(call) if callable(self.answer) else copy.deepcopy(self.answer)
+        return result if isinstance(result, Response) else respond(call, body=result)
+
+    def _request(self, method, url, params=None, headers=None, **kwargs):
+        call, delay = self._start(method, url, params, headers)
+        if delay:
+            time.sleep(delay)
+        return self._finish(call)
+
+    async def _async_request(self, method, url, params=None, headers=None, **kwargs):
+        call, delay = self._start(method, url, params, headers)
+        if delay:
+            await asyncio.sleep(delay)
+        return self._finish(call)
+
+
+def fake_api(monkeypatch, sdk, answer, delay=0.0):
+    """Answer every request of a client, including the pages the sync client fetches through its AsyncClient"""
+    sessions = [sdk.session, sdk.async_session] if isinstance(sdk, VantageSDK) else [sdk.session]
+    return FakeAPI(answer, delay).install(monkeypatch, *sessions)
+
+
+def respond(call, status=200, body=None, headers=None):
+    """A response to a Call"""
+    return Response(status, json=body, headers=headers, request=Request(call.method, call.url))
+
+
+def links(endpoint, *, last=None, next=None):
+    """The links of a page, to the last page of a numbered listing or to the next page of a cursor"""
+    page_links = {}
+    if last is not None:
+        page_links["last"] = f"{BASE_URL}{endpoint}?page={last}"
+    if next is not None:
+        page_links["next"] = f"{BASE_URL}{endpoint}?page={next}"
+    return page_links
+
+
+def costs_body(*days, amount="1.25"):
+    """A GET /costs response with one row per day"""
+    return {
+        "links": {},
+        "total_cost": {"amount": str(Decimal(amount) * len(days)), "currency": "USD"},
+        "costs": [{"accrued_at": day, "amount": amount, "currency": "USD"} for day in days],
+    }
+
+
+def daily_costs(call):
+    """Answers GET /costs with a row for every day of the requested period, sorted like the API sorts them"""
+    start, end = date.fromisoformat(call.params["start_date"]), date.fromisoformat(call.params["end_date"])
+    days = [(start + timedelta(days=offset)).isoformat() for offset in range((end - start).days + 1)]
+    if call.params.get("order", "desc") == "desc":
+        days.reverse()
+    return costs_body(*days, amount="1")
+
+
+def integration(page):
+    """An integration that validates, tagged with the page it came from"""
+    return {
+        "token": f"accss_crdntl_{page}",
+        "provider": "aws",
+        "account_identifier": None,
+        "status": "connected",
+        "workspace_tokens": [],
+        "created_at": "2025-01-01T00:00:00Z",
+        "managed_account_tokens": [],
+    }
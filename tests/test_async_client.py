@@ -0,0 +1,36 @@
+import asyncio
+
+import pytest
+
+from tests.conftest import settings
+from tests.helpers import fake_api, links
+from vantage_sdk import AsyncVantageSDK, ResponseCache
+
+
+@pytest.mark.default_cassette("test_get_all_folders.yaml")
+def test_async_get_all_folders():
+    async def get_all_folders():
+        async with AsyncVantageSDK(api_key=settings.vantage_api_key) as async_sdk:
+            return await async_sdk.get_all_folders()
+
+    folders = asyncio.run(get_all_folders())
+    assert folders is not None
+    assert folders.folders is not None
+
+
+def test_async_paginated_merges_concurrent_pages(monkeypatch):
+    async_sdk = AsyncVantageSDK(api_key="test", cache=ResponseCache(ttl=60))
+    api = fake_api(
+        monkeypatch,
+        async_sdk,
+        lambda call: {"links": links("folders", last=3) if call.page == 1 else {}, "folders": [{"page": call.page}]},
+    )
+
+    async def fetch():
+        result = await async_sdk._get_paginated("folders")
+        # Pages 2..N are not cached on their own, the combined response covers them
+        await async_sdk._get("folders", {"page": 2})
+        return result
+
+    assert asyncio.run(fetch()) == {"folders": [{"page": 1}, {"page": 2}, {"page": 3}]}
+    assert sorted(api.pages) == [1, 2, 2, 3]
@@ -0,0 +1,322 @@
+import asyncio
+import json
+import multiprocessing
+import threading
+import time
+
+import pytest
+
+from tests.helpers import costs_body, fake_api, links, respond
+from vantage_sdk import AsyncVantageSDK, ResponseCache, VantageSDK
+from vantage_sdk.cache import CacheEntry, MemoryCacheBackend, SQLiteCacheBackend
+from vantage_sdk.cost_cache import CostCache
+from vantage_sdk.models import CostsGetParametersQuery, UpdateFolder
+
+
+def test_cache_serves_repeated_gets(monkeypatch):
+    cache = ResponseCache(ttl=60, endpoint_ttls={"costs": 0})
+    sdk = VantageSDK(api_key="test", cache=cache)
+    api = fake_api(monkeypatch, sdk, {"links": {}, "folders": [{"token": "fldr_1"}]})
+
+    first = sdk._get_paginated("folders")
+    first["folders"].append({"token": "mutated"})
+    assert sdk._get_paginated("folders") == {"folders": [{"token": "fldr_1"}]}
+    assert sdk._get("folders/fldr_1", {"b": 1, "a": 2}) == sdk._get("folders/fldr_1", {"a": 2, "b": 1})
+    # Endpoints with a TTL of 0 are never cached
+    sdk._get("costs")
+    sdk._get("costs")
+
+    assert len(api.calls) == 4
+    stats = cache.stats
+    # The combined listing and its first page are separate entries
+    assert (stats.hits, stats.misses, stats.stores) == (2, 3, 3)
+    assert stats.hit_ratio == 0.4
+
+
+def test_cache_entries_expire_and_are_evicted():
+    cache = ResponseCache(MemoryCacheBackend(max_entries=2), ttl=0.05)
+    for endpoint in ("folders", "workspaces", "teams"):
+        cache.store(cache.key(endpoint), endpoint, {"endpoint": endpoint})
+
+    # The least recently used entry was evicted
+    assert cache.load(cache.key("folders")) is None
+    assert cache.load(cache.key("teams")) == {"endpoint": "teams"}
+
+    time.sleep(0.06)
+    assert cache.load(cache.key("teams")) is None
+    assert cache.stats.expired == 1
+    assert cache.stats.entries == 2
+
+
+def test_cache_revalidates_expired_entries(monkeypatch):
+    cache = ResponseCache(ttl=0.05)
+    sdk = VantageSDK(api_key="test", cache=cache)
+    body = {"virtual_tag_configs": [{"token": "vtag_1", "key": "team"}]}
+
+    def answer(call):
+        if call.headers is not None and call.headers.get("If-None-Match") == 'W/"abc"':
+            return respond(call, 304)
+        return respond(call, body=body, headers={"ETag": 'W/"abc"'})
+
+    api = fake_api(monkeypatch, sdk, answer)
+
+    assert sdk._get("virtual_tag_configs") == body
+    time.sleep(0.06)
+    assert sdk._get("virtual_tag_configs") == body
+    # The revalidated entry is fresh again
+    assert sdk._get("virtual_tag_configs") == body
+
+    assert [call.headers for call in api.calls] == [None, {"If-None-Match": 'W/"abc"'}]
+    assert cache.stats.revalidated == 1
+
+
+def test_cache_revalidates_every_page_of_expired_listings(monkeypatch):
+    cache = ResponseCache(ttl=0.05)
+    sdk = VantageSDK(api_key="test", cache=cache)
+    versions = {1: "a", 2: "a", 3: "a"}
+
+    def answer(call):
+        etag = f'"{call.page}{versions[call.page]}"'
+        if call.headers is not None and call.headers.get("If-None-Match") == etag:
+            return respond(call, 304)
+        body = {"links": links("products", last=3), "products": [f"{call.page}{versions[call.page]}"]}
+        return respond(call, body=body, headers={"ETag": etag})
+
+    api = fake_api(monkeypatch, sdk, answer)
+
+    assert sdk._get_paginated("products") == {"products": ["1a", "2a", "3a"]}
+    time.sleep(0.06)
+    api.calls.clear()
+    # Every page is unchanged, so the combined listing is renewed without downloading any page
+    assert sdk._get_paginated("products") == {"products": ["1a", "2a", "3a"]}
+    assert sorted((call.page, call.headers.get("If-None-Match")) for call in api.calls) == [
+        (1, '"1a"'),
+        (2, '"2a"'),
+        (3, '"3a"'),
+    ]
+    assert cache.stats.revalidated == 2
+
+    time.sleep(0.06)
+    api.calls.clear()
+    versions[3] = "b"
+    # Only the unchanged page is downloaded again, the changed one came back with the conditional request
+    assert sdk._get_paginated("products") == {"products": ["1a", "2a", "3b"]}
+    assert sorted(call.page for call in api.calls) == [1, 2, 2, 3]
+
+
+def test_stale_entries_are_served_while_refreshed_once(monkeypatch):
+    cache = ResponseCache(ttl=0.05, stale_ttl=60)
+    sdk = VantageSDK(api_key="test", cache=cache)
+    release = threading.Event()
+
+    def answer(call):
+        version = len(api.calls)
+        if version > 1:
+            release.wait(5)
+        return {"workspaces": [{"version": version}]}
+
+    api = fake_api(monkeypatch, sdk, answer)
+
+    assert sdk._get("workspaces") == {"workspaces": [{"version": 1}]}
+    time.sleep(0.06)
+    # Every caller gets the stale response at once while a single refresh is blocked on the API
+    for _ in range(5):
+        assert sdk._get("workspaces") == {"workspaces": [{"version": 1}]}
+    assert len(api.calls) == 2
+
+    release.set()
+    deadline = time.monotonic() + 5
+    while sdk._refreshing and time.monotonic() < deadline:
+        time.sleep(0.01)
+    assert sdk._get("workspaces") == {"workspaces": [{"version": 2}]}
+    assert cache.stats.stale == 5
+
+
+def test_async_stale_entries_are_refreshed_in_background(monkeypatch):
+    async def run():
+        async with AsyncVantageSDK(api_key="test", cache=ResponseCache(ttl=0.05, stale_ttl=60)) as sdk:
+            api = fake_api(monkeypatch, sdk, lambda call: {"folders": [len(api.calls)]})
+            await sdk._get("folders")
+            await asyncio.sleep(0.06)
+            stale = await asyncio.gather(sdk._get("folders"), sdk._get("folders"))
+            await asyncio.gather(*sdk._refresh_tasks.values())
+            return stale, await sdk._get("folders"), len(api.calls)
+
+    stale, refreshed, request_count = asyncio.run(run())
+
+    assert stale == [{"folders": [1]}, {"folders": [1]}]
+    assert refreshed == {"folders": [2]}
+    assert request_count == 2
+
+
+def test_concurrent_identical_gets_share_one_request(monkeypatch):
+    sdk = VantageSDK(api_key="test")
+    release = threading.Event()
+
+    def answer(call):
+        release.wait(5)
+        return {"workspaces": [{"token": "wrkspc_1"}]}
+
+    api = fake_api(monkeypatch, sdk, answer)
+    results = []
+    threads = [threading.Thread(target=lambda: results.append(sdk._get("workspaces"))) for _ in range(8)]
+    for thread in threads:
+        thread.start()
+    time.sleep(0.1)
+    release.set()
+    for thread in threads:
+        thread.join(5)
+
+    assert len(api.calls) == 1
+    assert results == [{"workspaces": [{"token": "wrkspc_1"}]}] * 8
+    # Every caller owns its result
+    assert len({id(result) for result in results}) == 8
+
+
+def test_async_concurrent_identical_gets_share_one_request(monkeypatch):
+    async def run():
+        async with AsyncVantageSDK(api_key="test") as sdk:
+            api = fake_api(monkeypatch, sdk, {"cost_report": {"token": "rprt_1"}}, delay=0.05)
+            results = await asyncio.gather(*(sdk._get("cost_reports/rprt_1") for _ in range(5)), sdk._get("folders"))
+            return results, api.calls
+
+    results, calls = asyncio.run(run())
+
+    assert len(calls) == 2
+    assert results[:5] == [{"cost_report": {"token": "rprt_1"}}] * 5
+
+
+def test_writes_invalidate_affected_cache_entries(monkeypatch):
+    cache = ResponseCache(ttl=60)
+    cost_cache = CostCache(backend=MemoryCacheBackend())
+    sdk = VantageSDK(api_key="test", cache=cache, cost_cache=cost_cache)
+    api = fake_api(monkeypatch, sdk, {"links": {}})
+    reads = [
+        ("folders", None),
+        ("folders/fldr_1", None),
+        ("cost_reports", {"folder_token": "fldr_1"}),
+        ("workspaces", None),
+    ]
+    for endpoint, params in reads:
+        sdk._get(endpoint, params)
+    report_costs = CostsGetParametersQuery(cost_report_token="rprt_1")
+    other_costs = CostsGetParametersQuery(cost_report_token="rprt_2")
+    cost_cache.store(report_costs, costs_body("2024-01-01"))
+    cost_cache.store(other_costs, costs_body("2024-01-01"))
+
+    sdk._put("folders/fldr_1", UpdateFolder(title="Renamed"))
+    sdk._delete("cost_reports/rprt_1")
+
+    # The folder and the cost report listings were evicted, the workspaces were not
+    api.calls.clear()
+    for endpoint, params in reads:
+        sdk._get(endpoint, params)
+    assert [call.url.rsplit("/", 1)[-1] for call in api.calls] == ["folders", "fldr_1", "cost_reports"]
+    assert cost_cache.load(report_costs) is None
+    assert cost_cache.load(other_costs) is not None
+
+
+@pytest.mark.parametrize(
+    ("written", "dependent"),
+    [("resource_reports/rprt_1", "resources"), ("business_metrics/bsnss_1", "unit_costs"), ("segments", "costs")],
+)
+def test_writes_invalidate_dependent_resources(written, dependent):
+    cache = ResponseCache(ttl=60)
+    cache.store(cache.key(dependent, {"page": 1}), dependent, {"links": {}})
+
+    cache.invalidate(written)
+
+    assert cache.load(cache.key(dependent, {"page": 1})) is None
+
+
+def test_responses_fetched_during_a_write_are_not_cached(monkeypatch):
+    cache = ResponseCache(ttl=60)
+    sdk = VantageSDK(api_key="test", cache=cache)
+
+    def answer(call):
+        if call.method == "GET" and len(api.calls) == 1:
+            # The folder is updated while its first read is in flight, which may have been answered before
+            sdk._put("folders/fldr_1", UpdateFolder(title="Renamed"))
+        return {"folder": {"token": "fldr_1"}}
+
+    api = fake_api(monkeypatch, sdk, answer)
+
+    sdk._get("folders/fldr_1")
+    sdk._get("folders/fldr_1")
+    sdk._get("folders/fldr_1")
+
+    # The read that overlapped the write was not cached, the one after it was
+    assert [call.method for call in api.calls] == ["GET", "PUT", "GET"]
+
+
+def test_sqlite_cache_is_shared_with_forked_workers(tmp_path):
+    backend = SQLiteCacheBackend(tmp_path / "shared.sqlite3")
+    backend.set("folders?{}#get", CacheEntry(b'{"folders": []}', time.time(), time.time() + 60))
+
+    def worker():
+        # The worker inherits the backend, reopens its own connection and shares the parent's entries
+        entry = backend.get("folders?{}#get")
+        backend.set("workspaces?{}#get", CacheEntry(entry.body, time.time(), time.time() + 60))
+
+    process = multiprocessing.get_context("fork").Process(target=worker)
+    process.start()
+    process.join(10)
+
+    assert process.exitcode == 0
+    assert backend.get("workspaces?{}#get").body == b'{"folders": []}'
+    with backend._connection() as db:
+        assert db.execute("PRAGMA journal_mode").fetchone()[0] == "wal"
+
+
+def test_sqlite_cache_compresses_bodies(tmp_path):
+    path = tmp_path / "compressed.sqlite3"
+    body = json.dumps(costs_body(*(f"2024-01-{day:02d}" for day in range(1, 32)))).encode()
+    cache = ResponseCache(SQLiteCacheBackend(path, compression="zlib"))
+    cache.store("costs?{}#get", "costs", json.loads(body))
+    # Entries written before the cache compressed are still read
+    with cache.backend._connection() as db:
+        db.execute("INSERT INTO entries (key, body, stored_at, expires_at) VALUES ('me?{}#get', '{}', 0, 1e12)")
+
+    reopened = ResponseCache(SQLiteCacheBackend(path, compression=None))
+    assert reopened.load("costs?{}#get") == json.loads(body)
+    assert reopened.load("me?{}#get") == {}
+    assert cache.stats.raw_bytes == len(reopened.backend.get("costs?{}#get").body) + 2
+    assert cache.stats.compression_ratio > 5
+    with pytest.raises(ValueError):
+        SQLiteCacheBackend(path, compression="brotli")
+
+
+def test_sqlite_cache_prunes_expired_entries(tmp_path):
+    path = tmp_path / "pruned.sqlite3"
+    backend = SQLiteCacheBackend(path, expired_grace=60, prune_interval=3)
+    now = time.time()
+    backend.set("expired?{}#get", CacheEntry(b"{}", now - 200, now - 100))
+    backend.set("stale?{}#get", CacheEntry(b"{}", now - 20, now - 10))
+    backend.set("fresh?{}#get", CacheEntry(b"{}", now, now + 60))
+
+    # The third store pruned the entry that expired longer ago than the grace, the stale one can still be served
+    assert backend.get("expired?{}#get") is None
+    assert len(backend) == 2
+
+    backend.set("expired?{}#get", CacheEntry(b"{}", now - 200, now - 100))
+    backend.close()
+    assert len(SQLiteCacheBackend(path, expired_grace=0)) == 1
+
+
+def test_sqlite_cache_evicts_least_recently_used_entries(tmp_path):
+    now = time.time()
+    by_count = SQLiteCacheBackend(tmp_path / "count.sqlite3", compression=None, max_entries=2, prune_interval=1)
+    for key in ("folders", "workspaces"):
+        by_count.set(key, CacheEntry(b"{}", now, now + 60))
+    assert by_count.get("folders") is not None
+    by_count.set("teams", CacheEntry(b"{}", now, now + 60))
+    assert by_count.get("workspaces") is None
+    assert by_count.get("folders") is not None and by_count.get("teams") is not None
+
+    by_size = SQLiteCacheBackend(tmp_path / "size.sqlite3", compression=None, max_bytes=250, prune_interval=1)
+    for key in ("folders", "workspaces", "teams"):
+        by_size.set(key, CacheEntry(b"x" * 100, now, now + 60))
+    assert by_size.get("folders") is None
+    assert by_size.sizes() == (200, 200)
+    with pytest.raises(ValueError):
+        SQLiteCacheBackend(tmp_path / "size.sqlite3", max_bytes=0)
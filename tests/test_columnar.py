@@ -0,0 +1,73 @@
+import pytest
+
+from tests.helpers import costs_body, fake_api
+from vantage_sdk import VantageSDK
+from vantage_sdk.columnar import to_table
+from vantage_sdk.models import CostsGetParametersQuery, NetworkFlowLogsGetParametersQuery, ResourcesGetParametersQuery
+
+
+def test_cost_tables_hold_typed_columns(monkeypatch):
+    np = pytest.importorskip("numpy")
+    sdk = VantageSDK(api_key="test")
+    body = costs_body("2024-01-01", "2024-01-02", "2024-01-03")
+    for cost, service in zip(body["costs"], ["EC2", "S3", "EC2"], strict=True):
+        cost["service"] = service
+    body["costs"][1]["amount"] = "2.50"
+    api = fake_api(monkeypatch, sdk, body)
+
+    table = sdk.get_cost_report_costs_table(CostsGetParametersQuery(cost_report_token="rprt_1"))
+    assert len(table) == 3 and table.metadata["total_cost"]["amount"] == "3.75"
+    assert table["amount"].dtype == np.float64 and table["amount"].sum() == 5.0
+    assert table["accrued_at"].dtype == np.dtype("datetime64[D]")
+    assert table["service"].categories == ("EC2", "S3") and table["service"].codes.tolist() == [0, 1, 0]
+    assert table["region"].codes.tolist() == [-1, -1, -1]
+    assert table.sum_by("service") == {"EC2": 2.5, "S3": 2.5}
+    assert table.filter(table["service"].isin("S3"))["accrued_at"].astype(str).tolist() == ["2024-01-02"]
+
+    api.answer = {
+        "links": {},
+        "flow_weight": "bytes",
+        "sampling": {},
+        "network_flow_logs": [
+            {"groupings": {"region": "us-east-1"}, "bytes": 10, "estimated_cost": "0.5", "currency": "USD"},
+            {"groupings": {"region": None}, "bytes": 5, "estimated_cost": "0.25", "currency": "USD"},
+        ],
+    }
+    flows = sdk.get_network_flow_logs_table(NetworkFlowLogsGetParametersQuery())
+    assert flows.sum_by("region", "bytes") == {"us-east-1": 10.0, None: 5.0}
+    assert flows.metadata == {"flow_weight": "bytes", "sampling": {}}
+
+
+def test_tables_convert_to_dataframes(monkeypatch):
+    pa = pytest.importorskip("pyarrow")
+    pd = pytest.importorskip("pandas")
+    pl = pytest.importorskip("polars")
+
+    sdk = VantageSDK(api_key="test", lazy_collections=True)
+    body = costs_body("2024-01-01", "2024-01-02", amount="1.10")
+    body["costs"][0]["provider"] = "aws"
+    api = fake_api(monkeypatch, sdk, body)
+    query = CostsGetParametersQuery(cost_report_token="rprt_1")
+
+    arrow = sdk.get_cost_report_costs_table(query, decimals=True).to_arrow()
+    assert arrow.schema.field("amount").type == pa.decimal128(38, 2)
+    assert arrow.schema.field("accrued_at").type == pa.date32()
+    assert arrow.schema.field("provider").type == pa.dictionary(pa.int32(), pa.string())
+    assert arrow.column("provider").to_pylist() == ["aws", None]
+
+    costs = sdk.get_cost_report_costs(query)
+    frame = to_table(costs).to_pandas()
+    assert costs.costs.validated == 0
+    assert frame["amount"].sum() == pytest.approx(2.2) and frame["provider"].dtype == "category"
+    assert to_table(costs).to_polars().schema["service"] == pl.Categorical
+
+    api.answer = {
+        "links": {},
+        "resources": [
+            {"token": "rsrc_1", "provider": "aws", "created_at": "2024-01-01T02:00:00+02:00", "metadata": {"a": 1}},
+            {"token": "rsrc_2", "provider": "aws", "created_at": "2024-01-01T00:00:00Z", "metadata": {"a": "b"}},
+        ],
+    }
+    resources = sdk.get_all_resources_table(ResourcesGetParametersQuery(resource_report_token="rprt_1")).to_pandas()
+    assert resources["created_at"].tolist() == [pd.Timestamp("2024-01-01", tz="UTC")] * 2
+    assert resources["metadata"].tolist() == [{"a": 1}, {"a": "b"}]
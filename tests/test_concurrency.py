@@ -0,0 +1,78 @@
+from tests.helpers import fake_api, links
+from vantage_sdk import AdaptiveConcurrency, VantageSDK, concurrency_limit
+from vantage_sdk.concurrency import AIMDLimit
+
+
+def _integrations_api(monkeypatch, sdk, total_pages):
+    def answer(call):
+        if call.page == 1:
+            return {"links": links("integrations", last=total_pages), "integrations": []}
+        return {"integrations": [call.page]}
+
+    return fake_api(monkeypatch, sdk, answer, delay=0.01)
+
+
+def test_paginated_concurrency_is_bounded(monkeypatch):
+    sdk = VantageSDK(api_key="test", max_concurrency=5)
+    api = _integrations_api(monkeypatch, sdk, total_pages=40)
+
+    result = sdk._get_paginated("integrations")
+
+    assert result["integrations"] == list(range(2, 41))
+    assert api.peak == 5
+
+
+def test_paginated_concurrency_per_endpoint_and_per_call(monkeypatch):
+    sdk = VantageSDK(api_key="test", endpoint_concurrency={"/integrations": 3})
+    api = _integrations_api(monkeypatch, sdk, total_pages=20)
+
+    sdk._get_paginated("integrations")
+    assert api.peak == 3
+
+    api.peak = 0
+    with concurrency_limit(2):
+        sdk._get_paginated("integrations")
+    assert api.peak == 2
+
+
+def test_adaptive_limit_grows_while_stable_and_backs_off_on_overload():
+    limit = AIMDLimit(4, AdaptiveConcurrency(min_concurrency=2, max_concurrency=8))
+
+    # One round of healthy responses at a stable latency raises the limit by one
+    for _ in range(4):
+        limit.record(200, 0.1)
+    assert limit.limit == 5
+
+    # A 429 halves it, responses from the same round do not cut it again
+    limit.record(429, 0.1)
+    limit.record(429, 0.1)
+    assert limit.limit == 2
+
+    # It never drops below the minimum, nor grows past the maximum
+    assert AIMDLimit(1, AdaptiveConcurrency(min_concurrency=2)).limit == 2
+    assert AIMDLimit(100, AdaptiveConcurrency(max_concurrency=8)).limit == 8
+
+
+def test_adaptive_limit_backs_off_on_latency_spike():
+    limit = AIMDLimit(8, AdaptiveConcurrency(latency_tolerance=2.0))
+    limit.record(200, 0.1)
+    limit.record(200, 0.5)
+    assert limit.limit == 4
+
+
+def test_paginated_adaptive_concurrency_converges(monkeypatch):
+    sdk = VantageSDK(api_key="test", max_concurrency=2, adaptive_concurrency=AdaptiveConcurrency(max_concurrency=6))
+    api = _integrations_api(monkeypatch, sdk, total_pages=60)
+
+    result = sdk._get_paginated("integrations")
+
+    assert result["integrations"] == list(range(2, 61))
+    # Latency is stable, so the limit grows from 2 up to its maximum and later calls start there
+    assert api.peak == 6
+    assert sdk.concurrency_controller.limit_for("integrations", 2).limit == 6
+
+    # An explicit per-call limit is never adapted
+    api.peak = 0
+    with concurrency_limit(3):
+        sdk._get_paginated("integrations")
+    assert api.peak == 3
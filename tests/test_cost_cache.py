@@ -0,0 +1,214 @@
+import time
+from datetime import date
+from decimal import Decimal
+
+import pytest
+
+from tests.helpers import Call, costs_body, daily_costs, fake_api
+from vantage_sdk import CostCache, VantageSDK
+from vantage_sdk.cache import MemoryCacheBackend
+from vantage_sdk.costs import roll_up_costs
+from vantage_sdk.models import CostsGetParametersQuery
+
+
+def test_cost_cache_persists_across_clients(tmp_path, monkeypatch):
+    path = tmp_path / "costs.sqlite3"
+    query = CostsGetParametersQuery(cost_report_token="rprt_1", start_date="2024-01-01", end_date="2024-01-31")
+
+    sdk = VantageSDK(api_key="test", cost_cache=CostCache(path))
+    api = fake_api(monkeypatch, sdk, costs_body("2024-01-01"))
+    assert sdk.get_cost_report_costs(query).total_cost.amount == "1.25"
+
+    # A new process with the same cache file, and a query spelling out a default, needs no request
+    restarted = VantageSDK(api_key="test", cost_cache=CostCache(path))
+    api.install(monkeypatch, restarted.session)
+    same_query = query.model_copy(update={"order": "desc"})
+    assert restarted.get_cost_report_costs(same_query).costs[0].accrued_at == "2024-01-01"
+    assert len(api.calls) == 1
+    assert restarted.cost_cache.stats.hits == 1
+
+
+def test_cost_cache_trusts_closed_periods_longer(tmp_path):
+    cache = CostCache(tmp_path / "costs.sqlite3", closed_period_ttl=1000, open_period_ttl=10, settle_days=3)
+    closed = CostsGetParametersQuery(start_date="2024-01-01", end_date="2024-01-31")
+    current = CostsGetParametersQuery(start_date="2024-02-01", end_date="2024-02-29")
+
+    # Early in March, February's bills are still settling
+    assert not cache.is_closed(current, today=date(2024, 3, 2))
+    assert cache.is_closed(current, today=date(2024, 3, 5))
+    assert cache.is_closed(closed, today=date(2024, 3, 2))
+    assert not cache.is_closed(CostsGetParametersQuery(start_date="2024-01-01"))
+    assert cache.ttl_for(closed) == 1000
+
+
+def test_cost_cache_file_is_pruned_to_its_limit(tmp_path):
+    path = tmp_path / "costs.sqlite3"
+    queries = [CostsGetParametersQuery(cost_report_token=f"rprt_{number}") for number in range(4)]
+    cache = CostCache(path, open_period_ttl=0.01)
+    cache.store(queries[0], costs_body("2024-01-01"))
+    time.sleep(0.02)
+    cache.backend.close()
+
+    # Reopening the file prunes the expired results, then the least recently used beyond the limit
+    cache = CostCache(path, max_entries=2)
+    assert len(cache.backend) == 0
+    for query in queries:
+        cache.store(query, costs_body("2024-01-01"))
+    assert cache.load(queries[0]) is not None
+    cache.backend.close()
+
+    reopened = CostCache(path, max_entries=2)
+    assert [reopened.load(query) is not None for query in queries] == [True, False, False, True]
+
+
+def test_cost_cache_fetches_only_missing_months(monkeypatch):
+    sdk = VantageSDK(api_key="test", cost_cache=CostCache(backend=MemoryCacheBackend()))
+    api = fake_api(monkeypatch, sdk, lambda call: costs_body(call.params["start_date"]))
+    query = CostsGetParametersQuery(
+        cost_report_token="rprt_1", start_date="2024-01-01", end_date="2024-05-31", date_bin="day", order="asc"
+    )
+    sdk.get_cost_report_costs(query)
+    api.calls.clear()
+
+    result = sdk.get_cost_report_costs(query.model_copy(update={"end_date": "2024-06-30"}))
+
+    assert [(call.params["start_date"], call.params["end_date"]) for call in api.calls] == [
+        ("2024-06-01", "2024-06-30")
+    ]
+    assert [cost.accrued_at for cost in result.costs] == [f"2024-0{month}-01" for month in range(1, 7)]
+    assert result.total_cost.amount == "7.50"
+
+
+def test_cost_cache_merges_segments_in_the_query_order(monkeypatch):
+    sdk = VantageSDK(api_key="test", cost_cache=CostCache(backend=MemoryCacheBackend()))
+    api = fake_api(monkeypatch, sdk, daily_costs)
+    uncached = VantageSDK(api_key="test")
+    fake_api(monkeypatch, uncached, daily_costs)
+    query = CostsGetParametersQuery(
+        cost_report_token="rprt_1", start_date="2024-01-15", end_date="2024-03-10", date_bin="day"
+    )
+    sdk.get_cost_report_costs(query.model_copy(update={"end_date": "2024-02-29"}))
+
+    # The rows of the cached January and February come after those of March, like the API sorts them
+    assert sdk.get_cost_report_costs(query) == uncached.get_cost_report_costs(query)
+    assert [(call.params["start_date"], call.params["end_date"]) for call in api.calls[2:]] == [
+        ("2024-03-01", "2024-03-10")
+    ]
+
+
+def test_cost_cache_segments_keep_the_exact_bounds_of_the_period(tmp_path):
+    cache = CostCache(tmp_path / "costs.sqlite3")
+    query = CostsGetParametersQuery(start_date="2024-01-15T06:00:00Z", end_date="2024-02-10T18:00:00Z", date_bin="hour")
+
+    assert [(segment.start_date, segment.end_date) for segment in cache.segments(query)] == [
+        ("2024-01-15T06:00:00Z", "2024-01-31"),
+        ("2024-02-01", "2024-02-10T18:00:00Z"),
+    ]
+
+
+def test_cost_cache_rolls_up_coarser_groupings(monkeypatch):
+    sdk = VantageSDK(api_key="test", cost_cache=CostCache(backend=MemoryCacheBackend()))
+    rows = [
+        ("aws", "EC2", "us-east-1", "1.25", 2),
+        ("aws", "EC2", "eu-west-1", "0.75", 1),
+        ("aws", "S3", "us-east-1", "2.00", None),
+        ("gcp", "GCE", "us-east1", "3.00", 4),
+    ]
+    body = {
+        "links": {},
+        "total_cost": {"amount": "7.00", "currency": "USD"},
+        "costs": [
+            {
+                "accrued_at": "2024-01-01",
+                "amount": amount,
+                "currency": "USD",
+                "provider": provider,
+                "service": service,
+                "region": region,
+                **({"usage": {"amount": str(hours), "unit": "Hrs"}} if hours is not None else {}),
+            }
+            for provider, service, region, amount, hours in rows
+        ],
+    }
+    api = fake_api(monkeypatch, sdk, body)
+    query = CostsGetParametersQuery(cost_report_token="rprt_1", groupings=["provider", "service", "region"])
+    sdk.get_cost_report_costs(query)
+
+    by_service = sdk.get_cost_report_costs(query.model_copy(update={"groupings": ["provider", "service"]}))
+    by_provider = sdk.get_cost_report_costs(query.model_copy(update={"groupings": ["provider"]}))
+
+    assert len(api.calls) == 1
+    assert [(cost.service, cost.amount, cost.usage) for cost in by_service.costs] == [
+        ("EC2", "2.00", {"amount": "3", "unit": "Hrs"}),
+        ("S3", "2.00", None),
+        ("GCE", "3.00", {"amount": "4", "unit": "Hrs"}),
+    ]
+    assert [(cost.provider, cost.amount, cost.region) for cost in by_provider.costs] == [
+        ("aws", "4.00", None),
+        ("gcp", "3.00", None),
+    ]
+    assert by_provider.total_cost.amount == "7.00"
+
+    # A new dimension has to be fetched
+    sdk.get_cost_report_costs(query.model_copy(update={"groupings": ["provider", "account_id"]}))
+    assert len(api.calls) == 2
+
+
+def _grouping_api(call):
+    """GET /costs over a fixed set of costs, grouped and counted like the API groups them"""
+    costs = [
+        ("2024-01-01", "aws", "EC2", "us-east-1", "1.25"),
+        ("2024-01-01", "aws", "EC2", "eu-west-1", "0.75"),
+        ("2024-01-01", "aws", "S3", "us-east-1", "2.00"),
+        ("2024-01-02", "aws", "EC2", "us-east-1", "1.00"),
+        ("2024-01-02", "gcp", "GCE", "us-east1", "3.00"),
+    ]
+    groupings = call.params["groupings"]
+    rows = {}
+    for accrued_at, provider, service, region, amount in costs:
+        values = {"provider": provider, "service": service, "region": region}
+        group = (accrued_at, *(values[grouping] for grouping in groupings))
+        row = rows.setdefault(
+            group,
+            {"accrued_at": accrued_at, "amount": "0", "currency": "USD"}
+            | {grouping: values[grouping] for grouping in groupings},
+        )
+        row["amount"] = str(Decimal(row["amount"]) + Decimal(amount))
+    body = {"links": {}, "total_cost": {"amount": "8.00", "currency": "USD"}, "costs": list(rows.values())}
+    if call.params.get("settings[aggregate_by]") == "count":
+        days = [group[0] for group in rows]
+        body["counts"] = [{"accrued_at": day, "count": days.count(day)} for day in dict.fromkeys(days)]
+        body["total_count"] = len(rows)
+    return body
+
+
+@pytest.mark.parametrize("aggregate_by", ["cost", "count"])
+def test_cost_cache_roll_up_matches_the_api(monkeypatch, aggregate_by):
+    query = CostsGetParametersQuery(
+        cost_report_token="rprt_1", groupings=["provider", "service", "region"], settings_aggregate_by_=aggregate_by
+    )
+    coarse = query.model_copy(update={"groupings": ["provider", "service"]})
+    sdk = VantageSDK(api_key="test", cost_cache=CostCache(backend=MemoryCacheBackend()))
+    api = fake_api(monkeypatch, sdk, _grouping_api)
+    uncached = VantageSDK(api_key="test")
+    fake_api(monkeypatch, uncached, _grouping_api)
+
+    sdk.get_cost_report_costs(query)
+    rolled_up = sdk.get_cost_report_costs(coarse)
+
+    assert rolled_up.model_dump(exclude_none=True) == uncached.get_cost_report_costs(coarse).model_dump(
+        exclude_none=True
+    )
+    # Counts of distinct groups cannot be summed, so those are always fetched
+    assert len(api.calls) == (1 if aggregate_by == "cost" else 2)
+
+
+def test_rolled_up_counts_are_counted_again():
+    body = _grouping_api(
+        Call("GET", "costs", {"groupings": ["provider", "service", "region"], "settings[aggregate_by]": "count"}, None)
+    )
+
+    rolled = roll_up_costs(body, ["provider", "service"])
+
+    assert rolled["counts"] == [{"accrued_at": "2024-01-01", "count": 2}, {"accrued_at": "2024-01-02", "count": 2}]
+    assert rolled["total_count"] == 4
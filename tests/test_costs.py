@@ -0,0 +1,104 @@
+from datetime import date
+
+import pytest
+
+from tests.helpers import daily_costs, fake_api
+from vantage_sdk import VantageSDK, concurrency_limit
+from vantage_sdk.cache import MemoryCacheBackend
+from vantage_sdk.concurrency import call_concurrency
+from vantage_sdk.cost_cache import CostCache
+from vantage_sdk.costs import shard_cost_params, shard_windows
+from vantage_sdk.models import CostsGetParametersQuery, CostsGetParametersQueryDateBin
+
+
+def test_shard_windows_keep_date_bins_whole():
+    assert shard_windows(date(2024, 1, 1), date(2024, 1, 10), CostsGetParametersQueryDateBin.day, 4) == [
+        (date(2024, 1, 1), date(2024, 1, 4)),
+        (date(2024, 1, 5), date(2024, 1, 8)),
+        (date(2024, 1, 9), date(2024, 1, 10)),
+    ]
+    # Monthly bins are never split, even when a month is longer than the shard
+    assert shard_windows(date(2024, 1, 15), date(2024, 3, 10), CostsGetParametersQueryDateBin.month, 7) == [
+        (date(2024, 1, 15), date(2024, 1, 31)),
+        (date(2024, 2, 1), date(2024, 2, 29)),
+        (date(2024, 3, 1), date(2024, 3, 10)),
+    ]
+    with pytest.raises(ValueError):
+        shard_windows(date(2024, 1, 1), date(2024, 2, 1), CostsGetParametersQueryDateBin.week, 7)
+
+
+def test_sharded_cost_report_costs_recomputes_totals(monkeypatch):
+    sdk = VantageSDK(api_key="test")
+    api = fake_api(
+        monkeypatch,
+        sdk,
+        lambda call: {
+            "links": {},
+            "total_cost": {"amount": "1.25", "currency": "USD"},
+            "total_usage": [{"amount": "2.5", "unit": "Hrs"}],
+            "costs": [{"accrued_at": call.params["start_date"], "amount": "1.25", "currency": "USD"}],
+        },
+    )
+
+    query = CostsGetParametersQuery(
+        cost_report_token="rprt_123", start_date="2024-01-01", end_date="2024-01-10", date_bin="day", order="asc"
+    )
+    costs = sdk.get_cost_report_costs(query, shard_days=3)
+
+    assert sorted((call.params["start_date"], call.params["end_date"]) for call in api.calls) == [
+        ("2024-01-01", "2024-01-03"),
+        ("2024-01-04", "2024-01-06"),
+        ("2024-01-07", "2024-01-09"),
+        ("2024-01-10", "2024-01-10"),
+    ]
+    assert [cost.accrued_at for cost in costs.costs] == ["2024-01-01", "2024-01-04", "2024-01-07", "2024-01-10"]
+    assert costs.total_cost.amount == "5.00"
+    assert [(usage.amount, usage.unit) for usage in costs.total_usage] == [("10.0", "Hrs")]
+
+
+@pytest.mark.parametrize("cost_cache", [None, CostCache(backend=MemoryCacheBackend())])
+def test_sharded_costs_keep_the_callers_concurrency_limit(monkeypatch, cost_cache):
+    sdk = VantageSDK(api_key="test", max_concurrency=8, rate_limits={"costs": None}, cost_cache=cost_cache)
+    limits = []
+
+    def answer(call):
+        limits.append(call_concurrency())
+        return daily_costs(call)
+
+    api = fake_api(monkeypatch, sdk, answer, delay=0.01)
+    query = CostsGetParametersQuery(
+        cost_report_token="rprt_1", start_date="2024-01-01", end_date="2024-06-30", date_bin="day"
+    )
+
+    with concurrency_limit(2):
+        sdk.get_cost_report_costs(query, shard_days=30)
+
+    # Every window sees the limit set around the call, not only the thread that made it
+    assert len(limits) > 2 and set(limits) == {2}
+    assert api.peak <= 2
+
+
+def test_shards_keep_the_exact_bounds_of_the_period():
+    query = CostsGetParametersQuery(
+        start_date="2024-01-01T06:00:00Z", end_date="2024-01-10T18:00:00Z", date_bin="hour", order="asc"
+    )
+
+    assert [(shard.start_date, shard.end_date) for shard in shard_cost_params(query, 4)] == [
+        ("2024-01-01T06:00:00Z", "2024-01-04"),
+        ("2024-01-05", "2024-01-08"),
+        ("2024-01-09", "2024-01-10T18:00:00Z"),
+    ]
+
+
+@pytest.mark.parametrize("order", ["asc", "desc"])
+def test_sharded_costs_match_the_unsharded_response(monkeypatch, order):
+    sdk = VantageSDK(api_key="test")
+    api = fake_api(monkeypatch, sdk, daily_costs)
+    query = CostsGetParametersQuery(
+        cost_report_token="rprt_123", start_date="2024-01-01", end_date="2024-01-10", date_bin="day", order=order
+    )
+
+    sharded = sdk.get_cost_report_costs(query, shard_days=3)
+
+    assert len(api.calls) == 4
+    assert sharded == sdk.get_cost_report_costs(query)
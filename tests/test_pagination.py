@@ -0,0 +1,266 @@
+import asyncio
+import gc
+import threading
+import time
+
+import pytest
+from httpx import Request, Response
+from pydantic import BaseModel
+
+from tests.helpers import FakeAPI, fake_api, integration, links, respond
+from vantage_sdk import AsyncVantageSDK, RetryPolicy, VantageSDK
+from vantage_sdk.client import ssl_context_of
+from vantage_sdk.loop import PaginationExecutor
+
+
+def _folders(call):
+    return {"links": links("folders", last=3), "folders": [{"page": call.page}]}
+
+
+def test_paginated_calls_share_pooled_async_session(monkeypatch):
+    sdk = VantageSDK(api_key="test")
+    async_session = sdk.async_session
+    FakeAPI(_folders).install(monkeypatch, sdk.session)
+    pages = FakeAPI(_folders).install(monkeypatch, async_session)
+
+    first = sdk._get_paginated("folders")
+    second = sdk._get_paginated("folders")
+
+    assert first == second == {"folders": [{"page": 1}, {"page": 2}, {"page": 3}]}
+    # Pages 2..N of both calls went through the one AsyncClient, authenticated like the sync session
+    assert pages.pages == [2, 3, 2, 3] and sdk.async_session is async_session
+    assert all(call.headers["Authorization"] == "Bearer test" for call in pages.calls)
+    assert ssl_context_of(sdk.session) is async_session._transport._pool._ssl_context
+    sdk.close()
+
+
+def test_unreferenced_sdk_releases_its_loop_thread(monkeypatch):
+    sdk = VantageSDK(api_key="test")
+    fake_api(monkeypatch, sdk, _folders)
+    sdk._get_paginated("folders")
+    thread = sdk._loop._thread
+    assert thread.is_alive()
+
+    # Never closed, yet dropping the SDK stops its loop
+    del sdk
+    gc.collect()
+    thread.join(5)
+    assert not thread.is_alive()
+
+
+def test_paginated_inside_running_event_loop(monkeypatch):
+    sdk = VantageSDK(api_key="test")
+    fake_api(monkeypatch, sdk, _folders)
+
+    async def handler():
+        # e.g. a FastAPI handler or a Jupyter cell calling the sync SDK
+        return sdk._get_paginated("folders")
+
+    assert asyncio.run(handler())["folders"] == [{"page": 1}, {"page": 2}, {"page": 3}]
+
+
+def test_paginated_falls_back_to_threads_on_background_loop(monkeypatch):
+    sdk = VantageSDK(api_key="test")
+    page_threads = set()
+
+    def answer(call):
+        page_threads.add((call.page, threading.current_thread().name))
+        return _folders(call)
+
+    fake_api(monkeypatch, sdk, answer)
+
+    async def on_background_loop():
+        return sdk._get_paginated("folders")
+
+    result = sdk._loop.run(on_background_loop())
+
+    assert result["folders"] == [{"page": 1}, {"page": 2}, {"page": 3}]
+    assert all(name.startswith("vantage-sdk-page") for page, name in page_threads if page > 1)
+
+
+def test_paginated_keeps_fetching_past_a_slow_page(monkeypatch):
+    sdk = VantageSDK(api_key="test", max_concurrency=3)
+    finished = []
+
+    def answer(call):
+        finished.append(call.page)
+        return {"links": links("integrations", last=10) if call.page == 1 else {}, "integrations": [call.page]}
+
+    fake_api(monkeypatch, sdk, answer, delay=lambda call: 0.3 if call.page == 2 else 0.01)
+
+    result = sdk._get_paginated("integrations")
+
+    # Every other page completes while page 2 is slow, yet the pages are still merged in order
+    assert result["integrations"] == list(range(1, 11))
+    assert finished[-1] == 2
+
+
+# ---- Streaming ----
+
+
+def test_iter_integrations_streams_pages_in_order(monkeypatch):
+    sdk = VantageSDK(api_key="test", max_concurrency=3)
+
+    def answer(call):
+        page_links = links("integrations", last=20) if call.page == 1 else {}
+        return {"links": page_links, "integrations": [integration(call.page)]}
+
+    # Later pages finish first, they must still be yielded in order
+    api = fake_api(monkeypatch, sdk, answer, delay=lambda call: 0.05 / call.page if call.page > 1 else 0)
+
+    integrations = sdk.iter_integrations()
+    assert [next(integrations).token for _ in range(4)] == [f"accss_crdntl_{page}" for page in range(1, 5)]
+    # Only a window of pages as large as the concurrency limit is requested ahead of the caller
+    assert max(api.pages) <= 7
+    integrations.close()
+
+    pages = list(sdk.iter_integrations_pages())
+    assert [page.integrations[0].token for page in pages] == [f"accss_crdntl_{page}" for page in range(1, 21)]
+    assert all(page.links is None for page in pages)
+
+
+class _Page(BaseModel):
+    """A page of numbers, without the links the API sends along with it"""
+
+    costs: list[int] = []
+    integrations: list[int] = []
+
+
+def test_iter_pages_walks_costs_cursor_and_raises_on_failed_page(monkeypatch):
+    sdk = VantageSDK(
+        api_key="test", retry_policy=RetryPolicy(max_retries=0), pagination_executor=PaginationExecutor.threads
+    )
+
+    def answer(call):
+        if "integrations" in call.url:
+            body = {"links": links("integrations", last=3), "integrations": [call.page]}
+            return respond(call, 500 if call.page == 3 else 200, body)
+        return {"links": links("costs", next=call.page + 1) if call.page < 3 else {}, "costs": [call.page]}
+
+    fake_api(monkeypatch, sdk, answer)
+
+    assert [page.costs for page in sdk._iter_pages("costs", _Page)] == [[1], [2], [3]]
+
+    pages = sdk._iter_pages("integrations", _Page)
+    assert next(pages).integrations == [1]
+    assert next(pages).integrations == [2]
+    with pytest.raises(RuntimeError, match="HTTP error on page 3: 500"):
+        next(pages)
+
+
+def test_async_iter_audit_logs_pages(monkeypatch):
+    async def collect():
+        async with AsyncVantageSDK(api_key="test", max_concurrency=2) as sdk:
+            fake_api(
+                monkeypatch,
+                sdk,
+                lambda call: {"links": links("audit_logs", last=5) if call.page == 1 else {}, "audit_logs": []},
+            )
+            return [page async for page in sdk.iter_audit_logs_pages()]
+
+    assert len(asyncio.run(collect())) == 5
+
+
+# ---- Prefetching the /costs cursor ----
+
+
+def test_costs_cursor_reads_ahead_of_the_caller(monkeypatch):
+    sdk = VantageSDK(api_key="test", prefetch_depth=3, rate_limits={"costs": None})
+
+    def answer(call):
+        return {"links": links("costs", next=call.page + 1) if call.page < 8 else {}, "costs": [call.page]}
+
+    api = fake_api(monkeypatch, sdk, answer, delay=0.01)
+
+    pages = sdk._iter_pages("costs", _Page)
+    assert [next(pages).costs for _ in range(2)] == [[1], [2]]
+    time.sleep(0.2)
+    # While the caller holds page 2, the pages it links to are fetched in the background, up to 3 pages ahead
+    assert api.pages == [1, 2, 3, 4]
+    assert [page.costs for page in pages] == [[page] for page in range(3, 9)]
+    # Each page is only requested once a page links to it, so none is requested past the last one
+    assert api.pages == list(range(1, 9))
+    assert api.peak == 1
+
+
+def test_async_costs_cursor_reads_ahead_until_the_last_page(monkeypatch):
+    async def collect():
+        async with AsyncVantageSDK(api_key="test", prefetch_depth=2, rate_limits={"costs": None}) as sdk:
+            api = fake_api(
+                monkeypatch,
+                sdk,
+                lambda call: {"links": links("costs", next=call.page + 1) if call.page < 4 else {}, "costs": [call.page]},
+            )
+            return await sdk._get_paginated("costs", collection_key="costs"), api.pages
+
+    result, pages = asyncio.run(collect())
+    assert result["costs"] == [1, 2, 3, 4]
+    assert pages == [1, 2, 3, 4]
+
+
+def _truncated_second_page(call):
+    if call.page == 2:
+        return Response(200, content=b'{"costs": [', request=Request(call.method, call.url))
+    return {"links": links("costs", next=call.page + 1), "costs": [call.page]}
+
+
+def test_costs_cursor_read_ahead_raises_when_a_page_is_not_json(monkeypatch):
+    sdk = VantageSDK(api_key="test", prefetch_depth=2, rate_limits={"costs": None})
+    fake_api(monkeypatch, sdk, _truncated_second_page)
+
+    raised = []
+
+    def collect():
+        try:
+            sdk._get_paginated("costs", collection_key="costs")
+        except ValueError as exc:
+            raised.append(exc)
+
+    # The worker dies on page 2, and the caller gets its error instead of waiting forever
+    caller = threading.Thread(target=collect, daemon=True)
+    caller.start()
+    caller.join(5)
+    assert not caller.is_alive()
+    assert len(raised) == 1
+
+
+def test_async_costs_cursor_read_ahead_raises_when_a_page_is_not_json(monkeypatch):
+    async def collect():
+        async with AsyncVantageSDK(api_key="test", prefetch_depth=2, rate_limits={"costs": None}) as sdk:
+            fake_api(monkeypatch, sdk, _truncated_second_page)
+            return await asyncio.wait_for(sdk._get_paginated("costs", collection_key="costs"), 5)
+
+    with pytest.raises(ValueError):
+        asyncio.run(collect())
+
+
+def test_costs_cursor_speculative_prefetch_overlaps_pages(monkeypatch):
+    sdk = VantageSDK(api_key="test", prefetch_depth=3, speculative_prefetch=True, rate_limits={"costs": None})
+
+    def answer(call):
+        page_links = links("costs", next=call.page + 1) if call.page < 5 else {}
+        return {"links": page_links, "costs": [call.page] if call.page <= 5 else []}
+
+    api = fake_api(monkeypatch, sdk, answer, delay=0.01)
+
+    result = sdk._get_paginated("costs", collection_key="costs")
+
+    # Pages past the last one may be requested speculatively but are never merged
+    assert result["costs"] == [1, 2, 3, 4, 5]
+    assert api.peak == 3
+
+
+def test_costs_cursor_speculative_prefetch_stops_at_first_empty_page(monkeypatch):
+    async def collect():
+        async with AsyncVantageSDK(
+            api_key="test", prefetch_depth=4, speculative_prefetch=True, rate_limits={"costs": None}
+        ) as sdk:
+            # The API keeps linking to a next page, but everything after page 3 is empty
+            fake_api(
+                monkeypatch,
+                sdk,
+                lambda call: {"links": links("costs", next=call.page + 1), "costs": [call.page] if call.page <= 3 else []},
+            )
+            return await sdk._get_paginated("costs", collection_key="costs")
+
+    assert asyncio.run(collect())["costs"] == [1, 2, 3]
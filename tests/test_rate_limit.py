@@ -0,0 +1,47 @@
+import time
+
+import pytest
+
+from tests.helpers import fake_api, links
+from vantage_sdk import RateLimit, VantageSDK
+from vantage_sdk.rate_limit import TokenBucket
+
+
+def test_token_bucket_never_exceeds_budget_in_any_window():
+    bucket = TokenBucket(RateLimit(requests=3, period=5.0), margin=0)
+
+    delays = [bucket.reserve() for _ in range(7)]
+
+    assert delays[:3] == pytest.approx([0, 0, 0], abs=0.01)
+    assert delays[3:6] == pytest.approx([5, 5, 5], abs=0.01)
+    assert delays[6] == pytest.approx(10, abs=0.01)
+
+
+def test_costs_pagination_is_rate_limited(monkeypatch):
+    sdk = VantageSDK(api_key="test", rate_limits={"/costs": RateLimit(requests=2, period=0.2)})
+    start_times = []
+
+    def answer(call):
+        start_times.append(time.monotonic())
+        return {"links": links("costs", next=call.page + 1) if call.page < 5 else {}, "costs": [call.page]}
+
+    fake_api(monkeypatch, sdk, answer)
+
+    result = sdk._get_paginated("costs", collection_key="costs")
+
+    assert result["costs"] == [1, 2, 3, 4, 5]
+    # No more than 2 requests may start within any 0.2 second window
+    for earlier, later in zip(start_times, start_times[2:]):
+        assert later - earlier >= 0.2
+    assert sdk.rate_limiter.bucket_for("costs/data_exports") is None
+
+
+def test_rate_limits_are_merged_over_the_defaults():
+    sdk = VantageSDK(api_key="test", rate_limits={"business_metrics/*/values": RateLimit(requests=20, period=1.0)})
+
+    # Supplying a limit for another endpoint keeps the documented /costs limit
+    assert sdk.rate_limiter.rate_limits == {
+        "costs": RateLimit(requests=5, period=5.0),
+        "business_metrics/*/values": RateLimit(requests=20, period=1.0),
+    }
+    assert VantageSDK(api_key="test", rate_limits={"costs": None}).rate_limiter.bucket_for("costs") is None
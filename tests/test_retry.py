@@ -0,0 +1,52 @@
+import time
+
+import pytest
+
+from tests.helpers import fake_api, links, respond
+from vantage_sdk import RetryPolicy, VantageSDK
+
+
+def test_paginated_retries_only_the_failed_page(monkeypatch):
+    sdk = VantageSDK(api_key="test", retry_policy=RetryPolicy(backoff_factor=0))
+
+    def answer(call):
+        if call.page == 3 and api.pages.count(3) == 1:
+            return respond(call, 502)
+        return {"links": links("integrations", last=5) if call.page == 1 else {}, "integrations": [call.page]}
+
+    api = fake_api(monkeypatch, sdk, answer)
+
+    result = sdk._get_paginated("integrations")
+
+    assert result["integrations"] == [1, 2, 3, 4, 5]
+    assert sorted(api.pages) == [1, 2, 3, 3, 4, 5]
+
+
+def test_retry_honors_retry_after(monkeypatch):
+    sdk = VantageSDK(api_key="test", retry_policy=RetryPolicy(backoff_factor=0))
+    start_times = []
+
+    def answer(call):
+        start_times.append(time.monotonic())
+        if len(start_times) == 1:
+            return respond(call, 429, headers={"Retry-After": "0.2"})
+        return {"links": {}, "costs": []}
+
+    fake_api(monkeypatch, sdk, answer)
+
+    assert sdk._get("costs") == {"links": {}, "costs": []}
+    assert start_times[1] - start_times[0] >= 0.2
+
+
+def test_retry_gives_up_after_max_retries(monkeypatch):
+    sdk = VantageSDK(api_key="test", retry_policy=RetryPolicy(max_retries=2, backoff_factor=0))
+    api = fake_api(monkeypatch, sdk, lambda call: respond(call, 504))
+
+    with pytest.raises(Exception, match="504"):
+        sdk._get("integrations")
+    assert len(api.calls) == 3
+
+    # POST is not retried on a 5xx since the server may have processed it
+    api.calls.clear()
+    assert sdk._request("POST", "integrations", json={}).status_code == 504
+    assert len(api.calls) == 1
@@ -0,0 +1,90 @@
+import copy
+import pickle
+
+import pytest
+from httpx import Response
+from pydantic import ValidationError
+
+from tests.helpers import costs_body, fake_api, integration, links
+from vantage_sdk import ResponseCache, VantageSDK
+from vantage_sdk.lazy import LazySequence
+from vantage_sdk.models import Costs, CostsGetParametersQuery, TeamTokenParams
+
+
+def test_gets_validate_raw_bodies_without_decoding(monkeypatch):
+    sdk = VantageSDK(api_key="test", cache=ResponseCache(ttl=60))
+    team = {
+        "token": "team_1",
+        "name": "Cost Savers",
+        "description": None,
+        "workspace_tokens": [],
+        "user_emails": [],
+        "user_tokens": [],
+        "default_dashboard_token": None,
+    }
+    api = fake_api(monkeypatch, sdk, team)
+    monkeypatch.setattr(Response, "json", lambda self: pytest.fail("response decoded before validation"))
+
+    first = sdk.get_team(TeamTokenParams(team_token="team_1"))
+    cached = sdk.get_team(TeamTokenParams(team_token="team_1"))
+
+    assert first == cached and first is not cached
+    assert first.name == "Cost Savers"
+    assert len(api.calls) == 1
+
+
+@pytest.mark.parametrize("prefetch_depth", [0, 2])
+def test_streamed_pages_validate_raw_bodies_without_decoding(monkeypatch, prefetch_depth):
+    sdk = VantageSDK(api_key="test", prefetch_depth=prefetch_depth, rate_limits={"costs": None})
+
+    def answer(call):
+        if "integrations" in call.url:
+            return {"links": links("integrations", last=3), "integrations": [integration(call.page)]}
+        body = costs_body(f"2024-01-0{call.page}")
+        body["links"] = links("costs", next=call.page + 1) if call.page < 3 else {}
+        return body
+
+    fake_api(monkeypatch, sdk, answer)
+    for module in ("vantage_sdk.client", "vantage_sdk.pagination"):
+        monkeypatch.setattr(f"{module}.from_json", lambda data: pytest.fail("page decoded before validation"))
+
+    costs = list(sdk.iter_cost_report_costs_pages(CostsGetParametersQuery(cost_report_token="rprt_1")))
+    assert [page.costs[0].accrued_at for page in costs] == ["2024-01-01", "2024-01-02", "2024-01-03"]
+    assert all(page.links is None for page in costs)
+    assert [item.token for item in sdk.iter_integrations()] == [f"accss_crdntl_{page}" for page in range(1, 4)]
+
+
+def test_lazy_collections_validate_items_on_first_access(monkeypatch):
+    sdk = VantageSDK(api_key="test", lazy_collections=True)
+    body = costs_body("2024-01-01", "2024-01-02", "2024-01-03")
+    body["costs"][2]["amount"] = None
+    fake_api(monkeypatch, sdk, lambda call: body)
+
+    costs = sdk.get_cost_report_costs(CostsGetParametersQuery(cost_report_token="rprt_1"))
+    assert isinstance(costs.costs, LazySequence)
+    assert len(costs.costs) == 3 and costs.costs.validated == 0
+    assert costs.costs[0].accrued_at == "2024-01-01"
+    assert costs.costs[0] is costs.costs[0]
+    assert costs.costs.validated == 1
+    assert [cost["amount"] for cost in costs.costs.raw_items] == ["1.25", "1.25", None]
+    with pytest.raises(ValidationError):
+        costs.costs[2]
+
+    body["costs"].pop()
+    costs = sdk.get_cost_report_costs(CostsGetParametersQuery(cost_report_token="rprt_1"))
+    assert costs.model_dump(mode="json", exclude_none=True)["costs"][1] == body["costs"][1]
+    assert costs.costs == Costs.model_validate(body).costs
+
+
+def test_lazy_collections_copy_and_pickle(monkeypatch):
+    sdk = VantageSDK(api_key="test", lazy_collections=True)
+    fake_api(monkeypatch, sdk, costs_body("2024-01-01", "2024-01-02"))
+
+    costs = sdk.get_cost_report_costs(CostsGetParametersQuery(cost_report_token="rprt_1"))
+    costs.costs[0]
+
+    for copied in (copy.deepcopy(costs), costs.model_copy(deep=True), pickle.loads(pickle.dumps(costs))):
+        assert isinstance(copied.costs, LazySequence)
+        assert copied.costs is not costs.costs and copied.costs.validated == 0
+        assert copied == costs
+        assert copied.costs[1].accrued_at == "2024-01-02"
@@ -1,8 +1,23 @@
 import logging
 
+from .async_client import AsyncVantageSDK
+from .cache import ResponseCache
 from .client import VantageSDK
+from .concurrency import AdaptiveConcurrency, concurrency_limit
+from .cost_cache import CostCache
+from .rate_limit import RateLimit
+from .retry import RetryPolicy
 
 logger = logging.getLogger(__name__)
 logger.addHandler(logging.NullHandler())
 
-__all__ = ["VantageSDK"]
+__all__ = [
+    "AdaptiveConcurrency",
+    "AsyncVantageSDK",
+    "CostCache",
+    "RateLimit",
+    "ResponseCache",
+    "RetryPolicy",
+    "VantageSDK",
+    "concurrency_limit",
+]
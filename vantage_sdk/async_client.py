@@ -0,0 +1,3963 @@
+import asyncio
+import logging
+import time
+from collections.abc import AsyncGenerator, AsyncIterator, Awaitable, Callable, Iterable, Mapping, Sequence
+from functools import partial
+from itertools import count
+from types import TracebackType
+from typing import TYPE_CHECKING, Any, Self
+from urllib.parse import urljoin
+
+from httpx import AsyncClient, HTTPError, HTTPStatusError, Response, Timeout
+from pydantic import BaseModel
+from pydantic_core import from_json
+
+from vantage_sdk.cache import (
+    ResponseCache,
+    background_refresh,
+    in_background_refresh,
+    invalidates,
+    request_key,
+    response_validators,
+)
+from vantage_sdk.client import BASE_URL, POOL_LIMITS, HttpStatusCode, PollInterval
+from vantage_sdk.concurrency import (
+    DEFAULT_MAX_CONCURRENCY,
+    AdaptiveConcurrency,
+    AIMDLimit,
+    ConcurrencyController,
+    call_concurrency,
+    resolve_concurrency,
+)
+from vantage_sdk.cost_cache import CostCache
+from vantage_sdk.costs import merge_cost_shards, shard_cost_params
+from vantage_sdk.models import (
+    AccessGrant,
+    AccessGrants,
+    AccessGrantTokenParams,
+    AnomalyAlert,
+    AnomalyAlerts,
+    AnomalyAlertsGetParametersQuery,
+    AnomalyAlertTokenParams,
+    AnomalyNotification,
+    AnomalyNotifications,
+    AnomalyNotificationTokenParams,
+    AsyncVirtualTagConfigUpdate,
+    AuditLog,
+    AuditLogs,
+    AuditLogsGetParametersQuery,
+    AuditLogTokenParams,
+    BillingRule,
+    BillingRules,
+    BillingRuleTokenParams,
+    Budget,
+    BudgetAlert,
+    BudgetAlerts,
+    BudgetAlertsBudgetAlertTokenPutRequest,
+    BudgetAlertsPostRequest,
+    BudgetAlertTokenParams,
+    Budgets,
+    BudgetsBudgetTokenGetParametersQuery,
+    BudgetTokenParams,
+    BusinessMetric,
+    BusinessMetricLabels,
+    BusinessMetrics,
+    BusinessMetricsBusinessMetricTokenLabelsGetParametersQuery,
+    BusinessMetricsBusinessMetricTokenValuesDeleteParametersQuery,
+    BusinessMetricsBusinessMetricTokenValuesGetParametersQuery,
+    BusinessMetricsGetParametersQuery,
+    BusinessMetricTokenParams,
+    BusinessMetricValue,
+    BusinessMetricValues,
+    BusinessMetricValuesDeleteResponse,
+    Canvas,
+    Canvases,
+    CanvasesGetParametersQuery,
+    CanvasTokenParams,
+    Cost,
+    CostAlert,
+    CostAlertEvent,
+    CostAlertEvents,
+    CostAlertEventTokenParams,
+    CostAlerts,
+    CostAlertsCostAlertTokenEventsGetParametersQuery,
+    CostAlertTokenParams,
+    CostProviders,
+    CostReport,
+    CostReports,
+    CostReportsCostReportTokenForecastedCostsGetParametersQuery,
+    CostReportTokenParams,
+    Costs,
+    CostsDataExportsPostRequest,
+    CostServices,
+    CostsGetParametersQuery,
+    CreateAccessGrant,
+    CreateAnomalyNotification,
+    CreateAzureIntegration,
+    CreateBillingRule,
+    CreateBudget,
+    CreateBusinessMetric,
+    CreateCanvas,
+    CreateCostAlert,
+    CreateCostReport,
+    CreateCustomProviderIntegration,
+    CreateDashboard,
+    CreateFinancialCommitmentReport,
+    CreateFolder,
+    CreateGCPIntegration,
+    CreateKubernetesEfficiencyReport,
+    CreateManagedAccount,
+    CreateNetworkFlowReport,
+    CreateReportNotification,
+    CreateResourceReport,
+    CreateSavedFilter,
+    CreateSegment,
+    CreateSsoConnectionForManagedAccount,
+    CreateTeam,
+    CreateUserFeedback,
+    CreateVirtualTagConfig,
+    CreateWorkspace,
+    Dashboard,
+    Dashboards,
+    DashboardsGetParametersQuery,
+    DashboardTokenParams,
+    DataExport,
+    DataExportTokenParams,
+    FinancialCommitmentReport,
+    FinancialCommitmentReports,
+    FinancialCommitmentReportTokenParams,
+    FinancialCommitments,
+    Folder,
+    Folders,
+    FolderTokenParams,
+    ForecastedCosts,
+    Integration,
+    Integrations,
+    IntegrationsGetParametersQuery,
+    IntegrationsIntegrationTokenPutRequest,
+    IntegrationTokenParams,
+    KubernetesEfficiencyReport,
+    KubernetesEfficiencyReports,
+    KubernetesEfficiencyReportTokenParams,
+    ManagedAccount,
+    ManagedAccounts,
+    ManagedAccountTokenParams,
+    Me,
+    NetworkFlowLogs,
+    NetworkFlowLogsGetParametersQuery,
+    NetworkFlowReport,
+    NetworkFlowReports,
+    NetworkFlowReportsGetParametersQuery,
+    NetworkFlowReportTokenParams,
+    Price,
+    Prices,
+    Product,
+    ProductIdParams,
+    ProductPriceIdParams,
+    Products,
+    Recommendation,
+    RecommendationResource,
+    RecommendationResources,
+    RecommendationResourceTokenParams,
+    Recommendations,
+    RecommendationsByTypeTypeResourcesGetParametersQuery,
+    RecommendationTokenParams,
+    RecommendationTypeParams,
+    ReportNotification,
+    ReportNotifications,
+    ReportNotificationTokenParams,
+    Resource,
+    ResourceReport,
+    ResourceReports,
+    ResourceReportTokenParams,
+    Resources,
+    ResourcesGetParametersQuery,
+    ResourceTokenParams,
+    SavedFilter,
+    SavedFilters,
+    SavedFilterTokenParams,
+    Segment,
+    Segments,
+    SegmentTokenParams,
+    TagKeyParams,
+    Tags,
+    TagsGetParametersQuery,
+    TagsKeyValuesGetParametersQuery,
+    TagValues,
+    Team,
+    Teams,
+    TeamTokenParams,
+    UnitCosts,
+    UnitCostsDataExportsPostRequest,
+    UnitCostsGetParametersQuery,
+    UpdateAccessGrant,
+    UpdateAnomalyAlert,
+    UpdateAnomalyNotification,
+    UpdateAsyncVirtualTagConfig,
+    UpdateBillingRule,
+    UpdateBudget,
+    UpdateBusinessMetric,
+    UpdateCanvas,
+    UpdateCostAlert,
+    UpdateCostReport,
+    UpdateDashboard,
+    UpdateFinancialCommitmentReport,
+    UpdateFolder,
+    UpdateKubernetesEfficiencyReport,
+    UpdateManagedAccount,
+    UpdateMe,
+    UpdateNetworkFlowReport,
+    UpdateReportNotification,
+    UpdateResourceReport,
+    UpdateSegment,
+    UpdateSsoConnectionForManagedAccount,
+    UpdateTag,
+    UpdateTeam,
+    UpdateUser,
+    UpdateVirtualTagConfig,
+    User,
+    UserCostsUploads,
+    UserFeedback,
+    Users,
+    UserTokenParams,
+    VirtualTagConfig,
+    VirtualTagConfigs,
+    VirtualTagConfigsGetParametersQuery,
+    VirtualTagConfigStatus,
+    VirtualTagTokenParams,
+    Workspace,
+    Workspaces,
+    WorkspacesGetParametersQuery,
+    WorkspacesWorkspaceTokenPutRequest,
+    WorkspaceTokenParams,
+)
+from vantage_sdk.pagination import (
+    ModelPage,
+    Page,
+    is_empty_page,
+    merge_keys,
+    merge_page,
+    model_page,
+    page_content,
+    page_json,
+    parse_page,
+)
+from vantage_sdk.rate_limit import RateLimit, RateLimiter
+from vantage_sdk.retry import RetryPolicy, send_with_retry_async
+from vantage_sdk.singleflight import AsyncSingleFlight
+from vantage_sdk.validation import M, parse_response
+
+if TYPE_CHECKING:
+    # Only imported for annotations, as columnar results require the optional NumPy dependency
+    from vantage_sdk.columnar import Table
+
+logger = logging.getLogger(__name__)
+
+
+class AsyncVantageSDK:
+    """AsyncVantageSDK is an asyncio Python client for the Vantage API
+
+    Every endpoint of VantageSDK is mirrored here as a coroutine. All requests share one long-lived
+    AsyncClient, so connections are pooled and kept alive across calls. Close the client with `aclose`
+    or use it as an async context manager
+    """
+
+    _timeout = Timeout(60.0, read=None)
+
+    def __init__(
+        self,
+        api_key: str,
+        session: AsyncClient | None = None,
+        *,
+        max_concurrency: int = DEFAULT_MAX_CONCURRENCY,
+        endpoint_concurrency: Mapping[str, int] | None = None,
+        adaptive_concurrency: AdaptiveConcurrency | None = None,
+        rate_limits: Mapping[str, RateLimit | None] | None = None,
+        retry_policy: RetryPolicy | None = None,
+        cache: ResponseCache | None = None,
+        cost_cache: CostCache | None = None,
+        prefetch_depth: int = 0,
+        speculative_prefetch: bool = False,
+        lazy_collections: bool = False,
+    ):
+        self.base_url = BASE_URL
+        # Upper bound on the pages of a single paginated call that are fetched at once,
+        # endpoint_concurrency overrides it for endpoints matching a pattern, e.g. {"business_metrics/*/values": 4}
+        self.max_concurrency = max_concurrency
+        self.endpoint_concurrency: dict[str, int] = dict(endpoint_concurrency or {})
+        # With adaptive_concurrency those limits are only starting points, adjusted per endpoint from the
+        # status and latency of every response
+        self.concurrency_controller = ConcurrencyController(adaptive_concurrency)
+        # Per-endpoint request budgets shared by every request made through this client,
+        # defaults to the documented limits of the API such as 5 requests every 5 seconds for GET /costs
+        self.rate_limiter = RateLimiter(rate_limits)
+        # Every request, including each page of a paginated call, is retried on its own on 429 and 5xx,
+        # pass RetryPolicy(max_retries=0) to disable retries
+        self.retry_policy = retry_policy if retry_policy is not None else RetryPolicy()
+        # Pages requested ahead on endpoints that only link to their next page such as GET /costs,
+        # 0 walks them one page at a time
+        self.prefetch_depth = prefetch_depth
+        # Opt-in requests for the page numbers after the last page seen, before any page links to them, which
+        # may request pages past the last one
+        self.speculative_prefetch = speculative_prefetch
+        # Opt-in cache of GET responses, both single requests and the combined pages of paginated ones
+        self.cache = cache
+        # Identical GET requests made concurrently share a single request to the API
+        self._in_flight = AsyncSingleFlight()
+        # Background refreshes of stale cache entries by key, so each is refreshed once at a time
+        self._refresh_tasks: dict[str, asyncio.Task[None]] = {}
+        # Opt-in persistent cache of get_cost_report_costs results, trusting closed periods for longer
+        self.cost_cache = cost_cache
+        # With lazy_collections the items of Costs, Resources and AuditLogs responses are only validated when
+        # first accessed, so callers reading a few of them do not pay for all of them
+        self.lazy_collections = lazy_collections
+        # Preventing mutable default arguments
+        if session is None:
+            session = AsyncClient(timeout=self._timeout, limits=POOL_LIMITS)
+        self.session = session
+        self.session.timeout = self._timeout
+        self.session.headers.update(
+            {
+                "Accept": "application/json",
+                "Authorization": f"Bearer {api_key}",
+                "Content-Type": "application/json",
+            }
+        )
+
+    async def __aenter__(self) -> Self:
+        """Enter the async context manager, returning the SDK itself"""
+        return self
+
+    async def __aexit__(
+        self,
+        exc_type: type[BaseException] | None,
+        exc_value: BaseException | None,
+        traceback: TracebackType | None,
+    ) -> None:
+        """Exit the async context manager, closing the underlying AsyncClient"""
+        await self.aclose()
+
+    async def aclose(self) -> None:
+        """Cancel pending background refreshes, then close the underlying AsyncClient and release its connections"""
+        for task in list(self._refresh_tasks.values()):
+            task.cancel()
+        await self.session.aclose()
+
+    @property
+    def timeout(self) -> Timeout:
+        """Get the current timeout setting for API requests"""
+        return self._timeout
+
+    @timeout.setter
+    def timeout(self, value: Timeout) -> None:
+        self._timeout = value
+        self.session.timeout = value
+
+    # ---- Private Methods ----
+
+    async def _request(self, method: str, endpoint: str, **kwargs: Any) -> Response:
+        """
+        Send a request through the session once the endpoint's rate limit allows it, retrying it on transient
+        failures according to the retry policy
+
+        Args:
+            method: The HTTP method
+            endpoint: The API endpoint, relative to the base URL
+            **kwargs: Extra arguments passed to `AsyncClient.request`
+
+        Returns:
+            The HTTP response
+        """
+        url = urljoin(self.base_url, endpoint)
+
+        async def send() -> Response:
+            await self.rate_limiter.acquire_async(endpoint)
+            started = time.monotonic()
+            response = await self.session.request(method, url, **kwargs)
+            self.concurrency_controller.record(endpoint, response.status_code, time.monotonic() - started)
+            return response
+
+        try:
+            return await send_with_retry_async(self.retry_policy, method, send)
+        finally:
+            # Evict what a write may have changed, even if it failed, since it may have been applied anyway
+            if invalidates(method, endpoint):
+                self._invalidate(endpoint)
+
+    def _invalidate(self, endpoint: str) -> None:
+        """Evict the cached responses and cost results that a write to an endpoint may have changed"""
+        if self.cache is not None:
+            self.cache.invalidate(endpoint)
+        if self.cost_cache is not None:
+            self.cost_cache.invalidate(endpoint)
+
+    def _cache_lookup(
+        self, endpoint: str, params: dict[str, Any] | None, *, variant: str = "get"
+    ) -> tuple[str | None, bytes | None, bool]:
+        """
+        Look a GET request up in the response cache, if caching is enabled
+
+        Returns:
+            The cache key, None if the request is not cached, the raw JSON body of the cached response, None on a
+            miss, and whether it is stale and should be refreshed
+        """
+        if self.cache is None:
+            return None, None, False
+        return self.cache.lookup(endpoint, params, variant=variant, allow_stale=not in_background_refresh())
+
+    def _refresh_in_background(self, cache_key: str, refresh: Callable[[], Awaitable[object]]) -> None:
+        """
+        Refresh a stale cache entry in a background task, unless a refresh of it is already running
+
+        Args:
+            cache_key: The key of the stale entry
+            refresh: Fetches the response and stores it under `cache_key`
+        """
+        if cache_key in self._refresh_tasks:
+            return
+
+        async def run() -> None:
+            try:
+                with background_refresh():
+                    await refresh()
+            except Exception:
+                logger.warning("Background refresh of %s failed", cache_key, exc_info=True)
+
+        logger.debug("Refreshing stale cache entry %s in the background", cache_key)
+        task = asyncio.create_task(run())
+        self._refresh_tasks[cache_key] = task
+        task.add_done_callback(lambda _: self._refresh_tasks.pop(cache_key, None))
+
+    def _cache_store(
+        self,
+        cache_key: str | None,
+        endpoint: str,
+        body: bytes | dict[str, Any],
+        response: Response | None = None,
+        *,
+        page_validators: Sequence[Mapping[str, str]] = (),
+        generation: int | None = None,
+    ) -> None:
+        """
+        Store a GET response under the key returned by `_cache_lookup`, if it is cached, along with the ETag and
+        Last-Modified validators of `response`, or the conditional request headers of each page it combines.
+        Nothing is stored if a write evicted the endpoint since `generation` was read
+        """
+        if cache_key is not None and self.cache is not None:
+            etag = response.headers.get("ETag") if response is not None else None
+            last_modified = response.headers.get("Last-Modified") if response is not None else None
+            self.cache.store(
+                cache_key,
+                endpoint,
+                body,
+                etag=etag,
+                last_modified=last_modified,
+                page_validators=page_validators,
+                generation=generation,
+            )
+
+    def _cache_generation(self, endpoint: str) -> int | None:
+        """The generation of an endpoint in the response cache, read before requesting it"""
+        return self.cache.generation(endpoint) if self.cache is not None else None
+
+    def _parse(self, model: type[M], data: bytes | Mapping[str, Any]) -> M:
+        """
+        Validate the model of a response, leaving the items of its collection to be validated on first access with
+        `lazy_collections`
+
+        Args:
+            model: The model of the response
+            data: The raw JSON body, or the decoded response
+
+        Returns:
+            The model
+        """
+        return parse_response(model, data, self.lazy_collections)
+
+    async def _get(self, endpoint: str, params: dict[str, Any] | BaseModel | None = None) -> dict[str, Any]:
+        """
+        Perform a GET request to the specified endpoint
+
+        Args:
+            endpoint: The API endpoint to fetch data from
+            params: Optional query parameters for the request, must be a Pydantic model
+
+        Returns:
+            The JSON response from the API
+        """
+        return from_json(await self._get_raw(endpoint, params))
+
+    async def _get_raw(self, endpoint: str, params: dict[str, Any] | BaseModel | None = None) -> bytes:
+        """
+        Perform a GET request to the specified endpoint without decoding its response
+
+        Methods returning a model validate these bytes with `model_validate_json`, which parses them directly
+        into the model instead of building a dictionary and validating that in a second pass
+
+        Args:
+            endpoint: The API endpoint to fetch data from
+            params: Optional query parameters for the request, must be a Pydantic model
+
+        Returns:
+            The raw JSON body of the response
+        """
+        if isinstance(params, BaseModel):
+            params = params.model_dump(
+                mode="json",
+                by_alias=True,
+                exclude_none=True,
+                exclude_defaults=True,
+            )
+
+        cache_key, cached, stale = self._cache_lookup(endpoint, params)
+        if cached is not None:
+            if stale and cache_key is not None:
+                self._refresh_in_background(cache_key, partial(self._fetch, endpoint, params, cache_key))
+            return cached
+        fetch = partial(self._fetch, endpoint, params, cache_key)
+        return await self._in_flight.do(request_key(endpoint, params), fetch)
+
+    async def _fetch(self, endpoint: str, params: dict[str, Any] | None, cache_key: str | None) -> bytes:
+        """
+        Send a GET request and cache its response, revalidating the expired entry under `cache_key` if it has
+        validators
+
+        Args:
+            endpoint: The API endpoint to fetch data from
+            params: The query parameters of the request
+            cache_key: The key returned by `_cache_lookup`
+
+        Returns:
+            The raw JSON body of the response
+        """
+        generation = self._cache_generation(endpoint)
+        response = None
+        if self.cache is not None and cache_key is not None and (validators := self.cache.validators(cache_key)):
+            # Revalidate the expired entry, so an unchanged response is not downloaded again
+            response = await self._request("GET", endpoint, params=params, headers=validators)
+            if response.status_code == 304:
+                revalidated = self.cache.revalidate(cache_key, endpoint, generation)
+                if revalidated is not None:
+                    return revalidated
+                response = None
+        if response is None:
+            response = await self._request("GET", endpoint, params=params)
+        response.raise_for_status()
+        self._cache_store(cache_key, endpoint, response.content, response, generation=generation)
+        return response.content
+
+    async def _get_paginated(
+        self,
+        endpoint: str,
+        params: dict[str, Any] | BaseModel | None = None,
+        *,
+        collection_key: str | None = None,
+        max_concurrency: int | None = None,
+    ) -> dict[str, Any]:
+        """Fetch paginated results automatically, combining all pages into a single response dictionary
+
+        Logic:
+            If the response is not paginated, the result fails fast and raises an exception
+            If any of the requests fail, the entire operation fails and raises an exception,
+            so that partial data is not returned
+
+        Args:
+            endpoint: The API endpoint to fetch data from
+            params: Optional query parameters for the request, can be a Pydantic model or dict
+            collection_key: Optional response key to concatenate while preserving other response metadata
+            max_concurrency: Optional limit on the pages fetched at once, overrides the client and endpoint limits
+
+        Returns:
+            The combined response from all pages
+        """
+        # Initialize params if needed
+        if params is None:
+            params = {}
+        elif isinstance(params, BaseModel):
+            params = params.model_dump(mode="json", by_alias=True, exclude_none=True, exclude_defaults=True)
+
+        cache_key, cached, stale = self._cache_lookup(endpoint, params, variant=f"pages:{collection_key or ''}")
+        if cached is not None:
+            if stale and cache_key is not None:
+                refresh = partial(self._fetch_paginated, endpoint, params, cache_key, collection_key, max_concurrency)
+                self._refresh_in_background(cache_key, refresh)
+            return from_json(cached)
+        fetch = partial(self._fetch_paginated, endpoint, params, cache_key, collection_key, max_concurrency)
+        return await self._in_flight.do(request_key(endpoint, params, f"pages:{collection_key or ''}"), fetch)
+
+    async def _fetch_paginated(
+        self,
+        endpoint: str,
+        params: dict[str, Any],
+        cache_key: str | None,
+        collection_key: str | None,
+        max_concurrency: int | None,
+    ) -> dict[str, Any]:
+        """
+        Fetch every page of a paginated endpoint, combine them and cache the combined response
+
+        The combined response keeps the validators of each page. Once it expires, it is renewed if no page changed,
+        otherwise the pages that changed are reused and only the others are downloaded again
+
+        Args:
+            endpoint: The API endpoint to fetch data from
+            params: The query parameters shared by every page
+            cache_key: The key returned by `_cache_lookup`
+            collection_key: Optional response key to concatenate while preserving other response metadata
+            max_concurrency: Optional limit on the pages fetched at once, overrides the client and endpoint limits
+
+        Returns:
+            The combined response from all pages
+        """
+        generation = self._cache_generation(endpoint)
+        first_response = await self._get(endpoint, {**params, "page": 1})
+
+        total_pages = parse_page(first_response, "last")
+        next_page = parse_page(first_response, "next")
+
+        # If a normal paginated response returns 1 for total_pages, there is only one page
+        # or if the GET /costs endpoint returns None for total_pages and next_page
+        if total_pages == 1 or (total_pages is None and next_page is None):
+            first_response.pop("links", None)
+            self._cache_store(cache_key, endpoint, first_response, generation=generation)
+            return first_response
+
+        # Identify keys to merge (excluding links)
+        response_keys = merge_keys(first_response, collection_key)
+
+        # GET /costs is the only paginated endpoint that returns None for total_pages
+        # since Vantage doesn't provide the total number of pages
+        # We don't know total pages, so fetch next pages in sequence
+        if not total_pages:
+            async for page_num, page_data in self._walk_cursor(
+                endpoint, params, next_page, response_keys, self._get, from_json
+            ):
+                merge_page(first_response, page_data, response_keys, page_num)
+
+            first_response.pop("links", None)
+            self._cache_store(cache_key, endpoint, first_response, generation=generation)
+            return first_response
+
+        page_numbers = range(2, total_pages + 1)
+        concurrency = resolve_concurrency(endpoint, self.max_concurrency, self.endpoint_concurrency, max_concurrency)
+        limit = self.concurrency_controller.limit_for(
+            endpoint, concurrency, fixed=call_concurrency(max_concurrency) is not None
+        )
+        renewed, changed = await self._revalidate_pages(endpoint, params, cache_key, total_pages, limit, generation)
+        if renewed is not None:
+            return from_json(renewed)
+
+        # Pages that changed were downloaded while revalidating, only the others are fetched
+        reused = [(page_num, changed[page_num]) for page_num in page_numbers if page_num in changed]
+        missing = [page_num for page_num in page_numbers if page_num not in changed]
+        # Pages are decoded as they arrive, failing fast on the first one that failed, then merged in order
+        pages: dict[int, dict[str, Any]] = {}
+        validators = {1: self._first_page_validators(endpoint, params)}
+        for page_num, response in reused:
+            pages[page_num] = page_json(page_num, response)
+            validators[page_num] = response_validators(response)
+        fetches = self._page_fetches(endpoint, params, missing, limit)
+        try:
+            async for page_num, response in fetches:
+                pages[page_num] = page_json(page_num, response)
+                if isinstance(response, Response):
+                    validators[page_num] = response_validators(response)
+        finally:
+            await fetches.aclose()
+        for page_num in page_numbers:
+            merge_page(first_response, pages.pop(page_num), response_keys, page_num)
+
+        # Remove the links from the result
+        first_response.pop("links", None)
+        page_validators = [validators[page_num] for page_num in range(1, total_pages + 1)]
+        self._cache_store(cache_key, endpoint, first_response, page_validators=page_validators, generation=generation)
+
+        return first_response
+
+    def _first_page_validators(self, endpoint: str, params: dict[str, Any]) -> dict[str, str]:
+        """The conditional request headers that revalidate the first page of a paginated call, cached by `_get`"""
+        if self.cache is None:
+            return {}
+        key = self.cache.key(endpoint, {**params, "page": 1})
+        return self.cache.validators(key) if key is not None else {}
+
+    async def _revalidate_pages(
+        self,
+        endpoint: str,
+        params: dict[str, Any],
+        cache_key: str | None,
+        total_pages: int,
+        limit: AIMDLimit,
+        generation: int | None,
+    ) -> tuple[bytes | None, dict[int, Response]]:
+        """
+        Send a conditional request for pages 2 to `total_pages` of an expired combined response
+
+        `_get` revalidates the first page through its own entry. If that page kept the validators stored with the
+        combined response it is unchanged, along with the page count, so the other pages are revalidated with
+        theirs. Otherwise, or if some page has no validators, nothing is sent
+
+        Args:
+            endpoint: The API endpoint to fetch data from
+            params: The query parameters shared by every page
+            cache_key: The key returned by `_cache_lookup`
+            total_pages: The number of pages the first page links to
+            limit: The number of pages allowed in flight at once
+            generation: The generation of the endpoint in the response cache when the call started
+
+        Returns:
+            The raw JSON body of the renewed combined response, None unless every page was unchanged, and the
+            response of each page that changed
+        """
+        if self.cache is None or cache_key is None:
+            return None, {}
+        page_validators = self.cache.page_validators(cache_key)
+        if len(page_validators) != total_pages or page_validators[0] != self._first_page_validators(endpoint, params):
+            return None, {}
+        headers = dict(enumerate(page_validators[1:], start=2))
+        fetches = self._page_fetches(endpoint, params, headers, limit, headers=headers)
+        try:
+            responses = {page_num: response async for page_num, response in fetches}
+        finally:
+            await fetches.aclose()
+        if all(isinstance(response, Response) and response.status_code == 304 for response in responses.values()):
+            renewed = self.cache.revalidate(cache_key, endpoint, generation)
+            if renewed is not None:
+                return renewed, {}
+        # Pages whose request failed are fetched again along with the unchanged ones
+        return None, {
+            page_num: response
+            for page_num, response in responses.items()
+            if isinstance(response, Response) and response.status_code != 304 and not response.is_error
+        }
+
+    async def _walk_cursor(
+        self,
+        endpoint: str,
+        params: dict[str, Any],
+        next_page: int | None,
+        response_keys: Sequence[str],
+        get: Callable[[str, dict[str, Any]], Awaitable[Page]],
+        decode: Callable[[bytes], Page],
+    ) -> AsyncIterator[tuple[int, Page]]:
+        """
+        Walk an endpoint that only links to its next page, such as GET /costs, starting at `next_page`
+
+        By default each page is requested once the previous one arrived. With `prefetch_depth` set, the next links
+        are followed in the background up to that many pages ahead of the caller, so the next page is in flight
+        while earlier ones are merged, and nothing is requested past the last page. With `speculative_prefetch`
+        page numbers are requested ahead instead, since they are always consecutive, before any page links to
+        them. That walk stops at the first page without a next link or without items, and requests made past it
+        are cancelled or discarded
+
+        Args:
+            endpoint: The API endpoint to fetch data from
+            params: The query parameters shared by every page
+            next_page: The first page to fetch, None if there is none
+            response_keys: The keys of the response that hold its items
+            get: Requests a page the way `_get` does and decodes it, used when pages are fetched one at a time
+            decode: Decodes the raw body of a page fetched ahead of the caller
+
+        Yields:
+            The page number and decoded page of each page
+        """
+        if not self.prefetch_depth:
+            while next_page:
+                page_num = next_page
+                page_data = await get(endpoint, {**params, "page": page_num})
+                next_page = parse_page(page_data, "next")
+                yield page_num, page_data
+            return
+
+        if next_page is None:
+            return
+        if not self.speculative_prefetch:
+            pages = self._read_ahead(endpoint, params, next_page, decode)
+            try:
+                async for page in pages:
+                    yield page
+            finally:
+                await pages.aclose()
+            return
+
+        fetches = self._page_fetches(endpoint, params, count(next_page), AIMDLimit(self.prefetch_depth), ordered=True)
+        try:
+            async for page_num, response in fetches:
+                page_data = decode(page_content(page_num, response))
+                has_next = parse_page(page_data, "next") is not None
+                if is_empty_page(page_data, response_keys):
+                    logger.debug("Page %d of %s is empty, stopping", page_num, endpoint)
+                    return
+                yield page_num, page_data
+                if not has_next:
+                    return
+        finally:
+            await fetches.aclose()
+
+    async def _read_ahead(
+        self, endpoint: str, params: dict[str, Any], next_page: int, decode: Callable[[bytes], Page]
+    ) -> AsyncGenerator[tuple[int, Page]]:
+        """
+        Follow the next links of an endpoint in a background task, up to `prefetch_depth` pages ahead of the caller
+
+        Args:
+            endpoint: The API endpoint to fetch data from
+            params: The query parameters shared by every page
+            next_page: The first page to fetch
+            decode: Decodes the raw body of a page
+
+        Yields:
+            The page number and decoded page of each page
+        """
+        fetched: asyncio.Queue[tuple[int, Page] | BaseException | None] = asyncio.Queue()
+        # Each page fetched takes a slot until the caller moves past it
+        slots = asyncio.Semaphore(self.prefetch_depth)
+
+        async def follow() -> None:
+            page_num: int | None = next_page
+            try:
+                while page_num is not None:
+                    await slots.acquire()
+                    try:
+                        response = await self._request("GET", endpoint, params={**params, "page": page_num})
+                    except Exception as exc:
+                        response = exc
+                    page_data = decode(page_content(page_num, response))
+                    fetched.put_nowait((page_num, page_data))
+                    page_num = parse_page(page_data, "next")
+            except asyncio.CancelledError:
+                raise
+            except BaseException as exc:
+                # Whatever stops the task is raised to the caller, which would otherwise wait forever
+                fetched.put_nowait(exc)
+                return
+            fetched.put_nowait(None)
+
+        task = asyncio.create_task(follow())
+        try:
+            while (page := await fetched.get()) is not None:
+                if isinstance(page, BaseException):
+                    raise page
+                yield page
+                slots.release()
+        finally:
+            task.cancel()
+
+    async def _iter_pages(
+        self,
+        endpoint: str,
+        model: type[M],
+        params: dict[str, Any] | BaseModel | None = None,
+        *,
+        max_concurrency: int | None = None,
+    ) -> AsyncIterator[M]:
+        """
+        Yield the pages of a paginated endpoint in order, each as soon as it and the pages before it arrive
+
+        Unlike `_get_paginated` nothing is merged, and only a window of pages as large as the concurrency limit
+        is requested ahead of the caller, so memory stays bounded and processing overlaps with network I/O.
+        Pages the caller never reaches are not requested, and closing the iterator cancels those in flight.
+        Each page is validated straight from its raw body, without being decoded into a dictionary first
+
+        Args:
+            endpoint: The API endpoint to fetch data from
+            model: The model of each page
+            params: Optional query parameters for the request, can be a Pydantic model or dict
+            max_concurrency: Optional limit on the pages fetched at once, overrides the client and endpoint limits
+
+        Yields:
+            The model of each page, without its links
+        """
+        if params is None:
+            params = {}
+        elif isinstance(params, BaseModel):
+            params = params.model_dump(mode="json", by_alias=True, exclude_none=True, exclude_defaults=True)
+
+        decode = partial(model_page, model, lazy=self.lazy_collections)
+
+        async def get(endpoint: str, params: dict[str, Any]) -> ModelPage[M]:
+            return decode(await self._get_raw(endpoint, params))
+
+        first_page = await get(endpoint, {**params, "page": 1})
+        total_pages = parse_page(first_page, "last")
+        next_page = parse_page(first_page, "next")
+        response_keys = [field for field in model.model_fields if field != "links"]
+        yield first_page.model
+
+        # GET /costs only links to the next page, so it is walked by following those links
+        if not total_pages:
+            async for _, page in self._walk_cursor(endpoint, params, next_page, response_keys, get, decode):
+                yield page.model
+            return
+
+        concurrency = resolve_concurrency(endpoint, self.max_concurrency, self.endpoint_concurrency, max_concurrency)
+        limit = self.concurrency_controller.limit_for(
+            endpoint, concurrency, fixed=call_concurrency(max_concurrency) is not None
+        )
+        fetches = self._page_fetches(endpoint, params, range(2, total_pages + 1), limit, ordered=True)
+        try:
+            async for page_num, response in fetches:
+                yield decode(page_content(page_num, response)).model
+        finally:
+            await fetches.aclose()
+
+    async def _page_fetches(
+        self,
+        endpoint: str,
+        params: dict[str, Any],
+        page_numbers: Iterable[int],
+        limit: AIMDLimit,
+        *,
+        ordered: bool = False,
+        headers: Mapping[int, Mapping[str, str]] | None = None,
+    ) -> AsyncGenerator[tuple[int, Response | BaseException]]:
+        """
+        Fetch pages concurrently, yielding each as soon as it completes
+
+        Every paginated call runs on this engine: `_get_paginated` collects what it yields, while `_iter_pages`
+        and the prefetching cursor walk consume it in order. Pages are requested directly rather than through
+        `_get`, since a combined response is cached as a whole. At most `limit.limit` pages are in flight at any
+        time, which with `ordered` includes the pages that completed while waiting for an earlier one, so
+        `page_numbers` may be unbounded as long as the caller stops consuming. Closing the generator cancels the
+        requests still in flight
+
+        Args:
+            endpoint: The API endpoint to fetch data from
+            params: The query parameters shared by every page
+            page_numbers: The pages to fetch
+            limit: The number of pages allowed in flight at once
+            ordered: Whether to yield the pages in the order of `page_numbers` rather than as they complete
+            headers: Extra headers of the pages that need them, such as those of a conditional request
+
+        Yields:
+            The page number and the response, or the exception raised while requesting it, of each page
+        """
+        # Tasks in the order they were created, which is the order of `page_numbers`
+        pending: dict[asyncio.Task[Response], int] = {}
+        remaining = iter(page_numbers)
+        try:
+            while True:
+                while len(pending) < limit.limit and (page_num := next(remaining, None)) is not None:
+                    logger.debug("Fetching page %d of %s", page_num, endpoint)
+                    page_params = {**params, "page": page_num}
+                    page_headers = headers.get(page_num) if headers is not None else None
+                    task = asyncio.create_task(self._request("GET", endpoint, params=page_params, headers=page_headers))
+                    pending[task] = page_num
+                if not pending:
+                    return
+                if ordered:
+                    done = [next(iter(pending))]
+                    await asyncio.wait(done)
+                else:
+                    done, _ = await asyncio.wait(pending, return_when=asyncio.FIRST_COMPLETED)
+                for task in done:
+                    page_num = pending.pop(task)
+                    yield page_num, task.exception() or task.result()
+        finally:
+            for task in pending:
+                task.cancel()
+
+    async def _get_sharded_costs(self, cost_report_params: CostsGetParametersQuery, shard_days: int) -> dict[str, Any]:
+        """
+        Fetch costs one date window at a time, with windows fetched concurrently
+
+        GET /costs can only be walked page by page, so windows are the only way to fetch its pages in parallel.
+        All windows share the client's rate limiter, so together they stay within the endpoint's budget
+
+        Args:
+            cost_report_params: The parameters to filter costs
+            shard_days: The preferred number of days in each window
+
+        Returns:
+            The combined response of all windows
+        """
+        shards = shard_cost_params(cost_report_params, shard_days)
+        concurrency = resolve_concurrency("costs", self.max_concurrency, self.endpoint_concurrency)
+        logger.debug("Fetching costs in %d windows, %d at a time", len(shards), concurrency)
+        semaphore = asyncio.Semaphore(concurrency)
+
+        async def fetch_shard(shard_params: CostsGetParametersQuery) -> dict[str, Any]:
+            async with semaphore:
+                return await self._get_paginated("costs", shard_params, collection_key="costs")
+
+        return merge_cost_shards(
+            await asyncio.gather(*(fetch_shard(shard_params) for shard_params in shards)), cost_report_params.order
+        )
+
+    async def _fetch_costs(self, cost_report_params: CostsGetParametersQuery, shard_days: int | None) -> dict[str, Any]:
+        """Fetch the combined response of a costs query from the API, sharded when `shard_days` is set"""
+        if shard_days is not None:
+            return await self._get_sharded_costs(cost_report_params, shard_days)
+        return await self._get_paginated("costs", cost_report_params, collection_key="costs")
+
+    async def _get_cached_costs(
+        self, cost_cache: CostCache, cost_report_params: CostsGetParametersQuery, shard_days: int | None
+    ) -> dict[str, Any]:
+        """
+        Serve costs from the cost cache, fetching only the segments it does not hold
+
+        Missing segments are fetched concurrently and cached, then every segment is merged in the order the query
+        sorts its rows by
+
+        Args:
+            cost_cache: The cache to serve costs from
+            cost_report_params: The parameters to filter costs
+            shard_days: Optionally shard each missing segment into windows of about this many days
+
+        Returns:
+            The combined response of every segment
+        """
+        segments = cost_cache.segments(cost_report_params) or [cost_report_params]
+        cached = [cost_cache.load(segment) for segment in segments]
+        missing = [segment for segment, data in zip(segments, cached, strict=True) if data is None]
+        if missing:
+            logger.debug("Fetching %d of %d cost segments missing from the cache", len(missing), len(segments))
+        concurrency = resolve_concurrency("costs", self.max_concurrency, self.endpoint_concurrency)
+        # A sharded segment already fetches as many windows at once as the limit allows
+        semaphore = asyncio.Semaphore(1 if shard_days is not None else concurrency)
+
+        async def fetch_segment(segment: CostsGetParametersQuery) -> dict[str, Any]:
+            async with semaphore:
+                data = await self._fetch_costs(segment, shard_days)
+            cost_cache.store(segment, data)
+            return data
+
+        pieces = iter(await asyncio.gather(*(fetch_segment(segment) for segment in missing)))
+        shards = [data if data is not None else next(pieces) for data in cached]
+        return shards[0] if len(shards) == 1 else merge_cost_shards(shards, cost_report_params.order)
+
+    async def _get_costs(self, cost_report_params: CostsGetParametersQuery, shard_days: int | None) -> dict[str, Any]:
+        """Get the combined response of a costs query, through the cost cache when the client has one"""
+        if self.cost_cache is not None:
+            return await self._get_cached_costs(self.cost_cache, cost_report_params, shard_days)
+        return await self._fetch_costs(cost_report_params, shard_days)
+
+    async def _post(self, endpoint: str, params: BaseModel) -> dict[str, Any]:
+        """
+        Perform a POST request to the specified endpoint
+
+        Args:
+            endpoint: The API endpoint to post data to
+            params: The Pydantic model to serialize and send
+
+        Returns:
+            The JSON response from the API
+        """
+        json_data = params.model_dump(
+            mode="json",
+            by_alias=True,
+            exclude_none=True,
+            exclude_defaults=True,
+        )
+
+        response = await self._request("POST", endpoint, json=json_data)
+        response.raise_for_status()
+        return response.json()
+
+    async def _put(self, endpoint: str, params: BaseModel) -> dict[str, Any]:
+        """
+        Perform a PUT request to the specified endpoint
+
+        Args:
+            endpoint: The API endpoint to update data
+            params: The Pydantic model to serialize and send
+
+        Returns:
+            The JSON response from the API
+        """
+        json_data = params.model_dump(
+            mode="json",
+            by_alias=True,
+            exclude_none=True,
+            exclude_defaults=True,
+        )
+
+        response = await self._request("PUT", endpoint, json=json_data)
+        response.raise_for_status()
+        return response.json()
+
+    async def _delete(self, endpoint: str) -> HttpStatusCode:
+        """
+        Perform a DELETE request to the specified endpoint
+
+        Args:
+            endpoint: The API endpoint to delete data
+
+        Returns:
+            The HTTP status code of the response
+        """
+        response = await self._request("DELETE", endpoint)
+        response.raise_for_status()
+        return HttpStatusCode(response.status_code)
+
+    # ---- Folder APIs ----
+
+    async def get_all_folders(self) -> Folders:
+        """
+        Get all folders - GET /folders
+
+        Returns:
+            A Folders object which is a list of Folder objects
+
+        """
+        # getting all folders
+        paginated_data = await self._get_paginated("folders")
+        return self._parse(Folders, paginated_data)
+
+    async def create_folder(self, new_folder: CreateFolder) -> Folder:
+        """
+        Create a new folder - POST /folders
+
+        Args:
+            new_folder: The new folder object to create
+
+        Returns:
+            The created folder object
+        """
+        data = await self._post("folders", new_folder)
+        return self._parse(Folder, data)
+
+    async def get_folder(self, folder_token_params: FolderTokenParams) -> Folder:
+        """
+        Retrieve a specific folder - GET /folders/{folder_token}
+
+        Args:
+            folder_token_params: The token of the folder to retrieve, begins with 'fldr_'
+
+        Returns:
+            The folder object
+        """
+        folder_value = folder_token_params.folder_token
+        data = await self._get_raw(f"folders/{folder_value}")
+        return self._parse(Folder, data)
+
+    async def update_folder(self, folder_token_params: FolderTokenParams, folder_update: UpdateFolder) -> Folder:
+        """
+        Update a specific folder - PUT /folders/{folder_token}
+
+        Args:
+            folder_token_params: The token of the folder to update, begins with 'fldr_'
+            folder_update: The updated folder object
+
+        Returns:
+            The updated folder object
+        """
+        folder_value = folder_token_params.folder_token
+        data = await self._put(f"folders/{folder_value}", folder_update)
+        return self._parse(Folder, data)
+
+    async def delete_folder(self, folder_token_params: FolderTokenParams) -> HttpStatusCode:
+        """
+        Delete a specific folder - DELETE /folders/{folder_token}
+
+        Args:
+            folder_token_params: The token of the folder to delete, begins with 'fldr_'
+
+        Returns:
+            The HTTP status code of the response
+        """
+        folder_value = folder_token_params.folder_token
+        return await self._delete(f"folders/{folder_value}")
+
+    # ---- Cost APIs ----
+
+    async def get_all_cost_reports(self, folder_token_params: FolderTokenParams | None = None) -> CostReports:
+        """
+        Fetch cost reports - GET /cost_reports
+
+        Args:
+            folder_token_params: The token of the folder to fetch cost reports from, begins with 'fldr_'
+
+        Returns:
+            A list of CostReport objects
+        """
+        paginated_data = await self._get_paginated("cost_reports", folder_token_params)
+        return self._parse(CostReports, paginated_data)
+
+    async def create_cost_report(self, new_cost_report: CreateCostReport) -> CostReport:
+        """
+        Create a new cost report - POST /cost_reports
+
+        Args:
+            new_cost_report: The new cost report object to create
+
+        Returns:
+            The created cost report
+        """
+        data = await self._post("cost_reports", new_cost_report)
+        return self._parse(CostReport, data)
+
+    async def get_cost_report(self, cost_report_token_params: CostReportTokenParams) -> CostReport:
+        """
+        Retrieve a specific cost report - GET /cost_reports/{cost_report_token}
+
+        Args:
+            cost_report_token_params: The token of the cost report to retrieve, begins with 'rprt_'
+
+        Returns:
+            The cost report object
+        """
+        token_value = cost_report_token_params.cost_report_token
+        data = await self._get_raw(f"cost_reports/{token_value}")
+        return self._parse(CostReport, data)
+
+    async def update_cost_report(
+        self, cost_report_token_params: CostReportTokenParams, cost_report_update: UpdateCostReport
+    ) -> CostReport:
+        """
+        Update a specific cost report - PUT /cost_reports/{cost_report_token}
+
+        Args:
+            cost_report_token_params: The token of the cost report to update, begins with 'rprt_'
+            cost_report_update: The updated cost report object
+
+        Returns:
+            The updated cost report object
+        """
+        token_value = cost_report_token_params.cost_report_token
+        data = await self._put(f"cost_reports/{token_value}", cost_report_update)
+        return self._parse(CostReport, data)
+
+    async def delete_cost_report(self, cost_report_token_params: CostReportTokenParams) -> HttpStatusCode:
+        """
+        Delete a specific cost report - DELETE /cost_reports/{cost_report_token}
+
+        Args:
+            cost_report_token_params: The token of the cost report to delete, begins with 'rprt_'
+
+        Returns:
+            The HTTP status code of the response
+        """
+        token_value = cost_report_token_params.cost_report_token
+        return await self._delete(f"cost_reports/{token_value}")
+
+    async def get_cost_report_costs(
+        self, cost_report_params: CostsGetParametersQuery, *, shard_days: int | None = None
+    ) -> Costs:
+        """
+        Get all costs - GET /costs
+
+        Args:
+            cost_report_params: The parameters to filter costs
+            shard_days: Optionally split start_date..end_date into windows of about this many days that are fetched
+                concurrently. Requires start_date, end_date and a date_bin of hour, day, month or quarter
+
+        Returns:
+            A Costs object, with totals summed across windows when sharded
+
+        Note:
+            This endpoint allows 5 requests every 5 seconds. Requests, including every page of the
+            response, are throttled by the client's rate limiter to stay within that budget.
+            With a `cost_cache`, results are served from it and only the months it does not hold are fetched
+        """
+        paginated_data = await self._get_costs(cost_report_params, shard_days)
+        return self._parse(Costs, paginated_data)
+
+    async def get_cost_report_costs_table(
+        self, cost_report_params: CostsGetParametersQuery, *, shard_days: int | None = None, decimals: bool = False
+    ) -> "Table":
+        """
+        Get all costs as columns - GET /costs
+
+        Args:
+            cost_report_params: The parameters to filter costs
+            shard_days: Optionally split start_date..end_date into windows of about this many days that are fetched
+                concurrently. Requires start_date, end_date and a date_bin of hour, day, month or quarter
+            decimals: Whether amounts are kept exact as Decimal objects rather than converted to float64
+
+        Returns:
+            A Table with a column per Cost field, built without any Cost model, and the totals in its metadata
+
+        Note:
+            Requires the `numpy` extra. Fetched, cached and throttled like get_cost_report_costs
+        """
+        from vantage_sdk.columnar import COSTS_TABLE, build_table
+
+        paginated_data = await self._get_costs(cost_report_params, shard_days)
+        return build_table(COSTS_TABLE, paginated_data, decimals)
+
+    async def iter_cost_report_costs_pages(self, cost_report_params: CostsGetParametersQuery) -> AsyncIterator[Costs]:
+        """
+        Stream the pages of all costs - GET /costs
+
+        Args:
+            cost_report_params: The parameters to filter costs
+
+        Yields:
+            A Costs object for each page, as soon as it arrives
+        """
+        async for page in self._iter_pages("costs", Costs, cost_report_params):
+            yield page
+
+    async def iter_cost_report_costs(self, cost_report_params: CostsGetParametersQuery) -> AsyncIterator[Cost]:
+        """
+        Stream all costs - GET /costs
+
+        Args:
+            cost_report_params: The parameters to filter costs
+
+        Yields:
+            Each Cost object, as soon as the page containing it arrives
+        """
+        async for page in self.iter_cost_report_costs_pages(cost_report_params):
+            for cost in page.costs:
+                yield cost
+
+    # ---- Data Export APIs ----
+
+    async def create_data_export(
+        self,
+        new_data_export: CostsDataExportsPostRequest,
+    ) -> str:
+        """
+        Create a new data export - POST /costs/data_exports
+
+        Args:
+            new_data_export: The new data export object to create
+
+        Returns:
+            str: The token of the created data export
+
+        Note:
+            This function doesn't use the _post protected method because we
+            need to extract the token from the response header
+            and not the response body.
+            1. The response body is empty
+            2. The token is in the 'location' header
+        """
+        response = await self._request(
+            "POST",
+            "costs/data_exports",
+            json=new_data_export.model_dump(mode="json", exclude_none=True, by_alias=True),
+        )
+        if response.is_success:
+            location = response.headers["location"]
+            # Split the entire location URL and get the last part
+            token = location.split("/")[-1]
+            data_export_token_params = DataExportTokenParams(data_export_token=token)
+            return data_export_token_params.data_export_token
+        else:
+            error_details = response.json()
+            error_message = f"Failed to create data export: {response.status_code}. Details: {error_details}"
+            raise HTTPStatusError(error_message, request=response.request, response=response)
+
+    async def get_data_export(self, data_export_token_params: DataExportTokenParams) -> DataExport | PollInterval:
+        """
+        Retrieve a specific data export - GET /data_exports/{data_export_token}
+
+        Args:
+            data_export_token_params: The token of the data export to retrieve, begins with 'rprt_'
+
+        Returns:
+            DataExport: The data export object
+            PollInterval: The number of seconds to wait before polling again if the export is still in progress
+
+        Note:
+            This function returns the data export object if it's ready
+            If the data export is still in progress, it returns the retry-after value from the response headers
+            This is useful for polling the status of the data export
+        """
+        token_value = data_export_token_params.data_export_token
+        response = await self._request("GET", f"data_exports/{token_value}")
+
+        if response.is_success:
+            body = response.json()
+            if body == 202:
+                # The export is still in progress
+                return PollInterval(int(response.headers["retry-after"]))
+            else:
+                # The export is ready
+                return self._parse(DataExport, body)
+        else:
+            error_details = response.json()
+            error_message = f"Failed to create data export: {response.status_code}. Details: {error_details}"
+            raise HTTPStatusError(error_message, request=response.request, response=response)
+
+    # ---- Virtual Tag APIs ----
+
+    async def create_virtual_tag(self, new_virtual_tag: CreateVirtualTagConfig) -> VirtualTagConfig:
+        """
+        Create a new custom tag - POST /virtual_tag_configs
+
+        Args:
+            new_virtual_tag: The new custom tag object to create
+
+        Returns:
+            The created custom tag
+        """
+        data = await self._post("virtual_tag_configs", new_virtual_tag)
+        return self._parse(VirtualTagConfig, data)
+
+    async def delete_virtual_tag(self, virtual_tag_token_params: VirtualTagTokenParams) -> HttpStatusCode:
+        """
+        Delete a specific custom tag - DELETE /virtual_tag_configs/{token}
+
+        Args:
+            virtual_tag_token_params: The token of the custom tag to delete, begins with 'vtag_'
+
+        Returns:
+            The HTTP status code of the response
+        """
+        virtual_tag_value = virtual_tag_token_params.virtual_tag_token
+        return await self._delete(f"virtual_tag_configs/{virtual_tag_value}")
+
+    async def get_virtual_tag(self, virtual_tag_token_params: VirtualTagTokenParams) -> VirtualTagConfig:
+        """
+        Retrieve a specific custom tag - GET /virtual_tag_configs/{token}
+
+        Args:
+            virtual_tag_token_params: The token of the custom tag to retrieve, begins with 'vtag_'
+
+        Returns:
+            The custom tag object
+        """
+        virtual_tag_value = virtual_tag_token_params.virtual_tag_token
+        data = await self._get_raw(f"virtual_tag_configs/{virtual_tag_value}")
+        return self._parse(VirtualTagConfig, data)
+
+    async def get_all_virtual_tags(
+        self, query_params: VirtualTagConfigsGetParametersQuery | None = None
+    ) -> VirtualTagConfigs:
+        """
+        Get all custom tags - GET /virtual_tag_configs
+
+        Args:
+            query_params: Optional query parameters for filtering custom tags
+
+        Returns:
+            A list of VirtualTagConfig objects
+
+        Note:
+            This method is not paginated
+        """
+        data = await self._get_raw("virtual_tag_configs", query_params)
+        return self._parse(VirtualTagConfigs, data)
+
+    async def get_virtual_tag_processing_status(
+        self, virtual_tag_token_params: VirtualTagTokenParams
+    ) -> VirtualTagConfigStatus:
+        """
+        Get the processing status for a custom tag - GET /virtual_tag_configs/{token}/status
+
+        Args:
+            virtual_tag_token_params: The token of the custom tag to retrieve status for, begins with 'vtag_'
+
+        Returns:
+            The processing status for the custom tag
+        """
+        virtual_tag_value = virtual_tag_token_params.virtual_tag_token
+        data = await self._get_raw(f"virtual_tag_configs/{virtual_tag_value}/status")
+        return self._parse(VirtualTagConfigStatus, data)
+
+    async def update_virtual_tag(
+        self, virtual_tag_token_params: VirtualTagTokenParams, virtual_tag_update: UpdateVirtualTagConfig
+    ) -> VirtualTagConfig | AsyncVirtualTagConfigUpdate:
+        """
+        Update a specific custom tag synchronously - PUT /virtual_tag_configs/{token}
+
+        This is the standard update path. The API typically returns 200 with the
+        updated VirtualTagConfig, but for large or complex tag configurations
+        (e.g. many values, cost-based allocations, long backfill periods) the
+        server may respond with 202 instead, indicating that the update was
+        accepted but will be processed asynchronously. In that case, the response
+        contains a request_id and status_url for polling.
+
+        If you know the update will be large, prefer update_virtual_tag_async
+        which uses the dedicated async endpoint
+
+        Args:
+            virtual_tag_token_params: The token of the custom tag to update, begins with 'vtag_'
+            virtual_tag_update: The updated custom tag object
+
+        Returns:
+            VirtualTagConfig if the update completed synchronously (200),
+            or AsyncVirtualTagConfigUpdate if the server deferred processing (202)
+        """
+        virtual_tag_value = virtual_tag_token_params.virtual_tag_token
+
+        json_data = virtual_tag_update.model_dump(
+            mode="json",
+            by_alias=True,
+            exclude_none=True,
+            exclude_defaults=True,
+        )
+
+        response = await self._request("PUT", f"virtual_tag_configs/{virtual_tag_value}", json=json_data)
+        response.raise_for_status()
+        data = response.json()
+
+        if response.status_code == 202:
+            return self._parse(AsyncVirtualTagConfigUpdate, data)
+        return self._parse(VirtualTagConfig, data)
+
+    async def update_virtual_tag_async(
+        self,
+        virtual_tag_token_params: VirtualTagTokenParams,
+        virtual_tag_update: UpdateAsyncVirtualTagConfig,
+    ) -> AsyncVirtualTagConfigUpdate:
+        """
+        Update a custom tag asynchronously - PUT /virtual_tag_configs/{token}/async
+
+        This is the dedicated async endpoint for virtual tag updates. Unlike the
+        sync endpoint (update_virtual_tag), this always returns 202 immediately
+        without waiting for the update to complete. Use this when updating tags
+        with many values, cost-based allocations, or long backfill periods where
+        processing may take significant time.
+
+        Poll the returned status_url via get_virtual_tag_async_status to check
+        whether the update has completed
+
+        Args:
+            virtual_tag_token_params: The token of the custom tag to update, begins with 'vtag_'
+            virtual_tag_update: The updated custom tag object
+
+        Returns:
+            AsyncVirtualTagConfigUpdate with request_id and status_url for polling
+        """
+        virtual_tag_value = virtual_tag_token_params.virtual_tag_token
+        data = await self._put(f"virtual_tag_configs/{virtual_tag_value}/async", virtual_tag_update)
+        return self._parse(AsyncVirtualTagConfigUpdate, data)
+
+    async def get_virtual_tag_async_status(self, request_id: str) -> dict[str, Any]:
+        """
+        Check the status of an async virtual tag update - GET /virtual_tag_configs/async/{request_id}
+
+        Args:
+            request_id: The request_id returned from update_virtual_tag_async
+
+        Returns:
+            The status of the async update
+        """
+        return await self._get(f"virtual_tag_configs/async/{request_id}")
+
+    # ---- Saved Filters APIs ----
+
+    async def create_saved_filter(self, new_saved_filter: CreateSavedFilter) -> SavedFilter:
+        """
+        Create a new saved filter - POST /saved_filters
+
+        Args:
+            new_saved_filter: The new saved filter object to create
+
+        Returns:
+            The created saved filter
+        """
+        data = await self._post("saved_filters", new_saved_filter)
+        return self._parse(SavedFilter, data)
+
+    async def delete_saved_filter(self, saved_filter_token_params: SavedFilterTokenParams) -> HttpStatusCode:
+        """
+        Delete a specific saved filter - DELETE /saved_filters/{saved_filter_token}
+
+        Args:
+            saved_filter_token_params: The token of the saved filter to delete, begins with 'svd_fltr'
+
+        Returns:
+            The HTTP status code of the response
+        """
+        saved_filter_value = saved_filter_token_params.saved_filter_token
+        return await self._delete(f"saved_filters/{saved_filter_value}")
+
+    async def get_saved_filter(self, saved_filter_token_params: SavedFilterTokenParams) -> SavedFilter:
+        """
+        Retrieve a specific saved filter - GET /saved_filters/{saved_filter_token}
+
+        Args:
+            saved_filter_token_params: The token of the saved filter to retrieve, begins with 'svd_fltr'
+
+        Returns:
+            The saved filter object
+        """
+        saved_filter_value = saved_filter_token_params.saved_filter_token
+        data = await self._get_raw(f"saved_filters/{saved_filter_value}")
+        return self._parse(SavedFilter, data)
+
+    async def get_all_saved_filters(self) -> SavedFilters:
+        """
+        Get all saved filters - GET /saved_filters
+
+        Returns:
+            A list of SavedFilter objects
+        """
+        paginated_data = await self._get_paginated("saved_filters")
+        return self._parse(SavedFilters, paginated_data)
+
+    # ---- Health Check ----
+
+    async def ping(self) -> bool:
+        """
+        Ping the 'ping' URL to verify connectivity
+
+        Returns:
+            True if the response is "pong", False otherwise
+        """
+        try:
+            response = await self._get("ping")
+            return response["ping"] == "pong"
+        except HTTPError:
+            return False
+
+    # ---- Business Metrics ----
+
+    async def create_business_metric(self, new_business_metric: CreateBusinessMetric) -> BusinessMetric:
+        """
+        Create a new business metric - POST /business_metrics
+
+        Args:
+            new_business_metric: The new business metric object to create
+
+        Returns:
+            A BusinessMetric object
+        """
+        data = await self._post("business_metrics", new_business_metric)
+        return self._parse(BusinessMetric, data)
+
+    async def get_all_business_metrics(
+        self, query_params: BusinessMetricsGetParametersQuery | None = None
+    ) -> BusinessMetrics:
+        """
+        Get all business metrics - GET /business_metrics
+
+        Args:
+            query_params: Optional query parameters for fetching business metrics
+
+        Returns:
+            A BusinessMetrics object which is a list of BusinessMetric objects
+        """
+        paginated_data = await self._get_paginated("business_metrics", query_params)
+        return self._parse(BusinessMetrics, paginated_data)
+
+    async def get_business_metric(self, business_metric_token: BusinessMetricTokenParams) -> BusinessMetric:
+        """
+        Get a specific business metric - GET /business_metrics/{business_metric_token}
+
+        Args:
+            business_metric_token: The token of the business metric to retrieve
+
+        Returns:
+            The business metric object
+        """
+        business_metric_token_value = business_metric_token.business_metric_token
+        data = await self._get_raw(f"business_metrics/{business_metric_token_value}")
+        return self._parse(BusinessMetric, data)
+
+    async def delete_business_metric(self, business_metric_token: BusinessMetricTokenParams) -> HttpStatusCode:
+        """
+        Delete a specific business metric - DELETE /business_metrics/{business_metric_token}
+
+        Args:
+            business_metric_token: The token of the business metric to delete
+
+        Returns:
+            The HTTP status code of the response
+        """
+        business_metric_token_value = business_metric_token.business_metric_token
+        return await self._delete(f"business_metrics/{business_metric_token_value}")
+
+    async def update_business_metric(
+        self, business_metric_token: BusinessMetricTokenParams, business_metric_update: UpdateBusinessMetric
+    ) -> BusinessMetric:
+        """
+        Update a specific business metric - PUT /business_metrics/{business_metric_token}
+
+        Args:
+            business_metric_token: The token of the business metric to update
+            business_metric_update: The updated business metric object
+
+        Returns:
+            The updated business metric object
+        """
+        business_metric_token_value = business_metric_token.business_metric_token
+        data = await self._put(f"business_metrics/{business_metric_token_value}", business_metric_update)
+        return self._parse(BusinessMetric, data)
+
+    async def get_business_metric_values(
+        self,
+        business_metric_token_values: BusinessMetricsBusinessMetricTokenValuesGetParametersQuery,
+        business_metric_token_params: BusinessMetricTokenParams,
+    ) -> BusinessMetricValues:
+        """
+        Get the values of a specific business metric - GET /business_metrics/{business_metric_token}/values
+
+        Args:
+            business_metric_token_values: The parameters to filter the business metric values
+            business_metric_token_params: The token of the business metric to retrieve values for
+
+        Returns:
+            A dictionary containing the values of the business metric
+        """
+        business_metric_token_value = business_metric_token_params.business_metric_token
+        paginated_data = await self._get_paginated(
+            f"business_metrics/{business_metric_token_value}/values", business_metric_token_values
+        )
+        return self._parse(BusinessMetricValues, paginated_data)
+
+    async def get_business_metric_values_table(
+        self,
+        business_metric_token_values: BusinessMetricsBusinessMetricTokenValuesGetParametersQuery,
+        business_metric_token_params: BusinessMetricTokenParams,
+        *,
+        decimals: bool = False,
+    ) -> "Table":
+        """
+        Get the values of a specific business metric as columns - GET /business_metrics/{business_metric_token}/values
+
+        Args:
+            business_metric_token_values: The parameters to filter the business metric values
+            business_metric_token_params: The token of the business metric to retrieve values for
+            decimals: Whether amounts are kept exact as Decimal objects rather than converted to float64
+
+        Returns:
+            A Table with a column per BusinessMetricValue field
+
+        Note:
+            Requires the `numpy` extra
+        """
+        from vantage_sdk.columnar import BUSINESS_METRIC_VALUES_TABLE, build_table
+
+        business_metric_token_value = business_metric_token_params.business_metric_token
+        paginated_data = await self._get_paginated(
+            f"business_metrics/{business_metric_token_value}/values", business_metric_token_values
+        )
+        return build_table(BUSINESS_METRIC_VALUES_TABLE, paginated_data, decimals)
+
+    async def iter_business_metric_values_pages(
+        self,
+        business_metric_token_values: BusinessMetricsBusinessMetricTokenValuesGetParametersQuery,
+        business_metric_token_params: BusinessMetricTokenParams,
+    ) -> AsyncIterator[BusinessMetricValues]:
+        """
+        Stream the pages of values of a specific business metric - GET /business_metrics/{business_metric_token}/values
+
+        Args:
+            business_metric_token_values: The parameters to filter the business metric values
+            business_metric_token_params: The token of the business metric to retrieve values for
+
+        Yields:
+            A BusinessMetricValues object for each page, as soon as it arrives
+        """
+        business_metric_token_value = business_metric_token_params.business_metric_token
+        async for page in self._iter_pages(
+            f"business_metrics/{business_metric_token_value}/values", BusinessMetricValues, business_metric_token_values
+        ):
+            yield page
+
+    async def iter_business_metric_values(
+        self,
+        business_metric_token_values: BusinessMetricsBusinessMetricTokenValuesGetParametersQuery,
+        business_metric_token_params: BusinessMetricTokenParams,
+    ) -> AsyncIterator[BusinessMetricValue]:
+        """
+        Stream the values of a specific business metric - GET /business_metrics/{business_metric_token}/values
+
+        Args:
+            business_metric_token_values: The parameters to filter the business metric values
+            business_metric_token_params: The token of the business metric to retrieve values for
+
+        Yields:
+            Each BusinessMetricValue object, as soon as the page containing it arrives
+        """
+        async for page in self.iter_business_metric_values_pages(
+            business_metric_token_values, business_metric_token_params
+        ):
+            for value in page.values:
+                yield value
+
+    async def get_business_metric_labels(
+        self,
+        business_metric_token_params: BusinessMetricTokenParams,
+        query_params: BusinessMetricsBusinessMetricTokenLabelsGetParametersQuery | None = None,
+    ) -> BusinessMetricLabels:
+        """
+        Get labels for a specific business metric - GET /business_metrics/{business_metric_token}/labels
+
+        Args:
+            business_metric_token_params: The token of the business metric to retrieve labels for
+            query_params: Optional pagination parameters
+
+        Returns:
+            The labels associated with the business metric
+        """
+        business_metric_token = business_metric_token_params.business_metric_token
+        paginated_data = await self._get_paginated(f"business_metrics/{business_metric_token}/labels", query_params)
+        return self._parse(BusinessMetricLabels, paginated_data)
+
+    async def delete_business_metric_values(
+        self,
+        business_metric_token_params: BusinessMetricTokenParams,
+        delete_params: BusinessMetricsBusinessMetricTokenValuesDeleteParametersQuery,
+    ) -> BusinessMetricValuesDeleteResponse:
+        """
+        Delete values of a specific business metric - DELETE /business_metrics/{business_metric_token}/values
+
+        Args:
+            business_metric_token_params: The token of the business metric whose values to delete
+            delete_params: The query parameters to filter which values to delete
+
+        Returns:
+            A BusinessMetricValuesDeleteResponse containing the count of deleted rows
+        """
+        business_metric_token_value = business_metric_token_params.business_metric_token
+        query = delete_params.model_dump(mode="json", by_alias=True, exclude_none=True, exclude_defaults=True)
+        response = await self._request("DELETE", f"business_metrics/{business_metric_token_value}/values", params=query)
+        response.raise_for_status()
+        return self._parse(BusinessMetricValuesDeleteResponse, response.json())
+
+    # ---- Integration APIs ----
+
+    async def get_all_integrations(self, query_params: IntegrationsGetParametersQuery | None = None) -> Integrations:
+        """
+        Get all integrations - GET /integrations
+
+        Args:
+            query_params: Optional query parameters for filtering integrations
+
+        Returns:
+            An Integrations object which is a list of Integration objects
+        """
+        paginated_data = await self._get_paginated("integrations", query_params)
+        return self._parse(Integrations, paginated_data)
+
+    async def iter_integrations_pages(
+        self, query_params: IntegrationsGetParametersQuery | None = None
+    ) -> AsyncIterator[Integrations]:
+        """
+        Stream the pages of all integrations - GET /integrations
+
+        Args:
+            query_params: Optional query parameters for filtering integrations
+
+        Yields:
+            An Integrations object for each page, as soon as it arrives
+        """
+        async for page in self._iter_pages("integrations", Integrations, query_params):
+            yield page
+
+    async def iter_integrations(
+        self, query_params: IntegrationsGetParametersQuery | None = None
+    ) -> AsyncIterator[Integration]:
+        """
+        Stream all integrations - GET /integrations
+
+        Args:
+            query_params: Optional query parameters for filtering integrations
+
+        Yields:
+            Each Integration object, as soon as the page containing it arrives
+        """
+        async for page in self.iter_integrations_pages(query_params):
+            for integration in page.integrations:
+                yield integration
+
+    async def create_azure_integration(self, new_azure_integration: CreateAzureIntegration) -> Integration:
+        """
+        Create a new Azure integration - POST /integrations/azure
+
+        Args:
+            new_azure_integration: The new Azure integration object to create
+
+        Returns:
+            The created integration object
+        """
+        data = await self._post("integrations/azure", new_azure_integration)
+        return self._parse(Integration, data)
+
+    async def create_gcp_integration(self, new_gcp_integration: CreateGCPIntegration) -> Integration:
+        """
+        Create a new GCP integration - POST /integrations/gcp
+
+        Args:
+            new_gcp_integration: The new GCP integration object to create
+
+        Returns:
+            The created integration object
+        """
+        data = await self._post("integrations/gcp", new_gcp_integration)
+        return self._parse(Integration, data)
+
+    async def create_custom_provider_integration(
+        self, new_custom_provider_integration: CreateCustomProviderIntegration
+    ) -> Integration:
+        """
+        Create a new Custom Provider integration - POST /integrations/custom_provider
+
+        Args:
+            new_custom_provider_integration: The new custom provider integration object to create
+
+        Returns:
+            The created integration object
+        """
+        data = await self._post("integrations/custom_provider", new_custom_provider_integration)
+        return self._parse(Integration, data)
+
+    async def get_integration(self, integration_token_params: IntegrationTokenParams) -> Integration:
+        """
+        Retrieve a specific integration - GET /integrations/{integration_token}
+
+        Args:
+            integration_token_params: The token of the integration to retrieve, begins with 'intg_'
+
+        Returns:
+            The integration object
+        """
+        integration_token = integration_token_params.integration_token
+        data = await self._get_raw(f"integrations/{integration_token}")
+        return self._parse(Integration, data)
+
+    async def update_integration(
+        self, integration_token_params: IntegrationTokenParams, workspace_tokens: Sequence[str]
+    ) -> Integration:
+        """
+        Update a specific integration - PUT /integrations/{integration_token}
+
+        Args:
+            integration_token_params: The token of the integration to update, begins with 'intg_'
+            workspace_tokens: Array of workspace tokens to associate with the integration
+
+        Returns:
+            The updated integration object
+        """
+        integration_token = integration_token_params.integration_token
+        data = await self._put(
+            f"integrations/{integration_token}",
+            IntegrationsIntegrationTokenPutRequest(workspace_tokens=workspace_tokens),
+        )
+        return self._parse(Integration, data)
+
+    async def delete_integration(self, integration_token_params: IntegrationTokenParams) -> HttpStatusCode:
+        """
+        Delete a specific integration - DELETE /integrations/{integration_token}
+
+        Args:
+            integration_token_params: The token of the integration to delete, begins with 'intg_'
+
+        Returns:
+            The HTTP status code of the response
+        """
+        integration_token = integration_token_params.integration_token
+        return await self._delete(f"integrations/{integration_token}")
+
+    async def get_integration_costs(self, integration_token_params: IntegrationTokenParams) -> UserCostsUploads:
+        """
+        List UserCostsUploads for an integration - GET /integrations/{integration_token}/costs
+
+        Args:
+            integration_token_params: The token of the integration, begins with 'intg_'
+
+        Returns:
+            A UserCostsUploads object containing a list of UserCostsUpload objects
+        """
+        integration_token = integration_token_params.integration_token
+        data = await self._get_raw(f"integrations/{integration_token}/costs")
+        return self._parse(UserCostsUploads, data)
+
+    async def delete_integration_costs(
+        self,
+        integration_token_params: IntegrationTokenParams,
+        user_costs_upload_token: str,
+    ) -> HttpStatusCode:
+        """
+        Delete a UserCostsUpload - DELETE /integrations/{integration_token}/costs/{user_costs_upload_token}
+
+        Args:
+            integration_token_params: The token of the integration, begins with 'intg_'
+            user_costs_upload_token: The token of the user costs upload to delete
+
+        Returns:
+            The HTTP status code of the response
+        """
+        integration_token = integration_token_params.integration_token
+        return await self._delete(f"integrations/{integration_token}/costs/{user_costs_upload_token}")
+
+    async def upload_integration_costs(
+        self,
+        integration_token_params: IntegrationTokenParams,
+        csv_data: bytes,
+    ) -> dict[str, Any]:
+        """
+        Create UserCostsUpload via CSV for a Custom Provider Integration.
+
+        POST /integrations/{integration_token}/costs.csv
+
+        Args:
+            integration_token_params: The token of the integration, begins with 'intg_'
+            csv_data: CSV file data containing custom costs
+
+        Returns:
+            The response data from the server
+
+        Note:
+            This function doesn't use the _post protected method because we need to send
+            form data with the CSV file rather than JSON data.
+        """
+        integration_token = integration_token_params.integration_token
+        # Create the form data with the CSV file
+        files = {"csv": ("costs.csv", csv_data, "text/csv")}
+
+        # Send the request
+        response = await self._request(
+            "POST", f"integrations/{integration_token}/costs.csv", files=files, headers=self.session.headers
+        )
+        response.raise_for_status()
+        return response.json()
+
+    # ---- Access Grants APIs ----
+
+    async def get_all_access_grants(self) -> AccessGrants:
+        """
+        Get all access grants - GET /access_grants
+
+        Returns:
+            An AccessGrants object which is a list of AccessGrant objects
+        """
+        paginated_data = await self._get_paginated("access_grants")
+        return self._parse(AccessGrants, paginated_data)
+
+    async def get_access_grant(self, access_grant_token_params: AccessGrantTokenParams) -> AccessGrant:
+        """
+        Retrieve a specific access grant - GET /access_grants/{access_grant_token}
+
+        Args:
+            access_grant_token_params: The token of the access grant to retrieve
+
+        Returns:
+            The access grant object
+        """
+        access_grant_token = access_grant_token_params.access_grant_token
+        data = await self._get_raw(f"access_grants/{access_grant_token}")
+        return self._parse(AccessGrant, data)
+
+    async def create_access_grant(self, new_access_grant: CreateAccessGrant) -> AccessGrant:
+        """
+        Create a new access grant - POST /access_grants
+
+        Args:
+            new_access_grant: The new access grant object to create
+
+        Returns:
+            The created access grant object
+        """
+        data = await self._post("access_grants", new_access_grant)
+        return self._parse(AccessGrant, data)
+
+    async def update_access_grant(
+        self, access_grant_token_params: AccessGrantTokenParams, access_grant_update: UpdateAccessGrant
+    ) -> AccessGrant:
+        """
+        Update a specific access grant - PUT /access_grants/{access_grant_token}
+
+        Args:
+            access_grant_token_params: The token of the access grant to update
+            access_grant_update: The updated access grant object
+
+        Returns:
+            The updated access grant object
+        """
+        access_grant_token = access_grant_token_params.access_grant_token
+        data = await self._put(f"access_grants/{access_grant_token}", access_grant_update)
+        return self._parse(AccessGrant, data)
+
+    async def delete_access_grant(self, access_grant_token_params: AccessGrantTokenParams) -> HttpStatusCode:
+        """
+        Delete a specific access grant - DELETE /access_grants/{access_grant_token}
+
+        Args:
+            access_grant_token_params: The token of the access grant to delete
+
+        Returns:
+            The HTTP status code of the response
+        """
+        access_grant_token = access_grant_token_params.access_grant_token
+        return await self._delete(f"access_grants/{access_grant_token}")
+
+    # ---- Me API ----
+
+    async def get_me(self) -> Me:
+        """
+        Get information about the authenticated BearerToken - GET /me
+
+        Returns:
+            A Me object containing information about the authenticated user's token and workspaces
+        """
+        data = await self._get_raw("me")
+        return self._parse(Me, data)
+
+    async def update_me(self, me_update: UpdateMe) -> Me:
+        """
+        Update the authenticated user - PUT /me
+
+        Args:
+            me_update: The update payload
+
+        Returns:
+            The updated Me object
+        """
+        data = await self._put("me", me_update)
+        return self._parse(Me, data)
+
+    # ---- Teams APIs ----
+
+    async def get_all_teams(self) -> Teams:
+        """
+        Get all teams - GET /teams
+
+        Returns:
+            A Teams object which is a list of Team objects
+        """
+        paginated_data = await self._get_paginated("teams")
+        return self._parse(Teams, paginated_data)
+
+    async def get_team(self, team_token_params: TeamTokenParams) -> Team:
+        """
+        Retrieve a specific team - GET /teams/{team_token}
+
+        Args:
+            team_token_params: The token of the team to retrieve
+
+        Returns:
+            The team object
+        """
+        team_token = team_token_params.team_token
+        data = await self._get_raw(f"teams/{team_token}")
+        return self._parse(Team, data)
+
+    async def create_team(self, new_team: CreateTeam) -> Team:
+        """
+        Create a new team - POST /teams
+
+        Args:
+            new_team: The new team object to create
+
+        Returns:
+            The created team object
+        """
+        data = await self._post("teams", new_team)
+        return self._parse(Team, data)
+
+    async def update_team(self, team_token_params: TeamTokenParams, team_update: UpdateTeam) -> Team:
+        """
+        Update a specific team - PUT /teams/{team_token}
+
+        Args:
+            team_token_params: The token of the team to update
+            team_update: The updated team object
+
+        Returns:
+            The updated team object
+        """
+        team_token = team_token_params.team_token
+        data = await self._put(f"teams/{team_token}", team_update)
+        return self._parse(Team, data)
+
+    async def delete_team(self, team_token_params: TeamTokenParams) -> HttpStatusCode:
+        """
+        Delete a specific team - DELETE /teams/{team_token}
+
+        Args:
+            team_token_params: The token of the team to delete
+
+        Returns:
+            The HTTP status code of the response
+        """
+        team_token = team_token_params.team_token
+        return await self._delete(f"teams/{team_token}")
+
+    # ---- Anomaly Alerts & Notifications APIs ----
+
+    async def get_all_anomaly_alerts(
+        self, anomaly_alerts_params: AnomalyAlertsGetParametersQuery | None = None
+    ) -> AnomalyAlerts:
+        """
+        Get all anomaly alerts - GET /anomaly_alerts
+
+        Args:
+            anomaly_alerts_params: Optional query parameters for filtering anomaly alerts
+
+        Returns:
+            An AnomalyAlerts object which is a list of AnomalyAlert objects
+        """
+        paginated_data = await self._get_paginated("anomaly_alerts", anomaly_alerts_params)
+        return self._parse(AnomalyAlerts, paginated_data)
+
+    async def get_anomaly_alert(self, anomaly_alert_token_params: AnomalyAlertTokenParams) -> AnomalyAlert:
+        """
+        Retrieve a specific anomaly alert - GET /anomaly_alerts/{anomaly_alert_token}
+
+        Args:
+            anomaly_alert_token_params: The token of the anomaly alert to retrieve
+
+        Returns:
+            The anomaly alert object
+        """
+        anomaly_alert_token = anomaly_alert_token_params.anomaly_alert_token
+        data = await self._get_raw(f"anomaly_alerts/{anomaly_alert_token}")
+        return self._parse(AnomalyAlert, data)
+
+    async def update_anomaly_alert(
+        self, anomaly_alert_token_params: AnomalyAlertTokenParams, anomaly_alert_update: UpdateAnomalyAlert
+    ) -> AnomalyAlert:
+        """
+        Update a specific anomaly alert - PUT /anomaly_alerts/{anomaly_alert_token}
+
+        Args:
+            anomaly_alert_token_params: The token of the anomaly alert to update
+            anomaly_alert_update: The updated anomaly alert object
+
+        Returns:
+            The updated anomaly alert object
+        """
+        anomaly_alert_token = anomaly_alert_token_params.anomaly_alert_token
+        data = await self._put(f"anomaly_alerts/{anomaly_alert_token}", anomaly_alert_update)
+        return self._parse(AnomalyAlert, data)
+
+    async def get_all_anomaly_notifications(self) -> AnomalyNotifications:
+        """
+        Get all anomaly notifications - GET /anomaly_notifications
+
+        Returns:
+            An AnomalyNotifications object which is a list of AnomalyNotification objects
+        """
+        paginated_data = await self._get_paginated("anomaly_notifications")
+        return self._parse(AnomalyNotifications, paginated_data)
+
+    async def get_anomaly_notification(
+        self, anomaly_notification_token_params: AnomalyNotificationTokenParams
+    ) -> AnomalyNotification:
+        """
+        Retrieve a specific anomaly notification - GET /anomaly_notifications/{anomaly_notification_token}
+
+        Args:
+            anomaly_notification_token_params: The token of the anomaly notification to retrieve
+
+        Returns:
+            The anomaly notification object
+        """
+        anomaly_notification_token = anomaly_notification_token_params.anomaly_notification_token
+        data = await self._get_raw(f"anomaly_notifications/{anomaly_notification_token}")
+        return self._parse(AnomalyNotification, data)
+
+    async def create_anomaly_notification(
+        self, new_anomaly_notification: CreateAnomalyNotification
+    ) -> AnomalyNotification:
+        """
+        Create a new anomaly notification - POST /anomaly_notifications
+
+        Args:
+            new_anomaly_notification: The new anomaly notification object to create
+
+        Returns:
+            The created anomaly notification object
+        """
+        data = await self._post("anomaly_notifications", new_anomaly_notification)
+        return self._parse(AnomalyNotification, data)
+
+    async def update_anomaly_notification(
+        self,
+        anomaly_notification_token_params: AnomalyNotificationTokenParams,
+        anomaly_notification_update: UpdateAnomalyNotification,
+    ) -> AnomalyNotification:
+        """
+        Update a specific anomaly notification - PUT /anomaly_notifications/{anomaly_notification_token}
+
+        Args:
+            anomaly_notification_token_params: The token of the anomaly notification to update
+            anomaly_notification_update: The updated anomaly notification object
+
+        Returns:
+            The updated anomaly notification object
+        """
+        anomaly_notification_token = anomaly_notification_token_params.anomaly_notification_token
+        data = await self._put(f"anomaly_notifications/{anomaly_notification_token}", anomaly_notification_update)
+        return self._parse(AnomalyNotification, data)
+
+    async def delete_anomaly_notification(
+        self, anomaly_notification_token_params: AnomalyNotificationTokenParams
+    ) -> HttpStatusCode:
+        """
+        Delete a specific anomaly notification - DELETE /anomaly_notifications/{anomaly_notification_token}
+
+        Args:
+            anomaly_notification_token_params: The token of the anomaly notification to delete
+
+        Returns:
+            The HTTP status code of the response
+        """
+        anomaly_notification_token = anomaly_notification_token_params.anomaly_notification_token
+        return await self._delete(f"anomaly_notifications/{anomaly_notification_token}")
+
+    # ---- Billing Rules APIs ----
+
+    async def get_all_billing_rules(self) -> BillingRules:
+        """
+        Get all billing rules - GET /billing_rules
+
+        Returns:
+            A BillingRules object which is a list of BillingRule objects
+        """
+        paginated_data = await self._get_paginated("billing_rules")
+        return self._parse(BillingRules, paginated_data)
+
+    async def get_billing_rule(self, billing_rule_token_params: BillingRuleTokenParams) -> BillingRule:
+        """
+        Retrieve a specific billing rule - GET /billing_rules/{billing_rule_token}
+
+        Args:
+            billing_rule_token_params: The token of the billing rule to retrieve
+
+        Returns:
+            The billing rule object
+        """
+        billing_rule_token = billing_rule_token_params.billing_rule_token
+        data = await self._get_raw(f"billing_rules/{billing_rule_token}")
+        return self._parse(BillingRule, data)
+
+    async def create_billing_rule(self, new_billing_rule: CreateBillingRule) -> BillingRule:
+        """
+        Create a new billing rule - POST /billing_rules
+
+        Args:
+            new_billing_rule: The new billing rule object to create
+
+        Returns:
+            The created billing rule object
+        """
+        data = await self._post("billing_rules", new_billing_rule)
+        return self._parse(BillingRule, data)
+
+    async def update_billing_rule(
+        self, billing_rule_token_params: BillingRuleTokenParams, billing_rule_update: UpdateBillingRule
+    ) -> BillingRule:
+        """
+        Update a specific billing rule - PUT /billing_rules/{billing_rule_token}
+
+        Args:
+            billing_rule_token_params: The token of the billing rule to update
+            billing_rule_update: The updated billing rule object
+
+        Returns:
+            The updated billing rule object
+        """
+        billing_rule_token = billing_rule_token_params.billing_rule_token
+        data = await self._put(f"billing_rules/{billing_rule_token}", billing_rule_update)
+        return self._parse(BillingRule, data)
+
+    async def delete_billing_rule(self, billing_rule_token_params: BillingRuleTokenParams) -> HttpStatusCode:
+        """
+        Delete a specific billing rule - DELETE /billing_rules/{billing_rule_token}
+
+        Args:
+            billing_rule_token_params: The token of the billing rule to delete
+
+        Returns:
+            The HTTP status code of the response
+        """
+        billing_rule_token = billing_rule_token_params.billing_rule_token
+        return await self._delete(f"billing_rules/{billing_rule_token}")
+
+    # ---- Budgets APIs ----
+
+    async def get_all_budgets(self) -> Budgets:
+        """
+        Get all budgets - GET /budgets
+
+        Returns:
+            A Budgets object which is a list of Budget objects
+        """
+        paginated_data = await self._get_paginated("budgets")
+        return self._parse(Budgets, paginated_data)
+
+    async def get_budget(
+        self, budget_token_params: BudgetTokenParams, budget_params: BudgetsBudgetTokenGetParametersQuery | None = None
+    ) -> Budget:
+        """
+        Retrieve a specific budget - GET /budgets/{budget_token}
+
+        Args:
+            budget_token_params: The token of the budget to retrieve
+            budget_params: Optional query parameters for the budget
+
+        Returns:
+            The budget object
+        """
+        budget_token = budget_token_params.budget_token
+        data = await self._get_raw(f"budgets/{budget_token}", budget_params)
+        return self._parse(Budget, data)
+
+    async def create_budget(self, new_budget: CreateBudget) -> Budget:
+        """
+        Create a new budget - POST /budgets
+
+        Args:
+            new_budget: The new budget object to create
+
+        Returns:
+            The created budget object
+        """
+        data = await self._post("budgets", new_budget)
+        return self._parse(Budget, data)
+
+    async def update_budget(self, budget_token_params: BudgetTokenParams, budget_update: UpdateBudget) -> Budget:
+        """
+        Update a specific budget - PUT /budgets/{budget_token}
+
+        Args:
+            budget_token_params: The token of the budget to update
+            budget_update: The updated budget object
+
+        Returns:
+            The updated budget object
+        """
+        budget_token = budget_token_params.budget_token
+        data = await self._put(f"budgets/{budget_token}", budget_update)
+        return self._parse(Budget, data)
+
+    async def delete_budget(self, budget_token_params: BudgetTokenParams) -> HttpStatusCode:
+        """
+        Delete a specific budget - DELETE /budgets/{budget_token}
+
+        Args:
+            budget_token_params: The token of the budget to delete
+
+        Returns:
+            The HTTP status code of the response
+        """
+        budget_token = budget_token_params.budget_token
+        return await self._delete(f"budgets/{budget_token}")
+
+    # ---- Budget Alerts APIs ----
+
+    async def get_all_budget_alerts(self) -> BudgetAlerts:
+        """
+        Get all budget alerts - GET /budget_alerts
+
+        Returns:
+            A BudgetAlerts object which is a list of BudgetAlert objects
+        """
+        paginated_data = await self._get_paginated("budget_alerts")
+        return self._parse(BudgetAlerts, paginated_data)
+
+    async def get_budget_alert(self, budget_alert_token_params: BudgetAlertTokenParams) -> BudgetAlert:
+        """
+        Retrieve a specific budget alert - GET /budget_alerts/{budget_alert_token}
+
+        Args:
+            budget_alert_token_params: The token of the budget alert to retrieve
+
+        Returns:
+            The budget alert object
+        """
+        budget_alert_token = budget_alert_token_params.budget_alert_token
+        data = await self._get_raw(f"budget_alerts/{budget_alert_token}")
+        return self._parse(BudgetAlert, data)
+
+    async def create_budget_alert(self, new_budget_alert: BudgetAlertsPostRequest) -> BudgetAlert:
+        """
+        Create a new budget alert - POST /budget_alerts
+
+        Args:
+            new_budget_alert: The new budget alert object to create
+
+        Returns:
+            The created budget alert object
+        """
+        data = await self._post("budget_alerts", new_budget_alert)
+        return self._parse(BudgetAlert, data)
+
+    async def update_budget_alert(
+        self,
+        budget_alert_token_params: BudgetAlertTokenParams,
+        budget_alert_update: BudgetAlertsBudgetAlertTokenPutRequest,
+    ) -> BudgetAlert:
+        """
+        Update a specific budget alert - PUT /budget_alerts/{budget_alert_token}
+
+        Args:
+            budget_alert_token_params: The token of the budget alert to update
+            budget_alert_update: The updated budget alert object
+
+        Returns:
+            The updated budget alert object
+        """
+        budget_alert_token = budget_alert_token_params.budget_alert_token
+        data = await self._put(f"budget_alerts/{budget_alert_token}", budget_alert_update)
+        return self._parse(BudgetAlert, data)
+
+    async def delete_budget_alert(self, budget_alert_token_params: BudgetAlertTokenParams) -> HttpStatusCode:
+        """
+        Delete a specific budget alert - DELETE /budget_alerts/{budget_alert_token}
+
+        Args:
+            budget_alert_token_params: The token of the budget alert to delete
+
+        Returns:
+            The HTTP status code of the response
+        """
+        budget_alert_token = budget_alert_token_params.budget_alert_token
+        return await self._delete(f"budget_alerts/{budget_alert_token}")
+
+    # ---- Cost Alerts APIs ----
+
+    async def get_all_cost_alerts(self) -> CostAlerts:
+        """
+        Get all cost alerts - GET /cost_alerts
+
+        Returns:
+            A CostAlerts object which is a list of CostAlert objects
+        """
+        paginated_data = await self._get_paginated("cost_alerts")
+        return self._parse(CostAlerts, paginated_data)
+
+    async def get_cost_alert(self, cost_alert_token_params: CostAlertTokenParams) -> CostAlert:
+        """
+        Retrieve a specific cost alert - GET /cost_alerts/{cost_alert_token}
+
+        Args:
+            cost_alert_token_params: The token of the cost alert to retrieve
+
+        Returns:
+            The cost alert object
+        """
+        cost_alert_token = cost_alert_token_params.cost_alert_token
+        data = await self._get_raw(f"cost_alerts/{cost_alert_token}")
+        return self._parse(CostAlert, data)
+
+    async def get_cost_alert_events(
+        self,
+        cost_alert_token_params: CostAlertTokenParams,
+        query_params: CostAlertsCostAlertTokenEventsGetParametersQuery | None = None,
+    ) -> CostAlertEvents:
+        """
+        Get events for a specific cost alert - GET /cost_alerts/{cost_alert_token}/events
+
+        Args:
+            cost_alert_token_params: The token of the cost alert
+            query_params: Optional query parameters for filtering events
+
+        Returns:
+            A CostAlertEvents object containing the events
+        """
+        cost_alert_token = cost_alert_token_params.cost_alert_token
+        paginated_data = await self._get_paginated(f"cost_alerts/{cost_alert_token}/events", query_params)
+        return self._parse(CostAlertEvents, paginated_data)
+
+    async def get_cost_alert_event(
+        self, cost_alert_token_params: CostAlertTokenParams, cost_alert_event_token_params: CostAlertEventTokenParams
+    ) -> CostAlertEvent:
+        """
+        Retrieve a specific cost alert event - GET /cost_alerts/{cost_alert_token}/events/{event_token}
+
+        Args:
+            cost_alert_token_params: The token of the cost alert
+            cost_alert_event_token_params: The token of the event to retrieve
+
+        Returns:
+            The cost alert event object
+        """
+        cost_alert_token = cost_alert_token_params.cost_alert_token
+        event_token = cost_alert_event_token_params.event_token
+        data = await self._get_raw(f"cost_alerts/{cost_alert_token}/events/{event_token}")
+        return self._parse(CostAlertEvent, data)
+
+    async def create_cost_alert(self, new_cost_alert: CreateCostAlert) -> CostAlert:
+        """
+        Create a new cost alert - POST /cost_alerts
+
+        Args:
+            new_cost_alert: The new cost alert object to create
+
+        Returns:
+            The created cost alert object
+        """
+        data = await self._post("cost_alerts", new_cost_alert)
+        return self._parse(CostAlert, data)
+
+    async def update_cost_alert(
+        self, cost_alert_token_params: CostAlertTokenParams, cost_alert_update: UpdateCostAlert
+    ) -> CostAlert:
+        """
+        Update a specific cost alert - PUT /cost_alerts/{cost_alert_token}
+
+        Args:
+            cost_alert_token_params: The token of the cost alert to update
+            cost_alert_update: The updated cost alert object
+
+        Returns:
+            The updated cost alert object
+        """
+        cost_alert_token = cost_alert_token_params.cost_alert_token
+        data = await self._put(f"cost_alerts/{cost_alert_token}", cost_alert_update)
+        return self._parse(CostAlert, data)
+
+    async def delete_cost_alert(self, cost_alert_token_params: CostAlertTokenParams) -> HttpStatusCode:
+        """
+        Delete a specific cost alert - DELETE /cost_alerts/{cost_alert_token}
+
+        Args:
+            cost_alert_token_params: The token of the cost alert to delete
+
+        Returns:
+            The HTTP status code of the response
+        """
+        cost_alert_token = cost_alert_token_params.cost_alert_token
+        return await self._delete(f"cost_alerts/{cost_alert_token}")
+
+    # ---- Cost Reports - Forecasted Costs API ----
+
+    async def get_cost_report_forecasted_costs(
+        self,
+        cost_report_token_params: CostReportTokenParams,
+        query_params: CostReportsCostReportTokenForecastedCostsGetParametersQuery | None = None,
+    ) -> ForecastedCosts:
+        """
+        Get forecasted costs for a cost report - GET /cost_reports/{cost_report_token}/forecasted_costs
+
+        Args:
+            cost_report_token_params: The token of the cost report
+            query_params: Optional query parameters for filtering forecasted costs
+
+        Returns:
+            A ForecastedCosts object containing the forecasted costs
+        """
+        cost_report_token = cost_report_token_params.cost_report_token
+        paginated_data = await self._get_paginated(f"cost_reports/{cost_report_token}/forecasted_costs", query_params)
+        return self._parse(ForecastedCosts, paginated_data)
+
+    # ---- Cost Providers & Services APIs ----
+
+    async def get_cost_providers(self, workspace_token_params: WorkspaceTokenParams | None = None) -> CostProviders:
+        """
+        Get all cost providers - GET /cost_providers
+
+        Args:
+            workspace_token_params: Optional workspace token parameters
+
+        Returns:
+            A CostProviders object which is a list of CostProvider objects
+        """
+        data = await self._get_raw("cost_providers", workspace_token_params)
+        return self._parse(CostProviders, data)
+
+    async def get_cost_services(self, workspace_token_params: WorkspaceTokenParams | None = None) -> CostServices:
+        """
+        Get all cost services - GET /cost_services
+
+        Args:
+            workspace_token_params: Optional workspace token parameters
+
+        Returns:
+            A CostServices object which is a list of CostService objects
+        """
+        data = await self._get_raw("cost_services", workspace_token_params)
+        return self._parse(CostServices, data)
+
+    # ---- Dashboards APIs ----
+
+    async def get_all_dashboards(
+        self, workspace_token_params: DashboardsGetParametersQuery | None = None
+    ) -> Dashboards:
+        """
+        Get all dashboards - GET /dashboards
+
+        Args:
+            workspace_token_params: Optional workspace token parameters
+
+        Returns:
+            A Dashboards object containing all dashboards
+        """
+        paginated_data = await self._get_paginated("dashboards", workspace_token_params)
+        return self._parse(Dashboards, paginated_data)
+
+    async def get_dashboard(self, dashboard_token_params: DashboardTokenParams) -> Dashboard:
+        """
+        Get a single dashboard - GET /dashboards/{dashboard_token}
+
+        Args:
+            dashboard_token_params: The token of the dashboard to retrieve
+
+        Returns:
+            A Dashboard object
+        """
+        dashboard_token = dashboard_token_params.dashboard_token
+        data = await self._get_raw(f"dashboards/{dashboard_token}")
+        return self._parse(Dashboard, data)
+
+    async def create_dashboard(self, new_dashboard: CreateDashboard) -> Dashboard:
+        """
+        Create a new dashboard - POST /dashboards
+
+        Args:
+            new_dashboard: The dashboard configuration to create
+
+        Returns:
+            The created Dashboard object
+        """
+        data = await self._post("dashboards", new_dashboard)
+        return self._parse(Dashboard, data)
+
+    async def update_dashboard(
+        self, dashboard_token_params: DashboardTokenParams, dashboard_update: UpdateDashboard
+    ) -> Dashboard:
+        """
+        Update an existing dashboard - PUT /dashboards/{dashboard_token}
+
+        Args:
+            dashboard_token_params: The token of the dashboard to update
+            dashboard_update: The updated dashboard configuration
+
+        Returns:
+            The updated Dashboard object
+        """
+        dashboard_token = dashboard_token_params.dashboard_token
+        data = await self._put(f"dashboards/{dashboard_token}", dashboard_update)
+        return self._parse(Dashboard, data)
+
+    async def delete_dashboard(self, dashboard_token_params: DashboardTokenParams) -> HttpStatusCode:
+        """
+        Delete a dashboard - DELETE /dashboards/{dashboard_token}
+
+        Args:
+            dashboard_token_params: The token of the dashboard to delete
+
+        Returns:
+            HTTP 204 No Content on successful deletion
+        """
+        dashboard_token = dashboard_token_params.dashboard_token
+        return await self._delete(f"dashboards/{dashboard_token}")
+
+    # ---- Canvases APIs ----
+
+    async def get_all_canvases(self, canvases_query_params: CanvasesGetParametersQuery | None = None) -> Canvases:
+        """
+        Get all canvases - GET /canvases
+
+        Args:
+            canvases_query_params: Optional pagination parameters
+
+        Returns:
+            A Canvases object containing all canvases
+        """
+        paginated_data = await self._get_paginated("canvases", canvases_query_params)
+        return self._parse(Canvases, paginated_data)
+
+    async def get_canvas(self, canvas_token_params: CanvasTokenParams) -> Canvas:
+        """
+        Get a single canvas - GET /canvases/{canvas_token}
+
+        Args:
+            canvas_token_params: The token of the canvas to retrieve
+
+        Returns:
+            A Canvas object
+        """
+        canvas_token = canvas_token_params.canvas_token
+        data = await self._get_raw(f"canvases/{canvas_token}")
+        return self._parse(Canvas, data)
+
+    async def create_canvas(self, new_canvas: CreateCanvas) -> Canvas:
+        """
+        Create a new canvas - POST /canvases
+
+        Args:
+            new_canvas: The canvas configuration to create
+
+        Returns:
+            The created Canvas object
+        """
+        data = await self._post("canvases", new_canvas)
+        return self._parse(Canvas, data)
+
+    async def update_canvas(self, canvas_token_params: CanvasTokenParams, canvas_update: UpdateCanvas) -> Canvas:
+        """
+        Update an existing canvas - PUT /canvases/{canvas_token}
+
+        Args:
+            canvas_token_params: The token of the canvas to update
+            canvas_update: The updated canvas configuration
+
+        Returns:
+            The updated Canvas object
+        """
+        canvas_token = canvas_token_params.canvas_token
+        data = await self._put(f"canvases/{canvas_token}", canvas_update)
+        return self._parse(Canvas, data)
+
+    async def delete_canvas(self, canvas_token_params: CanvasTokenParams) -> HttpStatusCode:
+        """
+        Delete a canvas - DELETE /canvases/{canvas_token}
+
+        Args:
+            canvas_token_params: The token of the canvas to delete
+
+        Returns:
+            HTTP 204 No Content on successful deletion
+        """
+        canvas_token = canvas_token_params.canvas_token
+        return await self._delete(f"canvases/{canvas_token}")
+
+    # ---- OpenAPI Specification ----
+
+    async def get_openapi_spec(self) -> dict[str, Any]:
+        """
+        Get the OpenAPI 3 specification - GET /oas_v3.json
+
+        Returns:
+            The OpenAPI specification as a dictionary
+        """
+        return await self._get("oas_v3.json")
+
+    # ---- Products & Pricing APIs ----
+
+    async def get_all_products(self) -> Products:
+        """
+        Get all products - GET /products
+
+        Returns:
+            A Products object which is a list of Product objects
+        """
+        paginated_data = await self._get_paginated("products")
+        return self._parse(Products, paginated_data)
+
+    async def get_product(self, product_id_params: ProductIdParams) -> Product:
+        """
+        Retrieve a specific product - GET /products/{id}
+
+        Args:
+            product_id_params: The ID of the product to retrieve
+
+        Returns:
+            The product object
+        """
+        product_id = product_id_params.id
+        data = await self._get_raw(f"products/{product_id}")
+        return self._parse(Product, data)
+
+    async def get_product_prices(self, product_id_params: ProductIdParams) -> Prices:
+        """
+        Get all prices for a product - GET /products/{product_id}/prices
+
+        Args:
+            product_id_params: The ID of the product to retrieve prices for
+
+        Returns:
+            A Prices object which is a list of Price objects
+        """
+        product_id = product_id_params.id
+        paginated_data = await self._get_paginated(f"products/{product_id}/prices")
+        return self._parse(Prices, paginated_data)
+
+    async def get_product_price(
+        self, product_id_params: ProductIdParams, price_id_params: ProductPriceIdParams
+    ) -> Price:
+        """
+        Retrieve a specific price for a product - GET /products/{product_id}/prices/{id}
+
+        Args:
+            product_id_params: The ID of the product
+            price_id_params: The ID of the price to retrieve
+
+        Returns:
+            The price object
+        """
+        product_id = product_id_params.id
+        price_id = price_id_params.id
+        data = await self._get_raw(f"products/{product_id}/prices/{price_id}")
+        return self._parse(Price, data)
+
+    # ---- Recommendations APIs ----
+
+    async def get_all_recommendations(self) -> Recommendations:
+        """
+        Get all recommendations - GET /recommendations
+
+        Returns:
+            A Recommendations object which is a list of Recommendation objects
+        """
+        paginated_data = await self._get_paginated("recommendations")
+        return self._parse(Recommendations, paginated_data)
+
+    async def get_recommendation(self, recommendation_token_params: RecommendationTokenParams) -> Recommendation:
+        """
+        Retrieve a specific recommendation - GET /recommendations/{recommendation_token}
+
+        Args:
+            recommendation_token_params: The token of the recommendation to retrieve
+
+        Returns:
+            The recommendation object
+        """
+        recommendation_token = recommendation_token_params.recommendation_token
+        data = await self._get_raw(f"recommendations/{recommendation_token}")
+        return self._parse(Recommendation, data)
+
+    async def get_recommendation_resources(
+        self, recommendation_token_params: RecommendationTokenParams
+    ) -> RecommendationResources:
+        """
+        Get resources for a recommendation - GET /recommendations/{recommendation_token}/resources
+
+        Args:
+            recommendation_token_params: The token of the recommendation to retrieve resources for
+
+        Returns:
+            A RecommendationResources object which is a list of RecommendationResource objects
+        """
+        recommendation_token = recommendation_token_params.recommendation_token
+        paginated_data = await self._get_paginated(f"recommendations/{recommendation_token}/resources")
+        return self._parse(RecommendationResources, paginated_data)
+
+    async def get_recommendation_resource(
+        self,
+        recommendation_token_params: RecommendationTokenParams,
+        recommendation_resource_token_params: RecommendationResourceTokenParams,
+    ) -> RecommendationResource:
+        """
+        Retrieve a specific recommendation resource.
+
+        GET /recommendations/{recommendation_token}/resources/{resource_token}
+
+        Args:
+            recommendation_token_params: The token of the recommendation
+            recommendation_resource_token_params: The token of the recommendation resource to retrieve
+
+        Returns:
+            The recommendation resource object
+        """
+        recommendation_token = recommendation_token_params.recommendation_token
+        resource_token = recommendation_resource_token_params.resource_token
+        data = await self._get_raw(f"recommendations/{recommendation_token}/resources/{resource_token}")
+        return self._parse(RecommendationResource, data)
+
+    async def get_recommendation_type_resources(
+        self,
+        recommendation_type_params: RecommendationTypeParams,
+        query_params: RecommendationsByTypeTypeResourcesGetParametersQuery | None = None,
+    ) -> RecommendationResources:
+        """
+        Get all resources for a recommendation type - GET /recommendations/by_type/{type}/resources
+
+        Args:
+            recommendation_type_params: The recommendation type to filter by
+            query_params: Optional query parameters for filtering resources
+
+        Returns:
+            A RecommendationResources object containing the resources
+        """
+        recommendation_type = recommendation_type_params.recommendation_type
+        paginated_data = await self._get_paginated(
+            f"recommendations/by_type/{recommendation_type}/resources", query_params
+        )
+        return self._parse(RecommendationResources, paginated_data)
+
+    # ---- Report Notifications APIs ----
+
+    async def get_all_report_notifications(self) -> ReportNotifications:
+        """
+        Get all report notifications - GET /report_notifications
+
+        Returns:
+            A ReportNotifications object which is a list of ReportNotification objects
+        """
+        paginated_data = await self._get_paginated("report_notifications")
+        return self._parse(ReportNotifications, paginated_data)
+
+    async def get_report_notification(
+        self, report_notification_token_params: ReportNotificationTokenParams
+    ) -> ReportNotification:
+        """
+        Retrieve a specific report notification - GET /report_notifications/{report_notification_token}
+
+        Args:
+            report_notification_token_params: The token of the report notification to retrieve
+
+        Returns:
+            The report notification object
+        """
+        report_notification_token = report_notification_token_params.report_notification_token
+        data = await self._get_raw(f"report_notifications/{report_notification_token}")
+        return self._parse(ReportNotification, data)
+
+    async def create_report_notification(self, new_report_notification: CreateReportNotification) -> ReportNotification:
+        """
+        Create a new report notification - POST /report_notifications
+
+        Args:
+            new_report_notification: The new report notification object to create
+
+        Returns:
+            The created report notification object
+        """
+        data = await self._post("report_notifications", new_report_notification)
+        return self._parse(ReportNotification, data)
+
+    async def update_report_notification(
+        self,
+        report_notification_token_params: ReportNotificationTokenParams,
+        report_notification_update: UpdateReportNotification,
+    ) -> ReportNotification:
+        """
+        Update a specific report notification - PUT /report_notifications/{report_notification_token}
+
+        Args:
+            report_notification_token_params: The token of the report notification to update
+            report_notification_update: The updated report notification object
+
+        Returns:
+            The updated report notification object
+        """
+        report_notification_token = report_notification_token_params.report_notification_token
+        data = await self._put(f"report_notifications/{report_notification_token}", report_notification_update)
+        return self._parse(ReportNotification, data)
+
+    async def delete_report_notification(
+        self, report_notification_token_params: ReportNotificationTokenParams
+    ) -> HttpStatusCode:
+        """
+        Delete a specific report notification - DELETE /report_notifications/{report_notification_token}
+
+        Args:
+            report_notification_token_params: The token of the report notification to delete
+
+        Returns:
+            The HTTP status code of the response
+        """
+        report_notification_token = report_notification_token_params.report_notification_token
+        return await self._delete(f"report_notifications/{report_notification_token}")
+
+    # ---- Resource Reports APIs ----
+
+    async def get_all_resource_reports(self) -> ResourceReports:
+        """
+        Get all resource reports - GET /resource_reports
+
+        Returns:
+            A ResourceReports object which is a list of ResourceReport objects
+        """
+        paginated_data = await self._get_paginated("resource_reports")
+        return self._parse(ResourceReports, paginated_data)
+
+    async def get_resource_report(self, resource_report_token_params: ResourceReportTokenParams) -> ResourceReport:
+        """
+        Retrieve a specific resource report - GET /resource_reports/{resource_report_token}
+
+        Args:
+            resource_report_token_params: The token of the resource report to retrieve
+
+        Returns:
+            The resource report object
+        """
+        token_value = resource_report_token_params.resource_report_token
+        data = await self._get_raw(f"resource_reports/{token_value}")
+        return self._parse(ResourceReport, data)
+
+    async def create_resource_report(self, new_resource_report: CreateResourceReport) -> ResourceReport:
+        """
+        Create a new resource report - POST /resource_reports
+
+        Args:
+            new_resource_report: The new resource report object to create
+
+        Returns:
+            The created resource report object
+        """
+        data = await self._post("resource_reports", new_resource_report)
+        return self._parse(ResourceReport, data)
+
+    async def update_resource_report(
+        self,
+        resource_report_token_params: ResourceReportTokenParams,
+        resource_report_update: UpdateResourceReport,
+    ) -> ResourceReport:
+        """
+        Update a specific resource report - PUT /resource_reports/{resource_report_token}
+
+        Args:
+            resource_report_token_params: The token of the resource report to update
+            resource_report_update: The updated resource report object
+
+        Returns:
+            The updated resource report object
+        """
+        token_value = resource_report_token_params.resource_report_token
+        data = await self._put(f"resource_reports/{token_value}", resource_report_update)
+        return self._parse(ResourceReport, data)
+
+    async def delete_resource_report(self, resource_report_token_params: ResourceReportTokenParams) -> HttpStatusCode:
+        """
+        Delete a specific resource report - DELETE /resource_reports/{resource_report_token}
+
+        Args:
+            resource_report_token_params: The token of the resource report to delete
+
+        Returns:
+            The HTTP status code of the response
+        """
+        token_value = resource_report_token_params.resource_report_token
+        return await self._delete(f"resource_reports/{token_value}")
+
+    # ---- Resources APIs ----
+
+    async def get_all_resources(self, query_params: ResourcesGetParametersQuery) -> Resources:
+        """
+        Get all resources - GET /resources
+
+        Args:
+            query_params: Query parameters for filtering resources, must include resource_report_token
+
+        Returns:
+            A Resources object which is a list of Resource objects
+        """
+        data = await self._get_raw("resources", query_params)
+        return self._parse(Resources, data)
+
+    async def get_all_resources_table(self, query_params: ResourcesGetParametersQuery) -> "Table":
+        """
+        Get all resources as columns - GET /resources
+
+        Args:
+            query_params: Query parameters for filtering resources, must include resource_report_token
+
+        Returns:
+            A Table with a column per Resource field
+
+        Note:
+            Requires the `numpy` extra
+        """
+        from vantage_sdk.columnar import RESOURCES_TABLE, build_table
+
+        data = await self._get("resources", query_params)
+        return build_table(RESOURCES_TABLE, data)
+
+    async def get_resource(self, resource_token_params: ResourceTokenParams) -> Resource:
+        """
+        Retrieve a specific resource - GET /resources/{resource_token}
+
+        Args:
+            resource_token_params: The token of the resource to retrieve
+
+        Returns:
+            The resource object
+        """
+        token_value = resource_token_params.resource_token
+        data = await self._get_raw(f"resources/{token_value}")
+        return self._parse(Resource, data)
+
+    # ---- Segments APIs ----
+
+    async def get_all_segments(self) -> Segments:
+        """
+        Get all segments - GET /segments
+
+        Returns:
+            A Segments object which is a list of Segment objects
+        """
+        paginated_data = await self._get_paginated("segments")
+        return self._parse(Segments, paginated_data)
+
+    async def get_segment(self, segment_token_params: SegmentTokenParams) -> Segment:
+        """
+        Retrieve a specific segment - GET /segments/{segment_token}
+
+        Args:
+            segment_token_params: The token of the segment to retrieve
+
+        Returns:
+            The segment object
+        """
+        token_value = segment_token_params.segment_token
+        data = await self._get_raw(f"segments/{token_value}")
+        return self._parse(Segment, data)
+
+    async def create_segment(self, new_segment: CreateSegment) -> Segment:
+        """
+        Create a new segment - POST /segments
+
+        Args:
+            new_segment: The new segment object to create
+
+        Returns:
+            The created segment object
+        """
+        data = await self._post("segments", new_segment)
+        return self._parse(Segment, data)
+
+    async def update_segment(
+        self,
+        segment_token_params: SegmentTokenParams,
+        segment_update: UpdateSegment,
+    ) -> Segment:
+        """
+        Update a specific segment - PUT /segments/{segment_token}
+
+        Args:
+            segment_token_params: The token of the segment to update
+            segment_update: The updated segment object
+
+        Returns:
+            The updated segment object
+        """
+        token_value = segment_token_params.segment_token
+        data = await self._put(f"segments/{token_value}", segment_update)
+        return self._parse(Segment, data)
+
+    async def delete_segment(self, segment_token_params: SegmentTokenParams) -> HttpStatusCode:
+        """
+        Delete a specific segment - DELETE /segments/{segment_token}
+
+        Args:
+            segment_token_params: The token of the segment to delete
+
+        Returns:
+            The HTTP status code of the response
+        """
+        token_value = segment_token_params.segment_token
+        return await self._delete(f"segments/{token_value}")
+
+    # ---- Kubernetes Efficiency Reports APIs ----
+
+    async def get_all_kubernetes_efficiency_reports(self) -> KubernetesEfficiencyReports:
+        """
+        Get all kubernetes efficiency reports - GET /kubernetes_efficiency_reports
+
+        Returns:
+            A KubernetesEfficiencyReports object which is a list of KubernetesEfficiencyReport objects
+        """
+        paginated_data = await self._get_paginated("kubernetes_efficiency_reports")
+        return self._parse(KubernetesEfficiencyReports, paginated_data)
+
+    async def get_kubernetes_efficiency_report(
+        self, kubernetes_efficiency_report_token_params: KubernetesEfficiencyReportTokenParams
+    ) -> KubernetesEfficiencyReport:
+        """
+        Retrieve a specific kubernetes efficiency report.
+
+        GET /kubernetes_efficiency_reports/{kubernetes_efficiency_report_token}
+
+        Args:
+            kubernetes_efficiency_report_token_params: The token of the kubernetes efficiency report to retrieve
+
+        Returns:
+            The kubernetes efficiency report object
+        """
+        token_value = kubernetes_efficiency_report_token_params.kubernetes_efficiency_report_token
+        data = await self._get_raw(f"kubernetes_efficiency_reports/{token_value}")
+        return self._parse(KubernetesEfficiencyReport, data)
+
+    async def create_kubernetes_efficiency_report(
+        self, new_kubernetes_efficiency_report: CreateKubernetesEfficiencyReport
+    ) -> KubernetesEfficiencyReport:
+        """
+        Create a new kubernetes efficiency report - POST /kubernetes_efficiency_reports
+
+        Args:
+            new_kubernetes_efficiency_report: The new kubernetes efficiency report object to create
+
+        Returns:
+            The created kubernetes efficiency report object
+        """
+        data = await self._post("kubernetes_efficiency_reports", new_kubernetes_efficiency_report)
+        return self._parse(KubernetesEfficiencyReport, data)
+
+    async def update_kubernetes_efficiency_report(
+        self,
+        kubernetes_efficiency_report_token_params: KubernetesEfficiencyReportTokenParams,
+        kubernetes_efficiency_report_update: UpdateKubernetesEfficiencyReport,
+    ) -> KubernetesEfficiencyReport:
+        """
+        Update a specific kubernetes efficiency report.
+
+        PUT /kubernetes_efficiency_reports/{kubernetes_efficiency_report_token}
+
+        Args:
+            kubernetes_efficiency_report_token_params: The token of the kubernetes efficiency report to update
+            kubernetes_efficiency_report_update: The updated kubernetes efficiency report object
+
+        Returns:
+            The updated kubernetes efficiency report object
+        """
+        token_value = kubernetes_efficiency_report_token_params.kubernetes_efficiency_report_token
+        data = await self._put(f"kubernetes_efficiency_reports/{token_value}", kubernetes_efficiency_report_update)
+        return self._parse(KubernetesEfficiencyReport, data)
+
+    async def delete_kubernetes_efficiency_report(
+        self, kubernetes_efficiency_report_token_params: KubernetesEfficiencyReportTokenParams
+    ) -> HttpStatusCode:
+        """
+        Delete a specific kubernetes efficiency report.
+
+        DELETE /kubernetes_efficiency_reports/{kubernetes_efficiency_report_token}
+
+        Args:
+            kubernetes_efficiency_report_token_params: The token of the kubernetes efficiency report to delete
+
+        Returns:
+            The HTTP status code of the response
+        """
+        token_value = kubernetes_efficiency_report_token_params.kubernetes_efficiency_report_token
+        return await self._delete(f"kubernetes_efficiency_reports/{token_value}")
+
+    # ---- Managed Accounts APIs ----
+
+    async def get_all_managed_accounts(self) -> ManagedAccounts:
+        """
+        Get all managed accounts - GET /managed_accounts
+
+        Returns:
+            A ManagedAccounts object which is a list of ManagedAccount objects
+        """
+        paginated_data = await self._get_paginated("managed_accounts")
+        return self._parse(ManagedAccounts, paginated_data)
+
+    async def get_managed_account(self, managed_account_token_params: ManagedAccountTokenParams) -> ManagedAccount:
+        """
+        Retrieve a specific managed account - GET /managed_accounts/{managed_account_token}
+
+        Args:
+            managed_account_token_params: The token of the managed account to retrieve
+
+        Returns:
+            The managed account object
+        """
+        token_value = managed_account_token_params.managed_account_token
+        data = await self._get_raw(f"managed_accounts/{token_value}")
+        return self._parse(ManagedAccount, data)
+
+    async def create_managed_account(self, new_managed_account: CreateManagedAccount) -> ManagedAccount:
+        """
+        Create a new managed account - POST /managed_accounts
+
+        Args:
+            new_managed_account: The new managed account object to create
+
+        Returns:
+            The created managed account object
+        """
+        data = await self._post("managed_accounts", new_managed_account)
+        return self._parse(ManagedAccount, data)
+
+    async def update_managed_account(
+        self,
+        managed_account_token_params: ManagedAccountTokenParams,
+        managed_account_update: UpdateManagedAccount,
+    ) -> ManagedAccount:
+        """
+        Update a specific managed account - PUT /managed_accounts/{managed_account_token}
+
+        Args:
+            managed_account_token_params: The token of the managed account to update
+            managed_account_update: The updated managed account object
+
+        Returns:
+            The updated managed account object
+        """
+        token_value = managed_account_token_params.managed_account_token
+        data = await self._put(f"managed_accounts/{token_value}", managed_account_update)
+        return self._parse(ManagedAccount, data)
+
+    async def delete_managed_account(self, managed_account_token_params: ManagedAccountTokenParams) -> HttpStatusCode:
+        """
+        Delete a specific managed account - DELETE /managed_accounts/{managed_account_token}
+
+        Args:
+            managed_account_token_params: The token of the managed account to delete
+
+        Returns:
+            The HTTP status code of the response
+        """
+        token_value = managed_account_token_params.managed_account_token
+        return await self._delete(f"managed_accounts/{token_value}")
+
+    # ---- Managed Account SSO APIs ----
+
+    async def create_managed_account_sso_connection(
+        self,
+        managed_account_token_params: ManagedAccountTokenParams,
+        sso_connection: CreateSsoConnectionForManagedAccount,
+    ) -> ManagedAccount:
+        """
+        Configure SSO for a managed account - POST /managed_accounts/{managed_account_token}/sso_connection
+
+        Args:
+            managed_account_token_params: The token of the managed account
+            sso_connection: The SSO connection configuration
+
+        Returns:
+            The updated managed account object
+        """
+        token_value = managed_account_token_params.managed_account_token
+        data = await self._post(f"managed_accounts/{token_value}/sso_connection", sso_connection)
+        return self._parse(ManagedAccount, data)
+
+    async def update_managed_account_sso_connection(
+        self,
+        managed_account_token_params: ManagedAccountTokenParams,
+        sso_connection_update: UpdateSsoConnectionForManagedAccount,
+    ) -> ManagedAccount:
+        """
+        Update SSO configuration for a managed account - PUT /managed_accounts/{managed_account_token}/sso_connection
+
+        Args:
+            managed_account_token_params: The token of the managed account
+            sso_connection_update: The updated SSO connection configuration
+
+        Returns:
+            The updated managed account object
+        """
+        token_value = managed_account_token_params.managed_account_token
+        data = await self._put(f"managed_accounts/{token_value}/sso_connection", sso_connection_update)
+        return self._parse(ManagedAccount, data)
+
+    async def delete_managed_account_sso_connection(
+        self, managed_account_token_params: ManagedAccountTokenParams
+    ) -> HttpStatusCode:
+        """
+        Delete SSO connection for a managed account - DELETE /managed_accounts/{managed_account_token}/sso_connection
+
+        Args:
+            managed_account_token_params: The token of the managed account
+
+        Returns:
+            The HTTP status code of the response
+        """
+        token_value = managed_account_token_params.managed_account_token
+        return await self._delete(f"managed_accounts/{token_value}/sso_connection")
+
+    # ---- Network Flow Reports APIs ----
+
+    async def get_all_network_flow_reports(
+        self, query_params: NetworkFlowReportsGetParametersQuery | None = None
+    ) -> NetworkFlowReports:
+        """
+        Get all network flow reports - GET /network_flow_reports
+
+        Args:
+            query_params: Optional query parameters for filtering network flow reports
+
+        Returns:
+            A NetworkFlowReports object which is a list of NetworkFlowReport objects
+        """
+        paginated_data = await self._get_paginated("network_flow_reports", query_params)
+        return self._parse(NetworkFlowReports, paginated_data)
+
+    async def get_network_flow_logs(self, query_params: NetworkFlowLogsGetParametersQuery) -> NetworkFlowLogs:
+        """
+        Get network flow logs - GET /network_flow_logs
+
+        Args:
+            query_params: Parameters for filtering and grouping network flow logs
+
+        Returns:
+            The matching network flow logs and sampling metadata
+        """
+        paginated_data = await self._get_paginated(
+            "network_flow_logs", query_params, collection_key="network_flow_logs"
+        )
+        return self._parse(NetworkFlowLogs, paginated_data)
+
+    async def get_network_flow_logs_table(
+        self, query_params: NetworkFlowLogsGetParametersQuery, *, decimals: bool = False
+    ) -> "Table":
+        """
+        Get network flow logs as columns - GET /network_flow_logs
+
+        Args:
+            query_params: Parameters for filtering and grouping network flow logs
+            decimals: Whether estimated costs are kept exact as Decimal objects rather than converted to float64
+
+        Returns:
+            A Table with a column per NetworkFlowLog field and per grouping, and the sampling metadata
+
+        Note:
+            Requires the `numpy` extra
+        """
+        from vantage_sdk.columnar import NETWORK_FLOW_LOGS_TABLE, build_table
+
+        paginated_data = await self._get_paginated(
+            "network_flow_logs", query_params, collection_key="network_flow_logs"
+        )
+        return build_table(NETWORK_FLOW_LOGS_TABLE, paginated_data, decimals)
+
+    # ---- Tags APIs ----
+
+    async def get_all_tags(self, query_params: TagsGetParametersQuery | None = None) -> Tags:
+        """
+        Get all tags - GET /tags
+
+        Args:
+            query_params: Optional query parameters for filtering tags
+
+        Returns:
+            A Tags object which is a list of Tag objects
+        """
+        paginated_data = await self._get_paginated("tags", query_params)
+        return self._parse(Tags, paginated_data)
+
+    async def get_tag_values(
+        self, tag_key_params: TagKeyParams, query_params: TagsKeyValuesGetParametersQuery | None = None
+    ) -> TagValues:
+        """
+        Get all values for a tag key - GET /tags/{key}/values
+
+        Args:
+            tag_key_params: The key of the tag to retrieve values for
+            query_params: Optional query parameters for filtering tag values
+
+        Returns:
+            A TagValues object which is a list of TagValue objects
+        """
+        key = tag_key_params.key
+        paginated_data = await self._get_paginated(f"tags/{key}/values", query_params)
+        return self._parse(TagValues, paginated_data)
+
+    # NOTE: The OpenAPI spec declares the response as a singular Tag, but the
+    # actual API returns {"tags": [...]}, matching the Tags collection format
+    async def update_tags(self, tag_update: UpdateTag) -> Tags:
+        """
+        Update tags - PUT /tags
+
+        Args:
+            tag_update: The update tag object
+
+        Returns:
+            The updated Tags object
+        """
+        data = await self._put("tags", tag_update)
+        return self._parse(Tags, data)
+
+    async def get_network_flow_report(
+        self, network_flow_report_token_params: NetworkFlowReportTokenParams
+    ) -> NetworkFlowReport:
+        """
+        Retrieve a specific network flow report - GET /network_flow_reports/{network_flow_report_token}
+
+        Args:
+            network_flow_report_token_params: The token of the network flow report to retrieve
+
+        Returns:
+            The network flow report object
+        """
+        token_value = network_flow_report_token_params.network_flow_report_token
+        data = await self._get_raw(f"network_flow_reports/{token_value}")
+        return self._parse(NetworkFlowReport, data)
+
+    async def create_network_flow_report(self, new_network_flow_report: CreateNetworkFlowReport) -> NetworkFlowReport:
+        """
+        Create a new network flow report - POST /network_flow_reports
+
+        Args:
+            new_network_flow_report: The new network flow report object to create
+
+        Returns:
+            The created network flow report object
+        """
+        data = await self._post("network_flow_reports", new_network_flow_report)
+        return self._parse(NetworkFlowReport, data)
+
+    async def update_network_flow_report(
+        self,
+        network_flow_report_token_params: NetworkFlowReportTokenParams,
+        network_flow_report_update: UpdateNetworkFlowReport,
+    ) -> NetworkFlowReport:
+        """
+        Update a specific network flow report - PUT /network_flow_reports/{network_flow_report_token}
+
+        Args:
+            network_flow_report_token_params: The token of the network flow report to update
+            network_flow_report_update: The updated network flow report object
+
+        Returns:
+            The updated network flow report object
+        """
+        token_value = network_flow_report_token_params.network_flow_report_token
+        data = await self._put(f"network_flow_reports/{token_value}", network_flow_report_update)
+        return self._parse(NetworkFlowReport, data)
+
+    async def delete_network_flow_report(
+        self, network_flow_report_token_params: NetworkFlowReportTokenParams
+    ) -> HttpStatusCode:
+        """
+        Delete a specific network flow report - DELETE /network_flow_reports/{network_flow_report_token}
+
+        Args:
+            network_flow_report_token_params: The token of the network flow report to delete
+
+        Returns:
+            The HTTP status code of the response
+        """
+        token_value = network_flow_report_token_params.network_flow_report_token
+        return await self._delete(f"network_flow_reports/{token_value}")
+
+    # ---- Financial Commitments & Reports APIs ----
+
+    async def get_all_financial_commitments(
+        self, workspace_token_params: WorkspaceTokenParams | None = None
+    ) -> FinancialCommitments:
+        """
+        Get all financial commitments - GET /financial_commitments
+
+        Args:
+            workspace_token_params: Optional workspace token parameters
+
+        Returns:
+            A FinancialCommitments object which is a list of FinancialCommitment objects
+        """
+        paginated_data = await self._get_paginated("financial_commitments", workspace_token_params)
+        return self._parse(FinancialCommitments, paginated_data)
+
+    async def get_all_financial_commitments_table(
+        self, workspace_token_params: WorkspaceTokenParams | None = None
+    ) -> "Table":
+        """
+        Get all financial commitments as columns - GET /financial_commitments
+
+        Args:
+            workspace_token_params: Optional workspace token parameters
+
+        Returns:
+            A Table with a column per FinancialCommitment field
+
+        Note:
+            Requires the `numpy` extra
+        """
+        from vantage_sdk.columnar import FINANCIAL_COMMITMENTS_TABLE, build_table
+
+        paginated_data = await self._get_paginated("financial_commitments", workspace_token_params)
+        return build_table(FINANCIAL_COMMITMENTS_TABLE, paginated_data)
+
+    async def get_all_financial_commitment_reports(self) -> FinancialCommitmentReports:
+        """
+        Get all financial commitment reports - GET /financial_commitment_reports
+
+        Returns:
+            A FinancialCommitmentReports object which is a list of FinancialCommitmentReport objects
+        """
+        paginated_data = await self._get_paginated("financial_commitment_reports")
+        return self._parse(FinancialCommitmentReports, paginated_data)
+
+    async def get_financial_commitment_report(
+        self, financial_commitment_report_token_params: FinancialCommitmentReportTokenParams
+    ) -> FinancialCommitmentReport:
+        """
+        Retrieve a specific financial commitment report.
+
+        GET /financial_commitment_reports/{financial_commitment_report_token}
+
+        Args:
+            financial_commitment_report_token_params: The token of the financial commitment report to retrieve
+
+        Returns:
+            The financial commitment report object
+        """
+        token_value = financial_commitment_report_token_params.financial_commitment_report_token
+        data = await self._get_raw(f"financial_commitment_reports/{token_value}")
+        return self._parse(FinancialCommitmentReport, data)
+
+    async def create_financial_commitment_report(
+        self, new_financial_commitment_report: CreateFinancialCommitmentReport
+    ) -> FinancialCommitmentReport:
+        """
+        Create a new financial commitment report - POST /financial_commitment_reports
+
+        Args:
+            new_financial_commitment_report: The new financial commitment report object to create
+
+        Returns:
+            The created financial commitment report object
+        """
+        data = await self._post("financial_commitment_reports", new_financial_commitment_report)
+        return self._parse(FinancialCommitmentReport, data)
+
+    async def update_financial_commitment_report(
+        self,
+        financial_commitment_report_token_params: FinancialCommitmentReportTokenParams,
+        financial_commitment_report_update: UpdateFinancialCommitmentReport,
+    ) -> FinancialCommitmentReport:
+        """
+        Update a specific financial commitment report.
+
+        PUT /financial_commitment_reports/{financial_commitment_report_token}
+
+        Args:
+            financial_commitment_report_token_params: The token of the financial commitment report to update
+            financial_commitment_report_update: The updated financial commitment report object
+
+        Returns:
+            The updated financial commitment report object
+        """
+        token_value = financial_commitment_report_token_params.financial_commitment_report_token
+        data = await self._put(f"financial_commitment_reports/{token_value}", financial_commitment_report_update)
+        return self._parse(FinancialCommitmentReport, data)
+
+    async def delete_financial_commitment_report(
+        self, financial_commitment_report_token_params: FinancialCommitmentReportTokenParams
+    ) -> HttpStatusCode:
+        """
+        Delete a specific financial commitment report.
+
+        DELETE /financial_commitment_reports/{financial_commitment_report_token}
+
+        Args:
+            financial_commitment_report_token_params: The token of the financial commitment report to delete
+
+        Returns:
+            The HTTP status code of the response
+        """
+        token_value = financial_commitment_report_token_params.financial_commitment_report_token
+        return await self._delete(f"financial_commitment_reports/{token_value}")
+
+    # ---- Unit Costs APIs ----
+
+    async def get_all_unit_costs(self, query_params: UnitCostsGetParametersQuery) -> UnitCosts:
+        """
+        Get all unit costs - GET /unit_costs
+
+        Args:
+            query_params: Optional query parameters for filtering unit costs
+
+        Returns:
+            A UnitCosts object containing the unit costs data
+        """
+        paginated_data = await self._get_paginated("unit_costs", query_params)
+        return self._parse(UnitCosts, paginated_data)
+
+    async def get_all_unit_costs_table(
+        self, query_params: UnitCostsGetParametersQuery, *, decimals: bool = False
+    ) -> "Table":
+        """
+        Get all unit costs as columns - GET /unit_costs
+
+        Args:
+            query_params: Optional query parameters for filtering unit costs
+            decimals: Whether amounts are kept exact as Decimal objects rather than converted to float64
+
+        Returns:
+            A Table with a column per UnitCost field
+
+        Note:
+            Requires the `numpy` extra
+        """
+        from vantage_sdk.columnar import UNIT_COSTS_TABLE, build_table
+
+        paginated_data = await self._get_paginated("unit_costs", query_params)
+        return build_table(UNIT_COSTS_TABLE, paginated_data, decimals)
+
+    async def create_unit_costs_data_export(self, unit_costs_export_request: UnitCostsDataExportsPostRequest) -> str:
+        """
+        Create a new unit costs data export - POST /unit_costs/data_exports
+
+        Args:
+            unit_costs_export_request: The request parameters for the unit costs data export
+
+        Returns:
+            str: The token of the created data export
+
+        Note:
+            This function returns the token of the created data export, which can be used to retrieve the export later.
+            The export process is asynchronous, and the export may not be immediately available.
+        """
+        response = await self._request(
+            "POST",
+            "unit_costs/data_exports",
+            json=unit_costs_export_request.model_dump(mode="json", exclude_none=True, by_alias=True),
+            timeout=None,
+        )
+        response.raise_for_status()
+
+        if response.is_success:
+            location = response.headers.get("location")
+            if location:
+                # Split the entire location URL and get the last part
+                token = location.split("/")[-1]
+                return token
+            else:
+                raise ValueError("No location header found in response")
+        else:
+            error_details = response.json()
+            error_message = f"Failed to create unit costs data export: {response.status_code}. Details: {error_details}"
+            raise HTTPStatusError(error_message, request=response.request, response=response)
+
+    # ---- User Feedback API ----
+
+    async def create_user_feedback(self, feedback: CreateUserFeedback) -> UserFeedback:
+        """
+        Create user feedback - POST /user_feedback
+
+        Args:
+            feedback: The feedback message to submit
+
+        Returns:
+            The created UserFeedback object
+        """
+        data = await self._post("user_feedback", feedback)
+        return self._parse(UserFeedback, data)
+
+    # ---- Users APIs ----
+
+    async def get_all_users(self) -> Users:
+        """
+        Get all users - GET /users
+
+        Returns:
+            A Users object containing all users
+        """
+        paginated_data = await self._get_paginated("users")
+        return self._parse(Users, paginated_data)
+
+    async def get_user(self, user_token_params: UserTokenParams) -> User:
+        """
+        Get a specific user - GET /users/{user_token}
+
+        Args:
+            user_token_params: The token of the user to retrieve
+
+        Returns:
+            The User object
+        """
+        token = user_token_params.user_token
+        data = await self._get_raw(f"users/{token}")
+        return self._parse(User, data)
+
+    async def update_user(self, user_token_params: UserTokenParams, user_update: UpdateUser) -> User:
+        """
+        Update a specific user - PUT /users/{user_token}
+
+        Args:
+            user_token_params: The token of the user to update
+            user_update: The update payload
+
+        Returns:
+            The updated User object
+        """
+        token = user_token_params.user_token
+        data = await self._put(f"users/{token}", user_update)
+        return self._parse(User, data)
+
+    # ---- Workspaces APIs ----
+
+    async def get_all_workspaces(self, query_params: WorkspacesGetParametersQuery | None = None) -> Workspaces:
+        """
+        Get all workspaces - GET /workspaces
+
+        Args:
+            query_params: Optional query parameters for filtering workspaces
+
+        Returns:
+            A Workspaces object containing all workspaces
+        """
+        paginated_data = await self._get_paginated("workspaces", query_params)
+        return self._parse(Workspaces, paginated_data)
+
+    async def get_workspace(self, workspace_token_params: WorkspaceTokenParams) -> Workspace:
+        """
+        Get a specific workspace - GET /workspaces/{workspace_token}
+
+        Args:
+            workspace_token_params: The token of the workspace to retrieve
+
+        Returns:
+            The Workspace object
+        """
+        token = workspace_token_params.workspace_token
+        data = await self._get_raw(f"workspaces/{token}")
+        return self._parse(Workspace, data)
+
+    async def create_workspace(self, workspace: CreateWorkspace) -> Workspace:
+        """
+        Create a new workspace - POST /workspaces
+
+        Args:
+            workspace: The workspace to create
+
+        Returns:
+            The created Workspace object
+        """
+        data = await self._post("workspaces", workspace)
+        return self._parse(Workspace, data)
+
+    async def update_workspace(
+        self, workspace_token_params: WorkspaceTokenParams, workspace_update: WorkspacesWorkspaceTokenPutRequest
+    ) -> Workspace:
+        """
+        Update a workspace - PUT /workspaces/{workspace_token}
+
+        Args:
+            workspace_token_params: The token of the workspace to update
+            workspace_update: The updated workspace data
+
+        Returns:
+            The updated Workspace object
+        """
+        token = workspace_token_params.workspace_token
+        data = await self._put(f"workspaces/{token}", workspace_update)
+        return self._parse(Workspace, data)
+
+    async def delete_workspace(self, workspace_token_params: WorkspaceTokenParams) -> HttpStatusCode:
+        """
+        Delete a workspace - DELETE /workspaces/{workspace_token}
+
+        Args:
+            workspace_token_params: The token of the workspace to delete
+
+        Returns:
+            The HTTP status code of the response
+        """
+        token = workspace_token_params.workspace_token
+        return await self._delete(f"workspaces/{token}")
+
+    # ---- Audit Logs APIs ----
+
+    async def get_all_audit_logs(self, query_params: AuditLogsGetParametersQuery | None = None) -> AuditLogs:
+        """
+        Get all audit logs - GET /audit_logs
+
+        Args:
+            query_params: Optional query parameters for filtering audit logs.
+                         Use object_token to filter by resource (e.g., cost report token)
+
+        Returns:
+            An AuditLogs object containing all audit logs (filtered if query_params provided)
+        """
+        paginated_data = await self._get_paginated("audit_logs", query_params)
+        return self._parse(AuditLogs, paginated_data)
+
+    async def iter_audit_logs_pages(
+        self, query_params: AuditLogsGetParametersQuery | None = None
+    ) -> AsyncIterator[AuditLogs]:
+        """
+        Stream the pages of all audit logs - GET /audit_logs
+
+        Args:
+            query_params: Optional query parameters for filtering audit logs
+
+        Yields:
+            An AuditLogs object for each page, as soon as it arrives
+        """
+        async for page in self._iter_pages("audit_logs", AuditLogs, query_params):
+            yield page
+
+    async def iter_audit_logs(self, query_params: AuditLogsGetParametersQuery | None = None) -> AsyncIterator[AuditLog]:
+        """
+        Stream all audit logs - GET /audit_logs
+
+        Args:
+            query_params: Optional query parameters for filtering audit logs
+
+        Yields:
+            Each AuditLog object, as soon as the page containing it arrives
+        """
+        async for page in self.iter_audit_logs_pages(query_params):
+            for audit_log in page.audit_logs:
+                yield audit_log
+
+    async def get_audit_log(self, audit_log_token_params: AuditLogTokenParams) -> AuditLog:
+        """
+        Get a specific audit log - GET /audit_logs/{audit_log_token}
+
+        Args:
+            audit_log_token_params: The token of the audit log to retrieve
+
+        Returns:
+            The AuditLog object
+        """
+        token = audit_log_token_params.audit_log_token
+        data = await self._get_raw(f"audit_logs/{token}")
+        return self._parse(AuditLog, data)
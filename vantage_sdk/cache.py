@@ -0,0 +1,974 @@
+"""
+Response caching for GET requests
+
+A ResponseCache sits under the clients' `_get` and `_get_paginated`, so every read method can be served from it
+without a round trip. Entries are keyed by the normalized endpoint and the canonical JSON of the query
+parameters, hold the raw JSON body of the response and expire after a TTL that can be set per endpoint pattern.
+Bodies are handed back undecoded on every hit, so the clients validate them straight into their models and
+callers always receive their own copy
+
+Caching is opt-in: pass a ResponseCache to the client. Where entries are stored is up to its backend, by default
+a bounded in-memory LRU, or a SQLite file that persists across process restarts and is shared by every process
+on the host, such as the workers of a gunicorn server, so a response fetched by one worker serves them all
+
+Entries also keep the ETag and Last-Modified validators of their response. Once an entry has expired the next
+request for it is sent with If-None-Match and If-Modified-Since, and a 304 Not Modified renews the entry and
+serves its body without downloading it again. A combined paginated response keeps the validators of each of its
+pages, and is only renewed if every page is unchanged
+
+Writes made through a client keep the cache consistent. A POST, PUT or DELETE evicts every entry of the resource
+it wrote to, e.g. `folders` and `folders/fldr_1` after updating that folder, along with the entries of resources
+whose responses depend on it, such as cost report listings after a folder changes. A response that was still
+being fetched when its resource was evicted is not stored, since it may predate the write
+
+With a stale TTL, an entry that expired less than that many seconds ago is still served, instantly, while a
+single background request refreshes it, so hot metadata never makes a caller wait on the API
+
+The SQLite backend stores bodies compressed, with zstd when the `zstandard` package is installed and zlib
+otherwise. Cost responses repeat the same provider, service, region and currency strings on every row and
+typically shrink by an order of magnitude, so the same disk and page cache hold many more months of history
+"""
+
+import importlib
+import json
+import logging
+import os
+import sqlite3
+import threading
+import time
+import zlib
+from collections import OrderedDict
+from collections.abc import Generator, Mapping, Sequence
+from contextlib import contextmanager
+from contextvars import ContextVar
+from pathlib import Path
+from typing import Any, Protocol
+
+from httpx import Response
+from pydantic import BaseModel, Field
+
+from vantage_sdk.endpoints import match_endpoint, normalize_endpoint
+
+logger = logging.getLogger(__name__)
+
+# Default number of seconds a cached response stays fresh
+DEFAULT_CACHE_TTL = 300.0
+
+# Default number of entries kept by the in-memory backend
+DEFAULT_MAX_ENTRIES = 1024
+
+# Default number of bytes of a SQLite cache file each process maps into memory
+DEFAULT_MMAP_SIZE = 256 * 1024 * 1024
+
+# Default number of seconds to wait for another process's write to a SQLite cache file
+DEFAULT_BUSY_TIMEOUT = 5.0
+
+# Default number of stores a process makes to a SQLite cache file between two prunes
+DEFAULT_PRUNE_INTERVAL = 100
+
+# Default number of seconds an expired entry of a SQLite cache file is kept, to be served stale or revalidated
+DEFAULT_EXPIRED_GRACE = 24 * 60 * 60.0
+
+# Methods that never change what the API returns
+SAFE_METHODS = frozenset({"GET", "HEAD", "OPTIONS"})
+
+# Endpoints that are written to but only start reads, so writing to them changes no cached response
+READ_ONLY_WRITES = frozenset({"costs/data_exports", "unit_costs/data_exports"})
+
+# Resources whose responses also change when another resource is written to
+RELATED_RESOURCES: dict[str, tuple[str, ...]] = {
+    "billing_rules": ("costs", "managed_accounts"),
+    "budget_alerts": ("budgets",),
+    "budgets": ("budget_alerts",),
+    "business_metrics": ("cost_reports", "unit_costs"),
+    "cost_reports": ("business_metrics", "costs", "saved_filters"),
+    "folders": ("cost_reports", "resource_reports"),
+    "integrations": ("costs", "managed_accounts"),
+    "resource_reports": ("resources",),
+    "saved_filters": ("cost_reports", "costs", "dashboards", "folders"),
+    "segments": ("costs",),
+    "virtual_tag_configs": ("costs", "tags"),
+    "workspaces": ("me",),
+}
+
+# Codecs the SQLite backend can compress bodies with
+COMPRESSION_CODECS = ("zstd", "zlib")
+
+# Default compression level of each codec, favoring speed since bodies are compressed on every store
+COMPRESSION_LEVELS = {"zstd": 3, "zlib": 6}
+
+
+def _import_zstd() -> Any | None:
+    """The zstandard module, if the optional dependency is installed"""
+    try:
+        return importlib.import_module("zstandard")
+    except ImportError:
+        return None
+
+
+_zstd = _import_zstd()
+
+# The codec the SQLite backend uses unless told otherwise, the best one available
+DEFAULT_COMPRESSION = "zstd" if _zstd is not None else "zlib"
+
+_background_refresh: ContextVar[bool] = ContextVar("vantage_sdk_background_refresh", default=False)
+
+
+class CacheEntry:
+    """
+    A cached response body, when it stops being fresh and the validators to revalidate it with
+
+    A combined paginated response has no validators of its own, it keeps the conditional request headers that
+    revalidate each of its pages in `page_validators`
+    """
+
+    __slots__ = ("body", "etag", "expires_at", "last_modified", "page_validators", "stored_at")
+
+    def __init__(
+        self,
+        body: bytes,
+        stored_at: float,
+        expires_at: float,
+        etag: str | None = None,
+        last_modified: str | None = None,
+        page_validators: Sequence[Mapping[str, str]] = (),
+    ):
+        self.body = body
+        self.stored_at = stored_at
+        self.expires_at = expires_at
+        self.etag = etag
+        self.last_modified = last_modified
+        self.page_validators = tuple(page_validators)
+
+    def is_fresh(self, now: float | None = None) -> bool:
+        """Whether the entry can still be served, optionally at a given wall-clock time"""
+        return (time.time() if now is None else now) < self.expires_at
+
+
+def compress(body: bytes, codec: str, level: int | None = None) -> bytes:
+    """
+    Compress a body
+
+    Args:
+        body: The bytes to compress
+        codec: One of COMPRESSION_CODECS
+        level: The compression level, defaults to the codec's level in COMPRESSION_LEVELS
+
+    Returns:
+        The compressed bytes
+    """
+    if codec not in COMPRESSION_CODECS:
+        raise ValueError(f"Unknown compression codec {codec!r}, expected one of {', '.join(COMPRESSION_CODECS)}")
+    level = level if level is not None else COMPRESSION_LEVELS[codec]
+    if codec == "zstd":
+        if _zstd is None:
+            raise ValueError("zstd requires the zstandard package, install client-for-vantage[zstd]")
+        return _zstd.ZstdCompressor(level=level).compress(body)
+    return zlib.compress(body, level)
+
+
+def decompress(body: bytes, codec: str | None) -> bytes:
+    """
+    Decompress a body
+
+    Args:
+        body: The stored bytes
+        codec: The codec they were compressed with, None if they were stored as is
+
+    Returns:
+        The original bytes
+    """
+    if codec is None:
+        return body
+    if codec == "zstd":
+        if _zstd is None:
+            raise ValueError("Decompressing zstd requires the zstandard package")
+        return _zstd.ZstdDecompressor().decompress(body)
+    if codec == "zlib":
+        return zlib.decompress(body)
+    raise ValueError(f"Unknown compression codec {codec!r}")
+
+
+class CacheBackend(Protocol):
+    """Where a ResponseCache stores its entries"""
+
+    def get(self, key: str) -> CacheEntry | None:
+        """Get the entry stored under a key, expired or not"""
+        ...
+
+    def set(self, key: str, entry: CacheEntry) -> None:
+        """Store an entry, replacing any entry under the same key"""
+        ...
+
+    def delete(self, key: str) -> None:
+        """Remove the entry stored under a key, if any"""
+        ...
+
+    def delete_prefix(self, prefix: str) -> int:
+        """Remove every entry whose key starts with a prefix, returning how many were removed"""
+        ...
+
+    def sizes(self) -> tuple[int, int]:
+        """The bytes of the bodies stored, before and after compression"""
+        ...
+
+    def clear(self) -> None:
+        """Remove every entry"""
+        ...
+
+    def __len__(self) -> int:
+        """The number of entries stored"""
+        ...
+
+
+class MemoryCacheBackend:
+    """A thread-safe in-memory backend that evicts the least recently used entry once full"""
+
+    def __init__(self, max_entries: int = DEFAULT_MAX_ENTRIES):
+        if max_entries < 1:
+            raise ValueError("max_entries must be at least 1")
+        self.max_entries = max_entries
+        self._entries: OrderedDict[str, CacheEntry] = OrderedDict()
+        self._lock = threading.Lock()
+
+    def get(self, key: str) -> CacheEntry | None:
+        """Get the entry stored under a key, marking it as recently used"""
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is not None:
+                self._entries.move_to_end(key)
+            return entry
+
+    def set(self, key: str, entry: CacheEntry) -> None:
+        """Store an entry, evicting the least recently used entries beyond `max_entries`"""
+        with self._lock:
+            self._entries[key] = entry
+            self._entries.move_to_end(key)
+            while len(self._entries) > self.max_entries:
+                evicted, _ = self._entries.popitem(last=False)
+                logger.debug("Evicted cache entry %s", evicted)
+
+    def delete(self, key: str) -> None:
+        """Remove the entry stored under a key, if any"""
+        with self._lock:
+            self._entries.pop(key, None)
+
+    def delete_prefix(self, prefix: str) -> int:
+        """Remove every entry whose key starts with a prefix, returning how many were removed"""
+        with self._lock:
+            keys = [key for key in self._entries if key.startswith(prefix)]
+            for key in keys:
+                del self._entries[key]
+            return len(keys)
+
+    def sizes(self) -> tuple[int, int]:
+        """The bytes of the bodies stored, which are kept uncompressed so both sizes are equal"""
+        with self._lock:
+            size = sum(len(entry.body) for entry in self._entries.values())
+        return size, size
+
+    def clear(self) -> None:
+        """Remove every entry"""
+        with self._lock:
+            self._entries.clear()
+
+    def __len__(self) -> int:
+        """The number of entries stored"""
+        return len(self._entries)
+
+
+class SQLiteCacheBackend:
+    """
+    A backend storing entries in a SQLite file, so they survive process restarts and are shared by every process
+    on a host that opens the same file
+
+    The database runs in WAL mode, so readers never block the writer or each other, and is memory-mapped, so
+    processes reading the same entries share the OS page cache instead of each holding a copy. Each process opens
+    its own connection on first use, including workers forked after the backend was created, and within a process
+    that connection is shared by all threads and serialized with a lock
+
+    Bodies are compressed before they are written and decompressed when read. Each row records its codec, so a
+    file written with another codec, or by a version that did not compress, is still read correctly
+
+    The file is pruned when a process opens it and then every `prune_interval` stores that process makes. Entries
+    that expired more than `expired_grace` seconds ago are removed, then the least recently used entries beyond
+    `max_entries` or `max_bytes` of stored bodies. Between two prunes the file can exceed its caps by the entries
+    stored since the last one
+
+    Args:
+        path: The SQLite file
+        mmap_size: The number of bytes of the file each process maps into memory, 0 disables memory-mapped I/O
+        busy_timeout: Seconds to wait for another process's write to finish before failing
+        compression: The codec to compress bodies with, one of COMPRESSION_CODECS, or None to store them as is
+        compression_level: The codec's compression level, defaults to its level in COMPRESSION_LEVELS
+        max_entries: The number of entries kept, unbounded by default
+        max_bytes: The bytes of stored, compressed, bodies kept, unbounded by default
+        expired_grace: Seconds an expired entry is kept, so it can still be served stale or revalidated
+        prune_interval: The number of stores a process makes between two prunes
+    """
+
+    def __init__(
+        self,
+        path: str | os.PathLike[str],
+        *,
+        mmap_size: int = DEFAULT_MMAP_SIZE,
+        busy_timeout: float = DEFAULT_BUSY_TIMEOUT,
+        compression: str | None = DEFAULT_COMPRESSION,
+        compression_level: int | None = None,
+        max_entries: int | None = None,
+        max_bytes: int | None = None,
+        expired_grace: float = DEFAULT_EXPIRED_GRACE,
+        prune_interval: int = DEFAULT_PRUNE_INTERVAL,
+    ):
+        if compression is not None:
+            # Fail on an unknown or unavailable codec now rather than on the first store
+            compress(b"", compression, compression_level)
+        if max_entries is not None and max_entries < 1:
+            raise ValueError("max_entries must be at least 1")
+        if max_bytes is not None and max_bytes < 1:
+            raise ValueError("max_bytes must be at least 1")
+        if prune_interval < 1:
+            raise ValueError("prune_interval must be at least 1")
+        self.path = Path(path)
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        self.mmap_size = mmap_size
+        self.busy_timeout = busy_timeout
+        self.compression = compression
+        self.compression_level = compression_level
+        self.max_entries = max_entries
+        self.max_bytes = max_bytes
+        self.expired_grace = expired_grace
+        self.prune_interval = prune_interval
+        self._lock = threading.Lock()
+        self._pid = os.getpid()
+        self._db: sqlite3.Connection | None = None
+        self._stores = 0
+        # Open eagerly so that a file that cannot be used fails here rather than on the first lookup
+        with self._connection():
+            pass
+
+    @property
+    def _capped(self) -> bool:
+        """Whether the file keeps a bounded number of entries or bytes, so reads must record when they happened"""
+        return self.max_entries is not None or self.max_bytes is not None
+
+    def _open(self) -> sqlite3.Connection:
+        """Open a connection, create or migrate the schema and prune the file"""
+        db = sqlite3.connect(self.path, timeout=self.busy_timeout, check_same_thread=False, isolation_level=None)
+        db.execute("PRAGMA journal_mode=WAL")
+        # In WAL mode NORMAL can only lose the last writes on power loss, never corrupt the file
+        db.execute("PRAGMA synchronous=NORMAL")
+        db.execute(f"PRAGMA mmap_size={int(self.mmap_size)}")
+        # Serialize schema changes across processes opening the file at the same time
+        db.execute("BEGIN IMMEDIATE")
+        try:
+            db.execute(
+                "CREATE TABLE IF NOT EXISTS entries ("
+                "key TEXT PRIMARY KEY, body BLOB NOT NULL, stored_at REAL NOT NULL, expires_at REAL NOT NULL, "
+                "etag TEXT, last_modified TEXT, codec TEXT, size INTEGER, accessed_at REAL, page_validators TEXT)"
+            )
+            # Files created before entries kept validators, were compressed or were evicted lack their columns
+            columns = {row[1] for row in db.execute("PRAGMA table_info(entries)")}
+            for column, kind in (
+                ("etag", "TEXT"),
+                ("last_modified", "TEXT"),
+                ("codec", "TEXT"),
+                ("size", "INTEGER"),
+                ("accessed_at", "REAL"),
+                ("page_validators", "TEXT"),
+            ):
+                if column not in columns:
+                    db.execute(f"ALTER TABLE entries ADD COLUMN {column} {kind}")
+            if "accessed_at" not in columns:
+                db.execute("UPDATE entries SET accessed_at = stored_at")
+            db.execute("CREATE INDEX IF NOT EXISTS entries_accessed_at ON entries (accessed_at)")
+            db.execute("COMMIT")
+        except BaseException:
+            db.execute("ROLLBACK")
+            db.close()
+            raise
+        self._prune(db)
+        return db
+
+    @contextmanager
+    def _connection(self) -> Generator[sqlite3.Connection]:
+        """Hold the connection of the current process, opening it on first use"""
+        if self._pid != os.getpid():
+            # A forked worker must not touch its parent's connection, nor a lock the parent may have held
+            self._lock = threading.Lock()
+            self._db = None
+            self._pid = os.getpid()
+        with self._lock:
+            if self._db is None:
+                self._db = self._open()
+            yield self._db
+
+    def get(self, key: str) -> CacheEntry | None:
+        """Get the entry stored under a key, expired or not, or None if it cannot be decompressed here"""
+        with self._connection() as db:
+            row = db.execute(
+                "SELECT body, stored_at, expires_at, etag, last_modified, codec, page_validators "
+                "FROM entries WHERE key = ?",
+                (key,),
+            ).fetchone()
+            if row is not None and self._capped:
+                db.execute("UPDATE entries SET accessed_at = ? WHERE key = ?", (time.time(), key))
+        if row is None:
+            return None
+        body, stored_at, expires_at, etag, last_modified, codec, page_validators = row
+        try:
+            body = decompress(body, codec)
+        except (ValueError, zlib.error) as exc:
+            logger.warning("Ignoring cache entry %s that cannot be decompressed: %s", key, exc)
+            return None
+        pages = json.loads(page_validators) if page_validators else ()
+        return CacheEntry(body, stored_at, expires_at, etag, last_modified, pages)
+
+    def set(self, key: str, entry: CacheEntry) -> None:
+        """Store an entry, replacing any entry under the same key, and prune the file every `prune_interval` stores"""
+        body, codec = entry.body, self.compression
+        if codec is not None:
+            body = compress(entry.body, codec, self.compression_level)
+            # Tiny bodies can grow, those are stored as is
+            if len(body) >= len(entry.body):
+                body, codec = entry.body, None
+        with self._connection() as db:
+            db.execute(
+                "INSERT OR REPLACE INTO entries "
+                "(key, body, stored_at, expires_at, etag, last_modified, codec, size, accessed_at, page_validators) "
+                "VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?)",
+                (
+                    key,
+                    body,
+                    entry.stored_at,
+                    entry.expires_at,
+                    entry.etag,
+                    entry.last_modified,
+                    codec,
+                    len(entry.body),
+                    time.time(),
+                    json.dumps(entry.page_validators) if entry.page_validators else None,
+                ),
+            )
+            self._stores += 1
+            if self._stores >= self.prune_interval:
+                self._prune(db)
+
+    def delete(self, key: str) -> None:
+        """Remove the entry stored under a key, if any"""
+        with self._connection() as db:
+            db.execute("DELETE FROM entries WHERE key = ?", (key,))
+
+    def delete_prefix(self, prefix: str) -> int:
+        """Remove every entry whose key starts with a prefix, returning how many were removed"""
+        with self._connection() as db:
+            return db.execute("DELETE FROM entries WHERE substr(key, 1, ?) = ?", (len(prefix), prefix)).rowcount
+
+    def sizes(self) -> tuple[int, int]:
+        """The bytes of the bodies stored, before and after compression"""
+        with self._connection() as db:
+            raw, stored = db.execute(
+                "SELECT COALESCE(SUM(COALESCE(size, length(body))), 0), COALESCE(SUM(length(body)), 0) FROM entries"
+            ).fetchone()
+        return raw, stored
+
+    def clear(self) -> None:
+        """Remove every entry"""
+        with self._connection() as db:
+            db.execute("DELETE FROM entries")
+
+    def purge_expired(self, grace: float = 0.0) -> int:
+        """
+        Remove the entries that are no longer fresh, which are otherwise kept until they are replaced or pruned
+
+        Args:
+            grace: Only remove the entries that expired more than this many seconds ago
+
+        Returns:
+            The number of entries removed
+        """
+        with self._connection() as db:
+            return db.execute("DELETE FROM entries WHERE expires_at <= ?", (time.time() - grace,)).rowcount
+
+    def prune(self) -> int:
+        """
+        Remove the entries that expired more than `expired_grace` seconds ago, then the least recently used entries
+        beyond `max_entries` or `max_bytes`
+
+        Returns:
+            The number of entries removed
+        """
+        with self._connection() as db:
+            return self._prune(db)
+
+    def _prune(self, db: sqlite3.Connection) -> int:
+        """Prune the file through a connection already held"""
+        self._stores = 0
+        removed = db.execute("DELETE FROM entries WHERE expires_at <= ?", (time.time() - self.expired_grace,)).rowcount
+        if self.max_entries is not None:
+            removed += db.execute(
+                "DELETE FROM entries WHERE key IN "
+                "(SELECT key FROM entries ORDER BY accessed_at DESC, key LIMIT -1 OFFSET ?)",
+                (self.max_entries,),
+            ).rowcount
+        if self.max_bytes is not None:
+            removed += db.execute(
+                "DELETE FROM entries WHERE key IN (SELECT key FROM "
+                "(SELECT key, SUM(length(body)) OVER (ORDER BY accessed_at DESC, key) AS kept FROM entries) "
+                "WHERE kept > ?)",
+                (self.max_bytes,),
+            ).rowcount
+        if removed:
+            logger.debug("Pruned %d entries from cache file %s", removed, self.path)
+        return removed
+
+    def close(self) -> None:
+        """Close the current process's database connection, a later call reopens it"""
+        with self._lock:
+            if self._db is not None and self._pid == os.getpid():
+                self._db.close()
+            self._db = None
+
+    def __len__(self) -> int:
+        """The number of entries stored"""
+        with self._connection() as db:
+            return db.execute("SELECT COUNT(*) FROM entries").fetchone()[0]
+
+
+class CacheStats(BaseModel):
+    """A snapshot of a ResponseCache's counters"""
+
+    hits: int = Field(default=0, description="Lookups served from the cache")
+    misses: int = Field(default=0, description="Lookups that had to go to the API, including expired entries")
+    expired: int = Field(default=0, description="Misses caused by an entry that was no longer fresh")
+    stale: int = Field(default=0, description="Hits served from an expired entry while it was being refreshed")
+    revalidated: int = Field(default=0, description="Expired entries renewed by a 304 Not Modified")
+    invalidated: int = Field(default=0, description="Entries evicted because a write may have changed them")
+    stores: int = Field(default=0, description="Responses written to the cache")
+    entries: int = Field(default=0, description="Entries currently held by the backend")
+    raw_bytes: int = Field(default=0, description="Bytes of the bodies held by the backend, uncompressed")
+    stored_bytes: int = Field(default=0, description="Bytes the backend uses to hold those bodies")
+
+    @property
+    def hit_ratio(self) -> float:
+        """The share of lookups served from the cache"""
+        lookups = self.hits + self.misses
+        return self.hits / lookups if lookups else 0.0
+
+    @property
+    def compression_ratio(self) -> float:
+        """How many times smaller the bodies are as stored, 1.0 when they are not compressed"""
+        return self.raw_bytes / self.stored_bytes if self.stored_bytes else 1.0
+
+
+def canonical_params(params: Mapping[str, Any] | None) -> str:
+    """
+    Serialize query parameters so that equal queries produce equal strings
+
+    Args:
+        params: The query parameters
+
+    Returns:
+        Compact JSON with sorted keys
+    """
+    return json.dumps(params or {}, sort_keys=True, separators=(",", ":"), default=str)
+
+
+@contextmanager
+def background_refresh() -> Generator[None]:
+    """Mark the requests made inside the block as a background refresh, so they never serve stale entries"""
+    token = _background_refresh.set(True)
+    try:
+        yield
+    finally:
+        _background_refresh.reset(token)
+
+
+def in_background_refresh() -> bool:
+    """Whether the current request is part of a background refresh"""
+    return _background_refresh.get()
+
+
+def request_key(endpoint: str, params: Mapping[str, Any] | None = None, variant: str = "get") -> str:
+    """
+    Identify a GET request, so that equal requests produce equal keys
+
+    Args:
+        endpoint: The endpoint being requested
+        params: The query parameters of the request
+        variant: Distinguishes differently shaped results of the same request, e.g. a single page and the
+            combined response of every page
+
+    Returns:
+        The normalized endpoint, the canonical parameters and the variant
+    """
+    return f"{normalize_endpoint(endpoint)}?{canonical_params(params)}#{variant}"
+
+
+def resource_of(endpoint: str) -> str:
+    """
+    The resource an endpoint belongs to
+
+    Args:
+        endpoint: The endpoint, e.g. 'folders/fldr_123'
+
+    Returns:
+        Its first path segment, e.g. 'folders'
+    """
+    return normalize_endpoint(endpoint).split("/", 1)[0]
+
+
+def invalidates(method: str, endpoint: str) -> bool:
+    """
+    Whether a request may change cached responses
+
+    Args:
+        method: The HTTP method
+        endpoint: The endpoint being requested
+
+    Returns:
+        True for writes, except to endpoints in READ_ONLY_WRITES
+    """
+    return method.upper() not in SAFE_METHODS and normalize_endpoint(endpoint) not in READ_ONLY_WRITES
+
+
+def conditional_headers(etag: str | None, last_modified: str | None) -> dict[str, str]:
+    """
+    The headers of a conditional request that revalidates a response
+
+    Args:
+        etag: The ETag header of the response
+        last_modified: The Last-Modified header of the response
+
+    Returns:
+        If-None-Match and If-Modified-Since headers, empty if the response had no validators
+    """
+    headers: dict[str, str] = {}
+    if etag is not None:
+        headers["If-None-Match"] = etag
+    if last_modified is not None:
+        headers["If-Modified-Since"] = last_modified
+    return headers
+
+
+def response_validators(response: Response) -> dict[str, str]:
+    """The conditional request headers that revalidate a response"""
+    return conditional_headers(response.headers.get("ETag"), response.headers.get("Last-Modified"))
+
+
+class ResponseCache:
+    """
+    A TTL cache for GET responses, shared by every request made through a client
+
+    Example:
+        cache = ResponseCache(ttl=60, endpoint_ttls={"workspaces": 3600, "costs": 0})
+        vantage = VantageSDK(api_key, cache=cache)
+
+    Args:
+        backend: Where entries are stored, defaults to an in-memory LRU of `max_entries` entries
+        ttl: The number of seconds a response stays fresh, 0 disables caching except for `endpoint_ttls`
+        endpoint_ttls: TTLs for endpoints matching a pattern, 0 disables caching for them
+        max_entries: The size of the default in-memory backend
+        stale_ttl: The number of seconds past its TTL an entry is still served while it is refreshed in the
+            background, 0 waits for the refresh
+        endpoint_stale_ttls: Stale TTLs for endpoints matching a pattern
+    """
+
+    def __init__(
+        self,
+        backend: CacheBackend | None = None,
+        *,
+        ttl: float = DEFAULT_CACHE_TTL,
+        endpoint_ttls: Mapping[str, float] | None = None,
+        max_entries: int = DEFAULT_MAX_ENTRIES,
+        stale_ttl: float = 0.0,
+        endpoint_stale_ttls: Mapping[str, float] | None = None,
+    ):
+        self.backend: CacheBackend = backend if backend is not None else MemoryCacheBackend(max_entries)
+        self.ttl = ttl
+        self.endpoint_ttls: dict[str, float] = dict(endpoint_ttls or {})
+        self.stale_ttl = stale_ttl
+        self.endpoint_stale_ttls: dict[str, float] = dict(endpoint_stale_ttls or {})
+        self._hits = self._misses = self._expired = self._stale = 0
+        self._revalidated = self._invalidated = self._stores = 0
+        # How many times the entries of each resource were evicted, so responses fetched before are not stored
+        self._generations: dict[str, int] = {}
+        self._lock = threading.Lock()
+
+    @property
+    def stats(self) -> CacheStats:
+        """The hit and miss counters since the cache was created or last reset"""
+        raw_bytes, stored_bytes = self.backend.sizes()
+        with self._lock:
+            return CacheStats(
+                hits=self._hits,
+                misses=self._misses,
+                expired=self._expired,
+                stale=self._stale,
+                revalidated=self._revalidated,
+                invalidated=self._invalidated,
+                stores=self._stores,
+                entries=len(self.backend),
+                raw_bytes=raw_bytes,
+                stored_bytes=stored_bytes,
+            )
+
+    def reset_stats(self) -> None:
+        """Reset the hit and miss counters"""
+        with self._lock:
+            self._hits = self._misses = self._expired = self._stale = 0
+            self._revalidated = self._invalidated = self._stores = 0
+
+    def ttl_for(self, endpoint: str) -> float:
+        """
+        The TTL of an endpoint
+
+        Args:
+            endpoint: The endpoint being requested
+
+        Returns:
+            The number of seconds its responses stay fresh, 0 if they are not cached
+        """
+        endpoint_ttl = match_endpoint(self.endpoint_ttls, endpoint)
+        return endpoint_ttl if endpoint_ttl is not None else self.ttl
+
+    def stale_ttl_for(self, endpoint: str) -> float:
+        """
+        The stale TTL of an endpoint
+
+        Args:
+            endpoint: The endpoint being requested
+
+        Returns:
+            The number of seconds past their TTL its responses are still served while being refreshed
+        """
+        endpoint_stale_ttl = match_endpoint(self.endpoint_stale_ttls, endpoint)
+        return endpoint_stale_ttl if endpoint_stale_ttl is not None else self.stale_ttl
+
+    def generation(self, endpoint: str) -> int:
+        """
+        How many times a write evicted the entries of an endpoint's resource
+
+        Read it before requesting the endpoint and pass it to `store`, so that a response fetched while a write
+        evicted its resource, which may predate the write, is not stored
+
+        Args:
+            endpoint: The endpoint being requested
+
+        Returns:
+            The number of evictions so far
+        """
+        with self._lock:
+            return self._generations.get(resource_of(endpoint), 0)
+
+    def key(self, endpoint: str, params: Mapping[str, Any] | None = None, *, variant: str = "get") -> str | None:
+        """
+        The cache key of a request
+
+        Args:
+            endpoint: The endpoint being requested
+            params: The query parameters of the request
+            variant: Distinguishes differently shaped results of the same request, e.g. a single page and the
+                combined response of every page
+
+        Returns:
+            The key, or None if the endpoint is not cached
+        """
+        if self.ttl_for(endpoint) <= 0:
+            return None
+        return request_key(endpoint, params, variant)
+
+    def load(self, key: str) -> dict[str, Any] | None:
+        """
+        Get a fresh cached response
+
+        Args:
+            key: The cache key of the request
+
+        Returns:
+            A new copy of the decoded response, or None on a miss
+        """
+        body = self._read(key, 0.0)[0]
+        return json.loads(body) if body is not None else None
+
+    def _read(self, key: str, stale_ttl: float) -> tuple[bytes | None, bool]:
+        """
+        Get a cached response that is fresh, or expired less than `stale_ttl` seconds ago
+
+        Returns:
+            The raw JSON body, None on a miss, and whether it has expired and should be refreshed
+        """
+        entry = self.backend.get(key)
+        now = time.time()
+        fresh = entry is not None and entry.is_fresh(now)
+        stale = entry is not None and not fresh and entry.is_fresh(now - stale_ttl)
+        with self._lock:
+            if fresh or stale:
+                self._hits += 1
+                self._stale += stale
+            else:
+                self._misses += 1
+                self._expired += entry is not None
+        if entry is None or not (fresh or stale):
+            return None, False
+        logger.debug("Cache hit for %s%s", key, " (stale)" if stale else "")
+        return entry.body, stale
+
+    def lookup(
+        self, endpoint: str, params: Mapping[str, Any] | None = None, *, variant: str = "get", allow_stale: bool = True
+    ) -> tuple[str | None, bytes | None, bool]:
+        """
+        Look a request up in the cache
+
+        The body is returned undecoded, so that callers can validate it straight into a model
+
+        Args:
+            endpoint: The endpoint being requested
+            params: The query parameters of the request
+            variant: Distinguishes differently shaped results of the same request
+            allow_stale: Whether an entry within the endpoint's stale TTL may be served
+
+        Returns:
+            The cache key, None if the endpoint is not cached, the raw JSON body of the cached response, None on
+            a miss, and whether it has expired and should be refreshed
+        """
+        key = self.key(endpoint, params, variant=variant)
+        if key is None:
+            return None, None, False
+        return key, *self._read(key, self.stale_ttl_for(endpoint) if allow_stale else 0.0)
+
+    def store(
+        self,
+        key: str,
+        endpoint: str,
+        body: bytes | dict[str, Any],
+        *,
+        ttl: float | None = None,
+        etag: str | None = None,
+        last_modified: str | None = None,
+        page_validators: Sequence[Mapping[str, str]] = (),
+        generation: int | None = None,
+    ) -> None:
+        """
+        Cache a response
+
+        Args:
+            key: The cache key of the request
+            endpoint: The endpoint that was requested, selects the TTL
+            body: The raw JSON body, or the decoded response
+            ttl: Overrides the endpoint's TTL for this entry
+            etag: The ETag header of the response
+            last_modified: The Last-Modified header of the response
+            page_validators: The conditional request headers that revalidate each page of a combined paginated
+                response
+            generation: The `generation` of the endpoint when the request started, the response is dropped if
+                its resource was evicted since
+        """
+        if self._evicted_since(endpoint, generation):
+            logger.debug("Not caching %s, it was evicted while being fetched", key)
+            return
+        if not isinstance(body, bytes):
+            body = json.dumps(body, separators=(",", ":")).encode()
+        now = time.time()
+        expires_at = now + (self.ttl_for(endpoint) if ttl is None else ttl)
+        self.backend.set(key, CacheEntry(body, now, expires_at, etag, last_modified, page_validators))
+        if self._evicted_since(endpoint, generation):
+            # Evicted after the check above but possibly before the entry was set
+            self.backend.delete(key)
+            return
+        with self._lock:
+            self._stores += 1
+
+    def _evicted_since(self, endpoint: str, generation: int | None) -> bool:
+        """Whether a write evicted the entries of an endpoint's resource after `generation` was read"""
+        return generation is not None and self.generation(endpoint) != generation
+
+    def validators(self, key: str) -> dict[str, str]:
+        """
+        The conditional request headers that revalidate a cached response
+
+        Args:
+            key: The cache key of the request
+
+        Returns:
+            If-None-Match and If-Modified-Since headers, empty if no entry with validators is stored under the key
+        """
+        entry = self.backend.get(key)
+        if entry is None:
+            return {}
+        return conditional_headers(entry.etag, entry.last_modified)
+
+    def page_validators(self, key: str) -> list[dict[str, str]]:
+        """
+        The conditional request headers that revalidate each page of a cached paginated response
+
+        Args:
+            key: The cache key of the combined response
+
+        Returns:
+            The If-None-Match and If-Modified-Since headers of each page in order, empty if no entry is stored
+            under the key or any of its pages lacks validators, since such a response can only be fetched again
+        """
+        entry = self.backend.get(key)
+        if entry is None:
+            return []
+        headers = [dict(page) for page in entry.page_validators]
+        return headers if all(headers) else []
+
+    def revalidate(self, key: str, endpoint: str, generation: int | None = None) -> bytes | None:
+        """
+        Renew a cached response after the server answered its conditional request with 304 Not Modified
+
+        Args:
+            key: The cache key of the request
+            endpoint: The endpoint that was requested, selects the TTL
+            generation: The `generation` of the endpoint when the conditional request started
+
+        Returns:
+            The raw JSON body of the response, or None if the entry was evicted in the meantime
+        """
+        entry = self.backend.get(key)
+        if entry is None or self._evicted_since(endpoint, generation):
+            return None
+        now = time.time()
+        expires_at = now + self.ttl_for(endpoint)
+        self.backend.set(
+            key,
+            CacheEntry(entry.body, entry.stored_at, expires_at, entry.etag, entry.last_modified, entry.page_validators),
+        )
+        if self._evicted_since(endpoint, generation):
+            self.backend.delete(key)
+            return None
+        with self._lock:
+            self._revalidated += 1
+        logger.debug("Revalidated cache entry %s", key)
+        return entry.body
+
+    def invalidate(self, endpoint: str) -> int:
+        """
+        Evict the entries that a write to an endpoint may have changed
+
+        Args:
+            endpoint: The endpoint that was written to
+
+        Returns:
+            The number of entries evicted
+        """
+        resource = resource_of(endpoint)
+        affected_resources = (resource, *RELATED_RESOURCES.get(resource, ()))
+        # Counted before evicting, so a response stored in between is either evicted or dropped by `store`
+        with self._lock:
+            for affected in affected_resources:
+                self._generations[affected] = self._generations.get(affected, 0) + 1
+        evicted = 0
+        for affected in affected_resources:
+            # Both the resource's listings and every object under it
+            evicted += self.backend.delete_prefix(f"{affected}?") + self.backend.delete_prefix(f"{affected}/")
+        with self._lock:
+            self._invalidated += evicted
+        logger.debug("Evicted %d cache entries after a write to %s", evicted, endpoint)
+        return evicted
+
+    def clear(self) -> None:
+        """Remove every entry"""
+        self.backend.clear()
@@ -1,13 +1,42 @@
-import asyncio
 import logging
-import warnings
-from collections.abc import Sequence
-from typing import Any, NewType, cast
+import queue
+import ssl
+import threading
+import time
+import weakref
+from collections.abc import Callable, Generator, Iterable, Iterator, Mapping, Sequence
+from concurrent.futures import FIRST_COMPLETED, Future, ThreadPoolExecutor, wait
+from contextlib import closing
+from contextvars import copy_context
+from functools import partial
+from itertools import chain, count
+from types import TracebackType
+from typing import TYPE_CHECKING, Any, NewType, Self
 from urllib.parse import urljoin
 
-from httpx import AsyncClient, Client, HTTPError, HTTPStatusError, Timeout
+from httpx import AsyncClient, Client, HTTPError, HTTPStatusError, Limits, Response, Timeout, create_ssl_context
 from pydantic import BaseModel
-
+from pydantic_core import from_json
+
+from vantage_sdk.cache import (
+    ResponseCache,
+    background_refresh,
+    in_background_refresh,
+    invalidates,
+    request_key,
+    response_validators,
+)
+from vantage_sdk.concurrency import (
+    DEFAULT_MAX_CONCURRENCY,
+    AdaptiveConcurrency,
+    AIMDLimit,
+    ConcurrencyController,
+    call_concurrency,
+    resolve_concurrency,
+)
+from vantage_sdk.cost_cache import CostCache
+from vantage_sdk.costs import merge_cost_shards, shard_cost_params
+from vantage_sdk.loop import BackgroundLoop, PaginationExecutor, has_running_loop
 from vantage_sdk.models import (
     AccessGrant,
     AccessGrants,
@@ -44,12 +73,14 @@ from vantage_sdk.models import (
     BusinessMetricsBusinessMetricTokenValuesGetParametersQuery,
     BusinessMetricsGetParametersQuery,
     BusinessMetricTokenParams,
+    BusinessMetricValue,
     BusinessMetricValues,
     BusinessMetricValuesDeleteResponse,
     Canvas,
     Canvases,
     CanvasesGetParametersQuery,
     CanvasTokenParams,
+    Cost,
     CostAlert,
     CostAlertEvent,
     CostAlertEvents,
@@ -206,6 +237,25 @@ from vantage_sdk.models import (
     WorkspacesWorkspaceTokenPutRequest,
     WorkspaceTokenParams,
 )
+from vantage_sdk.pagination import (
+    ModelPage,
+    Page,
+    is_empty_page,
+    merge_keys,
+    merge_page,
+    model_page,
+    page_content,
+    page_json,
+    parse_page,
+)
+from vantage_sdk.rate_limit import RateLimit, RateLimiter
+from vantage_sdk.retry import RetryPolicy, send_with_retry, send_with_retry_async
+from vantage_sdk.singleflight import SingleFlight
+from vantage_sdk.validation import M, parse_response
+
+if TYPE_CHECKING:
+    # Only imported for annotations, as columnar results require the optional NumPy dependency
+    from vantage_sdk.columnar import Table
 
 logger = logging.getLogger(__name__)
 
@@ -221,14 +271,97 @@ PollInterval = NewType("PollInterval", int)
 # Base URL for the Vantage API
 BASE_URL = "https://api.vantage.sh/v2/"
 
+# Connection pool for concurrent page fetches, idle connections are kept alive long enough
+# to be reused by back-to-back paginated calls
+POOL_LIMITS = Limits(max_connections=100, max_keepalive_connections=20, keepalive_expiry=30.0)
+
+
+def ssl_context_of(session: Client) -> ssl.SSLContext:
+    """
+    Get the SSL context used by a session's connection pool
+
+    Args:
+        session: The sync client to read the SSL context from
+
+    Returns:
+        The session's SSL context, or a new default context if the session uses a custom transport
+    """
+    pool = getattr(getattr(session, "_transport", None), "_pool", None)
+    ssl_context = getattr(pool, "_ssl_context", None)
+    if isinstance(ssl_context, ssl.SSLContext):
+        return ssl_context
+    return create_ssl_context()
+
+
+def release_pagination(loop: BackgroundLoop, async_session: AsyncClient | None = None) -> None:
+    """
+    Close the AsyncClient pages are fetched through and stop the background loop it lives on
+
+    Runs when a VantageSDK is closed or garbage collected, so it must not hold a reference to the SDK
+
+    Args:
+        loop: The SDK's background loop
+        async_session: The SDK's AsyncClient, if it created one
+    """
+    if async_session is not None and loop.is_running and not loop.in_loop_thread():
+        loop.run(async_session.aclose())
+    loop.close()
+
 
 class VantageSDK:
     """VantageSDK is a Python client for the Vantage API"""
 
     _timeout = Timeout(60.0, read=None)
 
-    def __init__(self, api_key: str, session: Client | None = None):
+    def __init__(
+        self,
+        api_key: str,
+        session: Client | None = None,
+        *,
+        max_concurrency: int = DEFAULT_MAX_CONCURRENCY,
+        endpoint_concurrency: Mapping[str, int] | None = None,
+        adaptive_concurrency: AdaptiveConcurrency | None = None,
+        rate_limits: Mapping[str, RateLimit | None] | None = None,
+        retry_policy: RetryPolicy | None = None,
+        cache: ResponseCache | None = None,
+        cost_cache: CostCache | None = None,
+        prefetch_depth: int = 0,
+        speculative_prefetch: bool = False,
+        pagination_executor: PaginationExecutor = PaginationExecutor.auto,
+        lazy_collections: bool = False,
+    ):
         self.base_url = BASE_URL
+        # Upper bound on the pages of a single paginated call that are fetched at once,
+        # endpoint_concurrency overrides it for endpoints matching a pattern, e.g. {"business_metrics/*/values": 4}
+        self.max_concurrency = max_concurrency
+        self.endpoint_concurrency: dict[str, int] = dict(endpoint_concurrency or {})
+        # With adaptive_concurrency those limits are only starting points, adjusted per endpoint from the
+        # status and latency of every response
+        self.concurrency_controller = ConcurrencyController(adaptive_concurrency)
+        # Per-endpoint request budgets shared by every request made through this client,
+        # defaults to the documented limits of the API such as 5 requests every 5 seconds for GET /costs
+        self.rate_limiter = RateLimiter(rate_limits)
+        # Every request, including each page of a paginated call, is retried on its own on 429 and 5xx,
+        # pass RetryPolicy(max_retries=0) to disable retries
+        self.retry_policy = retry_policy if retry_policy is not None else RetryPolicy()
+        # Pages requested ahead on endpoints that only link to their next page such as GET /costs,
+        # 0 walks them one page at a time
+        self.prefetch_depth = prefetch_depth
+        # Opt-in requests for the page numbers after the last page seen, before any page links to them, which
+        # may request pages past the last one
+        self.speculative_prefetch = speculative_prefetch
+        # Opt-in cache of GET responses, both single requests and the combined pages of paginated ones
+        self.cache = cache
+        # Identical GET requests made concurrently share a single request to the API
+        self._in_flight = SingleFlight()
+        # Keys of stale cache entries being refreshed in the background, so each is refreshed once at a time
+        self._refreshing: set[str] = set()
+        self._refresh_lock = threading.Lock()
+        # Opt-in persistent cache of get_cost_report_costs results, trusting closed periods for longer
+        self.cost_cache = cost_cache
+        # With lazy_collections the items of Costs, Resources and AuditLogs responses are only validated when
+        # first accessed, so callers reading a few of them do not pay for all of them
+        self.lazy_collections = lazy_collections
         # Preventing mutable default arguments
         if session is None:
             session = Client(timeout=self._timeout)
@@ -241,6 +374,36 @@ class VantageSDK:
                 "Content-Type": "application/json",
             }
         )
+        # Pages 2..N are fetched concurrently through one long-lived AsyncClient that lives on a
+        # background event loop, so its pooled keep-alive connections are reused across calls and
+        # pagination works even when the caller already runs an event loop (Jupyter, FastAPI, ...)
+        self.pagination_executor = PaginationExecutor(pagination_executor)
+        self._loop = BackgroundLoop()
+        self._async_session: AsyncClient | None = None
+        # Both are also released once the SDK is garbage collected, so SDKs that are never closed do not leak
+        # threads or connections
+        self._release = weakref.finalize(self, release_pagination, self._loop)
+
+    def __enter__(self) -> Self:
+        """Enter the context manager, returning the SDK itself"""
+        return self
+
+    def __exit__(
+        self,
+        exc_type: type[BaseException] | None,
+        exc_value: BaseException | None,
+        traceback: TracebackType | None,
+    ) -> None:
+        """Exit the context manager, closing all connections"""
+        self.close()
+
+    def close(self) -> None:
+        """Close the sync session, the shared async session used for pagination and its event loop"""
+        self._release()
+        self._async_session = None
+        # The loop starts again if the SDK is used after being closed
+        self._release = weakref.finalize(self, release_pagination, self._loop)
+        self.session.close()
 
     @property
     def timeout(self) -> Timeout:
@@ -251,9 +414,178 @@ class VantageSDK:
     def timeout(self, value: Timeout) -> None:
         self._timeout = value
         self.session.timeout = value
+        if self._async_session is not None:
+            self._async_session.timeout = value
+
+    @property
+    def async_session(self) -> AsyncClient:
+        """
+        The AsyncClient shared by every concurrent page fetch
+
+        It is created on first use with the same SSL context as `session`, so no new context is built and
+        its keep-alive connection pool is reused by every paginated call made through this SDK
+        """
+        if self._async_session is None:
+            self._async_session = AsyncClient(
+                timeout=self._timeout,
+                verify=ssl_context_of(self.session),
+                limits=POOL_LIMITS,
+            )
+            self._release.detach()
+            self._release = weakref.finalize(self, release_pagination, self._loop, self._async_session)
+        return self._async_session
 
     # ---- Private Methods ----
 
+    def _request(self, method: str, endpoint: str, **kwargs: Any) -> Response:
+        """
+        Send a request through the sync session once the endpoint's rate limit allows it, retrying it on
+        transient failures according to the retry policy
+
+        Args:
+            method: The HTTP method
+            endpoint: The API endpoint, relative to the base URL
+            **kwargs: Extra arguments passed to `Client.request`
+
+        Returns:
+            The HTTP response
+        """
+        url = urljoin(self.base_url, endpoint)
+
+        def send() -> Response:
+            self.rate_limiter.acquire(endpoint)
+            started = time.monotonic()
+            response = self.session.request(method, url, **kwargs)
+            self.concurrency_controller.record(endpoint, response.status_code, time.monotonic() - started)
+            return response
+
+        try:
+            return send_with_retry(self.retry_policy, method, send)
+        finally:
+            # Evict what a write may have changed, even if it failed, since it may have been applied anyway
+            if invalidates(method, endpoint):
+                self._invalidate(endpoint)
+
+    async def _request_async(self, method: str, endpoint: str, **kwargs: Any) -> Response:
+        """
+        Send a request through the shared AsyncClient once the endpoint's rate limit allows it, retrying it on
+        transient failures according to the retry policy
+
+        Args:
+            method: The HTTP method
+            endpoint: The API endpoint, relative to the base URL
+            **kwargs: Extra arguments passed to `AsyncClient.request`
+
+        Returns:
+            The HTTP response
+        """
+        url = urljoin(self.base_url, endpoint)
+        # The AsyncClient is shared, so the sync session's headers are sent along with those of the request
+        headers = self.session.headers.copy()
+        headers.update(kwargs.pop("headers", None) or {})
+
+        async def send() -> Response:
+            await self.rate_limiter.acquire_async(endpoint)
+            started = time.monotonic()
+            response = await self.async_session.request(method, url, headers=headers, **kwargs)
+            self.concurrency_controller.record(endpoint, response.status_code, time.monotonic() - started)
+            return response
+
+        return await send_with_retry_async(self.retry_policy, method, send)
+
+    def _invalidate(self, endpoint: str) -> None:
+        """Evict the cached responses and cost results that a write to an endpoint may have changed"""
+        if self.cache is not None:
+            self.cache.invalidate(endpoint)
+        if self.cost_cache is not None:
+            self.cost_cache.invalidate(endpoint)
+
+    def _cache_lookup(
+        self, endpoint: str, params: dict[str, Any] | None, *, variant: str = "get"
+    ) -> tuple[str | None, bytes | None, bool]:
+        """
+        Look a GET request up in the response cache, if caching is enabled
+
+        Returns:
+            The cache key, None if the request is not cached, the raw JSON body of the cached response, None on a
+            miss, and whether it is stale and should be refreshed
+        """
+        if self.cache is None:
+            return None, None, False
+        return self.cache.lookup(endpoint, params, variant=variant, allow_stale=not in_background_refresh())
+
+    def _refresh_in_background(self, cache_key: str, refresh: Callable[[], object]) -> None:
+        """
+        Refresh a stale cache entry on a daemon thread, unless a refresh of it is already running
+
+        Args:
+            cache_key: The key of the stale entry
+            refresh: Fetches the response and stores it under `cache_key`
+        """
+        with self._refresh_lock:
+            if cache_key in self._refreshing:
+                return
+            self._refreshing.add(cache_key)
+
+        def run() -> None:
+            try:
+                with background_refresh():
+                    refresh()
+            except Exception:
+                logger.warning("Background refresh of %s failed", cache_key, exc_info=True)
+            finally:
+                with self._refresh_lock:
+                    self._refreshing.discard(cache_key)
+
+        logger.debug("Refreshing stale cache entry %s in the background", cache_key)
+        threading.Thread(target=run, name="vantage-sdk-refresh", daemon=True).start()
+
+    def _cache_store(
+        self,
+        cache_key: str | None,
+        endpoint: str,
+        body: bytes | dict[str, Any],
+        response: Response | None = None,
+        *,
+        page_validators: Sequence[Mapping[str, str]] = (),
+        generation: int | None = None,
+    ) -> None:
+        """
+        Store a GET response under the key returned by `_cache_lookup`, if it is cached, along with the ETag and
+        Last-Modified validators of `response`, or the conditional request headers of each page it combines.
+        Nothing is stored if a write evicted the endpoint since `generation` was read
+        """
+        if cache_key is not None and self.cache is not None:
+            etag = response.headers.get("ETag") if response is not None else None
+            last_modified = response.headers.get("Last-Modified") if response is not None else None
+            self.cache.store(
+                cache_key,
+                endpoint,
+                body,
+                etag=etag,
+                last_modified=last_modified,
+                page_validators=page_validators,
+                generation=generation,
+            )
+
+    def _cache_generation(self, endpoint: str) -> int | None:
+        """The generation of an endpoint in the response cache, read before requesting it"""
+        return self.cache.generation(endpoint) if self.cache is not None else None
+
+    def _parse(self, model: type[M], data: bytes | Mapping[str, Any]) -> M:
+        """
+        Validate the model of a response, leaving the items of its collection to be validated on first access with
+        `lazy_collections`
+
+        Args:
+            model: The model of the response
+            data: The raw JSON body, or the decoded response
+
+        Returns:
+            The model
+        """
+        return parse_response(model, data, self.lazy_collections)
+
     def _get(self, endpoint: str, params: dict[str, Any] | BaseModel | None = None) -> dict[str, Any]:
         """
         Perform a GET request to the specified endpoint
@@ -265,8 +597,22 @@ class VantageSDK:
         Returns:
             The JSON response from the API
         """
-        url = urljoin(self.base_url, endpoint)
+        return from_json(self._get_raw(endpoint, params))
 
+    def _get_raw(self, endpoint: str, params: dict[str, Any] | BaseModel | None = None) -> bytes:
+        """
+        Perform a GET request to the specified endpoint without decoding its response
+
+        Methods returning a model validate these bytes with `model_validate_json`, which parses them directly
+        into the model instead of building a dictionary and validating that in a second pass
+
+        Args:
+            endpoint: The API endpoint to fetch data from
+            params: Optional query parameters for the request, must be a Pydantic model
+
+        Returns:
+            The raw JSON body of the response
+        """
         if isinstance(params, BaseModel):
             params = params.model_dump(
                 mode="json",
@@ -275,9 +621,42 @@ class VantageSDK:
                 exclude_defaults=True,
             )
 
-        response = self.session.get(url, params=params)
+        cache_key, cached, stale = self._cache_lookup(endpoint, params)
+        if cached is not None:
+            if stale and cache_key is not None:
+                self._refresh_in_background(cache_key, partial(self._fetch, endpoint, params, cache_key))
+            return cached
+        fetch = partial(self._fetch, endpoint, params, cache_key)
+        return self._in_flight.do(request_key(endpoint, params), fetch)
+
+    def _fetch(self, endpoint: str, params: dict[str, Any] | None, cache_key: str | None) -> bytes:
+        """
+        Send a GET request and cache its response, revalidating the expired entry under `cache_key` if it has
+        validators
+
+        Args:
+            endpoint: The API endpoint to fetch data from
+            params: The query parameters of the request
+            cache_key: The key returned by `_cache_lookup`
+
+        Returns:
+            The raw JSON body of the response
+        """
+        generation = self._cache_generation(endpoint)
+        response = None
+        if self.cache is not None and cache_key is not None and (validators := self.cache.validators(cache_key)):
+            # Revalidate the expired entry, so an unchanged response is not downloaded again
+            response = self._request("GET", endpoint, params=params, headers=validators)
+            if response.status_code == 304:
+                revalidated = self.cache.revalidate(cache_key, endpoint, generation)
+                if revalidated is not None:
+                    return revalidated
+                response = None
+        if response is None:
+            response = self._request("GET", endpoint, params=params)
         response.raise_for_status()
-        return response.json()
+        self._cache_store(cache_key, endpoint, response.content, response, generation=generation)
+        return response.content
 
     def _get_paginated(
         self,
@@ -285,6 +664,7 @@ class VantageSDK:
         params: dict[str, Any] | BaseModel | None = None,
         *,
         collection_key: str | None = None,
+        max_concurrency: int | None = None,
     ) -> dict[str, Any]:
         """Fetch paginated results automatically, combining all pages into a single response dictionary
 
@@ -297,6 +677,7 @@ class VantageSDK:
             endpoint: The API endpoint to fetch data from
             params: Optional query parameters for the request, can be a Pydantic model or dict
             collection_key: Optional response key to concatenate while preserving other response metadata
+            max_concurrency: Optional limit on the pages fetched at once, overrides the client and endpoint limits
 
         Returns:
             The combined response from all pages
@@ -307,13 +688,41 @@ class VantageSDK:
         elif isinstance(params, BaseModel):
             params = params.model_dump(mode="json", by_alias=True, exclude_none=True, exclude_defaults=True)
 
-        first_response = self._get(endpoint, {**params, "page": 1})
+        cache_key, cached, stale = self._cache_lookup(endpoint, params, variant=f"pages:{collection_key or ''}")
+        if cached is not None:
+            if stale and cache_key is not None:
+                refresh = partial(self._fetch_paginated, endpoint, params, cache_key, collection_key, max_concurrency)
+                self._refresh_in_background(cache_key, refresh)
+            return from_json(cached)
+        fetch = partial(self._fetch_paginated, endpoint, params, cache_key, collection_key, max_concurrency)
+        return self._in_flight.do(request_key(endpoint, params, f"pages:{collection_key or ''}"), fetch)
+
+    def _fetch_paginated(
+        self,
+        endpoint: str,
+        params: dict[str, Any],
+        cache_key: str | None,
+        collection_key: str | None,
+        max_concurrency: int | None,
+    ) -> dict[str, Any]:
+        """
+        Fetch every page of a paginated endpoint, combine them and cache the combined response
+
+        The combined response keeps the validators of each page. Once it expires, it is renewed if no page changed,
+        otherwise the pages that changed are reused and only the others are downloaded again
+
+        Args:
+            endpoint: The API endpoint to fetch data from
+            params: The query parameters shared by every page
+            cache_key: The key returned by `_cache_lookup`
+            collection_key: Optional response key to concatenate while preserving other response metadata
+            max_concurrency: Optional limit on the pages fetched at once, overrides the client and endpoint limits
 
-        def parse_page(page_response: dict[str, Any], page_key: str) -> int | None:
-            links = page_response.get("links", {}).get(page_key, None)
-            if links:
-                return int(links.split("page=")[1])
-            return None
+        Returns:
+            The combined response from all pages
+        """
+        generation = self._cache_generation(endpoint)
+        first_response = self._get(endpoint, {**params, "page": 1})
 
         total_pages = parse_page(first_response, "last")
         next_page = parse_page(first_response, "next")
@@ -322,103 +731,429 @@ class VantageSDK:
         # or if the GET /costs endpoint returns None for total_pages and next_page
         if total_pages == 1 or (total_pages is None and next_page is None):
             first_response.pop("links", None)
+            self._cache_store(cache_key, endpoint, first_response, generation=generation)
             return first_response
 
         # Identify keys to merge (excluding links)
-        response_keys = [collection_key] if collection_key else [k for k in first_response if k != "links"]
+        response_keys = merge_keys(first_response, collection_key)
 
         # GET /costs is the only paginated endpoint that returns None for total_pages
         # since Vantage doesn't provide the total number of pages
         # We don't know total pages, so fetch next pages in sequence
         if not total_pages:
-            while next_page:
-                page_data = self._get(endpoint, {**params, "page": next_page})
-                for key in response_keys:
-                    if key in page_data:
-                        if isinstance(first_response[key], list) and isinstance(page_data[key], list):
-                            first_response[key].extend(page_data[key])
-                            logger.debug(
-                                "Page %d: Added %d items to list key '%s'", next_page, len(page_data[key]), key
-                            )
-                        elif isinstance(first_response[key], dict) and isinstance(page_data[key], dict):
-                            first_response[key].update(page_data[key])
-                            logger.debug("Page %d: Updated dictionary key '%s'", next_page, key)
-                    else:
-                        # For other types, assume addition is appropriate
-                        first_response[key] += page_data[key]
-                        logger.debug("Page %d: Updated scalar key '%s'", next_page, key)
-
-                next_page = parse_page(page_data, "next")
+            for page_num, page_data in self._walk_cursor(
+                endpoint, params, next_page, response_keys, self._get, from_json
+            ):
+                merge_page(first_response, page_data, response_keys, page_num)
 
             first_response.pop("links", None)
+            self._cache_store(cache_key, endpoint, first_response, generation=generation)
             return first_response
 
-        async def fetch_remaining_pages() -> None:
-            """Fetch all remaining pages concurrently"""
-            # Create a temporary async client with the same headers
-            headers = dict(self.session.headers)
-
-            # Initialize a new async client
-            async with AsyncClient(base_url=self.base_url, headers=headers, timeout=self._timeout) as async_client:
-                # Create tasks for pages 2 to n
-                tasks: list[Any] = []
-
-                for page_num in range(2, total_pages + 1):
-                    page_params = {**params, "page": page_num}
-                    tasks.append(async_client.get(f"/{endpoint}", params=page_params))
-
-                    # Log URLs for debugging
-                    query_string = "&".join([f"{k}={v}" for k, v in page_params.items()])
-                    full_url = f"{self.base_url}/{endpoint}?{query_string}"
-                    logger.debug("Fetching page %d: %s", page_num, full_url)
-
-                # Execute all requests concurrently
-                responses = await asyncio.gather(*tasks, return_exceptions=True)
-
-                # Process results
-                for i, response in enumerate(responses, start=2):
-                    # Check if response is an exception
-                    if isinstance(response, Exception):
-                        error_msg = f"Request failed for page {i}: {response!s}"
-                        logger.error(error_msg)
-                        raise RuntimeError(error_msg)
-
-                    # Check for HTTP errors
-                    if response.is_error:  # type: ignore
-                        error_msg = f"HTTP error on page {i}: {response.status_code} - {response.text}"  # type: ignore
-                        logger.error(error_msg)
-                        raise RuntimeError(error_msg)
-
-                    page_data = response.json()  # type: ignore
-
-                    # Process each key from the response
-                    for key in response_keys:
-                        if key in page_data:
-                            if isinstance(first_response[key], list) and isinstance(page_data[key], list):
-                                items = cast(list[Any], page_data[key])
-                                first_response[key].extend(items)
-                                logger.debug(
-                                    "Page %d: Added %d items to list key '%s'",
-                                    i,
-                                    len(items),
-                                    key,
-                                )
-                            elif isinstance(first_response[key], dict) and isinstance(page_data[key], dict):
-                                first_response[key].update(page_data[key])
-                                logger.debug("Page %d: Updated dictionary key '%s'", i, key)
-                            else:
-                                # For other types, assume addition is appropriate
-                                first_response[key] += page_data[key]
-                                logger.debug("Page %d: Updated scalar key '%s'", i, key)
-
-        # Run the async function
-        asyncio.run(fetch_remaining_pages())
+        page_numbers = range(2, total_pages + 1)
+        concurrency = resolve_concurrency(endpoint, self.max_concurrency, self.endpoint_concurrency, max_concurrency)
+        limit = self.concurrency_controller.limit_for(
+            endpoint, concurrency, fixed=call_concurrency(max_concurrency) is not None
+        )
+        renewed, changed = self._revalidate_pages(endpoint, params, cache_key, total_pages, limit, generation)
+        if renewed is not None:
+            return from_json(renewed)
+
+        # Pages that changed were downloaded while revalidating, only the others are fetched
+        reused = [(page_num, changed[page_num]) for page_num in page_numbers if page_num in changed]
+        missing = [page_num for page_num in page_numbers if page_num not in changed]
+        # Pages are decoded as they arrive, failing fast on the first one that failed, then merged in order
+        pages: dict[int, dict[str, Any]] = {}
+        validators = {1: self._first_page_validators(endpoint, params)}
+        with closing(self._page_fetches(endpoint, params, missing, limit)) as fetches:
+            for page_num, response in chain(reused, fetches):
+                pages[page_num] = page_json(page_num, response)
+                if isinstance(response, Response):
+                    validators[page_num] = response_validators(response)
+        for page_num in page_numbers:
+            merge_page(first_response, pages.pop(page_num), response_keys, page_num)
 
         # Remove the links from the result
         first_response.pop("links", None)
+        page_validators = [validators[page_num] for page_num in range(1, total_pages + 1)]
+        self._cache_store(cache_key, endpoint, first_response, page_validators=page_validators, generation=generation)
 
         return first_response
 
+    def _first_page_validators(self, endpoint: str, params: dict[str, Any]) -> dict[str, str]:
+        """The conditional request headers that revalidate the first page of a paginated call, cached by `_get`"""
+        if self.cache is None:
+            return {}
+        key = self.cache.key(endpoint, {**params, "page": 1})
+        return self.cache.validators(key) if key is not None else {}
+
+    def _revalidate_pages(
+        self,
+        endpoint: str,
+        params: dict[str, Any],
+        cache_key: str | None,
+        total_pages: int,
+        limit: AIMDLimit,
+        generation: int | None,
+    ) -> tuple[bytes | None, dict[int, Response]]:
+        """
+        Send a conditional request for pages 2 to `total_pages` of an expired combined response
+
+        `_get` revalidates the first page through its own entry. If that page kept the validators stored with the
+        combined response it is unchanged, along with the page count, so the other pages are revalidated with
+        theirs. Otherwise, or if some page has no validators, nothing is sent
+
+        Args:
+            endpoint: The API endpoint to fetch data from
+            params: The query parameters shared by every page
+            cache_key: The key returned by `_cache_lookup`
+            total_pages: The number of pages the first page links to
+            limit: The number of pages allowed in flight at once
+            generation: The generation of the endpoint in the response cache when the call started
+
+        Returns:
+            The raw JSON body of the renewed combined response, None unless every page was unchanged, and the
+            response of each page that changed
+        """
+        if self.cache is None or cache_key is None:
+            return None, {}
+        page_validators = self.cache.page_validators(cache_key)
+        if len(page_validators) != total_pages or page_validators[0] != self._first_page_validators(endpoint, params):
+            return None, {}
+        headers = dict(enumerate(page_validators[1:], start=2))
+        with closing(self._page_fetches(endpoint, params, headers, limit, headers=headers)) as fetches:
+            responses = dict(fetches)
+        if all(isinstance(response, Response) and response.status_code == 304 for response in responses.values()):
+            renewed = self.cache.revalidate(cache_key, endpoint, generation)
+            if renewed is not None:
+                return renewed, {}
+        # Pages whose request failed are fetched again along with the unchanged ones
+        return None, {
+            page_num: response
+            for page_num, response in responses.items()
+            if isinstance(response, Response) and response.status_code != 304 and not response.is_error
+        }
+
+    def _walk_cursor(
+        self,
+        endpoint: str,
+        params: dict[str, Any],
+        next_page: int | None,
+        response_keys: Sequence[str],
+        get: Callable[[str, dict[str, Any]], Page],
+        decode: Callable[[bytes], Page],
+    ) -> Iterator[tuple[int, Page]]:
+        """
+        Walk an endpoint that only links to its next page, such as GET /costs, starting at `next_page`
+
+        By default each page is requested once the previous one arrived. With `prefetch_depth` set, the next links
+        are followed in the background up to that many pages ahead of the caller, so the next page is in flight
+        while earlier ones are merged, and nothing is requested past the last page. With `speculative_prefetch`
+        page numbers are requested ahead instead, since they are always consecutive, before any page links to
+        them. That walk stops at the first page without a next link or without items, and requests made past it
+        are cancelled or discarded
+
+        Args:
+            endpoint: The API endpoint to fetch data from
+            params: The query parameters shared by every page
+            next_page: The first page to fetch, None if there is none
+            response_keys: The keys of the response that hold its items
+            get: Requests a page the way `_get` does and decodes it, used when pages are fetched one at a time
+            decode: Decodes the raw body of a page fetched ahead of the caller
+
+        Yields:
+            The page number and decoded page of each page
+        """
+        if not self.prefetch_depth:
+            while next_page:
+                page_num = next_page
+                page_data = get(endpoint, {**params, "page": page_num})
+                next_page = parse_page(page_data, "next")
+                yield page_num, page_data
+            return
+
+        if next_page is None:
+            return
+        if not self.speculative_prefetch:
+            with closing(self._read_ahead(endpoint, params, next_page, decode)) as pages:
+                yield from pages
+            return
+
+        window = AIMDLimit(self.prefetch_depth)
+        with closing(self._page_fetches(endpoint, params, count(next_page), window, ordered=True)) as fetches:
+            for page_num, response in fetches:
+                page_data = decode(page_content(page_num, response))
+                has_next = parse_page(page_data, "next") is not None
+                if is_empty_page(page_data, response_keys):
+                    logger.debug("Page %d of %s is empty, stopping", page_num, endpoint)
+                    return
+                yield page_num, page_data
+                if not has_next:
+                    return
+
+    def _read_ahead(
+        self, endpoint: str, params: dict[str, Any], next_page: int, decode: Callable[[bytes], Page]
+    ) -> Generator[tuple[int, Page]]:
+        """
+        Follow the next links of an endpoint on a worker thread, up to `prefetch_depth` pages ahead of the caller
+
+        Args:
+            endpoint: The API endpoint to fetch data from
+            params: The query parameters shared by every page
+            next_page: The first page to fetch
+            decode: Decodes the raw body of a page
+
+        Yields:
+            The page number and decoded page of each page
+        """
+        fetched: queue.SimpleQueue[tuple[int, Page] | BaseException | None] = queue.SimpleQueue()
+        # Each page fetched takes a slot until the caller moves past it
+        slots = threading.Semaphore(self.prefetch_depth)
+        closed = threading.Event()
+
+        def follow() -> None:
+            page_num: int | None = next_page
+            try:
+                while page_num is not None:
+                    slots.acquire()
+                    if closed.is_set():
+                        return
+                    try:
+                        response = self._request("GET", endpoint, params={**params, "page": page_num})
+                    except Exception as exc:
+                        response = exc
+                    page_data = decode(page_content(page_num, response))
+                    fetched.put((page_num, page_data))
+                    page_num = parse_page(page_data, "next")
+            except BaseException as exc:
+                # Whatever stops the worker is raised to the caller, which would otherwise wait forever
+                fetched.put(exc)
+                return
+            fetched.put(None)
+
+        threading.Thread(target=follow, name="vantage-sdk-page", daemon=True).start()
+        try:
+            while (page := fetched.get()) is not None:
+                if isinstance(page, BaseException):
+                    raise page
+                yield page
+                slots.release()
+        finally:
+            # Wake the worker if it waits for a slot, so it stops
+            closed.set()
+            slots.release()
+
+    def _iter_pages(
+        self,
+        endpoint: str,
+        model: type[M],
+        params: dict[str, Any] | BaseModel | None = None,
+        *,
+        max_concurrency: int | None = None,
+    ) -> Iterator[M]:
+        """
+        Yield the pages of a paginated endpoint in order, each as soon as it and the pages before it arrive
+
+        Unlike `_get_paginated` nothing is merged, and only a window of pages as large as the concurrency limit
+        is requested ahead of the caller, so memory stays bounded and processing overlaps with network I/O.
+        Pages the caller never reaches are not requested, and closing the iterator cancels those in flight.
+        Each page is validated straight from its raw body, without being decoded into a dictionary first
+
+        Args:
+            endpoint: The API endpoint to fetch data from
+            model: The model of each page
+            params: Optional query parameters for the request, can be a Pydantic model or dict
+            max_concurrency: Optional limit on the pages fetched at once, overrides the client and endpoint limits
+
+        Yields:
+            The model of each page, without its links
+        """
+        if params is None:
+            params = {}
+        elif isinstance(params, BaseModel):
+            params = params.model_dump(mode="json", by_alias=True, exclude_none=True, exclude_defaults=True)
+
+        decode = partial(model_page, model, lazy=self.lazy_collections)
+
+        def get(endpoint: str, params: dict[str, Any]) -> ModelPage[M]:
+            return decode(self._get_raw(endpoint, params))
+
+        first_page = get(endpoint, {**params, "page": 1})
+        total_pages = parse_page(first_page, "last")
+        next_page = parse_page(first_page, "next")
+        response_keys = [field for field in model.model_fields if field != "links"]
+        yield first_page.model
+
+        # GET /costs only links to the next page, so it is walked by following those links
+        if not total_pages:
+            for _, page in self._walk_cursor(endpoint, params, next_page, response_keys, get, decode):
+                yield page.model
+            return
+
+        concurrency = resolve_concurrency(endpoint, self.max_concurrency, self.endpoint_concurrency, max_concurrency)
+        limit = self.concurrency_controller.limit_for(
+            endpoint, concurrency, fixed=call_concurrency(max_concurrency) is not None
+        )
+        page_numbers = range(2, total_pages + 1)
+        with closing(self._page_fetches(endpoint, params, page_numbers, limit, ordered=True)) as fetches:
+            for page_num, response in fetches:
+                yield decode(page_content(page_num, response)).model
+
+    def _page_fetches(
+        self,
+        endpoint: str,
+        params: dict[str, Any],
+        page_numbers: Iterable[int],
+        limit: AIMDLimit,
+        *,
+        ordered: bool = False,
+        headers: Mapping[int, Mapping[str, str]] | None = None,
+    ) -> Generator[tuple[int, Response | BaseException]]:
+        """
+        Fetch pages concurrently with the configured pagination executor, yielding each as soon as it completes
+
+        Every paginated call runs on this engine: `_get_paginated` collects what it yields, while `_iter_pages`
+        and the prefetching cursor walk consume it in order. Pages are requested directly rather than through
+        `_get`, since a combined response is cached as a whole. At most `limit.limit` pages are in flight at any
+        time, which with `ordered` includes the pages that completed while waiting for an earlier one, so
+        `page_numbers` may be unbounded as long as the caller stops consuming. Closing the generator cancels the
+        requests still in flight
+
+        Args:
+            endpoint: The API endpoint to fetch data from
+            params: The query parameters shared by every page
+            page_numbers: The pages to fetch
+            limit: The number of pages allowed in flight at once
+            ordered: Whether to yield the pages in the order of `page_numbers` rather than as they complete
+            headers: Extra headers of the pages that need them, such as those of a conditional request
+
+        Yields:
+            The page number and the response, or the exception raised while requesting it, of each page
+        """
+        executor = self.pagination_executor
+        # Blocking on the background loop from its own thread would deadlock, so fall back to threads
+        use_threads = executor is PaginationExecutor.threads or (
+            executor is PaginationExecutor.auto and self._loop.in_loop_thread()
+        )
+        if not use_threads and has_running_loop():
+            logger.debug("Event loop already running in the calling thread, fetching pages on the background loop")
+        pool = (
+            ThreadPoolExecutor(max_workers=limit.ceiling, thread_name_prefix="vantage-sdk-page")
+            if use_threads
+            else None
+        )
+
+        def submit(page_num: int) -> Future[Response]:
+            page_params = {**params, "page": page_num}
+            page_headers = headers.get(page_num) if headers is not None else None
+            logger.debug("Fetching page %d of %s", page_num, endpoint)
+            if pool is not None:
+                return pool.submit(self._request, "GET", endpoint, params=page_params, headers=page_headers)
+            return self._loop.submit(self._request_async("GET", endpoint, params=page_params, headers=page_headers))
+
+        # Futures in the order they were submitted, which is the order of `page_numbers`
+        pending: dict[Future[Response], int] = {}
+        remaining = iter(page_numbers)
+        try:
+            while True:
+                while len(pending) < limit.limit and (page_num := next(remaining, None)) is not None:
+                    pending[submit(page_num)] = page_num
+                if not pending:
+                    return
+                if ordered:
+                    done = [next(iter(pending))]
+                else:
+                    done, _ = wait(pending, return_when=FIRST_COMPLETED)
+                for future in done:
+                    page_num = pending.pop(future)
+                    yield page_num, future.exception() or future.result()
+        finally:
+            for future in pending:
+                future.cancel()
+            if pool is not None:
+                pool.shutdown(wait=False, cancel_futures=True)
+
+    def _get_sharded_costs(self, cost_report_params: CostsGetParametersQuery, shard_days: int) -> dict[str, Any]:
+        """
+        Fetch costs one date window at a time, with windows fetched concurrently on a thread pool
+
+        GET /costs can only be walked page by page, so windows are the only way to fetch its pages in parallel.
+        All windows share the client's rate limiter, so together they stay within the endpoint's budget
+
+        Args:
+            cost_report_params: The parameters to filter costs
+            shard_days: The preferred number of days in each window
+
+        Returns:
+            The combined response of all windows
+        """
+        shards = shard_cost_params(cost_report_params, shard_days)
+        concurrency = resolve_concurrency("costs", self.max_concurrency, self.endpoint_concurrency)
+        logger.debug("Fetching costs in %d windows, %d at a time", len(shards), concurrency)
+
+        def fetch_shard(shard_params: CostsGetParametersQuery) -> dict[str, Any]:
+            return self._get_paginated("costs", shard_params, collection_key="costs")
+
+        with ThreadPoolExecutor(
+            max_workers=min(concurrency, len(shards)), thread_name_prefix="vantage-sdk-shard"
+        ) as pool:
+            # Each window runs in a copy of the caller's context, keeping any `concurrency_limit` set around the call
+            futures = [pool.submit(copy_context().run, fetch_shard, shard) for shard in shards]
+            return merge_cost_shards([future.result() for future in futures], cost_report_params.order)
+
+    def _fetch_costs(self, cost_report_params: CostsGetParametersQuery, shard_days: int | None) -> dict[str, Any]:
+        """Fetch the combined response of a costs query from the API, sharded when `shard_days` is set"""
+        if shard_days is not None:
+            return self._get_sharded_costs(cost_report_params, shard_days)
+        return self._get_paginated("costs", cost_report_params, collection_key="costs")
+
+    def _get_cached_costs(
+        self, cost_cache: CostCache, cost_report_params: CostsGetParametersQuery, shard_days: int | None
+    ) -> dict[str, Any]:
+        """
+        Serve costs from the cost cache, fetching only the segments it does not hold
+
+        Missing segments are fetched concurrently on a thread pool and cached, then every segment is merged in
+        the order the query sorts its rows by
+
+        Args:
+            cost_cache: The cache to serve costs from
+            cost_report_params: The parameters to filter costs
+            shard_days: Optionally shard each missing segment into windows of about this many days
+
+        Returns:
+            The combined response of every segment
+        """
+        segments = cost_cache.segments(cost_report_params) or [cost_report_params]
+        cached = [cost_cache.load(segment) for segment in segments]
+        missing = [segment for segment, data in zip(segments, cached, strict=True) if data is None]
+
+        def fetch_segment(segment: CostsGetParametersQuery) -> dict[str, Any]:
+            data = self._fetch_costs(segment, shard_days)
+            cost_cache.store(segment, data)
+            return data
+
+        fetched: list[dict[str, Any]] = []
+        if missing:
+            logger.debug("Fetching %d of %d cost segments missing from the cache", len(missing), len(segments))
+            concurrency = resolve_concurrency("costs", self.max_concurrency, self.endpoint_concurrency)
+            # A sharded segment already fetches as many windows at once as the limit allows
+            workers = 1 if shard_days is not None else min(concurrency, len(missing))
+            with ThreadPoolExecutor(max_workers=workers, thread_name_prefix="vantage-sdk-segment") as pool:
+                # Each segment runs in a copy of the caller's context, like the windows of a sharded call
+                futures = [pool.submit(copy_context().run, fetch_segment, segment) for segment in missing]
+                fetched = [future.result() for future in futures]
+
+        pieces = iter(fetched)
+        shards = [data if data is not None else next(pieces) for data in cached]
+        return shards[0] if len(shards) == 1 else merge_cost_shards(shards, cost_report_params.order)
+
+    def _get_costs(self, cost_report_params: CostsGetParametersQuery, shard_days: int | None) -> dict[str, Any]:
+        """Get the combined response of a costs query, through the cost cache when the client has one"""
+        if self.cost_cache is not None:
+            return self._get_cached_costs(self.cost_cache, cost_report_params, shard_days)
+        return self._fetch_costs(cost_report_params, shard_days)
+
     def _post(self, endpoint: str, params: BaseModel) -> dict[str, Any]:
         """
         Perform a POST request to the specified endpoint
@@ -430,8 +1165,6 @@ class VantageSDK:
         Returns:
             The JSON response from the API
         """
-        url = urljoin(self.base_url, endpoint)
-
         json_data = params.model_dump(
             mode="json",
             by_alias=True,
@@ -439,7 +1172,7 @@ class VantageSDK:
             exclude_defaults=True,
         )
 
-        response = self.session.post(url, json=json_data)
+        response = self._request("POST", endpoint, json=json_data)
         response.raise_for_status()
         return response.json()
 
@@ -454,8 +1187,6 @@ class VantageSDK:
         Returns:
             The JSON response from the API
         """
-        url = urljoin(self.base_url, endpoint)
-
         json_data = params.model_dump(
             mode="json",
             by_alias=True,
@@ -463,7 +1194,7 @@ class VantageSDK:
             exclude_defaults=True,
         )
 
-        response = self.session.put(url, json=json_data)
+        response = self._request("PUT", endpoint, json=json_data)
         response.raise_for_status()
         return response.json()
 
@@ -477,8 +1208,7 @@ class VantageSDK:
         Returns:
             The HTTP status code of the response
         """
-        url = urljoin(self.base_url, endpoint)
-        response = self.session.delete(url)
+        response = self._request("DELETE", endpoint)
         response.raise_for_status()
         return HttpStatusCode(response.status_code)
 
@@ -494,7 +1224,7 @@ class VantageSDK:
         """
         # getting all folders
         paginated_data = self._get_paginated("folders")
-        return Folders.model_validate(paginated_data)
+        return self._parse(Folders, paginated_data)
 
     def create_folder(self, new_folder: CreateFolder) -> Folder:
         """
@@ -507,7 +1237,7 @@ class VantageSDK:
             The created folder object
         """
         data = self._post("folders", new_folder)
-        return Folder.model_validate(data)
+        return self._parse(Folder, data)
 
     def get_folder(self, folder_token_params: FolderTokenParams) -> Folder:
         """
@@ -520,8 +1250,8 @@ class VantageSDK:
             The folder object
         """
         folder_value = folder_token_params.folder_token
-        data = self._get(f"folders/{folder_value}")
-        return Folder.model_validate(data)
+        data = self._get_raw(f"folders/{folder_value}")
+        return self._parse(Folder, data)
 
     def update_folder(self, folder_token_params: FolderTokenParams, folder_update: UpdateFolder) -> Folder:
         """
@@ -536,7 +1266,7 @@ class VantageSDK:
         """
         folder_value = folder_token_params.folder_token
         data = self._put(f"folders/{folder_value}", folder_update)
-        return Folder.model_validate(data)
+        return self._parse(Folder, data)
 
     def delete_folder(self, folder_token_params: FolderTokenParams) -> HttpStatusCode:
         """
@@ -564,7 +1294,7 @@ class VantageSDK:
             A list of CostReport objects
         """
         paginated_data = self._get_paginated("cost_reports", folder_token_params)
-        return CostReports.model_validate(paginated_data)
+        return self._parse(CostReports, paginated_data)
 
     def create_cost_report(self, new_cost_report: CreateCostReport) -> CostReport:
         """
@@ -577,7 +1307,7 @@ class VantageSDK:
             The created cost report
         """
         data = self._post("cost_reports", new_cost_report)
-        return CostReport.model_validate(data)
+        return self._parse(CostReport, data)
 
     def get_cost_report(self, cost_report_token_params: CostReportTokenParams) -> CostReport:
         """
@@ -590,8 +1320,8 @@ class VantageSDK:
             The cost report object
         """
         token_value = cost_report_token_params.cost_report_token
-        data = self._get(f"cost_reports/{token_value}")
-        return CostReport.model_validate(data)
+        data = self._get_raw(f"cost_reports/{token_value}")
+        return self._parse(CostReport, data)
 
     def update_cost_report(
         self, cost_report_token_params: CostReportTokenParams, cost_report_update: UpdateCostReport
@@ -608,7 +1338,7 @@ class VantageSDK:
         """
         token_value = cost_report_token_params.cost_report_token
         data = self._put(f"cost_reports/{token_value}", cost_report_update)
-        return CostReport.model_validate(data)
+        return self._parse(CostReport, data)
 
     def delete_cost_report(self, cost_report_token_params: CostReportTokenParams) -> HttpStatusCode:
         """
@@ -623,25 +1353,75 @@ class VantageSDK:
         token_value = cost_report_token_params.cost_report_token
         return self._delete(f"cost_reports/{token_value}")
 
-    def get_cost_report_costs(self, cost_report_params: CostsGetParametersQuery) -> Costs:
+    def get_cost_report_costs(
+        self, cost_report_params: CostsGetParametersQuery, *, shard_days: int | None = None
+    ) -> Costs:
         """
         Get all costs - GET /costs
 
         Args:
             cost_report_params: The parameters to filter costs
+            shard_days: Optionally split start_date..end_date into windows of about this many days that are fetched
+                concurrently. Requires start_date, end_date and a date_bin of hour, day, month or quarter
 
         Returns:
-            A Costs object
+            A Costs object, with totals summed across windows when sharded
+
+        Note:
+            This endpoint allows 5 requests every 5 seconds. Requests, including every page of the
+            response, are throttled by the client's rate limiter to stay within that budget.
+            With a `cost_cache`, results are served from it and only the months it does not hold are fetched
         """
-        warnings.warn(
-            "This endpoint has a very low rate limit \n"
-            "Consider implementing a delay or backoff \n"
-            "The rate limit is 5 requests every 5 seconds",
-            UserWarning,
-            2,
-        )
-        paginated_data = self._get_paginated("costs", cost_report_params, collection_key="costs")
-        return Costs.model_validate(paginated_data)
+        paginated_data = self._get_costs(cost_report_params, shard_days)
+        return self._parse(Costs, paginated_data)
+
+    def get_cost_report_costs_table(
+        self, cost_report_params: CostsGetParametersQuery, *, shard_days: int | None = None, decimals: bool = False
+    ) -> "Table":
+        """
+        Get all costs as columns - GET /costs
+
+        Args:
+            cost_report_params: The parameters to filter costs
+            shard_days: Optionally split start_date..end_date into windows of about this many days that are fetched
+                concurrently. Requires start_date, end_date and a date_bin of hour, day, month or quarter
+            decimals: Whether amounts are kept exact as Decimal objects rather than converted to float64
+
+        Returns:
+            A Table with a column per Cost field, built without any Cost model, and the totals in its metadata
+
+        Note:
+            Requires the `numpy` extra. Fetched, cached and throttled like get_cost_report_costs
+        """
+        from vantage_sdk.columnar import COSTS_TABLE, build_table
+
+        paginated_data = self._get_costs(cost_report_params, shard_days)
+        return build_table(COSTS_TABLE, paginated_data, decimals)
+
+    def iter_cost_report_costs_pages(self, cost_report_params: CostsGetParametersQuery) -> Iterator[Costs]:
+        """
+        Stream the pages of all costs - GET /costs
+
+        Args:
+            cost_report_params: The parameters to filter costs
+
+        Yields:
+            A Costs object for each page, as soon as it arrives
+        """
+        yield from self._iter_pages("costs", Costs, cost_report_params)
+
+    def iter_cost_report_costs(self, cost_report_params: CostsGetParametersQuery) -> Iterator[Cost]:
+        """
+        Stream all costs - GET /costs
+
+        Args:
+            cost_report_params: The parameters to filter costs
+
+        Yields:
+            Each Cost object, as soon as the page containing it arrives
+        """
+        for page in self.iter_cost_report_costs_pages(cost_report_params):
+            yield from page.costs
 
     # ---- Data Export APIs ----
 
@@ -665,10 +1445,10 @@ class VantageSDK:
             1. The response body is empty
             2. The token is in the 'location' header
         """
-        response = self.session.post(
-            urljoin(self.base_url, "costs/data_exports"),
+        response = self._request(
+            "POST",
+            "costs/data_exports",
             json=new_data_export.model_dump(mode="json", exclude_none=True, by_alias=True),
-            headers=self.session.headers,
         )
         if response.is_success:
             location = response.headers["location"]
@@ -698,7 +1478,7 @@ class VantageSDK:
             This is useful for polling the status of the data export
         """
         token_value = data_export_token_params.data_export_token
-        response = self.session.get(urljoin(self.base_url, f"data_exports/{token_value}"), headers=self.session.headers)
+        response = self._request("GET", f"data_exports/{token_value}")
 
         if response.is_success:
             body = response.json()
@@ -707,7 +1487,7 @@ class VantageSDK:
                 return PollInterval(int(response.headers["retry-after"]))
             else:
                 # The export is ready
-                return DataExport.model_validate(body)
+                return self._parse(DataExport, body)
         else:
             error_details = response.json()
             error_message = f"Failed to create data export: {response.status_code}. Details: {error_details}"
@@ -726,7 +1506,7 @@ class VantageSDK:
             The created custom tag
         """
         data = self._post("virtual_tag_configs", new_virtual_tag)
-        return VirtualTagConfig.model_validate(data)
+        return self._parse(VirtualTagConfig, data)
 
     def delete_virtual_tag(self, virtual_tag_token_params: VirtualTagTokenParams) -> HttpStatusCode:
         """
@@ -752,8 +1532,8 @@ class VantageSDK:
             The custom tag object
         """
         virtual_tag_value = virtual_tag_token_params.virtual_tag_token
-        data = self._get(f"virtual_tag_configs/{virtual_tag_value}")
-        return VirtualTagConfig.model_validate(data)
+        data = self._get_raw(f"virtual_tag_configs/{virtual_tag_value}")
+        return self._parse(VirtualTagConfig, data)
 
     def get_all_virtual_tags(
         self, query_params: VirtualTagConfigsGetParametersQuery | None = None
@@ -770,8 +1550,8 @@ class VantageSDK:
         Note:
             This method is not paginated
         """
-        data = self._get("virtual_tag_configs", query_params)
-        return VirtualTagConfigs.model_validate(data)
+        data = self._get_raw("virtual_tag_configs", query_params)
+        return self._parse(VirtualTagConfigs, data)
 
     def get_virtual_tag_processing_status(
         self, virtual_tag_token_params: VirtualTagTokenParams
@@ -786,8 +1566,8 @@ class VantageSDK:
             The processing status for the custom tag
         """
         virtual_tag_value = virtual_tag_token_params.virtual_tag_token
-        data = self._get(f"virtual_tag_configs/{virtual_tag_value}/status")
-        return VirtualTagConfigStatus.model_validate(data)
+        data = self._get_raw(f"virtual_tag_configs/{virtual_tag_value}/status")
+        return self._parse(VirtualTagConfigStatus, data)
 
     def update_virtual_tag(
         self, virtual_tag_token_params: VirtualTagTokenParams, virtual_tag_update: UpdateVirtualTagConfig
@@ -814,7 +1594,6 @@ class VantageSDK:
             or AsyncVirtualTagConfigUpdate if the server deferred processing (202)
         """
         virtual_tag_value = virtual_tag_token_params.virtual_tag_token
-        url = urljoin(self.base_url, f"virtual_tag_configs/{virtual_tag_value}")
 
         json_data = virtual_tag_update.model_dump(
             mode="json",
@@ -823,13 +1602,13 @@ class VantageSDK:
             exclude_defaults=True,
         )
 
-        response = self.session.put(url, json=json_data)
+        response = self._request("PUT", f"virtual_tag_configs/{virtual_tag_value}", json=json_data)
         response.raise_for_status()
         data = response.json()
 
         if response.status_code == 202:
-            return AsyncVirtualTagConfigUpdate.model_validate(data)
-        return VirtualTagConfig.model_validate(data)
+            return self._parse(AsyncVirtualTagConfigUpdate, data)
+        return self._parse(VirtualTagConfig, data)
 
     def update_virtual_tag_async(
         self,
@@ -857,7 +1636,7 @@ class VantageSDK:
         """
         virtual_tag_value = virtual_tag_token_params.virtual_tag_token
         data = self._put(f"virtual_tag_configs/{virtual_tag_value}/async", virtual_tag_update)
-        return AsyncVirtualTagConfigUpdate.model_validate(data)
+        return self._parse(AsyncVirtualTagConfigUpdate, data)
 
     def get_virtual_tag_async_status(self, request_id: str) -> dict[str, Any]:
         """
@@ -884,7 +1663,7 @@ class VantageSDK:
             The created saved filter
         """
         data = self._post("saved_filters", new_saved_filter)
-        return SavedFilter.model_validate(data)
+        return self._parse(SavedFilter, data)
 
     def delete_saved_filter(self, saved_filter_token_params: SavedFilterTokenParams) -> HttpStatusCode:
         """
@@ -910,8 +1689,8 @@ class VantageSDK:
             The saved filter object
         """
         saved_filter_value = saved_filter_token_params.saved_filter_token
-        data = self._get(f"saved_filters/{saved_filter_value}")
-        return SavedFilter.model_validate(data)
+        data = self._get_raw(f"saved_filters/{saved_filter_value}")
+        return self._parse(SavedFilter, data)
 
     def get_all_saved_filters(self) -> SavedFilters:
         """
@@ -921,7 +1700,7 @@ class VantageSDK:
             A list of SavedFilter objects
         """
         paginated_data = self._get_paginated("saved_filters")
-        return SavedFilters.model_validate(paginated_data)
+        return self._parse(SavedFilters, paginated_data)
 
     # ---- Health Check ----
 
@@ -951,7 +1730,7 @@ class VantageSDK:
             A BusinessMetric object
         """
         data = self._post("business_metrics", new_business_metric)
-        return BusinessMetric.model_validate(data)
+        return self._parse(BusinessMetric, data)
 
     def get_all_business_metrics(
         self, query_params: BusinessMetricsGetParametersQuery | None = None
@@ -966,7 +1745,7 @@ class VantageSDK:
             A BusinessMetrics object which is a list of BusinessMetric objects
         """
         paginated_data = self._get_paginated("business_metrics", query_params)
-        return BusinessMetrics.model_validate(paginated_data)
+        return self._parse(BusinessMetrics, paginated_data)
 
     def get_business_metric(self, business_metric_token: BusinessMetricTokenParams) -> BusinessMetric:
         """
@@ -979,8 +1758,8 @@ class VantageSDK:
             The business metric object
         """
         business_metric_token_value = business_metric_token.business_metric_token
-        data = self._get(f"business_metrics/{business_metric_token_value}")
-        return BusinessMetric.model_validate(data)
+        data = self._get_raw(f"business_metrics/{business_metric_token_value}")
+        return self._parse(BusinessMetric, data)
 
     def delete_business_metric(self, business_metric_token: BusinessMetricTokenParams) -> HttpStatusCode:
         """
@@ -1010,7 +1789,7 @@ class VantageSDK:
         """
         business_metric_token_value = business_metric_token.business_metric_token
         data = self._put(f"business_metrics/{business_metric_token_value}", business_metric_update)
-        return BusinessMetric.model_validate(data)
+        return self._parse(BusinessMetric, data)
 
     def get_business_metric_values(
         self,
@@ -1031,7 +1810,74 @@ class VantageSDK:
         paginated_data = self._get_paginated(
             f"business_metrics/{business_metric_token_value}/values", business_metric_token_values
         )
-        return BusinessMetricValues.model_validate(paginated_data)
+        return self._parse(BusinessMetricValues, paginated_data)
+
+    def get_business_metric_values_table(
+        self,
+        business_metric_token_values: BusinessMetricsBusinessMetricTokenValuesGetParametersQuery,
+        business_metric_token_params: BusinessMetricTokenParams,
+        *,
+        decimals: bool = False,
+    ) -> "Table":
+        """
+        Get the values of a specific business metric as columns - GET /business_metrics/{business_metric_token}/values
+
+        Args:
+            business_metric_token_values: The parameters to filter the business metric values
+            business_metric_token_params: The token of the business metric to retrieve values for
+            decimals: Whether amounts are kept exact as Decimal objects rather than converted to float64
+
+        Returns:
+            A Table with a column per BusinessMetricValue field
+
+        Note:
+            Requires the `numpy` extra
+        """
+        from vantage_sdk.columnar import BUSINESS_METRIC_VALUES_TABLE, build_table
+
+        business_metric_token_value = business_metric_token_params.business_metric_token
+        paginated_data = self._get_paginated(
+            f"business_metrics/{business_metric_token_value}/values", business_metric_token_values
+        )
+        return build_table(BUSINESS_METRIC_VALUES_TABLE, paginated_data, decimals)
+
+    def iter_business_metric_values_pages(
+        self,
+        business_metric_token_values: BusinessMetricsBusinessMetricTokenValuesGetParametersQuery,
+        business_metric_token_params: BusinessMetricTokenParams,
+    ) -> Iterator[BusinessMetricValues]:
+        """
+        Stream the pages of values of a specific business metric - GET /business_metrics/{business_metric_token}/values
+
+        Args:
+            business_metric_token_values: The parameters to filter the business metric values
+            business_metric_token_params: The token of the business metric to retrieve values for
+
+        Yields:
+            A BusinessMetricValues object for each page, as soon as it arrives
+        """
+        business_metric_token_value = business_metric_token_params.business_metric_token
+        yield from self._iter_pages(
+            f"business_metrics/{business_metric_token_value}/values", BusinessMetricValues, business_metric_token_values
+        )
+
+    def iter_business_metric_values(
+        self,
+        business_metric_token_values: BusinessMetricsBusinessMetricTokenValuesGetParametersQuery,
+        business_metric_token_params: BusinessMetricTokenParams,
+    ) -> Iterator[BusinessMetricValue]:
+        """
+        Stream the values of a specific business metric - GET /business_metrics/{business_metric_token}/values
+
+        Args:
+            business_metric_token_values: The parameters to filter the business metric values
+            business_metric_token_params: The token of the business metric to retrieve values for
+
+        Yields:
+            Each BusinessMetricValue object, as soon as the page containing it arrives
+        """
+        for page in self.iter_business_metric_values_pages(business_metric_token_values, business_metric_token_params):
+            yield from page.values
 
     def get_business_metric_labels(
         self,
@@ -1050,7 +1896,7 @@ class VantageSDK:
         """
         business_metric_token = business_metric_token_params.business_metric_token
         paginated_data = self._get_paginated(f"business_metrics/{business_metric_token}/labels", query_params)
-        return BusinessMetricLabels.model_validate(paginated_data)
+        return self._parse(BusinessMetricLabels, paginated_data)
 
     def delete_business_metric_values(
         self,
@@ -1068,11 +1914,10 @@ class VantageSDK:
             A BusinessMetricValuesDeleteResponse containing the count of deleted rows
         """
         business_metric_token_value = business_metric_token_params.business_metric_token
-        url = urljoin(self.base_url, f"business_metrics/{business_metric_token_value}/values")
         query = delete_params.model_dump(mode="json", by_alias=True, exclude_none=True, exclude_defaults=True)
-        response = self.session.delete(url, params=query)
+        response = self._request("DELETE", f"business_metrics/{business_metric_token_value}/values", params=query)
         response.raise_for_status()
-        return BusinessMetricValuesDeleteResponse.model_validate(response.json())
+        return self._parse(BusinessMetricValuesDeleteResponse, response.json())
 
     # ---- Integration APIs ----
 
@@ -1087,7 +1932,34 @@ class VantageSDK:
             An Integrations object which is a list of Integration objects
         """
         paginated_data = self._get_paginated("integrations", query_params)
-        return Integrations.model_validate(paginated_data)
+        return self._parse(Integrations, paginated_data)
+
+    def iter_integrations_pages(
+        self, query_params: IntegrationsGetParametersQuery | None = None
+    ) -> Iterator[Integrations]:
+        """
+        Stream the pages of all integrations - GET /integrations
+
+        Args:
+            query_params: Optional query parameters for filtering integrations
+
+        Yields:
+            An Integrations object for each page, as soon as it arrives
+        """
+        yield from self._iter_pages("integrations", Integrations, query_params)
+
+    def iter_integrations(self, query_params: IntegrationsGetParametersQuery | None = None) -> Iterator[Integration]:
+        """
+        Stream all integrations - GET /integrations
+
+        Args:
+            query_params: Optional query parameters for filtering integrations
+
+        Yields:
+            Each Integration object, as soon as the page containing it arrives
+        """
+        for page in self.iter_integrations_pages(query_params):
+            yield from page.integrations
 
     def create_azure_integration(self, new_azure_integration: CreateAzureIntegration) -> Integration:
         """
@@ -1100,7 +1972,7 @@ class VantageSDK:
             The created integration object
         """
         data = self._post("integrations/azure", new_azure_integration)
-        return Integration.model_validate(data)
+        return self._parse(Integration, data)
 
     def create_gcp_integration(self, new_gcp_integration: CreateGCPIntegration) -> Integration:
         """
@@ -1113,7 +1985,7 @@ class VantageSDK:
             The created integration object
         """
         data = self._post("integrations/gcp", new_gcp_integration)
-        return Integration.model_validate(data)
+        return self._parse(Integration, data)
 
     def create_custom_provider_integration(
         self, new_custom_provider_integration: CreateCustomProviderIntegration
@@ -1128,7 +2000,7 @@ class VantageSDK:
             The created integration object
         """
         data = self._post("integrations/custom_provider", new_custom_provider_integration)
-        return Integration.model_validate(data)
+        return self._parse(Integration, data)
 
     def get_integration(self, integration_token_params: IntegrationTokenParams) -> Integration:
         """
@@ -1141,8 +2013,8 @@ class VantageSDK:
             The integration object
         """
         integration_token = integration_token_params.integration_token
-        data = self._get(f"integrations/{integration_token}")
-        return Integration.model_validate(data)
+        data = self._get_raw(f"integrations/{integration_token}")
+        return self._parse(Integration, data)
 
     def update_integration(
         self, integration_token_params: IntegrationTokenParams, workspace_tokens: Sequence[str]
@@ -1162,7 +2034,7 @@ class VantageSDK:
             f"integrations/{integration_token}",
             IntegrationsIntegrationTokenPutRequest(workspace_tokens=workspace_tokens),
         )
-        return Integration.model_validate(data)
+        return self._parse(Integration, data)
 
     def delete_integration(self, integration_token_params: IntegrationTokenParams) -> HttpStatusCode:
         """
@@ -1188,8 +2060,8 @@ class VantageSDK:
             A UserCostsUploads object containing a list of UserCostsUpload objects
         """
         integration_token = integration_token_params.integration_token
-        data = self._get(f"integrations/{integration_token}/costs")
-        return UserCostsUploads.model_validate(data)
+        data = self._get_raw(f"integrations/{integration_token}/costs")
+        return self._parse(UserCostsUploads, data)
 
     def delete_integration_costs(
         self,
@@ -1231,13 +2103,13 @@ class VantageSDK:
             form data with the CSV file rather than JSON data.
         """
         integration_token = integration_token_params.integration_token
-        url = urljoin(self.base_url, f"integrations/{integration_token}/costs.csv")
-
         # Create the form data with the CSV file
         files = {"csv": ("costs.csv", csv_data, "text/csv")}
 
         # Send the request
-        response = self.session.post(url, files=files, headers=self.session.headers)
+        response = self._request(
+            "POST", f"integrations/{integration_token}/costs.csv", files=files, headers=self.session.headers
+        )
         response.raise_for_status()
         return response.json()
 
@@ -1251,7 +2123,7 @@ class VantageSDK:
             An AccessGrants object which is a list of AccessGrant objects
         """
         paginated_data = self._get_paginated("access_grants")
-        return AccessGrants.model_validate(paginated_data)
+        return self._parse(AccessGrants, paginated_data)
 
     def get_access_grant(self, access_grant_token_params: AccessGrantTokenParams) -> AccessGrant:
         """
@@ -1264,8 +2136,8 @@ class VantageSDK:
             The access grant object
         """
         access_grant_token = access_grant_token_params.access_grant_token
-        data = self._get(f"access_grants/{access_grant_token}")
-        return AccessGrant.model_validate(data)
+        data = self._get_raw(f"access_grants/{access_grant_token}")
+        return self._parse(AccessGrant, data)
 
     def create_access_grant(self, new_access_grant: CreateAccessGrant) -> AccessGrant:
         """
@@ -1278,7 +2150,7 @@ class VantageSDK:
             The created access grant object
         """
         data = self._post("access_grants", new_access_grant)
-        return AccessGrant.model_validate(data)
+        return self._parse(AccessGrant, data)
 
     def update_access_grant(
         self, access_grant_token_params: AccessGrantTokenParams, access_grant_update: UpdateAccessGrant
@@ -1295,7 +2167,7 @@ class VantageSDK:
         """
         access_grant_token = access_grant_token_params.access_grant_token
         data = self._put(f"access_grants/{access_grant_token}", access_grant_update)
-        return AccessGrant.model_validate(data)
+        return self._parse(AccessGrant, data)
 
     def delete_access_grant(self, access_grant_token_params: AccessGrantTokenParams) -> HttpStatusCode:
         """
@@ -1319,8 +2191,8 @@ class VantageSDK:
         Returns:
             A Me object containing information about the authenticated user's token and workspaces
         """
-        data = self._get("me")
-        return Me.model_validate(data)
+        data = self._get_raw("me")
+        return self._parse(Me, data)
 
     def update_me(self, me_update: UpdateMe) -> Me:
         """
@@ -1333,7 +2205,7 @@ class VantageSDK:
             The updated Me object
         """
         data = self._put("me", me_update)
-        return Me.model_validate(data)
+        return self._parse(Me, data)
 
     # ---- Teams APIs ----
 
@@ -1345,7 +2217,7 @@ class VantageSDK:
             A Teams object which is a list of Team objects
         """
         paginated_data = self._get_paginated("teams")
-        return Teams.model_validate(paginated_data)
+        return self._parse(Teams, paginated_data)
 
     def get_team(self, team_token_params: TeamTokenParams) -> Team:
         """
@@ -1358,8 +2230,8 @@ class VantageSDK:
             The team object
         """
         team_token = team_token_params.team_token
-        data = self._get(f"teams/{team_token}")
-        return Team.model_validate(data)
+        data = self._get_raw(f"teams/{team_token}")
+        return self._parse(Team, data)
 
     def create_team(self, new_team: CreateTeam) -> Team:
         """
@@ -1372,7 +2244,7 @@ class VantageSDK:
             The created team object
         """
         data = self._post("teams", new_team)
-        return Team.model_validate(data)
+        return self._parse(Team, data)
 
     def update_team(self, team_token_params: TeamTokenParams, team_update: UpdateTeam) -> Team:
         """
@@ -1387,7 +2259,7 @@ class VantageSDK:
         """
         team_token = team_token_params.team_token
         data = self._put(f"teams/{team_token}", team_update)
-        return Team.model_validate(data)
+        return self._parse(Team, data)
 
     def delete_team(self, team_token_params: TeamTokenParams) -> HttpStatusCode:
         """
@@ -1417,7 +2289,7 @@ class VantageSDK:
             An AnomalyAlerts object which is a list of AnomalyAlert objects
         """
         paginated_data = self._get_paginated("anomaly_alerts", anomaly_alerts_params)
-        return AnomalyAlerts.model_validate(paginated_data)
+        return self._parse(AnomalyAlerts, paginated_data)
 
     def get_anomaly_alert(self, anomaly_alert_token_params: AnomalyAlertTokenParams) -> AnomalyAlert:
         """
@@ -1430,8 +2302,8 @@ class VantageSDK:
             The anomaly alert object
         """
         anomaly_alert_token = anomaly_alert_token_params.anomaly_alert_token
-        data = self._get(f"anomaly_alerts/{anomaly_alert_token}")
-        return AnomalyAlert.model_validate(data)
+        data = self._get_raw(f"anomaly_alerts/{anomaly_alert_token}")
+        return self._parse(AnomalyAlert, data)
 
     def update_anomaly_alert(
         self, anomaly_alert_token_params: AnomalyAlertTokenParams, anomaly_alert_update: UpdateAnomalyAlert
@@ -1448,7 +2320,7 @@ class VantageSDK:
         """
         anomaly_alert_token = anomaly_alert_token_params.anomaly_alert_token
         data = self._put(f"anomaly_alerts/{anomaly_alert_token}", anomaly_alert_update)
-        return AnomalyAlert.model_validate(data)
+        return self._parse(AnomalyAlert, data)
 
     def get_all_anomaly_notifications(self) -> AnomalyNotifications:
         """
@@ -1458,7 +2330,7 @@ class VantageSDK:
             An AnomalyNotifications object which is a list of AnomalyNotification objects
         """
         paginated_data = self._get_paginated("anomaly_notifications")
-        return AnomalyNotifications.model_validate(paginated_data)
+        return self._parse(AnomalyNotifications, paginated_data)
 
     def get_anomaly_notification(
         self, anomaly_notification_token_params: AnomalyNotificationTokenParams
@@ -1473,8 +2345,8 @@ class VantageSDK:
             The anomaly notification object
         """
         anomaly_notification_token = anomaly_notification_token_params.anomaly_notification_token
-        data = self._get(f"anomaly_notifications/{anomaly_notification_token}")
-        return AnomalyNotification.model_validate(data)
+        data = self._get_raw(f"anomaly_notifications/{anomaly_notification_token}")
+        return self._parse(AnomalyNotification, data)
 
     def create_anomaly_notification(self, new_anomaly_notification: CreateAnomalyNotification) -> AnomalyNotification:
         """
@@ -1487,7 +2359,7 @@ class VantageSDK:
             The created anomaly notification object
         """
         data = self._post("anomaly_notifications", new_anomaly_notification)
-        return AnomalyNotification.model_validate(data)
+        return self._parse(AnomalyNotification, data)
 
     def update_anomaly_notification(
         self,
@@ -1506,7 +2378,7 @@ class VantageSDK:
         """
         anomaly_notification_token = anomaly_notification_token_params.anomaly_notification_token
         data = self._put(f"anomaly_notifications/{anomaly_notification_token}", anomaly_notification_update)
-        return AnomalyNotification.model_validate(data)
+        return self._parse(AnomalyNotification, data)
 
     def delete_anomaly_notification(
         self, anomaly_notification_token_params: AnomalyNotificationTokenParams
@@ -1533,7 +2405,7 @@ class VantageSDK:
             A BillingRules object which is a list of BillingRule objects
         """
         paginated_data = self._get_paginated("billing_rules")
-        return BillingRules.model_validate(paginated_data)
+        return self._parse(BillingRules, paginated_data)
 
     def get_billing_rule(self, billing_rule_token_params: BillingRuleTokenParams) -> BillingRule:
         """
@@ -1546,8 +2418,8 @@ class VantageSDK:
             The billing rule object
         """
         billing_rule_token = billing_rule_token_params.billing_rule_token
-        data = self._get(f"billing_rules/{billing_rule_token}")
-        return BillingRule.model_validate(data)
+        data = self._get_raw(f"billing_rules/{billing_rule_token}")
+        return self._parse(BillingRule, data)
 
     def create_billing_rule(self, new_billing_rule: CreateBillingRule) -> BillingRule:
         """
@@ -1560,7 +2432,7 @@ class VantageSDK:
             The created billing rule object
         """
         data = self._post("billing_rules", new_billing_rule)
-        return BillingRule.model_validate(data)
+        return self._parse(BillingRule, data)
 
     def update_billing_rule(
         self, billing_rule_token_params: BillingRuleTokenParams, billing_rule_update: UpdateBillingRule
@@ -1577,7 +2449,7 @@ class VantageSDK:
         """
         billing_rule_token = billing_rule_token_params.billing_rule_token
         data = self._put(f"billing_rules/{billing_rule_token}", billing_rule_update)
-        return BillingRule.model_validate(data)
+        return self._parse(BillingRule, data)
 
     def delete_billing_rule(self, billing_rule_token_params: BillingRuleTokenParams) -> HttpStatusCode:
         """
@@ -1602,7 +2474,7 @@ class VantageSDK:
             A Budgets object which is a list of Budget objects
         """
         paginated_data = self._get_paginated("budgets")
-        return Budgets.model_validate(paginated_data)
+        return self._parse(Budgets, paginated_data)
 
     def get_budget(
         self, budget_token_params: BudgetTokenParams, budget_params: BudgetsBudgetTokenGetParametersQuery | None = None
@@ -1618,8 +2490,8 @@ class VantageSDK:
             The budget object
         """
         budget_token = budget_token_params.budget_token
-        data = self._get(f"budgets/{budget_token}", budget_params)
-        return Budget.model_validate(data)
+        data = self._get_raw(f"budgets/{budget_token}", budget_params)
+        return self._parse(Budget, data)
 
     def create_budget(self, new_budget: CreateBudget) -> Budget:
         """
@@ -1632,7 +2504,7 @@ class VantageSDK:
             The created budget object
         """
         data = self._post("budgets", new_budget)
-        return Budget.model_validate(data)
+        return self._parse(Budget, data)
 
     def update_budget(self, budget_token_params: BudgetTokenParams, budget_update: UpdateBudget) -> Budget:
         """
@@ -1647,7 +2519,7 @@ class VantageSDK:
         """
         budget_token = budget_token_params.budget_token
         data = self._put(f"budgets/{budget_token}", budget_update)
-        return Budget.model_validate(data)
+        return self._parse(Budget, data)
 
     def delete_budget(self, budget_token_params: BudgetTokenParams) -> HttpStatusCode:
         """
@@ -1672,7 +2544,7 @@ class VantageSDK:
             A BudgetAlerts object which is a list of BudgetAlert objects
         """
         paginated_data = self._get_paginated("budget_alerts")
-        return BudgetAlerts.model_validate(paginated_data)
+        return self._parse(BudgetAlerts, paginated_data)
 
     def get_budget_alert(self, budget_alert_token_params: BudgetAlertTokenParams) -> BudgetAlert:
         """
@@ -1685,8 +2557,8 @@ class VantageSDK:
             The budget alert object
         """
         budget_alert_token = budget_alert_token_params.budget_alert_token
-        data = self._get(f"budget_alerts/{budget_alert_token}")
-        return BudgetAlert.model_validate(data)
+        data = self._get_raw(f"budget_alerts/{budget_alert_token}")
+        return self._parse(BudgetAlert, data)
 
     def create_budget_alert(self, new_budget_alert: BudgetAlertsPostRequest) -> BudgetAlert:
         """
@@ -1699,7 +2571,7 @@ class VantageSDK:
             The created budget alert object
         """
         data = self._post("budget_alerts", new_budget_alert)
-        return BudgetAlert.model_validate(data)
+        return self._parse(BudgetAlert, data)
 
     def update_budget_alert(
         self,
@@ -1718,7 +2590,7 @@ class VantageSDK:
         """
         budget_alert_token = budget_alert_token_params.budget_alert_token
         data = self._put(f"budget_alerts/{budget_alert_token}", budget_alert_update)
-        return BudgetAlert.model_validate(data)
+        return self._parse(BudgetAlert, data)
 
     def delete_budget_alert(self, budget_alert_token_params: BudgetAlertTokenParams) -> HttpStatusCode:
         """
@@ -1743,7 +2615,7 @@ class VantageSDK:
             A CostAlerts object which is a list of CostAlert objects
         """
         paginated_data = self._get_paginated("cost_alerts")
-        return CostAlerts.model_validate(paginated_data)
+        return self._parse(CostAlerts, paginated_data)
 
     def get_cost_alert(self, cost_alert_token_params: CostAlertTokenParams) -> CostAlert:
         """
@@ -1756,8 +2628,8 @@ class VantageSDK:
             The cost alert object
         """
         cost_alert_token = cost_alert_token_params.cost_alert_token
-        data = self._get(f"cost_alerts/{cost_alert_token}")
-        return CostAlert.model_validate(data)
+        data = self._get_raw(f"cost_alerts/{cost_alert_token}")
+        return self._parse(CostAlert, data)
 
     def get_cost_alert_events(
         self,
@@ -1776,7 +2648,7 @@ class VantageSDK:
         """
         cost_alert_token = cost_alert_token_params.cost_alert_token
         paginated_data = self._get_paginated(f"cost_alerts/{cost_alert_token}/events", query_params)
-        return CostAlertEvents.model_validate(paginated_data)
+        return self._parse(CostAlertEvents, paginated_data)
 
     def get_cost_alert_event(
         self, cost_alert_token_params: CostAlertTokenParams, cost_alert_event_token_params: CostAlertEventTokenParams
@@ -1793,8 +2665,8 @@ class VantageSDK:
         """
         cost_alert_token = cost_alert_token_params.cost_alert_token
         event_token = cost_alert_event_token_params.event_token
-        data = self._get(f"cost_alerts/{cost_alert_token}/events/{event_token}")
-        return CostAlertEvent.model_validate(data)
+        data = self._get_raw(f"cost_alerts/{cost_alert_token}/events/{event_token}")
+        return self._parse(CostAlertEvent, data)
 
     def create_cost_alert(self, new_cost_alert: CreateCostAlert) -> CostAlert:
         """
@@ -1807,7 +2679,7 @@ class VantageSDK:
             The created cost alert object
         """
         data = self._post("cost_alerts", new_cost_alert)
-        return CostAlert.model_validate(data)
+        return self._parse(CostAlert, data)
 
     def update_cost_alert(
         self, cost_alert_token_params: CostAlertTokenParams, cost_alert_update: UpdateCostAlert
@@ -1824,7 +2696,7 @@ class VantageSDK:
         """
         cost_alert_token = cost_alert_token_params.cost_alert_token
         data = self._put(f"cost_alerts/{cost_alert_token}", cost_alert_update)
-        return CostAlert.model_validate(data)
+        return self._parse(CostAlert, data)
 
     def delete_cost_alert(self, cost_alert_token_params: CostAlertTokenParams) -> HttpStatusCode:
         """
@@ -1858,7 +2730,7 @@ class VantageSDK:
         """
         cost_report_token = cost_report_token_params.cost_report_token
         paginated_data = self._get_paginated(f"cost_reports/{cost_report_token}/forecasted_costs", query_params)
-        return ForecastedCosts.model_validate(paginated_data)
+        return self._parse(ForecastedCosts, paginated_data)
 
     # ---- Cost Providers & Services APIs ----
 
@@ -1872,8 +2744,8 @@ class VantageSDK:
         Returns:
             A CostProviders object which is a list of CostProvider objects
         """
-        data = self._get("cost_providers", workspace_token_params)
-        return CostProviders.model_validate(data)
+        data = self._get_raw("cost_providers", workspace_token_params)
+        return self._parse(CostProviders, data)
 
     def get_cost_services(self, workspace_token_params: WorkspaceTokenParams | None = None) -> CostServices:
         """
@@ -1885,8 +2757,8 @@ class VantageSDK:
         Returns:
             A CostServices object which is a list of CostService objects
         """
-        data = self._get("cost_services", workspace_token_params)
-        return CostServices.model_validate(data)
+        data = self._get_raw("cost_services", workspace_token_params)
+        return self._parse(CostServices, data)
 
     # ---- Dashboards APIs ----
 
@@ -1901,7 +2773,7 @@ class VantageSDK:
             A Dashboards object containing all dashboards
         """
         paginated_data = self._get_paginated("dashboards", workspace_token_params)
-        return Dashboards.model_validate(paginated_data)
+        return self._parse(Dashboards, paginated_data)
 
     def get_dashboard(self, dashboard_token_params: DashboardTokenParams) -> Dashboard:
         """
@@ -1914,8 +2786,8 @@ class VantageSDK:
             A Dashboard object
         """
         dashboard_token = dashboard_token_params.dashboard_token
-        data = self._get(f"dashboards/{dashboard_token}")
-        return Dashboard.model_validate(data)
+        data = self._get_raw(f"dashboards/{dashboard_token}")
+        return self._parse(Dashboard, data)
 
     def create_dashboard(self, new_dashboard: CreateDashboard) -> Dashboard:
         """
@@ -1928,7 +2800,7 @@ class VantageSDK:
             The created Dashboard object
         """
         data = self._post("dashboards", new_dashboard)
-        return Dashboard.model_validate(data)
+        return self._parse(Dashboard, data)
 
     def update_dashboard(
         self, dashboard_token_params: DashboardTokenParams, dashboard_update: UpdateDashboard
@@ -1945,7 +2817,7 @@ class VantageSDK:
         """
         dashboard_token = dashboard_token_params.dashboard_token
         data = self._put(f"dashboards/{dashboard_token}", dashboard_update)
-        return Dashboard.model_validate(data)
+        return self._parse(Dashboard, data)
 
     def delete_dashboard(self, dashboard_token_params: DashboardTokenParams) -> HttpStatusCode:
         """
@@ -1973,7 +2845,7 @@ class VantageSDK:
             A Canvases object containing all canvases
         """
         paginated_data = self._get_paginated("canvases", canvases_query_params)
-        return Canvases.model_validate(paginated_data)
+        return self._parse(Canvases, paginated_data)
 
     def get_canvas(self, canvas_token_params: CanvasTokenParams) -> Canvas:
         """
@@ -1986,8 +2858,8 @@ class VantageSDK:
             A Canvas object
         """
         canvas_token = canvas_token_params.canvas_token
-        data = self._get(f"canvases/{canvas_token}")
-        return Canvas.model_validate(data)
+        data = self._get_raw(f"canvases/{canvas_token}")
+        return self._parse(Canvas, data)
 
     def create_canvas(self, new_canvas: CreateCanvas) -> Canvas:
         """
@@ -2000,7 +2872,7 @@ class VantageSDK:
             The created Canvas object
         """
         data = self._post("canvases", new_canvas)
-        return Canvas.model_validate(data)
+        return self._parse(Canvas, data)
 
     def update_canvas(self, canvas_token_params: CanvasTokenParams, canvas_update: UpdateCanvas) -> Canvas:
         """
@@ -2015,7 +2887,7 @@ class VantageSDK:
         """
         canvas_token = canvas_token_params.canvas_token
         data = self._put(f"canvases/{canvas_token}", canvas_update)
-        return Canvas.model_validate(data)
+        return self._parse(Canvas, data)
 
     def delete_canvas(self, canvas_token_params: CanvasTokenParams) -> HttpStatusCode:
         """
@@ -2051,7 +2923,7 @@ class VantageSDK:
             A Products object which is a list of Product objects
         """
         paginated_data = self._get_paginated("products")
-        return Products.model_validate(paginated_data)
+        return self._parse(Products, paginated_data)
 
     def get_product(self, product_id_params: ProductIdParams) -> Product:
         """
@@ -2064,8 +2936,8 @@ class VantageSDK:
             The product object
         """
         product_id = product_id_params.id
-        data = self._get(f"products/{product_id}")
-        return Product.model_validate(data)
+        data = self._get_raw(f"products/{product_id}")
+        return self._parse(Product, data)
 
     def get_product_prices(self, product_id_params: ProductIdParams) -> Prices:
         """
@@ -2079,7 +2951,7 @@ class VantageSDK:
         """
         product_id = product_id_params.id
         paginated_data = self._get_paginated(f"products/{product_id}/prices")
-        return Prices.model_validate(paginated_data)
+        return self._parse(Prices, paginated_data)
 
     def get_product_price(self, product_id_params: ProductIdParams, price_id_params: ProductPriceIdParams) -> Price:
         """
@@ -2094,8 +2966,8 @@ class VantageSDK:
         """
         product_id = product_id_params.id
         price_id = price_id_params.id
-        data = self._get(f"products/{product_id}/prices/{price_id}")
-        return Price.model_validate(data)
+        data = self._get_raw(f"products/{product_id}/prices/{price_id}")
+        return self._parse(Price, data)
 
     # ---- Recommendations APIs ----
 
@@ -2107,7 +2979,7 @@ class VantageSDK:
             A Recommendations object which is a list of Recommendation objects
         """
         paginated_data = self._get_paginated("recommendations")
-        return Recommendations.model_validate(paginated_data)
+        return self._parse(Recommendations, paginated_data)
 
     def get_recommendation(self, recommendation_token_params: RecommendationTokenParams) -> Recommendation:
         """
@@ -2120,8 +2992,8 @@ class VantageSDK:
             The recommendation object
         """
         recommendation_token = recommendation_token_params.recommendation_token
-        data = self._get(f"recommendations/{recommendation_token}")
-        return Recommendation.model_validate(data)
+        data = self._get_raw(f"recommendations/{recommendation_token}")
+        return self._parse(Recommendation, data)
 
     def get_recommendation_resources(
         self, recommendation_token_params: RecommendationTokenParams
@@ -2137,7 +3009,7 @@ class VantageSDK:
         """
         recommendation_token = recommendation_token_params.recommendation_token
         paginated_data = self._get_paginated(f"recommendations/{recommendation_token}/resources")
-        return RecommendationResources.model_validate(paginated_data)
+        return self._parse(RecommendationResources, paginated_data)
 
     def get_recommendation_resource(
         self,
@@ -2158,8 +3030,8 @@ class VantageSDK:
         """
         recommendation_token = recommendation_token_params.recommendation_token
         resource_token = recommendation_resource_token_params.resource_token
-        data = self._get(f"recommendations/{recommendation_token}/resources/{resource_token}")
-        return RecommendationResource.model_validate(data)
+        data = self._get_raw(f"recommendations/{recommendation_token}/resources/{resource_token}")
+        return self._parse(RecommendationResource, data)
 
     def get_recommendation_type_resources(
         self,
@@ -2178,7 +3050,7 @@ class VantageSDK:
         """
         recommendation_type = recommendation_type_params.recommendation_type
         paginated_data = self._get_paginated(f"recommendations/by_type/{recommendation_type}/resources", query_params)
-        return RecommendationResources.model_validate(paginated_data)
+        return self._parse(RecommendationResources, paginated_data)
 
     # ---- Report Notifications APIs ----
 
@@ -2190,7 +3062,7 @@ class VantageSDK:
             A ReportNotifications object which is a list of ReportNotification objects
         """
         paginated_data = self._get_paginated("report_notifications")
-        return ReportNotifications.model_validate(paginated_data)
+        return self._parse(ReportNotifications, paginated_data)
 
     def get_report_notification(
         self, report_notification_token_params: ReportNotificationTokenParams
@@ -2205,8 +3077,8 @@ class VantageSDK:
             The report notification object
         """
         report_notification_token = report_notification_token_params.report_notification_token
-        data = self._get(f"report_notifications/{report_notification_token}")
-        return ReportNotification.model_validate(data)
+        data = self._get_raw(f"report_notifications/{report_notification_token}")
+        return self._parse(ReportNotification, data)
 
     def create_report_notification(self, new_report_notification: CreateReportNotification) -> ReportNotification:
         """
@@ -2219,7 +3091,7 @@ class VantageSDK:
             The created report notification object
         """
         data = self._post("report_notifications", new_report_notification)
-        return ReportNotification.model_validate(data)
+        return self._parse(ReportNotification, data)
 
     def update_report_notification(
         self,
@@ -2238,7 +3110,7 @@ class VantageSDK:
         """
         report_notification_token = report_notification_token_params.report_notification_token
         data = self._put(f"report_notifications/{report_notification_token}", report_notification_update)
-        return ReportNotification.model_validate(data)
+        return self._parse(ReportNotification, data)
 
     def delete_report_notification(
         self, report_notification_token_params: ReportNotificationTokenParams
@@ -2265,7 +3137,7 @@ class VantageSDK:
             A ResourceReports object which is a list of ResourceReport objects
         """
         paginated_data = self._get_paginated("resource_reports")
-        return ResourceReports.model_validate(paginated_data)
+        return self._parse(ResourceReports, paginated_data)
 
     def get_resource_report(self, resource_report_token_params: ResourceReportTokenParams) -> ResourceReport:
         """
@@ -2278,8 +3150,8 @@ class VantageSDK:
             The resource report object
         """
         token_value = resource_report_token_params.resource_report_token
-        data = self._get(f"resource_reports/{token_value}")
-        return ResourceReport.model_validate(data)
+        data = self._get_raw(f"resource_reports/{token_value}")
+        return self._parse(ResourceReport, data)
 
     def create_resource_report(self, new_resource_report: CreateResourceReport) -> ResourceReport:
         """
@@ -2292,7 +3164,7 @@ class VantageSDK:
             The created resource report object
         """
         data = self._post("resource_reports", new_resource_report)
-        return ResourceReport.model_validate(data)
+        return self._parse(ResourceReport, data)
 
     def update_resource_report(
         self,
@@ -2311,7 +3183,7 @@ class VantageSDK:
         """
         token_value = resource_report_token_params.resource_report_token
         data = self._put(f"resource_reports/{token_value}", resource_report_update)
-        return ResourceReport.model_validate(data)
+        return self._parse(ResourceReport, data)
 
     def delete_resource_report(self, resource_report_token_params: ResourceReportTokenParams) -> HttpStatusCode:
         """
@@ -2338,8 +3210,26 @@ class VantageSDK:
         Returns:
             A Resources object which is a list of Resource objects
         """
+        data = self._get_raw("resources", query_params)
+        return self._parse(Resources, data)
+
+    def get_all_resources_table(self, query_params: ResourcesGetParametersQuery) -> "Table":
+        """
+        Get all resources as columns - GET /resources
+
+        Args:
+            query_params: Query parameters for filtering resources, must include resource_report_token
+
+        Returns:
+            A Table with a column per Resource field
+
+        Note:
+            Requires the `numpy` extra
+        """
+        from vantage_sdk.columnar import RESOURCES_TABLE, build_table
+
         data = self._get("resources", query_params)
-        return Resources.model_validate(data)
+        return build_table(RESOURCES_TABLE, data)
 
     def get_resource(self, resource_token_params: ResourceTokenParams) -> Resource:
         """
@@ -2352,8 +3242,8 @@ class VantageSDK:
             The resource object
         """
         token_value = resource_token_params.resource_token
-        data = self._get(f"resources/{token_value}")
-        return Resource.model_validate(data)
+        data = self._get_raw(f"resources/{token_value}")
+        return self._parse(Resource, data)
 
     # ---- Segments APIs ----
 
@@ -2365,7 +3255,7 @@ class VantageSDK:
             A Segments object which is a list of Segment objects
         """
         paginated_data = self._get_paginated("segments")
-        return Segments.model_validate(paginated_data)
+        return self._parse(Segments, paginated_data)
 
     def get_segment(self, segment_token_params: SegmentTokenParams) -> Segment:
         """
@@ -2378,8 +3268,8 @@ class VantageSDK:
             The segment object
         """
         token_value = segment_token_params.segment_token
-        data = self._get(f"segments/{token_value}")
-        return Segment.model_validate(data)
+        data = self._get_raw(f"segments/{token_value}")
+        return self._parse(Segment, data)
 
     def create_segment(self, new_segment: CreateSegment) -> Segment:
         """
@@ -2392,7 +3282,7 @@ class VantageSDK:
             The created segment object
         """
         data = self._post("segments", new_segment)
-        return Segment.model_validate(data)
+        return self._parse(Segment, data)
 
     def update_segment(
         self,
@@ -2411,7 +3301,7 @@ class VantageSDK:
         """
         token_value = segment_token_params.segment_token
         data = self._put(f"segments/{token_value}", segment_update)
-        return Segment.model_validate(data)
+        return self._parse(Segment, data)
 
     def delete_segment(self, segment_token_params: SegmentTokenParams) -> HttpStatusCode:
         """
@@ -2436,7 +3326,7 @@ class VantageSDK:
             A KubernetesEfficiencyReports object which is a list of KubernetesEfficiencyReport objects
         """
         paginated_data = self._get_paginated("kubernetes_efficiency_reports")
-        return KubernetesEfficiencyReports.model_validate(paginated_data)
+        return self._parse(KubernetesEfficiencyReports, paginated_data)
 
     def get_kubernetes_efficiency_report(
         self, kubernetes_efficiency_report_token_params: KubernetesEfficiencyReportTokenParams
@@ -2453,8 +3343,8 @@ class VantageSDK:
             The kubernetes efficiency report object
         """
         token_value = kubernetes_efficiency_report_token_params.kubernetes_efficiency_report_token
-        data = self._get(f"kubernetes_efficiency_reports/{token_value}")
-        return KubernetesEfficiencyReport.model_validate(data)
+        data = self._get_raw(f"kubernetes_efficiency_reports/{token_value}")
+        return self._parse(KubernetesEfficiencyReport, data)
 
     def create_kubernetes_efficiency_report(
         self, new_kubernetes_efficiency_report: CreateKubernetesEfficiencyReport
@@ -2469,7 +3359,7 @@ class VantageSDK:
             The created kubernetes efficiency report object
         """
         data = self._post("kubernetes_efficiency_reports", new_kubernetes_efficiency_report)
-        return KubernetesEfficiencyReport.model_validate(data)
+        return self._parse(KubernetesEfficiencyReport, data)
 
     def update_kubernetes_efficiency_report(
         self,
@@ -2490,7 +3380,7 @@ class VantageSDK:
         """
         token_value = kubernetes_efficiency_report_token_params.kubernetes_efficiency_report_token
         data = self._put(f"kubernetes_efficiency_reports/{token_value}", kubernetes_efficiency_report_update)
-        return KubernetesEfficiencyReport.model_validate(data)
+        return self._parse(KubernetesEfficiencyReport, data)
 
     def delete_kubernetes_efficiency_report(
         self, kubernetes_efficiency_report_token_params: KubernetesEfficiencyReportTokenParams
@@ -2519,7 +3409,7 @@ class VantageSDK:
             A ManagedAccounts object which is a list of ManagedAccount objects
         """
         paginated_data = self._get_paginated("managed_accounts")
-        return ManagedAccounts.model_validate(paginated_data)
+        return self._parse(ManagedAccounts, paginated_data)
 
     def get_managed_account(self, managed_account_token_params: ManagedAccountTokenParams) -> ManagedAccount:
         """
@@ -2532,8 +3422,8 @@ class VantageSDK:
             The managed account object
         """
         token_value = managed_account_token_params.managed_account_token
-        data = self._get(f"managed_accounts/{token_value}")
-        return ManagedAccount.model_validate(data)
+        data = self._get_raw(f"managed_accounts/{token_value}")
+        return self._parse(ManagedAccount, data)
 
     def create_managed_account(self, new_managed_account: CreateManagedAccount) -> ManagedAccount:
         """
@@ -2546,7 +3436,7 @@ class VantageSDK:
             The created managed account object
         """
         data = self._post("managed_accounts", new_managed_account)
-        return ManagedAccount.model_validate(data)
+        return self._parse(ManagedAccount, data)
 
     def update_managed_account(
         self,
@@ -2565,7 +3455,7 @@ class VantageSDK:
         """
         token_value = managed_account_token_params.managed_account_token
         data = self._put(f"managed_accounts/{token_value}", managed_account_update)
-        return ManagedAccount.model_validate(data)
+        return self._parse(ManagedAccount, data)
 
     def delete_managed_account(self, managed_account_token_params: ManagedAccountTokenParams) -> HttpStatusCode:
         """
@@ -2599,7 +3489,7 @@ class VantageSDK:
         """
         token_value = managed_account_token_params.managed_account_token
         data = self._post(f"managed_accounts/{token_value}/sso_connection", sso_connection)
-        return ManagedAccount.model_validate(data)
+        return self._parse(ManagedAccount, data)
 
     def update_managed_account_sso_connection(
         self,
@@ -2618,7 +3508,7 @@ class VantageSDK:
         """
         token_value = managed_account_token_params.managed_account_token
         data = self._put(f"managed_accounts/{token_value}/sso_connection", sso_connection_update)
-        return ManagedAccount.model_validate(data)
+        return self._parse(ManagedAccount, data)
 
     def delete_managed_account_sso_connection(
         self, managed_account_token_params: ManagedAccountTokenParams
@@ -2650,7 +3540,7 @@ class VantageSDK:
             A NetworkFlowReports object which is a list of NetworkFlowReport objects
         """
         paginated_data = self._get_paginated("network_flow_reports", query_params)
-        return NetworkFlowReports.model_validate(paginated_data)
+        return self._parse(NetworkFlowReports, paginated_data)
 
     def get_network_flow_logs(self, query_params: NetworkFlowLogsGetParametersQuery) -> NetworkFlowLogs:
         """
@@ -2663,7 +3553,28 @@ class VantageSDK:
             The matching network flow logs and sampling metadata
         """
         paginated_data = self._get_paginated("network_flow_logs", query_params, collection_key="network_flow_logs")
-        return NetworkFlowLogs.model_validate(paginated_data)
+        return self._parse(NetworkFlowLogs, paginated_data)
+
+    def get_network_flow_logs_table(
+        self, query_params: NetworkFlowLogsGetParametersQuery, *, decimals: bool = False
+    ) -> "Table":
+        """
+        Get network flow logs as columns - GET /network_flow_logs
+
+        Args:
+            query_params: Parameters for filtering and grouping network flow logs
+            decimals: Whether estimated costs are kept exact as Decimal objects rather than converted to float64
+
+        Returns:
+            A Table with a column per NetworkFlowLog field and per grouping, and the sampling metadata
+
+        Note:
+            Requires the `numpy` extra
+        """
+        from vantage_sdk.columnar import NETWORK_FLOW_LOGS_TABLE, build_table
+
+        paginated_data = self._get_paginated("network_flow_logs", query_params, collection_key="network_flow_logs")
+        return build_table(NETWORK_FLOW_LOGS_TABLE, paginated_data, decimals)
 
     # ---- Tags APIs ----
 
@@ -2678,7 +3589,7 @@ class VantageSDK:
             A Tags object which is a list of Tag objects
         """
         paginated_data = self._get_paginated("tags", query_params)
-        return Tags.model_validate(paginated_data)
+        return self._parse(Tags, paginated_data)
 
     def get_tag_values(
         self, tag_key_params: TagKeyParams, query_params: TagsKeyValuesGetParametersQuery | None = None
@@ -2695,7 +3606,7 @@ class VantageSDK:
         """
         key = tag_key_params.key
         paginated_data = self._get_paginated(f"tags/{key}/values", query_params)
-        return TagValues.model_validate(paginated_data)
+        return self._parse(TagValues, paginated_data)
 
     # NOTE: The OpenAPI spec declares the response as a singular Tag, but the
     # actual API returns {"tags": [...]}, matching the Tags collection format
@@ -2710,7 +3621,7 @@ class VantageSDK:
             The updated Tags object
         """
         data = self._put("tags", tag_update)
-        return Tags.model_validate(data)
+        return self._parse(Tags, data)
 
     def get_network_flow_report(
         self, network_flow_report_token_params: NetworkFlowReportTokenParams
@@ -2725,8 +3636,8 @@ class VantageSDK:
             The network flow report object
         """
         token_value = network_flow_report_token_params.network_flow_report_token
-        data = self._get(f"network_flow_reports/{token_value}")
-        return NetworkFlowReport.model_validate(data)
+        data = self._get_raw(f"network_flow_reports/{token_value}")
+        return self._parse(NetworkFlowReport, data)
 
     def create_network_flow_report(self, new_network_flow_report: CreateNetworkFlowReport) -> NetworkFlowReport:
         """
@@ -2739,7 +3650,7 @@ class VantageSDK:
             The created network flow report object
         """
         data = self._post("network_flow_reports", new_network_flow_report)
-        return NetworkFlowReport.model_validate(data)
+        return self._parse(NetworkFlowReport, data)
 
     def update_network_flow_report(
         self,
@@ -2758,7 +3669,7 @@ class VantageSDK:
         """
         token_value = network_flow_report_token_params.network_flow_report_token
         data = self._put(f"network_flow_reports/{token_value}", network_flow_report_update)
-        return NetworkFlowReport.model_validate(data)
+        return self._parse(NetworkFlowReport, data)
 
     def delete_network_flow_report(
         self, network_flow_report_token_params: NetworkFlowReportTokenParams
@@ -2790,7 +3701,27 @@ class VantageSDK:
             A FinancialCommitments object which is a list of FinancialCommitment objects
         """
         paginated_data = self._get_paginated("financial_commitments", workspace_token_params)
-        return FinancialCommitments.model_validate(paginated_data)
+        return self._parse(FinancialCommitments, paginated_data)
+
+    def get_all_financial_commitments_table(
+        self, workspace_token_params: WorkspaceTokenParams | None = None
+    ) -> "Table":
+        """
+        Get all financial commitments as columns - GET /financial_commitments
+
+        Args:
+            workspace_token_params: Optional workspace token parameters
+
+        Returns:
+            A Table with a column per FinancialCommitment field
+
+        Note:
+            Requires the `numpy` extra
+        """
+        from vantage_sdk.columnar import FINANCIAL_COMMITMENTS_TABLE, build_table
+
+        paginated_data = self._get_paginated("financial_commitments", workspace_token_params)
+        return build_table(FINANCIAL_COMMITMENTS_TABLE, paginated_data)
 
     def get_all_financial_commitment_reports(self) -> FinancialCommitmentReports:
         """
@@ -2800,7 +3731,7 @@ class VantageSDK:
             A FinancialCommitmentReports object which is a list of FinancialCommitmentReport objects
         """
         paginated_data = self._get_paginated("financial_commitment_reports")
-        return FinancialCommitmentReports.model_validate(paginated_data)
+        return self._parse(FinancialCommitmentReports, paginated_data)
 
     def get_financial_commitment_report(
         self, financial_commitment_report_token_params: FinancialCommitmentReportTokenParams
@@ -2817,8 +3748,8 @@ class VantageSDK:
             The financial commitment report object
         """
         token_value = financial_commitment_report_token_params.financial_commitment_report_token
-        data = self._get(f"financial_commitment_reports/{token_value}")
-        return FinancialCommitmentReport.model_validate(data)
+        data = self._get_raw(f"financial_commitment_reports/{token_value}")
+        return self._parse(FinancialCommitmentReport, data)
 
     def create_financial_commitment_report(
         self, new_financial_commitment_report: CreateFinancialCommitmentReport
@@ -2833,7 +3764,7 @@ class VantageSDK:
             The created financial commitment report object
         """
         data = self._post("financial_commitment_reports", new_financial_commitment_report)
-        return FinancialCommitmentReport.model_validate(data)
+        return self._parse(FinancialCommitmentReport, data)
 
     def update_financial_commitment_report(
         self,
@@ -2854,7 +3785,7 @@ class VantageSDK:
         """
         token_value = financial_commitment_report_token_params.financial_commitment_report_token
         data = self._put(f"financial_commitment_reports/{token_value}", financial_commitment_report_update)
-        return FinancialCommitmentReport.model_validate(data)
+        return self._parse(FinancialCommitmentReport, data)
 
     def delete_financial_commitment_report(
         self, financial_commitment_report_token_params: FinancialCommitmentReportTokenParams
@@ -2886,7 +3817,26 @@ class VantageSDK:
             A UnitCosts object containing the unit costs data
         """
         paginated_data = self._get_paginated("unit_costs", query_params)
-        return UnitCosts.model_validate(paginated_data)
+        return self._parse(UnitCosts, paginated_data)
+
+    def get_all_unit_costs_table(self, query_params: UnitCostsGetParametersQuery, *, decimals: bool = False) -> "Table":
+        """
+        Get all unit costs as columns - GET /unit_costs
+
+        Args:
+            query_params: Optional query parameters for filtering unit costs
+            decimals: Whether amounts are kept exact as Decimal objects rather than converted to float64
+
+        Returns:
+            A Table with a column per UnitCost field
+
+        Note:
+            Requires the `numpy` extra
+        """
+        from vantage_sdk.columnar import UNIT_COSTS_TABLE, build_table
+
+        paginated_data = self._get_paginated("unit_costs", query_params)
+        return build_table(UNIT_COSTS_TABLE, paginated_data, decimals)
 
     def create_unit_costs_data_export(self, unit_costs_export_request: UnitCostsDataExportsPostRequest) -> str:
         """
@@ -2902,10 +3852,10 @@ class VantageSDK:
             This function returns the token of the created data export, which can be used to retrieve the export later.
             The export process is asynchronous, and the export may not be immediately available.
         """
-        response = self.session.post(
-            urljoin(self.base_url, "unit_costs/data_exports"),
+        response = self._request(
+            "POST",
+            "unit_costs/data_exports",
             json=unit_costs_export_request.model_dump(mode="json", exclude_none=True, by_alias=True),
-            headers=self.session.headers,
             timeout=None,
         )
         response.raise_for_status()
@@ -2936,7 +3886,7 @@ class VantageSDK:
             The created UserFeedback object
         """
         data = self._post("user_feedback", feedback)
-        return UserFeedback.model_validate(data)
+        return self._parse(UserFeedback, data)
 
     # ---- Users APIs ----
 
@@ -2948,7 +3898,7 @@ class VantageSDK:
             A Users object containing all users
         """
         paginated_data = self._get_paginated("users")
-        return Users.model_validate(paginated_data)
+        return self._parse(Users, paginated_data)
 
     def get_user(self, user_token_params: UserTokenParams) -> User:
         """
@@ -2961,8 +3911,8 @@ class VantageSDK:
             The User object
         """
         token = user_token_params.user_token
-        data = self._get(f"users/{token}")
-        return User.model_validate(data)
+        data = self._get_raw(f"users/{token}")
+        return self._parse(User, data)
 
     def update_user(self, user_token_params: UserTokenParams, user_update: UpdateUser) -> User:
         """
@@ -2977,7 +3927,7 @@ class VantageSDK:
         """
         token = user_token_params.user_token
         data = self._put(f"users/{token}", user_update)
-        return User.model_validate(data)
+        return self._parse(User, data)
 
     # ---- Workspaces APIs ----
 
@@ -2992,7 +3942,7 @@ class VantageSDK:
             A Workspaces object containing all workspaces
         """
         paginated_data = self._get_paginated("workspaces", query_params)
-        return Workspaces.model_validate(paginated_data)
+        return self._parse(Workspaces, paginated_data)
 
     def get_workspace(self, workspace_token_params: WorkspaceTokenParams) -> Workspace:
         """
@@ -3005,8 +3955,8 @@ class VantageSDK:
             The Workspace object
         """
         token = workspace_token_params.workspace_token
-        data = self._get(f"workspaces/{token}")
-        return Workspace.model_validate(data)
+        data = self._get_raw(f"workspaces/{token}")
+        return self._parse(Workspace, data)
 
     def create_workspace(self, workspace: CreateWorkspace) -> Workspace:
         """
@@ -3019,7 +3969,7 @@ class VantageSDK:
             The created Workspace object
         """
         data = self._post("workspaces", workspace)
-        return Workspace.model_validate(data)
+        return self._parse(Workspace, data)
 
     def update_workspace(
         self, workspace_token_params: WorkspaceTokenParams, workspace_update: WorkspacesWorkspaceTokenPutRequest
@@ -3036,7 +3986,7 @@ class VantageSDK:
         """
         token = workspace_token_params.workspace_token
         data = self._put(f"workspaces/{token}", workspace_update)
-        return Workspace.model_validate(data)
+        return self._parse(Workspace, data)
 
     def delete_workspace(self, workspace_token_params: WorkspaceTokenParams) -> HttpStatusCode:
         """
@@ -3065,7 +4015,32 @@ class VantageSDK:
             An AuditLogs object containing all audit logs (filtered if query_params provided)
         """
         paginated_data = self._get_paginated("audit_logs", query_params)
-        return AuditLogs.model_validate(paginated_data)
+        return self._parse(AuditLogs, paginated_data)
+
+    def iter_audit_logs_pages(self, query_params: AuditLogsGetParametersQuery | None = None) -> Iterator[AuditLogs]:
+        """
+        Stream the pages of all audit logs - GET /audit_logs
+
+        Args:
+            query_params: Optional query parameters for filtering audit logs
+
+        Yields:
+            An AuditLogs object for each page, as soon as it arrives
+        """
+        yield from self._iter_pages("audit_logs", AuditLogs, query_params)
+
+    def iter_audit_logs(self, query_params: AuditLogsGetParametersQuery | None = None) -> Iterator[AuditLog]:
+        """
+        Stream all audit logs - GET /audit_logs
+
+        Args:
+            query_params: Optional query parameters for filtering audit logs
+
+        Yields:
+            Each AuditLog object, as soon as the page containing it arrives
+        """
+        for page in self.iter_audit_logs_pages(query_params):
+            yield from page.audit_logs
 
     def get_audit_log(self, audit_log_token_params: AuditLogTokenParams) -> AuditLog:
         """
@@ -3078,5 +4053,5 @@ class VantageSDK:
             The AuditLog object
         """
         token = audit_log_token_params.audit_log_token
-        data = self._get(f"audit_logs/{token}")
-        return AuditLog.model_validate(data)
+        data = self._get_raw(f"audit_logs/{token}")
+        return self._parse(AuditLog, data)
@@ -0,0 +1,520 @@
+"""
+Columnar results of collection endpoints
+
+A Costs response holds a Cost model per row, each with its amount as a string, so summing, filtering or pivoting
+hundreds of thousands of rows allocates an object per row and converts every amount in Python. The `*_table`
+methods of the clients build a Table instead, straight from the combined JSON of the pages and without building
+any model: one NumPy array per field, where
+
+- amounts are float64 arrays, NaN where missing, or exact Decimal objects with `decimals=True`
+- dates are datetime64 arrays, of days or of seconds in UTC when the values carry a time, NaT where missing
+- low-cardinality strings such as provider, service, region and account_id are DictionaryColumns, int32 codes
+  into the distinct values, so filtering and grouping on them compares integers
+- other values are object arrays holding what the API sent
+
+A Table converts to a pyarrow Table, a pandas DataFrame or a polars DataFrame with the same types, amounts as
+float64 or decimal128, dates and UTC timestamps, and dictionary columns as dictionary or categorical columns.
+`to_table` also builds one from a response already built into its model, without dumping its rows one by one
+
+Requires NumPy, installed with the `numpy` extra: pip install 'client-for-vantage[numpy]'. The conversions
+require the `arrow`, `pandas` or `polars` extra
+"""
+
+import importlib
+import json
+from collections.abc import Hashable, Iterable, Mapping, Sequence
+from datetime import UTC, datetime
+from decimal import Decimal
+from enum import StrEnum
+from typing import Any, TypeAlias, cast
+
+from pydantic import BaseModel
+
+from vantage_sdk.lazy import LazySequence
+from vantage_sdk.models import BusinessMetricValues, Costs, FinancialCommitments, NetworkFlowLogs, Resources, UnitCosts
+
+try:
+    import numpy as np
+    import numpy.typing as npt
+except ImportError as error:
+    raise ImportError(
+        "Columnar results require NumPy, install it with: pip install 'client-for-vantage[numpy]'"
+    ) from error
+
+
+class ColumnKind(StrEnum):
+    """How the values of a field are stored in a Table"""
+
+    # float64, or Decimal objects when the table is built with decimals=True, for amounts sent as decimal strings
+    amount = "amount"
+    # float64, for plain numbers
+    number = "number"
+    # datetime64, for ISO 8601 dates and datetimes
+    date = "date"
+    # DictionaryColumn, for strings repeated across many rows
+    category = "category"
+    # object array, for values kept as the API sent them
+    raw = "raw"
+
+
+class DictionaryColumn:
+    """
+    A dictionary-encoded column: the distinct values once, and the position of each row's value among them
+
+    Args:
+        codes: The position of each row's value in `categories`, -1 where it is missing
+        categories: The distinct values, in order of first appearance
+    """
+
+    __slots__ = ("categories", "codes")
+
+    def __init__(self, codes: npt.NDArray[np.int32], categories: Sequence[Hashable]):
+        self.codes = codes
+        self.categories = tuple(categories)
+
+    @classmethod
+    def encode(cls, values: Iterable[Hashable | None]) -> "DictionaryColumn":
+        """
+        Encode the values of a column
+
+        Args:
+            values: The value of each row, None where it is missing
+
+        Returns:
+            The encoded column
+        """
+        positions: dict[Hashable, int] = {}
+        codes = [-1 if value is None else positions.setdefault(value, len(positions)) for value in values]
+        return cls(np.array(codes, dtype=np.int32), list(positions))
+
+    def __len__(self) -> int:
+        """The number of rows"""
+        return len(self.codes)
+
+    def __repr__(self) -> str:
+        """How many rows and distinct values the column holds"""
+        return f"{type(self).__name__}({len(self)} rows, {len(self.categories)} categories)"
+
+    def isin(self, *values: Hashable) -> npt.NDArray[np.bool_]:
+        """
+        Find the rows holding any of the values, comparing codes rather than the values themselves
+
+        Args:
+            *values: The values to look for
+
+        Returns:
+            A boolean mask with one entry per row
+        """
+        wanted = [position for position, category in enumerate(self.categories) if category in values]
+        return np.isin(self.codes, wanted)
+
+    def take(self, selection: npt.NDArray[np.bool_] | npt.NDArray[np.intp]) -> "DictionaryColumn":
+        """
+        Select rows, keeping the categories
+
+        Args:
+            selection: A boolean mask or the positions of the rows to keep
+
+        Returns:
+            The column of the selected rows
+        """
+        return DictionaryColumn(self.codes[selection], self.categories)
+
+    def to_numpy(self) -> npt.NDArray[np.object_]:
+        """Decode the column into an object array, None where a value is missing"""
+        lookup = np.array([*self.categories, None], dtype=object)
+        return lookup[self.codes]
+
+
+# A column of a Table
+Column: TypeAlias = npt.NDArray[Any] | DictionaryColumn
+
+
+class Table:
+    """
+    The rows of a collection response, stored as one column per field
+
+    Example:
+        table = vantage.get_cost_report_costs_table(query)
+        ec2 = table.filter(table["service"].isin("Amazon Elastic Compute Cloud"))
+        by_region = ec2.sum_by("region")
+
+    Args:
+        columns: The column of each field, all of the same length
+        metadata: The other keys of the response, such as total_cost
+    """
+
+    __slots__ = ("columns", "metadata")
+
+    def __init__(self, columns: Mapping[str, Column], metadata: Mapping[str, Any]):
+        self.columns = dict(columns)
+        self.metadata = dict(metadata)
+
+    @property
+    def column_names(self) -> list[str]:
+        """The name of every column, in order"""
+        return list(self.columns)
+
+    def __len__(self) -> int:
+        """The number of rows"""
+        return next((len(column) for column in self.columns.values()), 0)
+
+    def __getitem__(self, name: str) -> Column:
+        """Get a column by name"""
+        return self.columns[name]
+
+    def __contains__(self, name: object) -> bool:
+        """Whether the table has a column"""
+        return name in self.columns
+
+    def __repr__(self) -> str:
+        """How many rows the table holds and the names of its columns"""
+        return f"{type(self).__name__}({len(self)} rows, columns={self.column_names})"
+
+    def filter(self, mask: npt.NDArray[np.bool_]) -> "Table":
+        """
+        Keep the rows selected by a boolean mask
+
+        Args:
+            mask: One entry per row, True for the rows to keep
+
+        Returns:
+            A table of the selected rows, sharing the metadata of this one
+        """
+        columns = {
+            name: column.take(mask) if isinstance(column, DictionaryColumn) else column[mask]
+            for name, column in self.columns.items()
+        }
+        return Table(columns, self.metadata)
+
+    def sum_by(self, key: str, value: str = "amount") -> dict[Hashable | None, float]:
+        """
+        Sum a number column for each value of a dictionary-encoded column
+
+        Args:
+            key: The dictionary-encoded column to group by
+            value: The number column to sum, missing numbers count as 0
+
+        Returns:
+            The sum for each value of the key, under None for rows missing it
+        """
+        column = self.columns[key]
+        if not isinstance(column, DictionaryColumn):
+            raise TypeError(f"Column {key!r} is not dictionary-encoded")
+        amounts = np.nan_to_num(np.asarray(self.columns[value], dtype=np.float64))
+        # Shifting the codes by one puts the rows missing the key in the first bin
+        sums = np.bincount(column.codes + 1, weights=amounts, minlength=len(column.categories) + 1)
+        totals: dict[Hashable | None, float] = dict(zip(column.categories, sums[1:].tolist(), strict=True))
+        if sums[0]:
+            totals[None] = float(sums[0])
+        return totals
+
+    def to_arrow(self) -> Any:
+        """
+        Convert the table to a pyarrow Table, requires the `arrow` extra
+
+        Amounts become float64 or decimal128, dates date32, datetimes UTC timestamps and dictionary-encoded
+        columns dictionary arrays sharing their codes. Missing values become nulls
+
+        Returns:
+            A pyarrow.Table, without the metadata
+        """
+        pa = _require("pyarrow", "arrow")
+        return pa.table({name: _arrow_array(pa, column) for name, column in self.columns.items()})
+
+    def to_pandas(self) -> Any:
+        """
+        Convert the table to a pandas DataFrame, requires the `pandas` extra
+
+        Dictionary-encoded columns become categoricals sharing their codes, datetimes are UTC
+
+        Returns:
+            A pandas.DataFrame, without the metadata
+        """
+        pd = _require("pandas", "pandas")
+        data: dict[str, Any] = {}
+        for name, column in self.columns.items():
+            if isinstance(column, DictionaryColumn):
+                data[name] = pd.Categorical.from_codes(column.codes, categories=list(column.categories))
+            elif column.dtype == np.dtype("datetime64[s]"):
+                data[name] = pd.DatetimeIndex(column).tz_localize("UTC")
+            else:
+                data[name] = column
+        return pd.DataFrame(data)
+
+    def to_polars(self) -> Any:
+        """
+        Convert the table to a polars DataFrame through Arrow, requires the `polars` extra
+
+        Returns:
+            A polars.DataFrame, with dictionary-encoded columns as categoricals, without the metadata
+        """
+        pl = _require("polars", "polars")
+        return pl.from_arrow(self.to_arrow())
+
+
+class TableSpec:
+    """
+    How to turn the rows of a response into columns
+
+    Args:
+        collection: The key of the response holding the rows
+        columns: The kind of each column, by field name or by `field.key` for a key of a nested object, which is
+            named `field_key` in the table
+        expand: A field holding an object whose every key becomes a column of the given kind, under the key's name
+    """
+
+    __slots__ = ("collection", "columns", "expand")
+
+    def __init__(
+        self,
+        collection: str,
+        columns: Mapping[str, ColumnKind],
+        expand: tuple[str, ColumnKind] | None = None,
+    ):
+        self.collection = collection
+        self.columns = dict(columns)
+        self.expand = expand
+
+
+# GET /costs, grouping fields the query did not group by are missing from every row
+COSTS_TABLE = TableSpec(
+    "costs",
+    {
+        "accrued_at": ColumnKind.date,
+        "amount": ColumnKind.amount,
+        "currency": ColumnKind.category,
+        "usage.amount": ColumnKind.amount,
+        "usage.unit": ColumnKind.category,
+        "provider": ColumnKind.category,
+        "billing_account_id": ColumnKind.category,
+        "account_id": ColumnKind.category,
+        "service": ColumnKind.category,
+        "region": ColumnKind.category,
+        "resource_id": ColumnKind.raw,
+        "resource_name": ColumnKind.raw,
+        "tag": ColumnKind.category,
+        "tags": ColumnKind.raw,
+        "cost_category": ColumnKind.category,
+        "cost_subcategory": ColumnKind.category,
+        "segment": ColumnKind.category,
+    },
+)
+
+# GET /unit_costs
+UNIT_COSTS_TABLE = TableSpec(
+    "unit_costs",
+    {
+        "date": ColumnKind.date,
+        "business_metric_token": ColumnKind.category,
+        "business_metric_title": ColumnKind.category,
+        "calculation_type": ColumnKind.category,
+        "unit_cost_amount": ColumnKind.amount,
+        "business_metric_amount": ColumnKind.amount,
+        "scale": ColumnKind.number,
+    },
+)
+
+# GET /network_flow_logs, with a column for each key the logs are grouped by
+NETWORK_FLOW_LOGS_TABLE = TableSpec(
+    "network_flow_logs",
+    {
+        "bytes": ColumnKind.number,
+        "estimated_cost": ColumnKind.amount,
+        "currency": ColumnKind.category,
+        "sampled_bytes": ColumnKind.number,
+        "sampled_estimated_cost": ColumnKind.amount,
+    },
+    expand=("groupings", ColumnKind.category),
+)
+
+# GET /business_metrics/{business_metric_token}/values
+BUSINESS_METRIC_VALUES_TABLE = TableSpec(
+    "values",
+    {
+        "date": ColumnKind.date,
+        "amount": ColumnKind.amount,
+        "label": ColumnKind.category,
+    },
+)
+
+# GET /resources
+RESOURCES_TABLE = TableSpec(
+    "resources",
+    {
+        "token": ColumnKind.raw,
+        "uuid": ColumnKind.raw,
+        "type": ColumnKind.category,
+        "label": ColumnKind.raw,
+        "metadata": ColumnKind.raw,
+        "account_id": ColumnKind.category,
+        "billing_account_id": ColumnKind.category,
+        "provider": ColumnKind.category,
+        "region": ColumnKind.category,
+        "costs": ColumnKind.raw,
+        "created_at": ColumnKind.date,
+        "tags": ColumnKind.raw,
+    },
+)
+
+# GET /financial_commitments
+FINANCIAL_COMMITMENTS_TABLE = TableSpec(
+    "financial_commitments",
+    {
+        "commitment_type": ColumnKind.category,
+        "service": ColumnKind.category,
+        "account": ColumnKind.category,
+        "type": ColumnKind.category,
+        "amount": ColumnKind.number,
+        "term": ColumnKind.category,
+        "payment_type": ColumnKind.category,
+        "region": ColumnKind.category,
+        "purchase_date": ColumnKind.date,
+        "expiration_date": ColumnKind.date,
+        "commitment": ColumnKind.raw,
+        "status": ColumnKind.category,
+        "created_at": ColumnKind.date,
+        "workspace_token": ColumnKind.category,
+    },
+)
+
+# The spec of each collection response model, for to_table
+TABLE_SPECS: dict[type[BaseModel], TableSpec] = {
+    BusinessMetricValues: BUSINESS_METRIC_VALUES_TABLE,
+    Costs: COSTS_TABLE,
+    FinancialCommitments: FINANCIAL_COMMITMENTS_TABLE,
+    NetworkFlowLogs: NETWORK_FLOW_LOGS_TABLE,
+    Resources: RESOURCES_TABLE,
+    UnitCosts: UNIT_COSTS_TABLE,
+}
+
+
+def build_table(spec: TableSpec, data: Mapping[str, Any], decimals: bool = False) -> Table:
+    """
+    Build a table from a decoded response
+
+    Args:
+        spec: How to turn the rows of the response into columns
+        data: The decoded response, or the combined response of all its pages
+        decimals: Whether amounts are kept exact as Decimal objects rather than converted to float64
+
+    Returns:
+        The table, holding a column for every field of the spec even when no row has it
+    """
+    rows = cast(list[Mapping[str, Any]], data.get(spec.collection) or [])
+    metadata = {key: value for key, value in data.items() if key not in (spec.collection, "links")}
+    columns: dict[str, Column] = {}
+    for path, kind in spec.columns.items():
+        field, _, key = path.partition(".")
+        values = [row.get(field) for row in rows]
+        if key:
+            values = [cast(Mapping[str, Any], value).get(key) if isinstance(value, dict) else None for value in values]
+        columns[path.replace(".", "_")] = build_column(kind, values, decimals)
+    if spec.expand is not None:
+        field, kind = spec.expand
+        objects = [cast(Mapping[str, Any], row.get(field) or {}) for row in rows]
+        for key in dict.fromkeys(key for value in objects for key in value):
+            if key not in columns:
+                columns[key] = build_column(kind, [value.get(key) for value in objects])
+    return Table(columns, metadata)
+
+
+def to_table(response: BaseModel, decimals: bool = False) -> Table:
+    """
+    Build a table from a collection response already built into its model
+
+    The response is dumped to JSON-compatible data in a single call, or not at all for the items of a
+    LazySequence, whose decoded JSON is used as is
+
+    Example:
+        costs = vantage.get_cost_report_costs(query)
+        frame = to_table(costs).to_pandas()
+
+    Args:
+        response: A response of a model in TABLE_SPECS, such as Costs or Resources
+        decimals: Whether amounts are kept exact as Decimal objects rather than converted to float64
+
+    Returns:
+        The table
+    """
+    spec = TABLE_SPECS.get(type(response))
+    if spec is None:
+        raise TypeError(f"{type(response).__name__} responses cannot be converted to a table")
+    items = getattr(response, spec.collection)
+    if isinstance(items, LazySequence):
+        data = response.model_dump(mode="json", by_alias=True, exclude_none=True, exclude={spec.collection})
+        data[spec.collection] = cast(LazySequence[BaseModel], items).raw_items
+    else:
+        data = response.model_dump(mode="json", by_alias=True, exclude_none=True)
+    return build_table(spec, data, decimals)
+
+
+def build_column(kind: ColumnKind, values: list[Any], decimals: bool = False) -> Column:
+    """
+    Store the values of a field as a column
+
+    Args:
+        kind: How to store the values
+        values: The value of each row as the API sent it, None where it is missing
+        decimals: Whether amounts are kept exact as Decimal objects rather than converted to float64
+
+    Returns:
+        The column
+    """
+    if kind is ColumnKind.amount and decimals:
+        exact = (None if value is None else Decimal(str(value)) for value in values)
+        return np.fromiter(exact, dtype=object, count=len(values))
+    if kind in (ColumnKind.amount, ColumnKind.number):
+        return np.array(values, dtype=np.float64)
+    if kind is ColumnKind.date:
+        return _dates(values)
+    if kind is ColumnKind.category:
+        return DictionaryColumn.encode(values)
+    # Built item by item, as numpy would turn rows holding lists into a second dimension
+    return np.fromiter(values, dtype=object, count=len(values))
+
+
+def _dates(values: list[Any]) -> npt.NDArray[np.datetime64]:
+    """Parse ISO 8601 dates into days, or datetimes into seconds in UTC"""
+    if all(value is None or len(value) == 10 for value in values):
+        return np.array(values, dtype="datetime64[D]")
+    return np.array([None if value is None else _utc(value) for value in values], dtype="datetime64[s]")
+
+
+def _utc(value: str) -> datetime:
+    """Parse an ISO 8601 datetime into a naive datetime in UTC, as datetime64 has no time zone"""
+    parsed = datetime.fromisoformat(value)
+    return parsed if parsed.tzinfo is None else parsed.astimezone(UTC).replace(tzinfo=None)
+
+
+def _require(module: str, extra: str) -> Any:
+    """Import an optional dependency, naming the extra that installs it when it is missing"""
+    try:
+        return importlib.import_module(module)
+    except ImportError as error:
+        raise ImportError(
+            f"{module} is required, install it with: pip install 'client-for-vantage[{extra}]'"
+        ) from error
+
+
+def _arrow_array(pa: Any, column: Column) -> Any:
+    """Convert a column to a pyarrow array"""
+    if isinstance(column, DictionaryColumn):
+        indices = pa.array(column.codes, mask=column.codes < 0)
+        # Typed as strings even when no row has a value, so tables of the same endpoint share a schema
+        categories = pa.array(column.categories) if column.categories else pa.array([], type=pa.string())
+        return pa.DictionaryArray.from_arrays(indices, categories)
+    if column.dtype == np.dtype("datetime64[s]"):
+        return pa.array(column).cast(pa.timestamp("s", tz="UTC"))
+    if column.dtype != np.dtype(object):
+        # from_pandas turns NaN into null, as NaN marks a missing amount
+        return pa.array(column, from_pandas=True)
+    try:
+        array = pa.array(column)
+    except (pa.ArrowInvalid, pa.ArrowTypeError):
+        # Objects whose fields change type from row to row, such as resource metadata, are kept as JSON
+        return pa.array([None if value is None else json.dumps(value) for value in column], type=pa.string())
+    if pa.types.is_decimal(array.type):
+        # The widest precision, so tables of the same endpoint only differ by the scale of their amounts
+        return array.cast(pa.decimal128(38, array.type.scale))
+    return array
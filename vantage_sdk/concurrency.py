@@ -0,0 +1,230 @@
+"""
+Concurrency limits for fetching the pages of a paginated endpoint
+
+Without a limit every page from 2 to N is requested at once, which trips rate limits and exhausts sockets on
+large listings. The number of pages in flight is resolved, from most to least specific, from:
+1. A per-call limit set with the `concurrency_limit` context manager
+2. A per-endpoint limit from the client's `endpoint_concurrency` mapping
+3. The client-wide `max_concurrency`
+
+With AdaptiveConcurrency settings the resolved value is only the starting point. The limit of each endpoint
+then rises while latency is stable and is cut back on 429s and latency spikes, so large listings converge on
+the highest throughput the API sustains. A limit set explicitly for a call is never adapted
+"""
+
+import logging
+import threading
+import time
+from collections.abc import Generator, Mapping
+from contextlib import contextmanager
+from contextvars import ContextVar
+
+from pydantic import BaseModel, Field
+
+from vantage_sdk.endpoints import match_endpoint, normalize_endpoint
+
+logger = logging.getLogger(__name__)
+
+# Default number of pages fetched concurrently by a single paginated call
+DEFAULT_MAX_CONCURRENCY = 10
+
+_call_concurrency: ContextVar[int | None] = ContextVar("vantage_sdk_call_concurrency", default=None)
+
+
+@contextmanager
+def concurrency_limit(max_concurrency: int) -> Generator[None]:
+    """
+    Limit the number of pages fetched concurrently by paginated calls made inside the block
+
+    Example:
+        with concurrency_limit(4):
+            values = vantage.get_business_metric_values(query, token)
+
+    Args:
+        max_concurrency: The maximum number of page requests in flight at once
+    """
+    if max_concurrency < 1:
+        raise ValueError("max_concurrency must be at least 1")
+    token = _call_concurrency.set(max_concurrency)
+    try:
+        yield
+    finally:
+        _call_concurrency.reset(token)
+
+
+def resolve_concurrency(
+    endpoint: str,
+    max_concurrency: int,
+    endpoint_concurrency: Mapping[str, int],
+    call_concurrency: int | None = None,
+) -> int:
+    """
+    Resolve how many pages of an endpoint may be fetched at once
+
+    Args:
+        endpoint: The endpoint being paginated
+        max_concurrency: The client-wide limit
+        endpoint_concurrency: Per-endpoint limits keyed by endpoint pattern
+        call_concurrency: An explicit limit for this call, takes precedence over everything else
+
+    Returns:
+        The concurrency limit to apply
+    """
+    if call_concurrency is None:
+        call_concurrency = _call_concurrency.get()
+    if call_concurrency is not None:
+        return call_concurrency
+    endpoint_limit = match_endpoint(endpoint_concurrency, endpoint)
+    if endpoint_limit is not None:
+        return endpoint_limit
+    return max_concurrency
+
+
+def call_concurrency(max_concurrency: int | None = None) -> int | None:
+    """
+    The concurrency limit set explicitly for the current call
+
+    Args:
+        max_concurrency: The limit passed to the call, takes precedence over the `concurrency_limit` context
+
+    Returns:
+        The explicit limit, or None if the call uses the client and endpoint limits
+    """
+    return max_concurrency if max_concurrency is not None else _call_concurrency.get()
+
+
+class AdaptiveConcurrency(BaseModel):
+    """
+    Settings for adjusting the pages fetched at once with additive increase, multiplicative decrease (AIMD)
+
+    The limit starts at the resolved concurrency and grows by `increase` after every `limit` healthy responses,
+    i.e. roughly once per round of requests. A 429 or 503, or a response slower than `latency_tolerance` times
+    the smoothed latency, multiplies it by `decrease_factor`
+    """
+
+    min_concurrency: int = Field(default=1, ge=1, description="The lowest limit the controller backs off to")
+    max_concurrency: int = Field(default=50, ge=1, description="The highest limit the controller grows to")
+    increase: int = Field(default=1, ge=1, description="Added to the limit after a round of healthy responses")
+    decrease_factor: float = Field(default=0.5, gt=0, lt=1, description="Multiplies the limit on overload")
+    latency_tolerance: float = Field(
+        default=2.0, gt=1, description="A response slower than this multiple of the smoothed latency is a spike"
+    )
+    latency_smoothing: float = Field(
+        default=0.2, gt=0, le=1, description="The weight of the newest latency in the moving average"
+    )
+
+
+# Statuses that signal the server is overloaded and the client should back off
+OVERLOAD_STATUSES = frozenset({429, 503})
+
+
+class AIMDLimit:
+    """
+    The number of requests to an endpoint allowed in flight at once
+
+    Without settings the limit is fixed, otherwise it is adjusted from the status and latency of every response
+    recorded against it. Thread-safe, so pages fetched on worker threads and on the event loop can share it
+    """
+
+    def __init__(self, initial: int, settings: AdaptiveConcurrency | None = None):
+        self.settings = settings
+        if settings is not None:
+            initial = min(max(initial, settings.min_concurrency), settings.max_concurrency)
+        self._limit = initial
+        self._latency: float | None = None
+        self._successes = 0
+        self._last_decrease = float("-inf")
+        self._lock = threading.Lock()
+
+    @property
+    def limit(self) -> int:
+        """The current number of requests allowed in flight"""
+        return self._limit
+
+    @property
+    def ceiling(self) -> int:
+        """The highest value the limit can reach"""
+        return self._limit if self.settings is None else self.settings.max_concurrency
+
+    def record(self, status_code: int, latency: float) -> None:
+        """
+        Adjust the limit from a response
+
+        Args:
+            status_code: The HTTP status code of the response
+            latency: The number of seconds the request took
+        """
+        settings = self.settings
+        if settings is None:
+            return
+        with self._lock:
+            smoothed = self._latency
+            overloaded = status_code in OVERLOAD_STATUSES or (
+                smoothed is not None and latency > smoothed * settings.latency_tolerance
+            )
+            if status_code not in OVERLOAD_STATUSES:
+                # Spikes feed the average too, so a lasting slowdown becomes the new baseline
+                self._latency = (
+                    latency if smoothed is None else smoothed + settings.latency_smoothing * (latency - smoothed)
+                )
+            if overloaded:
+                # Requests already in flight when the limit was cut report the same overload,
+                # so back off at most once per typical request duration
+                now = time.monotonic()
+                if now - self._last_decrease >= (smoothed or latency):
+                    self._limit = max(settings.min_concurrency, int(self._limit * settings.decrease_factor))
+                    self._last_decrease = now
+                    self._successes = 0
+                    logger.debug(
+                        "Overload (status %d, %.2fs), concurrency cut to %d", status_code, latency, self._limit
+                    )
+                return
+            self._successes += 1
+            if self._successes >= self._limit and self._limit < settings.max_concurrency:
+                self._limit = min(settings.max_concurrency, self._limit + settings.increase)
+                self._successes = 0
+                logger.debug("Latency stable at %.2fs, concurrency raised to %d", self._latency, self._limit)
+
+
+class ConcurrencyController:
+    """Per-endpoint concurrency limits of a client, adaptive when AdaptiveConcurrency settings are given"""
+
+    def __init__(self, settings: AdaptiveConcurrency | None = None):
+        self.settings = settings
+        self._limits: dict[str, AIMDLimit] = {}
+        self._lock = threading.Lock()
+
+    def limit_for(self, endpoint: str, concurrency: int, *, fixed: bool = False) -> AIMDLimit:
+        """
+        Get the limit for a paginated call
+
+        Adaptive limits are kept per endpoint, so later calls start from what earlier calls converged on
+
+        Args:
+            endpoint: The endpoint being paginated
+            concurrency: The resolved concurrency, the starting point of a new adaptive limit
+            fixed: Whether the limit was set explicitly for this call and must not be adapted
+
+        Returns:
+            The limit to apply to the call
+        """
+        if self.settings is None or fixed:
+            return AIMDLimit(concurrency)
+        endpoint = normalize_endpoint(endpoint)
+        with self._lock:
+            if endpoint not in self._limits:
+                self._limits[endpoint] = AIMDLimit(concurrency, self.settings)
+            return self._limits[endpoint]
+
+    def record(self, endpoint: str, status_code: int, latency: float) -> None:
+        """
+        Feed a response to the endpoint's adaptive limit, if it has one
+
+        Args:
+            endpoint: The endpoint that was requested
+            status_code: The HTTP status code of the response
+            latency: The number of seconds the request took
+        """
+        limit = self._limits.get(normalize_endpoint(endpoint))
+        if limit is not None:
+            limit.record(status_code, latency)
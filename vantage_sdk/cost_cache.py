@@ -0,0 +1,302 @@
+"""
+A persistent cache for GET /costs results
+
+GET /costs allows only 5 requests every 5 seconds, yet most of what it returns is history that no longer
+changes. A CostCache stores the combined result of a costs query in a SQLite file, keyed by a fingerprint of
+its CostsGetParametersQuery, so that it survives restarts and can be shared by every tool on a host.
+
+How long an entry is trusted depends on the period it covers. Once a month has closed and its bills have settled
+its costs are treated as immutable and cached for a long time, while a query touching the current month is only
+cached briefly since its costs still accrue
+
+Queries with a start_date, end_date and a date_bin of hour, day, month or quarter are cached one calendar month,
+or quarter for quarterly bins, at a time. A query is split into those segments, only the segments that are not
+cached are fetched, and the segments are stitched back into one result. A rolling window then only fetches the
+months it has not seen before, and closed months stay cached long after the current month has expired
+
+The cache also remembers which groupings it holds for each query. A query grouped by a subset of a cached
+result's groupings, e.g. `provider` after `provider,service,region`, is rolled up from that result locally
+instead of being fetched, so only groupings adding a new dimension go to the API
+
+Results are evicted when the client writes to what they depend on: the cost report they were queried for, or a
+virtual tag, billing rule, saved filter or integration, which can change the costs of every report
+
+The file is pruned like any SQLiteCacheBackend file: expired results are deleted when it is opened and every
+hundred stores, along with the least recently used results beyond its size limit, 1 GiB by default
+"""
+
+import hashlib
+import json
+import logging
+import os
+import threading
+import time
+from datetime import UTC, date, datetime, timedelta
+from pathlib import Path
+from typing import Any
+
+from vantage_sdk.cache import CacheBackend, CacheEntry, CacheStats, ResponseCache, SQLiteCacheBackend, resource_of
+from vantage_sdk.costs import SHARDABLE_DATE_BINS, can_roll_up, roll_up_costs, shard_windows, window_cost_params
+from vantage_sdk.endpoints import normalize_endpoint
+from vantage_sdk.models import CostsGetParametersQuery, CostsGetParametersQueryDateBin
+
+logger = logging.getLogger(__name__)
+
+# Where the cost cache is stored unless another backend is given
+DEFAULT_COST_CACHE_PATH = Path.home() / ".cache" / "vantage_sdk" / "costs.sqlite3"
+
+# How long results for closed periods are cached
+DEFAULT_CLOSED_PERIOD_TTL = 30 * 24 * 3600.0
+
+# How long results touching the current period are cached
+DEFAULT_OPEN_PERIOD_TTL = 3600.0
+
+# Days into a month during which the previous month is still considered open, while late charges and credits land
+DEFAULT_SETTLE_DAYS = 3
+
+# Bytes of compressed results the cost cache file keeps before evicting the least recently used
+DEFAULT_COST_CACHE_MAX_BYTES = 1024 * 1024 * 1024
+
+# Resources that can change the costs of any cost report when written to
+COST_AFFECTING_RESOURCES = frozenset({"billing_rules", "integrations", "saved_filters", "virtual_tag_configs"})
+
+
+def cost_query_fingerprint(cost_report_params: CostsGetParametersQuery) -> str:
+    """
+    A canonical fingerprint of a costs query, equal for queries that request the same costs
+
+    Parameters left at their defaults are omitted and the page is ignored, so a query that spells out a default
+    and one that does not share a fingerprint
+
+    Args:
+        cost_report_params: The costs query
+
+    Returns:
+        A hex SHA-256 digest
+    """
+    params = cost_report_params.model_dump(mode="json", by_alias=True, exclude_none=True, exclude_defaults=True)
+    params.pop("page", None)
+    canonical = json.dumps(params, sort_keys=True, separators=(",", ":"))
+    return hashlib.sha256(canonical.encode()).hexdigest()
+
+
+def closed_before(today: date, settle_days: int = DEFAULT_SETTLE_DAYS) -> date:
+    """
+    The first day whose costs may still change
+
+    Args:
+        today: The current date
+        settle_days: Days into a month during which the previous month is still open
+
+    Returns:
+        The first day of the earliest month that has not closed and settled
+    """
+    settled = today - timedelta(days=settle_days)
+    return settled.replace(day=1)
+
+
+class CostCache:
+    """
+    A cache of combined GET /costs results that treats closed periods as immutable
+
+    Example:
+        vantage = VantageSDK(api_key, cost_cache=CostCache("/var/cache/vantage/costs.sqlite3"))
+
+    Args:
+        path: The SQLite file to store results in, ignored when a backend is given
+        backend: Where results are stored, defaults to a SQLite file at `path`
+        closed_period_ttl: Seconds a result is cached when its whole period has closed
+        open_period_ttl: Seconds a result is cached when its period includes days that have not closed
+        settle_days: Days into a month during which the previous month is still considered open
+        max_bytes: The bytes of compressed results kept in the file at `path`, None keeps every result until it
+            expires. Ignored when a backend is given
+        max_entries: The number of results kept in the file at `path`, unbounded by default. Ignored when a
+            backend is given
+    """
+
+    def __init__(
+        self,
+        path: str | os.PathLike[str] = DEFAULT_COST_CACHE_PATH,
+        *,
+        backend: CacheBackend | None = None,
+        closed_period_ttl: float = DEFAULT_CLOSED_PERIOD_TTL,
+        open_period_ttl: float = DEFAULT_OPEN_PERIOD_TTL,
+        settle_days: int = DEFAULT_SETTLE_DAYS,
+        max_bytes: int | None = DEFAULT_COST_CACHE_MAX_BYTES,
+        max_entries: int | None = None,
+    ):
+        self.closed_period_ttl = closed_period_ttl
+        self.open_period_ttl = open_period_ttl
+        self.settle_days = settle_days
+        if backend is None:
+            # Results are never revalidated nor served stale, so expired ones are deleted as soon as the file is pruned
+            backend = SQLiteCacheBackend(path, max_bytes=max_bytes, max_entries=max_entries, expired_grace=0)
+        self._cache = ResponseCache(backend)
+        self._index_lock = threading.Lock()
+
+    @property
+    def backend(self) -> CacheBackend:
+        """Where results are stored"""
+        return self._cache.backend
+
+    @property
+    def stats(self) -> CacheStats:
+        """The hit and miss counters since the cache was created or last reset"""
+        return self._cache.stats
+
+    def is_closed(self, cost_report_params: CostsGetParametersQuery, today: date | None = None) -> bool:
+        """
+        Whether the period of a costs query has closed, so its costs are not expected to change
+
+        Args:
+            cost_report_params: The costs query, without an end_date it reaches the current period
+            today: The current date, defaults to today in UTC
+
+        Returns:
+            True if the query ends before the earliest month that has not closed and settled
+        """
+        if cost_report_params.end_date is None:
+            return False
+        today = today if today is not None else datetime.now(UTC).date()
+        return date.fromisoformat(cost_report_params.end_date[:10]) < closed_before(today, self.settle_days)
+
+    def ttl_for(self, cost_report_params: CostsGetParametersQuery) -> float:
+        """
+        How long the result of a costs query is cached
+
+        Args:
+            cost_report_params: The costs query
+
+        Returns:
+            The number of seconds
+        """
+        return self.closed_period_ttl if self.is_closed(cost_report_params) else self.open_period_ttl
+
+    def segments(self, cost_report_params: CostsGetParametersQuery) -> list[CostsGetParametersQuery] | None:
+        """
+        Split a costs query into the segments it is cached as
+
+        Args:
+            cost_report_params: The costs query
+
+        Returns:
+            A copy of the query for each calendar month, or quarter for quarterly bins, it covers in date order,
+            or None if the query cannot be split and is cached as a whole
+        """
+        date_bin = cost_report_params.date_bin
+        if cost_report_params.start_date is None or cost_report_params.end_date is None:
+            return None
+        if date_bin is None or date_bin not in SHARDABLE_DATE_BINS:
+            return None
+        segment_bin = (
+            CostsGetParametersQueryDateBin.quarter
+            if date_bin is CostsGetParametersQueryDateBin.quarter
+            else CostsGetParametersQueryDateBin.month
+        )
+        windows = shard_windows(
+            date.fromisoformat(cost_report_params.start_date[:10]),
+            date.fromisoformat(cost_report_params.end_date[:10]),
+            segment_bin,
+            1,
+        )
+        return window_cost_params(cost_report_params, windows)
+
+    def key(self, cost_report_params: CostsGetParametersQuery) -> str:
+        """The cache key of a costs query, prefixed by its cost report so the report's results can be evicted"""
+        return f"costs:{cost_report_params.cost_report_token or ''}:{cost_query_fingerprint(cost_report_params)}"
+
+    def groupings_key(self, cost_report_params: CostsGetParametersQuery) -> str:
+        """The key of the index of groupings cached for a costs query, whatever its own groupings"""
+        fingerprint = cost_query_fingerprint(cost_report_params.model_copy(update={"groupings": None}))
+        return f"groupings:{cost_report_params.cost_report_token or ''}:{fingerprint}"
+
+    def cached_groupings(self, cost_report_params: CostsGetParametersQuery) -> list[list[str]]:
+        """
+        The groupings results are cached for, among queries that only differ from a costs query in their groupings
+
+        Args:
+            cost_report_params: The costs query
+
+        Returns:
+            Each set of groupings, possibly including some whose result has since expired
+        """
+        entry = self.backend.get(self.groupings_key(cost_report_params))
+        if entry is None or not entry.is_fresh():
+            return []
+        return json.loads(entry.body)
+
+    def load(self, cost_report_params: CostsGetParametersQuery) -> dict[str, Any] | None:
+        """
+        Get the cached result of a costs query, rolled up from a finer grouping if needed
+
+        Args:
+            cost_report_params: The costs query
+
+        Returns:
+            A new copy of the combined response, or None on a miss
+        """
+        cached = self._cache.load(self.key(cost_report_params))
+        if cached is not None or not can_roll_up(cost_report_params):
+            return cached
+
+        requested = set(cost_report_params.groupings or ())
+        finer = [groupings for groupings in self.cached_groupings(cost_report_params) if requested < set(groupings)]
+        # Roll up from the coarsest finer result, which has the fewest rows to sum
+        for groupings in sorted(finer, key=len):
+            cached = self._cache.load(self.key(cost_report_params.model_copy(update={"groupings": groupings})))
+            if cached is not None:
+                logger.debug("Rolling costs grouped by %s up to %s", groupings, cost_report_params.groupings)
+                return roll_up_costs(cached, cost_report_params.groupings or ())
+        return None
+
+    def store(self, cost_report_params: CostsGetParametersQuery, costs: dict[str, Any]) -> None:
+        """
+        Cache the result of a costs query
+
+        Args:
+            cost_report_params: The costs query
+            costs: The combined response of every page
+        """
+        ttl = self.ttl_for(cost_report_params)
+        logger.debug("Caching costs for %.0fs", ttl)
+        self._cache.store(self.key(cost_report_params), "costs", costs, ttl=ttl)
+        if can_roll_up(cost_report_params):
+            self._index_groupings(cost_report_params)
+
+    def _index_groupings(self, cost_report_params: CostsGetParametersQuery) -> None:
+        """Record that a result is cached for the groupings of a costs query"""
+        groupings = list(cost_report_params.groupings or ())
+        key = self.groupings_key(cost_report_params)
+        with self._index_lock:
+            indexed = self.cached_groupings(cost_report_params)
+            if groupings in indexed:
+                return
+            now = time.time()
+            body = json.dumps([*indexed, groupings], separators=(",", ":")).encode()
+            self.backend.set(key, CacheEntry(body, now, now + self.closed_period_ttl))
+
+    def invalidate(self, endpoint: str) -> int:
+        """
+        Evict the results that a write to an endpoint may have changed
+
+        Args:
+            endpoint: The endpoint that was written to
+
+        Returns:
+            The number of entries evicted
+        """
+        resource = resource_of(endpoint)
+        if resource in COST_AFFECTING_RESOURCES:
+            evicted = len(self.backend)
+            self.clear()
+        elif resource == "cost_reports" and "/" in (path := normalize_endpoint(endpoint)):
+            token = path.split("/")[1]
+            evicted = self.backend.delete_prefix(f"costs:{token}:") + self.backend.delete_prefix(f"groupings:{token}:")
+        else:
+            return 0
+        logger.debug("Evicted %d cached cost results after a write to %s", evicted, endpoint)
+        return evicted
+
+    def clear(self) -> None:
+        """Remove every cached result"""
+        self._cache.clear()
@@ -0,0 +1,279 @@
+"""
+Helpers for GET /costs shared by the sync and async clients
+
+GET /costs only links to the next page, so a long period has to be walked one page at a time. Splitting the
+requested period into date windows lets the windows be fetched concurrently, within the endpoint's rate limit,
+and merged back into a single response. Windows are made of whole date bins, so no bin is split across two
+requests and each row of the merged response is exactly the row an unsharded request would have returned
+
+Costs grouped by more dimensions can also be rolled up into a coarser grouping by summing the rows that share the
+remaining dimensions, so a cached `provider,service,region` result can answer a `provider,service` query
+"""
+
+from collections.abc import Sequence
+from datetime import date, timedelta
+from decimal import Decimal
+from typing import Any
+
+from vantage_sdk.models import (
+    CostsGetParametersQuery,
+    CostsGetParametersQueryDateBin,
+    CostsGetParametersQueryOrder,
+    CostsGetParametersQuerySettingsAggregateBy,
+)
+
+# Date bins that start on a fixed calendar boundary, so windows can be aligned to them
+SHARDABLE_DATE_BINS = frozenset(
+    {
+        CostsGetParametersQueryDateBin.hour,
+        CostsGetParametersQueryDateBin.day,
+        CostsGetParametersQueryDateBin.month,
+        CostsGetParametersQueryDateBin.quarter,
+    }
+)
+
+ONE_DAY = timedelta(days=1)
+
+# Groupings that put every cost in exactly one group, each named after the Cost field holding its value
+ROLLUP_GROUPINGS = frozenset(
+    {
+        "provider",
+        "billing_account_id",
+        "account_id",
+        "service",
+        "region",
+        "resource_id",
+        "cost_category",
+        "cost_subcategory",
+    }
+)
+
+
+def next_bin_start(day: date, date_bin: CostsGetParametersQueryDateBin) -> date:
+    """
+    The first day of the date bin after the one containing a day
+
+    Args:
+        day: A day inside the bin
+        date_bin: The date bin of the costs
+
+    Returns:
+        The first day of the next bin
+    """
+    if date_bin is CostsGetParametersQueryDateBin.month:
+        return date(day.year + day.month // 12, day.month % 12 + 1, 1)
+    if date_bin is CostsGetParametersQueryDateBin.quarter:
+        quarter_month = (day.month - 1) // 3 * 3 + 4
+        return date(day.year + (quarter_month > 12), (quarter_month - 1) % 12 + 1, 1)
+    return day + ONE_DAY
+
+
+def shard_windows(
+    start_date: date, end_date: date, date_bin: CostsGetParametersQueryDateBin, shard_days: int
+) -> list[tuple[date, date]]:
+    """
+    Split a period into consecutive windows of whole date bins
+
+    Each window spans at most `shard_days` days, unless a single bin is longer, e.g. a month with a 7 day shard
+
+    Args:
+        start_date: The first day of the period
+        end_date: The last day of the period, inclusive
+        date_bin: The date bin of the costs
+        shard_days: The preferred number of days in each window
+
+    Returns:
+        The first and last day, inclusive, of every window in order
+    """
+    if shard_days < 1:
+        raise ValueError("shard_days must be at least 1")
+    if date_bin not in SHARDABLE_DATE_BINS:
+        raise ValueError(f"Costs binned by {date_bin} cannot be sharded, use one of {sorted(SHARDABLE_DATE_BINS)}")
+
+    windows: list[tuple[date, date]] = []
+    window_start = cursor = start_date
+    while cursor <= end_date:
+        bin_end = min(next_bin_start(cursor, date_bin) - ONE_DAY, end_date)
+        # Close the window before a bin that would make it too long, unless the window is still empty
+        if cursor > window_start and (bin_end - window_start).days + 1 > shard_days:
+            windows.append((window_start, cursor - ONE_DAY))
+            window_start = cursor
+        cursor = bin_end + ONE_DAY
+    windows.append((window_start, end_date))
+    return windows
+
+
+def window_cost_params(
+    cost_report_params: CostsGetParametersQuery, windows: Sequence[tuple[date, date]]
+) -> list[CostsGetParametersQuery]:
+    """
+    Copy a costs query once per date window
+
+    Only the boundaries between windows fall on whole days. The first and last windows keep the query's own
+    start_date and end_date, so a period bounded by datetimes is not widened to the days containing them
+
+    Args:
+        cost_report_params: The query to copy, it must set start_date and end_date
+        windows: The first and last day, inclusive, of every window in date order, as returned by shard_windows
+
+    Returns:
+        A copy of the query for every window, in date order
+    """
+    queries = [
+        cost_report_params.model_copy(update={"start_date": start.isoformat(), "end_date": end.isoformat()})
+        for start, end in windows
+    ]
+    queries[0] = queries[0].model_copy(update={"start_date": cost_report_params.start_date})
+    queries[-1] = queries[-1].model_copy(update={"end_date": cost_report_params.end_date})
+    return queries
+
+
+def shard_cost_params(cost_report_params: CostsGetParametersQuery, shard_days: int) -> list[CostsGetParametersQuery]:
+    """
+    Split a costs query into one query per date window
+
+    Args:
+        cost_report_params: The query to split, it must set start_date, end_date and a shardable date_bin
+        shard_days: The preferred number of days in each window
+
+    Returns:
+        A copy of the query for every window, in date order
+    """
+    if cost_report_params.start_date is None or cost_report_params.end_date is None:
+        raise ValueError("Sharding costs requires both start_date and end_date")
+    if cost_report_params.date_bin is None:
+        raise ValueError("Sharding costs requires a date_bin so that no bin is split across windows")
+    windows = shard_windows(
+        date.fromisoformat(cost_report_params.start_date[:10]),
+        date.fromisoformat(cost_report_params.end_date[:10]),
+        cost_report_params.date_bin,
+        shard_days,
+    )
+    return window_cost_params(cost_report_params, windows)
+
+
+def merge_cost_shards(shards: Sequence[dict[str, Any]], order: CostsGetParametersQueryOrder) -> dict[str, Any]:
+    """
+    Merge the responses of sharded costs queries into a single response
+
+    Rows and per-bin counts are concatenated window by window, from the latest window for descending queries, so
+    they keep the order an unsharded query returns them in. `total_cost`, `total_usage` and `total_count` cover
+    each window only, so they are summed across windows, with usage summed per unit
+
+    Args:
+        shards: The combined response of every window, in date order
+        order: The order the query sorts its rows by
+
+    Returns:
+        The merged response
+    """
+    if order is CostsGetParametersQueryOrder.desc:
+        shards = shards[::-1]
+    merged: dict[str, Any] = dict(shards[0])
+    merged["costs"] = [cost for shard in shards for cost in shard.get("costs", [])]
+
+    total_cost = merged.get("total_cost")
+    if total_cost is not None:
+        amount = sum((Decimal(shard["total_cost"]["amount"]) for shard in shards if shard.get("total_cost")), Decimal())
+        merged["total_cost"] = {**total_cost, "amount": str(amount)}
+
+    if any(shard.get("total_usage") is not None for shard in shards):
+        usage: dict[str, Decimal] = {}
+        for shard in shards:
+            partials: list[dict[str, Any]] = shard.get("total_usage") or []
+            for partial in partials:
+                usage[partial["unit"]] = usage.get(partial["unit"], Decimal()) + Decimal(partial["amount"])
+        merged["total_usage"] = [{"amount": str(amount), "unit": unit} for unit, amount in usage.items()]
+
+    if any(shard.get("total_count") is not None for shard in shards):
+        merged["total_count"] = sum(shard.get("total_count") or 0 for shard in shards)
+
+    if any(shard.get("counts") is not None for shard in shards):
+        counts: list[dict[str, Any]] = []
+        for shard in shards:
+            counts.extend(shard.get("counts") or [])
+        merged["counts"] = counts
+
+    return merged
+
+
+def can_roll_up(cost_report_params: CostsGetParametersQuery) -> bool:
+    """
+    Whether the result of a costs query can be rolled up into, or computed from, another grouping
+
+    Args:
+        cost_report_params: The costs query
+
+    Returns:
+        True if the query names its groupings, all of them in ROLLUP_GROUPINGS, does not limit its rows and
+        aggregates by cost or usage. Counts of distinct groups cannot be summed across groups
+    """
+    groupings = cost_report_params.groupings
+    return (
+        groupings is not None
+        and cost_report_params.limit is None
+        and cost_report_params.settings_aggregate_by_ is not CostsGetParametersQuerySettingsAggregateBy.count_
+        and set(groupings) <= ROLLUP_GROUPINGS
+    )
+
+
+def roll_up_costs(costs: dict[str, Any], groupings: Sequence[str]) -> dict[str, Any]:
+    """
+    Roll the response of a costs query up into a coarser grouping
+
+    Rows sharing a date, a currency and the value of every grouping kept are summed into one row, in the order
+    the first of them appears. Usage is summed when all the rows of a group share a unit and dropped otherwise.
+    `total_cost` and `total_usage` do not depend on the grouping and are kept as they are, while the per-bin
+    `counts` of distinct groups and their `total_count` are counted again from the rolled up rows
+
+    Args:
+        costs: The combined response of a query grouped by a superset of `groupings`
+        groupings: The groupings to keep
+
+    Returns:
+        The response the query grouped by `groupings` would have returned
+    """
+    amounts: dict[tuple[Any, ...], Decimal] = {}
+    usages: dict[tuple[Any, ...], tuple[str, Decimal] | None] = {}
+    rows: dict[tuple[Any, ...], dict[str, Any]] = {}
+    for cost in costs.get("costs", []):
+        group = (cost.get("accrued_at"), cost.get("currency"), *(cost.get(grouping) for grouping in groupings))
+        usage: dict[str, Any] | None = cost.get("usage")
+        if group not in rows:
+            rows[group] = {
+                "accrued_at": cost.get("accrued_at"),
+                "currency": cost.get("currency"),
+                **{grouping: cost.get(grouping) for grouping in groupings},
+            }
+            amounts[group] = Decimal()
+            usages[group] = (usage["unit"], Decimal()) if usage and "unit" in usage else None
+        amounts[group] += Decimal(cost["amount"])
+        partial = usages[group]
+        if partial is not None and usage and usage.get("unit") == partial[0] and "amount" in usage:
+            usages[group] = (partial[0], partial[1] + Decimal(usage["amount"]))
+        else:
+            usages[group] = None
+
+    rolled: dict[str, Any] = {key: value for key, value in costs.items() if key not in ("costs", "links")}
+    for group, row in rows.items():
+        partial = usages[group]
+        row["amount"] = str(amounts[group])
+        if partial is not None:
+            row["usage"] = {"amount": str(partial[1]), "unit": partial[0]}
+    rolled["costs"] = list(rows.values())
+
+    if rolled.get("counts") is not None or rolled.get("total_count") is not None:
+        # A group split across currencies is still one distinct group of its bin
+        bin_counts: dict[Any, int] = {}
+        for accrued_at, *_ in {(group[0], *group[2:]) for group in rows}:
+            bin_counts[accrued_at] = bin_counts.get(accrued_at, 0) + 1
+        if rolled.get("counts") is not None:
+            counts: list[dict[str, Any]] = rolled["counts"]
+            rolled["counts"] = [
+                {**count, "count": bin_counts[count["accrued_at"]]}
+                for count in counts
+                if count["accrued_at"] in bin_counts
+            ]
+        if rolled.get("total_count") is not None:
+            rolled["total_count"] = sum(bin_counts.values())
+    return rolled
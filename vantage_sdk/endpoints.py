@@ -0,0 +1,51 @@
+"""
+Per-endpoint configuration lookup
+
+Several client options (concurrency, rate limits, cache TTLs) can be set per endpoint. They are given as a
+mapping of endpoint patterns to values, where a pattern is either an exact endpoint such as `costs` or a
+glob such as `business_metrics/*/values`. A leading slash is ignored so `/costs` and `costs` are equivalent
+"""
+
+from collections.abc import Mapping
+from fnmatch import fnmatchcase
+from typing import TypeVar
+
+T = TypeVar("T")
+
+
+def normalize_endpoint(endpoint: str) -> str:
+    """
+    Normalize an endpoint or endpoint pattern for lookups
+
+    Args:
+        endpoint: The endpoint, e.g. '/costs' or 'folders/fldr_123'
+
+    Returns:
+        The endpoint without leading or trailing slashes
+    """
+    return endpoint.strip("/")
+
+
+def match_endpoint(config: Mapping[str, T], endpoint: str) -> T | None:
+    """
+    Find the configured value for an endpoint
+
+    An exact match wins, otherwise the longest matching glob pattern is used
+
+    Args:
+        config: A mapping of endpoint patterns to values
+        endpoint: The endpoint being requested
+
+    Returns:
+        The configured value, or None if no pattern matches
+    """
+    endpoint = normalize_endpoint(endpoint)
+    best_pattern: str | None = None
+    best_value: T | None = None
+    for pattern, value in config.items():
+        pattern = normalize_endpoint(pattern)
+        if pattern == endpoint:
+            return value
+        if fnmatchcase(endpoint, pattern) and (best_pattern is None or len(pattern) > len(best_pattern)):
+            best_pattern, best_value = pattern, value
+    return best_value
@@ -0,0 +1,135 @@
+"""
+Collections that validate their items on first access
+
+A Costs, Resources or AuditLogs response can hold hundreds of thousands of items, while most callers only look at
+a few of them, such as the top N or those matching a filter. With `lazy_collections=True` a client validates
+everything but the items of those responses, and their collection keeps the decoded JSON of each item until it
+is first accessed, then validates it and keeps the result. Reading the first item no longer waits for every item
+to be validated, and items that are never read are never validated
+"""
+
+import threading
+from collections.abc import Iterator, Mapping, Sequence
+from functools import cache
+from typing import Any, TypeVar, cast, overload
+
+from pydantic import BaseModel, TypeAdapter
+from pydantic_core import SchemaSerializer, core_schema
+
+from vantage_sdk.models import AuditLogs, Costs, Resources
+
+M = TypeVar("M", bound=BaseModel)
+
+# The collection field of each response that is validated lazily
+LAZY_COLLECTIONS: dict[type[BaseModel], str] = {
+    AuditLogs: "audit_logs",
+    Costs: "costs",
+    Resources: "resources",
+}
+
+# Marks an item that has not been validated yet
+_PENDING: Any = object()
+
+
+class LazySequence(Sequence[M]):
+    """
+    A read-only sequence of models that are built from their decoded JSON on first access
+
+    An item that does not match its model raises when it is first accessed rather than when the response arrives.
+    Dumping the response that holds the sequence builds every item
+
+    Example:
+        costs = vantage.get_cost_report_costs(query).costs
+        top = sorted(costs.raw_items, key=lambda cost: float(cost["amount"]), reverse=True)[:10]
+
+    Args:
+        raw_items: The decoded JSON of each item
+        model: The model of the items
+    """
+
+    __slots__ = ("__pydantic_serializer__", "_items", "_lock", "_model", "_raw_items")
+
+    def __init__(self, raw_items: Sequence[Mapping[str, Any]], model: type[M]):
+        self._raw_items = raw_items
+        self._model = model
+        self._items: list[M] = [_PENDING] * len(raw_items)
+        self._lock = threading.Lock()
+        # Lets pydantic serialize the sequence, as a list of its items, when the response holding it is dumped
+        self.__pydantic_serializer__ = _serializer_for(model)
+
+    @property
+    def raw_items(self) -> Sequence[Mapping[str, Any]]:
+        """The decoded JSON of every item, to filter or sort on before any item is validated"""
+        return self._raw_items
+
+    @property
+    def validated(self) -> int:
+        """The number of items built so far"""
+        return sum(item is not _PENDING for item in self._items)
+
+    def __len__(self) -> int:
+        """The number of items"""
+        return len(self._items)
+
+    @overload
+    def __getitem__(self, index: int) -> M: ...
+
+    @overload
+    def __getitem__(self, index: slice) -> list[M]: ...
+
+    def __getitem__(self, index: int | slice) -> M | list[M]:
+        """Get an item, or a list of items for a slice, building those accessed for the first time"""
+        if isinstance(index, slice):
+            return [self[position] for position in range(*index.indices(len(self)))]
+        item = self._items[index]
+        if item is _PENDING:
+            with self._lock:
+                item = self._items[index]
+                if item is _PENDING:
+                    item = self._items[index] = self._model.model_validate(self._raw_items[index])
+        return item
+
+    def __iter__(self) -> Iterator[M]:
+        """Iterate over the items in order, building each as it is reached"""
+        for position in range(len(self)):
+            yield self[position]
+
+    def __eq__(self, other: object) -> bool:
+        """Whether another sequence holds equal items in the same order"""
+        if not isinstance(other, Sequence) or isinstance(other, str):
+            return NotImplemented
+        items = cast(Sequence[Any], other)
+        return len(self) == len(items) and all(mine == theirs for mine, theirs in zip(self, items, strict=True))
+
+    def __reduce__(self) -> tuple[type["LazySequence[M]"], tuple[Sequence[Mapping[str, Any]], type[M]]]:
+        """Copy and pickle the sequence as its decoded JSON, so each copy builds its items behind its own lock"""
+        return type(self), (self._raw_items, self._model)
+
+    def __repr__(self) -> str:
+        """How many items the sequence holds and how many were built"""
+        return f"{type(self).__name__}({len(self)} items, {self.validated} validated)"
+
+
+@cache
+def _serializer_for(model: type[BaseModel]) -> SchemaSerializer:
+    """A serializer dumping any sequence of a model as a list"""
+    return SchemaSerializer(
+        core_schema.any_schema(
+            serialization=core_schema.plain_serializer_function_ser_schema(
+                list, return_schema=core_schema.list_schema(TypeAdapter(model).core_schema)
+            )
+        )
+    )
+
+
+def lazy_field(model: type[BaseModel]) -> str | None:
+    """
+    The collection field of a response model that is validated lazily
+
+    Args:
+        model: The model of the response
+
+    Returns:
+        The name of the field, or None if the whole response is validated at once
+    """
+    return LAZY_COLLECTIONS.get(model)
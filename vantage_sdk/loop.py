@@ -0,0 +1,122 @@
+"""
+Execution strategies for the sync client's concurrent page fetches
+
+The sync client fetches pages concurrently through an AsyncClient. An AsyncClient's connection pool is bound
+to the event loop it was first used on, so for pooled connections to survive between calls every paginated
+request has to be scheduled onto the same loop. BackgroundLoop owns that loop on a dedicated daemon thread
+and lets sync code submit coroutines to it and block on their results. Because the loop never runs on the
+caller's thread this works the same in plain scripts, Jupyter notebooks and inside web framework handlers
+that already have a running event loop, where `asyncio.run` would raise
+
+The only place the background loop cannot be used is its own thread, where blocking on it would deadlock.
+Pages are then fetched on a thread pool through the sync session instead
+
+The loop thread is started on the first paginated call and stopped when its SDK is closed or garbage collected
+"""
+
+import asyncio
+import logging
+import threading
+from collections.abc import Coroutine
+from concurrent.futures import Future
+from enum import StrEnum
+from typing import Any, TypeVar
+
+logger = logging.getLogger(__name__)
+
+T = TypeVar("T")
+
+
+class PaginationExecutor(StrEnum):
+    """How the sync client fetches pages 2..N of a paginated endpoint concurrently"""
+
+    # Use the background loop, falling back to threads when called from the background loop itself
+    auto = "auto"
+    # Always use the background event loop and the shared AsyncClient
+    loop = "loop"
+    # Always use a thread pool and the pooled sync session
+    threads = "threads"
+
+
+def has_running_loop() -> bool:
+    """Whether the calling thread is currently running an asyncio event loop"""
+    try:
+        asyncio.get_running_loop()
+    except RuntimeError:
+        return False
+    return True
+
+
+class BackgroundLoop:
+    """An asyncio event loop running forever on a daemon thread, started lazily on first use"""
+
+    def __init__(self, name: str = "vantage-sdk-loop"):
+        self.name = name
+        self._loop: asyncio.AbstractEventLoop | None = None
+        self._thread: threading.Thread | None = None
+        self._lock = threading.Lock()
+
+    @property
+    def is_running(self) -> bool:
+        """Whether the loop thread has been started and is still alive"""
+        return self._thread is not None and self._thread.is_alive()
+
+    def in_loop_thread(self) -> bool:
+        """Whether the caller is running on the background loop's own thread"""
+        return self._thread is not None and threading.current_thread() is self._thread
+
+    def _ensure_started(self) -> asyncio.AbstractEventLoop:
+        with self._lock:
+            if self._loop is None or self._thread is None or not self._thread.is_alive():
+                loop = asyncio.new_event_loop()
+                thread = threading.Thread(target=loop.run_forever, name=self.name, daemon=True)
+                thread.start()
+                logger.debug("Started background event loop thread '%s'", self.name)
+                self._loop, self._thread = loop, thread
+            return self._loop
+
+    def run(self, coro: Coroutine[Any, Any, T]) -> T:
+        """
+        Run a coroutine on the background loop and block until it completes
+
+        Args:
+            coro: The coroutine to run
+
+        Returns:
+            The result of the coroutine
+        """
+        return self.submit(coro).result()
+
+    def submit(self, coro: Coroutine[Any, Any, T]) -> Future[T]:
+        """
+        Schedule a coroutine on the background loop without waiting for it
+
+        Args:
+            coro: The coroutine to run
+
+        Returns:
+            A future for the result of the coroutine, cancelling it cancels the coroutine
+
+        Raises:
+            RuntimeError: If called from the loop's own thread, where waiting on the future would deadlock
+        """
+        if self.in_loop_thread():
+            coro.close()
+            raise RuntimeError("Cannot block on the background loop from its own thread")
+        loop = self._ensure_started()
+        return asyncio.run_coroutine_threadsafe(coro, loop)
+
+    def close(self) -> None:
+        """Stop the loop and wait for its thread to exit"""
+        with self._lock:
+            loop, thread = self._loop, self._thread
+            self._loop, self._thread = None, None
+        if loop is None or thread is None:
+            return
+        loop.call_soon_threadsafe(loop.stop)
+        if threading.current_thread() is thread:
+            # Closed from a callback on the loop itself, which stops once that callback returns
+            return
+        thread.join()
+        loop.close()
+        logger.debug("Stopped background event loop thread '%s'", self.name)
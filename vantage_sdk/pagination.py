@@ -0,0 +1,192 @@
+"""
+Helpers shared by the sync and async clients for walking and merging paginated responses
+
+The Vantage API paginates with a `links` object on every page. Most endpoints include a `last` link so
+the total number of pages is known after the first request, while GET /costs only ever returns a `next`
+link and has to be walked page by page
+"""
+
+import logging
+from collections.abc import Mapping, Sequence
+from typing import Any, Generic, NamedTuple, TypeVar, cast
+
+from httpx import Response
+from pydantic import BaseModel
+from pydantic_core import from_json
+
+from vantage_sdk.models import Links
+from vantage_sdk.validation import M, parse_response
+
+logger = logging.getLogger(__name__)
+
+
+class PageLinks(BaseModel):
+    """The links of a page, validated from its raw body without building any of its items"""
+
+    links: Links | None = None
+
+
+class ModelPage(NamedTuple, Generic[M]):
+    """A page validated straight from its raw body into its model, along with the links taken off it"""
+
+    model: M
+    links: Links | None
+
+
+# A page as walked by the clients, decoded for merging or validated into its model for streaming
+Page = TypeVar("Page", dict[str, Any], ModelPage[Any])
+
+
+def model_page(model: type[M], content: bytes, lazy: bool = False) -> ModelPage[M]:
+    """
+    Validate the raw body of a page into its model, without decoding it into a dictionary first
+
+    The links are taken off the model, as they are from merged responses. Models without a `links` field have
+    them read from the body on their own
+
+    Args:
+        model: The model of the page
+        content: The raw JSON body of the page
+        lazy: Whether the items of the collection in LAZY_COLLECTIONS are only validated on first access
+
+    Returns:
+        The model of the page and its links
+    """
+    page = parse_response(model, content, lazy)
+    if "links" not in type(page).model_fields:
+        return ModelPage(page, PageLinks.model_validate_json(content).links)
+    links = PageLinks.model_validate(page, from_attributes=True).links
+    return ModelPage(page.model_copy(update={"links": None}), links)
+
+
+def parse_page(page_response: Mapping[str, Any] | ModelPage[Any], page_key: str) -> int | None:
+    """
+    Extract a page number from one of the links in a paginated response
+
+    Args:
+        page_response: The JSON response of a single page, or the page validated into its model
+        page_key: The link to read, e.g. 'next' or 'last'
+
+    Returns:
+        The page number the link points to, or None if the link is absent
+    """
+    if isinstance(page_response, ModelPage):
+        links: str | None = getattr(page_response.links, page_key, None)
+    else:
+        links = page_response.get("links", {}).get(page_key, None)
+    if links:
+        return int(links.split("page=")[1])
+    return None
+
+
+def merge_page(
+    combined: dict[str, Any],
+    page_data: dict[str, Any],
+    response_keys: Sequence[str],
+    page_num: int,
+) -> None:
+    """
+    Merge a single page into the combined response in place
+
+    Lists are extended, dictionaries are updated and any other value is added to the running total
+
+    Args:
+        combined: The response being accumulated, normally the first page
+        page_data: The JSON response of the page to merge
+        response_keys: The keys of the response that should be merged
+        page_num: The page number, used for logging
+    """
+    for key in response_keys:
+        if key not in page_data:
+            continue
+        if isinstance(combined[key], list) and isinstance(page_data[key], list):
+            items = cast(list[Any], page_data[key])
+            combined[key].extend(items)
+            logger.debug("Page %d: Added %d items to list key '%s'", page_num, len(items), key)
+        elif isinstance(combined[key], dict) and isinstance(page_data[key], dict):
+            combined[key].update(page_data[key])
+            logger.debug("Page %d: Updated dictionary key '%s'", page_num, key)
+        else:
+            # For other types, assume addition is appropriate
+            combined[key] += page_data[key]
+            logger.debug("Page %d: Updated scalar key '%s'", page_num, key)
+
+
+def merge_keys(first_response: dict[str, Any], collection_key: str | None) -> list[str]:
+    """
+    Work out which keys of a paginated response should be merged across pages
+
+    Args:
+        first_response: The JSON response of the first page
+        collection_key: Optional response key to concatenate while preserving other response metadata
+
+    Returns:
+        The keys to merge, every key except `links` unless a collection key is given
+    """
+    return [collection_key] if collection_key else [k for k in first_response if k != "links"]
+
+
+def page_json(page_num: int, response: Response | BaseException) -> dict[str, Any]:
+    """
+    Decode a page fetched concurrently, failing the whole operation if its request failed
+
+    Args:
+        page_num: The page number, used in the error message
+        response: The response of the page, or the exception raised while requesting it
+
+    Returns:
+        The JSON response of the page
+
+    Raises:
+        RuntimeError: If the request raised or returned an HTTP error
+    """
+    return from_json(page_content(page_num, response))
+
+
+def page_content(page_num: int, response: Response | BaseException) -> bytes:
+    """
+    Get the raw body of a page fetched concurrently, failing the whole operation if its request failed
+
+    Args:
+        page_num: The page number, used in the error message
+        response: The response of the page, or the exception raised while requesting it
+
+    Returns:
+        The raw JSON body of the page
+
+    Raises:
+        RuntimeError: If the request raised or returned an HTTP error
+    """
+    # Check if response is an exception
+    if isinstance(response, BaseException):
+        error_msg = f"Request failed for page {page_num}: {response!s}"
+        logger.error(error_msg)
+        raise RuntimeError(error_msg) from response
+
+    # Check for HTTP errors
+    if response.is_error:
+        error_msg = f"HTTP error on page {page_num}: {response.status_code} - {response.text}"
+        logger.error(error_msg)
+        raise RuntimeError(error_msg)
+
+    return response.content
+
+
+def is_empty_page(page_data: Mapping[str, Any] | ModelPage[Any], response_keys: Sequence[str]) -> bool:
+    """
+    Whether a page has no items, which marks the end of an endpoint that is walked speculatively
+
+    Args:
+        page_data: The JSON response of the page, or the page validated into its model
+        response_keys: The keys of the response that hold its items
+
+    Returns:
+        True if every list among the keys is empty
+    """
+    fields: Mapping[str, Any] = dict(page_data.model) if isinstance(page_data, ModelPage) else page_data
+    collections = [
+        fields[key]
+        for key in response_keys
+        if isinstance(fields.get(key), Sequence) and not isinstance(fields.get(key), str)
+    ]
+    return bool(collections) and not any(collections)
@@ -0,0 +1,145 @@
+"""
+Client-side rate limiting for Vantage API endpoints
+
+Some endpoints have a much lower rate limit than the rest of the API, most notably GET /costs which allows
+5 requests every 5 seconds. Every request made by the SDK passes through a RateLimiter, which holds a token
+bucket per configured endpoint pattern. Buckets are thread-safe and can be waited on from both sync and async
+code, so pagination, concurrent threads and coroutines sharing one client draw from the same budget
+"""
+
+import asyncio
+import logging
+import threading
+import time
+from collections import deque
+from collections.abc import Mapping
+
+from pydantic import BaseModel, Field
+
+from vantage_sdk.endpoints import match_endpoint, normalize_endpoint
+
+logger = logging.getLogger(__name__)
+
+
+class RateLimit(BaseModel):
+    """A request budget for an endpoint"""
+
+    requests: int = Field(..., ge=1, description="The number of requests allowed in each period")
+    period: float = Field(..., gt=0, description="The length of the period in seconds")
+
+
+# Rate limits documented by the Vantage API, keyed by endpoint pattern
+DEFAULT_RATE_LIMITS: Mapping[str, RateLimit] = {
+    "costs": RateLimit(requests=5, period=5.0),
+}
+
+# Extra delay before a token is returned to its bucket, so that requests which are delayed
+# in transit still land inside the server's window
+RATE_LIMIT_MARGIN = 0.1
+
+
+class TokenBucket:
+    """
+    A token bucket holding `requests` tokens, where each token returns to the bucket `period` seconds after it
+    was spent
+
+    Returning tokens one at a time, rather than refilling continuously, guarantees that no more than `requests`
+    requests start within any window of `period` seconds, which is how the API counts them. The full budget is
+    still available as a burst whenever the bucket is full
+
+    Waiting callers reserve their slot while holding the lock and sleep outside of it, so callers are served in
+    arrival order and a sync thread and a coroutine can share one bucket
+    """
+
+    def __init__(self, rate_limit: RateLimit, margin: float = RATE_LIMIT_MARGIN):
+        self.rate_limit = rate_limit
+        self.margin = margin
+        # Start times of the most recent requests, at most one per token
+        self._start_times: deque[float] = deque(maxlen=rate_limit.requests)
+        self._lock = threading.Lock()
+
+    def reserve(self) -> float:
+        """
+        Take a token, reserving the earliest start time that keeps within the budget
+
+        Returns:
+            The number of seconds the caller must wait before sending its request
+        """
+        with self._lock:
+            now = time.monotonic()
+            start = now
+            if len(self._start_times) == self._start_times.maxlen:
+                # The oldest of the last `requests` requests must have left the window
+                start = max(now, self._start_times[0] + self.rate_limit.period + self.margin)
+            self._start_times.append(start)
+            return start - now
+
+    def acquire(self) -> None:
+        """Block the calling thread until a token is available"""
+        delay = self.reserve()
+        if delay > 0:
+            logger.debug("Rate limit reached, waiting %.2fs", delay)
+            time.sleep(delay)
+
+    async def acquire_async(self) -> None:
+        """Wait without blocking the event loop until a token is available"""
+        delay = self.reserve()
+        if delay > 0:
+            logger.debug("Rate limit reached, waiting %.2fs", delay)
+            await asyncio.sleep(delay)
+
+
+class RateLimiter:
+    """
+    Per-endpoint token buckets; endpoints matching the same pattern share a bucket
+
+    Args:
+        rate_limits: Limits keyed by endpoint pattern, merged over DEFAULT_RATE_LIMITS. A pattern mapped to None
+            is not rate limited, which lifts a default limit
+    """
+
+    def __init__(self, rate_limits: Mapping[str, RateLimit | None] | None = None):
+        merged = {
+            normalize_endpoint(pattern): limit
+            for pattern, limit in {**DEFAULT_RATE_LIMITS, **(rate_limits or {})}.items()
+        }
+        self._buckets = {pattern: TokenBucket(limit) for pattern, limit in merged.items() if limit is not None}
+
+    @property
+    def rate_limits(self) -> dict[str, RateLimit]:
+        """The configured rate limits keyed by endpoint pattern"""
+        return {pattern: bucket.rate_limit for pattern, bucket in self._buckets.items()}
+
+    def bucket_for(self, endpoint: str) -> TokenBucket | None:
+        """
+        Find the bucket that limits an endpoint
+
+        Args:
+            endpoint: The endpoint being requested
+
+        Returns:
+            The bucket, or None if the endpoint is not rate limited
+        """
+        return match_endpoint(self._buckets, endpoint)
+
+    def acquire(self, endpoint: str) -> None:
+        """
+        Block until a request to the endpoint is allowed
+
+        Args:
+            endpoint: The endpoint being requested
+        """
+        bucket = self.bucket_for(endpoint)
+        if bucket is not None:
+            bucket.acquire()
+
+    async def acquire_async(self, endpoint: str) -> None:
+        """
+        Wait until a request to the endpoint is allowed
+
+        Args:
+            endpoint: The endpoint being requested
+        """
+        bucket = self.bucket_for(endpoint)
+        if bucket is not None:
+            await bucket.acquire_async()
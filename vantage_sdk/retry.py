@@ -0,0 +1,186 @@
+"""
+Retrying requests that failed for transient reasons
+
+The Vantage API occasionally answers with a 429 when a rate limit is exceeded, or with a 502, 503 or 504 when
+an upstream is slow. Every request made by the SDK, including each page of a paginated call, is retried on its
+own with exponential backoff and full jitter, honoring the server's Retry-After header when one is sent.
+A failed page is retried without refetching the pages that already succeeded
+"""
+
+import asyncio
+import logging
+import random
+import time
+from collections.abc import Awaitable, Callable
+from datetime import UTC, datetime
+from email.utils import parsedate_to_datetime
+
+from httpx import Response, TransportError
+from pydantic import BaseModel, Field
+
+logger = logging.getLogger(__name__)
+
+
+class RetryPolicy(BaseModel):
+    """When and how long to wait before retrying a failed request"""
+
+    max_retries: int = Field(
+        default=3, ge=0, description="The number of retries after the first attempt, 0 disables retries"
+    )
+    backoff_factor: float = Field(default=0.5, ge=0, description="The base delay in seconds, doubled on every retry")
+    max_backoff: float = Field(default=30.0, ge=0, description="The longest delay in seconds between two attempts")
+    max_retry_after: float = Field(
+        default=120.0,
+        ge=0,
+        description="Give up instead of waiting when the server asks to retry after longer than this",
+    )
+    retry_statuses: frozenset[int] = Field(
+        default=frozenset({429, 500, 502, 503, 504}), description="The HTTP status codes that are retried"
+    )
+    retry_methods: frozenset[str] = Field(
+        default=frozenset({"GET", "HEAD", "OPTIONS", "PUT", "DELETE"}),
+        description="The idempotent HTTP methods that are retried on any retryable status or transport error. "
+        "Other methods, such as POST, are only retried on 429 since the server did not process the request",
+    )
+
+    def is_retryable(self, method: str, status_code: int) -> bool:
+        """
+        Whether a response with the given status may be retried
+
+        Args:
+            method: The HTTP method of the request
+            status_code: The HTTP status code of the response
+
+        Returns:
+            True if the request should be retried
+        """
+        if status_code not in self.retry_statuses:
+            return False
+        return status_code == 429 or method.upper() in self.retry_methods
+
+    def backoff(self, attempt: int) -> float:
+        """
+        The exponential backoff delay with full jitter before a retry
+
+        Args:
+            attempt: The number of attempts made so far, starting at 1
+
+        Returns:
+            The delay in seconds
+        """
+        return random.uniform(0, min(self.max_backoff, self.backoff_factor * 2 ** (attempt - 1)))
+
+    def retry_delay(self, attempt: int, response: Response | None = None) -> float | None:
+        """
+        How long to wait before the next attempt
+
+        Args:
+            attempt: The number of attempts made so far, starting at 1
+            response: The response of the failed attempt, None if it raised a transport error
+
+        Returns:
+            The delay in seconds, or None if the request should not be retried again
+        """
+        if attempt > self.max_retries:
+            return None
+        retry_after = parse_retry_after(response) if response is not None else None
+        if retry_after is None:
+            return self.backoff(attempt)
+        if retry_after > self.max_retry_after:
+            logger.warning("Server asked to retry after %.0fs which exceeds max_retry_after, giving up", retry_after)
+            return None
+        return retry_after
+
+
+def parse_retry_after(response: Response) -> float | None:
+    """
+    Read the Retry-After header of a response
+
+    Args:
+        response: The HTTP response
+
+    Returns:
+        The number of seconds to wait, or None if the header is missing or invalid
+    """
+    value = response.headers.get("retry-after")
+    if value is None:
+        return None
+    try:
+        return max(0.0, float(value))
+    except ValueError:
+        pass
+    try:
+        retry_at = parsedate_to_datetime(value)
+    except (TypeError, ValueError):
+        return None
+    return max(0.0, (retry_at - datetime.now(UTC)).total_seconds())
+
+
+def send_with_retry(policy: RetryPolicy, method: str, send: Callable[[], Response]) -> Response:
+    """
+    Send a request, retrying it according to the policy
+
+    Args:
+        policy: The retry policy
+        method: The HTTP method of the request
+        send: Sends the request once and returns the response
+
+    Returns:
+        The first successful or non-retryable response, or the last response once retries are exhausted
+    """
+    attempt = 0
+    while True:
+        attempt += 1
+        try:
+            response = send()
+        except TransportError as exc:
+            delay = policy.retry_delay(attempt) if method.upper() in policy.retry_methods else None
+            if delay is None:
+                raise
+            logger.info("%s failed with %r, retrying in %.2fs (attempt %d)", method, exc, delay, attempt)
+            time.sleep(delay)
+            continue
+
+        if not policy.is_retryable(method, response.status_code):
+            return response
+        delay = policy.retry_delay(attempt, response)
+        if delay is None:
+            return response
+        logger.info("%s returned %d, retrying in %.2fs (attempt %d)", method, response.status_code, delay, attempt)
+        response.close()
+        time.sleep(delay)
+
+
+async def send_with_retry_async(policy: RetryPolicy, method: str, send: Callable[[], Awaitable[Response]]) -> Response:
+    """
+    Send a request without blocking the event loop, retrying it according to the policy
+
+    Args:
+        policy: The retry policy
+        method: The HTTP method of the request
+        send: Sends the request once and returns the response
+
+    Returns:
+        The first successful or non-retryable response, or the last response once retries are exhausted
+    """
+    attempt = 0
+    while True:
+        attempt += 1
+        try:
+            response = await send()
+        except TransportError as exc:
+            delay = policy.retry_delay(attempt) if method.upper() in policy.retry_methods else None
+            if delay is None:
+                raise
+            logger.info("%s failed with %r, retrying in %.2fs (attempt %d)", method, exc, delay, attempt)
+            await asyncio.sleep(delay)
+            continue
+
+        if not policy.is_retryable(method, response.status_code):
+            return response
+        delay = policy.retry_delay(attempt, response)
+        if delay is None:
+            return response
+        logger.info("%s returned %d, retrying in %.2fs (attempt %d)", method, response.status_code, delay, attempt)
+        await response.aclose()
+        await asyncio.sleep(delay)
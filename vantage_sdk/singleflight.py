@@ -0,0 +1,121 @@
+"""
+Single-flight coalescing of identical concurrent GET requests
+
+When many threads or coroutines ask for the same resource at once, typically right after its cache entry
+expired, only the first of them goes to the API. The others wait for that request and receive its result, so N
+identical concurrent calls cost one request and one unit of rate-limit budget instead of N
+
+Results may be JSON dictionaries that callers are free to mutate, so whenever a result is shared every caller
+receives its own deep copy, and a result nobody else waited for is returned as is. Raw response bodies are bytes,
+which are immutable, so sharing them copies nothing
+"""
+
+import asyncio
+import copy
+import logging
+import threading
+from collections.abc import Awaitable, Callable
+from concurrent.futures import Future
+from typing import Any, TypeVar
+
+logger = logging.getLogger(__name__)
+
+T = TypeVar("T")
+
+
+class _Flight:
+    """A call in progress and the number of callers waiting for it, including the one that made it"""
+
+    __slots__ = ("future", "waiters")
+
+    def __init__(self, future: Future[Any]):
+        self.future = future
+        self.waiters = 1
+
+
+class _AsyncFlight:
+    """A call in progress in its own task and the number of coroutines waiting for it"""
+
+    __slots__ = ("task", "waiters")
+
+    def __init__(self, task: asyncio.Future[Any]):
+        self.task = task
+        self.waiters = 1
+
+
+class SingleFlight:
+    """Coalesces concurrent sync calls that share a key into a single call, safe to use from any thread"""
+
+    def __init__(self):
+        self._flights: dict[str, _Flight] = {}
+        self._lock = threading.Lock()
+
+    def do(self, key: str, call: Callable[[], T]) -> T:
+        """
+        Make a call, or wait for the identical call already in progress
+
+        Args:
+            key: Identifies the call, calls with equal keys must have equal results
+            call: Makes the call
+
+        Returns:
+            The result of the call, copied when it was shared
+        """
+        with self._lock:
+            flight = self._flights.get(key)
+            leader = flight is None
+            if flight is None:
+                flight = self._flights[key] = _Flight(Future())
+            else:
+                flight.waiters += 1
+        if not leader:
+            logger.debug("Waiting for the request in flight for %s", key)
+            return copy.deepcopy(flight.future.result())
+
+        try:
+            result = call()
+        except BaseException as exc:
+            self._land(key)
+            flight.future.set_exception(exc)
+            raise
+        shared = self._land(key)
+        flight.future.set_result(result)
+        return copy.deepcopy(result) if shared else result
+
+    def _land(self, key: str) -> bool:
+        """Stop new callers from joining a flight, returning whether anyone else waited for it"""
+        with self._lock:
+            return self._flights.pop(key).waiters > 1
+
+
+class AsyncSingleFlight:
+    """Coalesces concurrent coroutine calls that share a key into a single call, on one event loop"""
+
+    def __init__(self):
+        self._flights: dict[str, _AsyncFlight] = {}
+
+    async def do(self, key: str, call: Callable[[], Awaitable[T]]) -> T:
+        """
+        Make a call, or wait for the identical call already in progress
+
+        The call runs in its own task, so cancelling one of the callers waiting for it does not cancel it for the
+        others
+
+        Args:
+            key: Identifies the call, calls with equal keys must have equal results
+            call: Makes the call
+
+        Returns:
+            The result of the call, copied when it was shared
+        """
+        flight = self._flights.get(key)
+        if flight is None:
+            task = asyncio.ensure_future(call())
+            flight = self._flights[key] = _AsyncFlight(task)
+            task.add_done_callback(lambda _: self._flights.pop(key, None))
+        else:
+            logger.debug("Waiting for the request in flight for %s", key)
+            flight.waiters += 1
+
+        result = await asyncio.shield(flight.task)
+        return copy.deepcopy(result) if flight.waiters > 1 else result
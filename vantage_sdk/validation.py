@@ -0,0 +1,46 @@
+"""
+Building response models
+
+Every response is validated into its model, straight from its raw bytes when it has not been decoded yet, and a
+response that does not match its model raises. With `lazy_collections` the items of the collection of a large
+response are kept decoded and only validated when first accessed, see vantage_sdk.lazy
+"""
+
+from collections.abc import Mapping
+from typing import Any, TypeVar, get_args
+
+from pydantic import BaseModel
+from pydantic_core import from_json
+
+from vantage_sdk.lazy import LazySequence, lazy_field
+
+M = TypeVar("M", bound=BaseModel)
+
+
+def parse_response(model: type[M], data: bytes | Mapping[str, Any], lazy: bool = False) -> M:
+    """
+    Build a response model from a raw or decoded JSON body
+
+    Args:
+        model: The model of the response
+        data: The raw JSON body, or the decoded response
+        lazy: Whether the items of the collection in LAZY_COLLECTIONS are only validated on first access
+
+    Returns:
+        The validated model
+    """
+    field = lazy_field(model) if lazy else None
+    if field is not None:
+        decoded: Mapping[str, Any] = from_json(data) if isinstance(data, bytes) else data
+        if isinstance(decoded.get(field), list):
+            return _parse_lazily(model, decoded, field)
+        data = decoded
+    return model.model_validate_json(data) if isinstance(data, bytes) else model.model_validate(data)
+
+
+def _parse_lazily(model: type[M], data: Mapping[str, Any], field: str) -> M:
+    """Build a response model whose collection field holds a LazySequence of its items"""
+    item_model: type[BaseModel] = get_args(model.model_fields[field].annotation)[0]
+    response = model.model_validate({**data, field: []})
+    setattr(response, field, LazySequence(data[field], item_model))
+    return response